@@ -0,0 +1,571 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for OpportunityIQ Client Matcher.
+
+Generates synthetic client books (with realistic scenario-specific extra
+fields) and scenario libraries (every criterion operator and revenue
+formula type), then times each pipeline stage separately:
+
+1. load_clients   - parse and validate the NDJSON client book
+2. load_scenarios - load, validate and compile the scenario library
+3. match          - score every client against every scenario
+4. revenue        - price every match (batched per scenario)
+5. opportunities  - full matching pipeline building Opportunity models
+6. rank           - composite ranking of every opportunity
+7. report         - markdown report for the top opportunities
+8. export         - streaming CSV export of every opportunity
+
+Each stage records seconds, throughput and peak memory. Results are written
+as JSON so runs can be compared to a baseline to catch regressions.
+
+Usage:
+    # Default grid: 10k clients x 10 and 100 scenarios
+    python benchmark.py
+
+    # Full grid (large books need several GB of memory)
+    python benchmark.py --clients 10000 100000 1000000 --scenarios 10 100 1000
+
+    # Keep generated data between runs and compare with a baseline
+    python benchmark.py --data-dir data/benchmark --output results.json --compare baseline.json
+
+    # Fail (exit 1) if any stage is more than 20% slower than the baseline
+    python benchmark.py --compare baseline.json --max-regression 0.2
+"""
+
+import argparse
+import gc
+import json
+import logging
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from src.services.revenue_calculator import RevenueCalculator
+from src.services.scenario_compiler import compile_scenarios
+from src.tools import (
+    export_opportunities,
+    generate_report,
+    load_all_scenario_files,
+    load_clients,
+    match_clients_to_scenarios,
+    rank_opportunities
+)
+
+logger = logging.getLogger("benchmark")
+
+# Bump when stages or generated data change, so results stay comparable
+BENCHMARK_VERSION = 1
+
+# Scenarios written per library file
+SCENARIOS_PER_FILE = 25
+
+# Stages faster than this in the baseline are too noisy to gate on
+NOISE_FLOOR_SECONDS = 0.05
+
+MB = 1024 * 1024
+
+STATES = ["AZ", "CA", "FL", "IL", "MA", "NC", "NY", "OH", "PA", "TX", "WA"]
+TAGS = ["retiree", "business_owner", "inheritor", "pre_retiree", "young_family", "widowed", "executive"]
+NOTES = [
+    None,
+    None,
+    "FIA surrender period ending soon",
+    "Holding excess cash after home sale",
+    "Concentrated employer stock position",
+    "Wants estate plan review",
+    "Interested in tax-loss harvesting",
+]
+SYMBOLS = ["AAPL", "MSFT", "VTSAX", "VBTLX", "BND", "SPY", "QQQ", "AMZN"]
+
+
+# Synthetic data generation
+
+def generate_client(rng: random.Random, index: int) -> dict[str, Any]:
+    """Generate one client record with realistic scenario-specific fields."""
+    total_value = round(rng.lognormvariate(12.5, 1.1), 2)
+    cash_percentage = round(min(rng.expovariate(1 / 12), 90.0), 2)
+    cash_value = round(total_value * cash_percentage / 100, 2)
+    equity = round(rng.uniform(20, 80), 1)
+    fixed_income = round(rng.uniform(0, 100 - equity), 1)
+
+    holdings = []
+    for symbol in rng.sample(SYMBOLS, rng.randint(0, 4)):
+        current_value = round(total_value * rng.uniform(0.02, 0.3), 2)
+        holdings.append({
+            "symbol": symbol,
+            "asset_type": rng.choice(["stock", "mutual_fund", "etf", "bond"]),
+            "quantity": round(rng.uniform(10, 5000), 2),
+            "current_value": current_value,
+            "cost_basis": round(current_value * rng.uniform(0.5, 1.5), 2),
+        })
+
+    client = {
+        "client_id": f"BENCH-{index:07d}",
+        "name": f"Client {index}",
+        "age": rng.randint(25, 90),
+        "risk_tolerance": rng.choice(["conservative", "moderate", "aggressive"]),
+        "investment_objective": rng.choice(["growth", "income", "balanced", "capital_preservation"]),
+        "time_horizon_years": rng.randint(1, 30),
+        "annual_income": round(rng.lognormvariate(11.5, 0.7), 2),
+        "net_worth": round(total_value * rng.uniform(1.0, 3.0), 2),
+        "liquidity_needs": rng.choice(["low", "medium", "high"]),
+        "tax_bracket": rng.choice([10.0, 12.0, 22.0, 24.0, 32.0, 35.0, 37.0]),
+        "has_estate_plan": rng.random() < 0.45,
+        "portfolio": {
+            "total_value": total_value,
+            "cash_value": cash_value,
+            "equity_allocation": equity,
+            "fixed_income_allocation": fixed_income,
+            "alternative_allocation": round(100 - equity - fixed_income, 1),
+            "holdings": holdings,
+        },
+        "advisor_notes": rng.choice(NOTES),
+        "last_review_date": (date(2024, 1, 1) + timedelta(days=rng.randint(0, 700))).isoformat(),
+        # Scenario-specific extra fields
+        "state": rng.choice(STATES),
+        "tags": rng.sample(TAGS, rng.randint(0, 3)),
+        "cash_percentage": cash_percentage,
+        "cash_balance": cash_value,
+        "cash_yield": round(rng.uniform(0.0, 5.0), 2),
+        "concentration_pct": round(rng.uniform(0, 60), 1),
+    }
+
+    if rng.random() < 0.35:
+        client["fia_value"] = round(total_value * rng.uniform(0.05, 0.4), 2)
+        client["fia_surrender_end_months"] = rng.randint(0, 60)
+        client["fia_current_cap_rate"] = round(rng.uniform(2.0, 8.0), 2)
+
+    return client
+
+
+# (field, operator, value generator) covering every operator
+CRITERIA_CATALOG: list[tuple[str, str, Callable[[random.Random], Any]]] = [
+    ("age", "gte", lambda rng: rng.choice([50, 55, 60, 65])),
+    ("age", "lt", lambda rng: rng.choice([40, 45, 50])),
+    ("portfolio_value", "gt", lambda rng: rng.choice([100000, 250000, 500000, 1000000])),
+    ("portfolio.cash_value", "gte", lambda rng: rng.choice([25000, 50000, 100000])),
+    ("net_worth", "lte", lambda rng: rng.choice([500000, 1000000, 2000000])),
+    ("annual_income", "gt", lambda rng: rng.choice([75000, 150000, 250000])),
+    ("tax_bracket", "gte", lambda rng: rng.choice([24.0, 32.0, 35.0])),
+    ("time_horizon_years", "gte", lambda rng: rng.choice([5, 10, 15])),
+    ("retirement_age_estimate", "gt", lambda rng: rng.choice([62, 65, 70])),
+    ("risk_tolerance", "eq", lambda rng: rng.choice(["conservative", "moderate", "aggressive"])),
+    ("has_estate_plan", "eq", lambda rng: False),
+    ("investment_objective", "in", lambda rng: rng.sample(["growth", "income", "balanced", "capital_preservation"], 2)),
+    ("liquidity_needs", "in", lambda rng: rng.sample(["low", "medium", "high"], 2)),
+    ("state", "in", lambda rng: rng.sample(STATES, 4)),
+    ("advisor_notes", "contains", lambda rng: rng.choice(["FIA", "cash", "estate", "stock", "tax"])),
+    ("tags", "contains", lambda rng: rng.choice(TAGS)),
+    ("cash_percentage", "gt", lambda rng: rng.choice([10.0, 20.0, 30.0])),
+    ("cash_yield", "lt", lambda rng: rng.choice([2.0, 3.0, 4.0])),
+    ("concentration_pct", "gt", lambda rng: rng.choice([20.0, 30.0, 40.0])),
+    ("fia_surrender_end_months", "lte", lambda rng: rng.choice([6, 12, 24])),
+    ("fia_current_cap_rate", "lt", lambda rng: rng.choice([4.0, 5.0, 6.0])),
+]
+
+FORMULA_TYPES = ["percentage", "flat_fee", "tiered", "aum_based"]
+
+
+def generate_scenario(rng: random.Random, index: int) -> dict[str, Any]:
+    """Generate one scenario, cycling through every revenue formula type."""
+    criteria = [
+        {
+            "field": field,
+            "operator": operator,
+            "value": value(rng),
+            "weight": round(rng.uniform(0.3, 1.0), 2),
+        }
+        for field, operator, value in rng.sample(CRITERIA_CATALOG, rng.randint(2, 6))
+    ]
+
+    formula_type = FORMULA_TYPES[index % len(FORMULA_TYPES)]
+    if formula_type == "percentage":
+        formula = {
+            "formula_type": "percentage",
+            "base_rate": rng.choice([0.001, 0.002, 0.005, 0.01]),
+            "multiplier_field": rng.choice(["portfolio_value", "cash_balance", "net_worth"]),
+            "min_revenue": 100.0,
+            "max_revenue": rng.choice([10000.0, 25000.0, 50000.0]),
+        }
+    elif formula_type == "flat_fee":
+        formula = {
+            "formula_type": "flat_fee",
+            "base_rate": rng.choice([500.0, 1500.0, 5000.0]),
+        }
+    elif formula_type == "tiered":
+        formula = {
+            "formula_type": "tiered",
+            "base_rate": 0.01,
+            "multiplier_field": "portfolio_value",
+            "tiers": {
+                "0-500000": 0.0075,
+                "500000-1000000": 0.005,
+                "1000000+": 0.0025,
+            },
+            "min_revenue": 250.0,
+        }
+    else:
+        formula = {
+            "formula_type": "aum_based",
+            "base_rate": rng.choice([0.005, 0.0075, 0.01]),
+            "max_revenue": 100000.0,
+        }
+
+    return {
+        "scenario_id": f"BENCH-SCN-{index:04d}",
+        "name": f"Benchmark Scenario {index}",
+        "description": "Synthetic scenario for throughput benchmarking",
+        "category": rng.choice(["annuity", "tax", "rebalance", "alternative_investment", "insurance"]),
+        "criteria": criteria,
+        "revenue_formula": formula,
+        "priority": rng.choice(["high", "medium", "low"]),
+        "required_licenses": rng.choice([None, ["Series 7"], ["Series 65"], ["Series 7", "Life & Health"]]),
+        "estimated_time_hours": rng.choice([None, 1.0, 2.0, 4.0, 8.0]),
+    }
+
+
+def write_client_book(path: Path, count: int, seed: int) -> None:
+    """Write a synthetic NDJSON client book."""
+    rng = random.Random(seed)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for index in range(count):
+            f.write(json.dumps(generate_client(rng, index)))
+            f.write("\n")
+
+
+def write_scenario_library(directory: Path, count: int, seed: int) -> None:
+    """Write a synthetic scenario library as JSON files."""
+    rng = random.Random(seed)
+    directory.mkdir(parents=True, exist_ok=True)
+    scenarios = [generate_scenario(rng, index) for index in range(count)]
+    for start in range(0, count, SCENARIOS_PER_FILE):
+        file_path = directory / f"scenarios_{start // SCENARIOS_PER_FILE:04d}.json"
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(scenarios[start:start + SCENARIOS_PER_FILE], f, indent=2)
+
+
+# Measurement
+
+def _peak_rss_mb() -> Optional[float]:
+    """Process peak resident memory in MB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak / MB if sys.platform == "darwin" else peak / 1024
+
+
+def measure(
+    stages: dict[str, Any],
+    name: str,
+    function: Callable[[], Any],
+    count_items: Callable[[Any], int],
+    trace_memory: bool
+) -> Any:
+    """
+    Time one stage and record it under stages[name].
+
+    Returns:
+        The stage function's result
+    """
+    gc.collect()
+    if trace_memory:
+        tracemalloc.reset_peak()
+
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+
+    items = count_items(result)
+    stage = {
+        "seconds": round(seconds, 6),
+        "items": items,
+        "items_per_second": round(items / seconds, 1) if seconds > 0 else None,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+    if trace_memory:
+        stage["traced_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / MB, 2)
+
+    stages[name] = stage
+    print(
+        f"   {name:<15} {seconds:>9.3f}s  {items:>10,} items  "
+        f"{stage['items_per_second'] or 0:>12,.0f}/s"
+    )
+    return result
+
+
+# Stages
+
+def score_matches(clients, compiled_scenarios, min_match_threshold):
+    """Score every pair; returns {compiled scenario: [matched clients]}."""
+    matches = {}
+    for compiled in compiled_scenarios:
+        compiled.calibrate(clients[:1000])
+        score_above = compiled.score_above
+        matches[compiled] = [
+            client for client in clients
+            if score_above(client, min_match_threshold) is not None
+        ]
+    return matches
+
+
+def price_matches(matches):
+    """Batch-price every match; returns the number of priced matches."""
+    calculator = RevenueCalculator()
+    priced = 0
+    for compiled, matched_clients in matches.items():
+        if matched_clients:
+            batch = calculator.calculate_revenue_batch(matched_clients, compiled.scenario)
+            priced += len(batch) - len(batch.errors)
+    return priced
+
+
+def run_benchmark(
+    book_path: Path,
+    scenarios_dir: Path,
+    client_count: int,
+    scenario_count: int,
+    args: argparse.Namespace
+) -> dict[str, Any]:
+    """Run every stage for one (clients, scenarios) combination."""
+    stages: dict[str, Any] = {}
+    trace = args.trace_memory
+
+    clients = measure(stages, "load_clients", lambda: load_clients(book_path), len, trace)
+
+    def load_library():
+        return compile_scenarios(load_all_scenario_files(scenarios_dir))
+
+    compiled_scenarios = measure(stages, "load_scenarios", load_library, len, trace)
+    scenarios = [compiled.scenario for compiled in compiled_scenarios]
+
+    matches = measure(
+        stages, "match",
+        lambda: score_matches(clients, compiled_scenarios, args.min_match_threshold),
+        lambda result: len(clients) * len(compiled_scenarios),
+        trace
+    )
+    match_count = sum(len(matched) for matched in matches.values())
+    stages["match"]["matches"] = match_count
+
+    measure(stages, "revenue", lambda: price_matches(matches), lambda priced: priced, trace)
+    del matches
+
+    opportunities = measure(
+        stages, "opportunities",
+        lambda: match_clients_to_scenarios(
+            clients, scenarios, args.min_match_threshold, engine=args.engine
+        ),
+        len,
+        trace
+    )
+
+    if not opportunities:
+        print("   (no opportunities matched; skipping rank, report and export)")
+        return {"clients": client_count, "scenarios": scenario_count, "stages": stages}
+
+    ranked = measure(stages, "rank", lambda: rank_opportunities(opportunities), len, trace)
+
+    top = ranked[:args.report_limit]
+    measure(
+        stages, "report",
+        lambda: generate_report(top, format="markdown"),
+        lambda report: len(top),
+        trace
+    )
+
+    with tempfile.TemporaryDirectory() as export_dir:
+        measure(
+            stages, "export",
+            lambda: export_opportunities(ranked, str(Path(export_dir) / "opportunities.csv")),
+            lambda count: count,
+            trace
+        )
+
+    return {
+        "clients": client_count,
+        "scenarios": scenario_count,
+        "opportunities": len(opportunities),
+        "stages": stages
+    }
+
+
+# Baseline comparison
+
+def compare_results(results: dict[str, Any], baseline: dict[str, Any]) -> float:
+    """
+    Print per-stage time ratios against a baseline.
+
+    Returns:
+        Worst (largest) new/baseline time ratio across stages above the
+        noise floor
+    """
+    if baseline.get("benchmark_version") != results["benchmark_version"]:
+        print("\n⚠️  Baseline was produced by a different benchmark version; ratios may mislead")
+
+    baseline_runs = {(run["clients"], run["scenarios"]): run for run in baseline.get("runs", [])}
+    worst = 0.0
+
+    print("\n" + "=" * 70)
+    print("COMPARISON WITH BASELINE (new / baseline time; < 1.00 is faster)")
+    print("=" * 70)
+
+    for run in results["runs"]:
+        old = baseline_runs.get((run["clients"], run["scenarios"]))
+        if old is None:
+            continue
+        print(f"\n{run['clients']:,} clients x {run['scenarios']:,} scenarios")
+        for name, stage in run["stages"].items():
+            old_stage = old["stages"].get(name)
+            if not old_stage or not old_stage["seconds"]:
+                continue
+            ratio = stage["seconds"] / old_stage["seconds"]
+            noisy = old_stage["seconds"] < NOISE_FLOOR_SECONDS
+            if not noisy:
+                worst = max(worst, ratio)
+            print(
+                f"   {name:<15} {old_stage['seconds']:>9.3f}s -> "
+                f"{stage['seconds']:>9.3f}s  x{ratio:.2f}{'  (noise)' if noisy else ''}"
+            )
+
+    return worst
+
+
+def main() -> int:
+    """Run the benchmark grid and write JSON results."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark OpportunityIQ throughput on synthetic data"
+    )
+    parser.add_argument(
+        "--clients", type=int, nargs="+", default=[10000],
+        help="Client book sizes to benchmark (default: 10000)"
+    )
+    parser.add_argument(
+        "--scenarios", type=int, nargs="+", default=[10, 100],
+        help="Scenario library sizes to benchmark (default: 10 100)"
+    )
+    parser.add_argument(
+        "--min-match-threshold", type=float, default=60.0,
+        help="Minimum match score (default: 60.0)"
+    )
+    parser.add_argument(
+        "--engine", choices=["auto", "compiled", "columnar", "sharded"], default="auto",
+        help=(
+            "Matching engine for the opportunities stage (default: auto; "
+            "auto never shards, pass 'sharded' to match across processes)"
+        )
+    )
+    parser.add_argument(
+        "--report-limit", type=int, default=100,
+        help="Opportunities in the markdown report (default: 100)"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument(
+        "--data-dir",
+        help="Directory for generated data, reused across runs (default: temporary)"
+    )
+    parser.add_argument(
+        "--output", default="benchmark_results.json",
+        help="JSON results file (default: benchmark_results.json)"
+    )
+    parser.add_argument("--compare", help="Baseline JSON results to compare against")
+    parser.add_argument(
+        "--max-regression", type=float,
+        help=(
+            "With --compare, exit 1 if any stage is slower by more than this "
+            f"fraction (e.g. 0.2); stages under {NOISE_FLOOR_SECONDS}s are ignored"
+        )
+    )
+    parser.add_argument(
+        "--trace-memory", action="store_true",
+        help="Record per-stage peak Python allocations (tracemalloc; slows stages)"
+    )
+    args = parser.parse_args()
+
+    # Per-pair log lines would dominate the timings
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.trace_memory:
+        tracemalloc.start()
+
+    data_dir = Path(args.data_dir) if args.data_dir else Path(tempfile.mkdtemp(prefix="oiq-bench-"))
+
+    results: dict[str, Any] = {
+        "benchmark_version": BENCHMARK_VERSION,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "environment": _environment(),
+        "config": {
+            "min_match_threshold": args.min_match_threshold,
+            "engine": args.engine,
+            "report_limit": args.report_limit,
+            "seed": args.seed,
+            "trace_memory": args.trace_memory,
+        },
+        "runs": [],
+    }
+
+    try:
+        for client_count in args.clients:
+            book_path = data_dir / f"clients-{client_count}-seed{args.seed}.ndjson"
+            if not book_path.exists():
+                print(f"Generating {client_count:,} clients...")
+                write_client_book(book_path, client_count, args.seed)
+
+            for scenario_count in args.scenarios:
+                scenarios_dir = data_dir / f"scenarios-{scenario_count}-seed{args.seed}"
+                if not scenarios_dir.exists():
+                    print(f"Generating {scenario_count:,} scenarios...")
+                    write_scenario_library(scenarios_dir, scenario_count, args.seed)
+
+                print(f"\n▶ {client_count:,} clients x {scenario_count:,} scenarios")
+                results["runs"].append(
+                    run_benchmark(book_path, scenarios_dir, client_count, scenario_count, args)
+                )
+    finally:
+        if not args.data_dir:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"\n📄 Results saved to: {output_path}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        worst = compare_results(results, baseline)
+        if args.max_regression is not None and worst > 1 + args.max_regression:
+            print(f"\n❌ Regression: a stage is x{worst:.2f} slower than baseline")
+            return 1
+
+    return 0
+
+
+def _environment() -> dict[str, Any]:
+    """Interpreter, platform and library versions for the results file."""
+    import os
+
+    import numpy
+    import pydantic
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "numpy": numpy.__version__,
+        "pydantic": pydantic.VERSION,
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,20 +17,32 @@ Biblical Principle: EXCELLENCE - Production-grade from inception
 """
 
 import os
-import json
+import asyncio
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from anthropic import Anthropic
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Union
+from anthropic import Anthropic, AsyncAnthropic
 from dotenv import load_dotenv
 
 from src.tools import (
     load_all_scenario_files,
+    iter_clients,
     match_clients_to_scenarios,
+    match_clients_incremental,
+    materialize_opportunities,
+    stream_client_matches,
+    stream_compact_matches,
     calculate_revenue,
     rank_opportunities,
-    generate_report
+    rank_top_opportunities,
+    generate_report,
+    export_opportunities
 )
+from src.tools.load_clients import detect_client_format
+from src.services.match_store import MatchStore
+from src.services.insight_cache import InsightCache, insight_cache_key
+from src.services.opportunity_stats import OpportunityStats
+from src.services.scenario_registry import default_registry
 from src.models import Scenario, ClientProfile, Opportunity
 
 # Configure logging
@@ -40,6 +52,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared instruction block for insight requests (sent as a cached system prompt)
+INSIGHT_INSTRUCTIONS = """You are a financial advisor assistant analyzing a revenue opportunity.
+
+**Your Task:**
+Generate a concise analysis (200-300 words) with these sections:
+
+1. **Why This Fits** (2-3 sentences): Explain why this opportunity makes sense for this specific client based on the match criteria.
+
+2. **Talking Points** (3-4 bullet points): Key points the advisor should emphasize when discussing this with the client.
+
+3. **Considerations** (2-3 bullet points): Potential risks, objections, or important factors to address.
+
+4. **Next Steps** (2-3 action items): Specific, actionable steps the advisor should take.
+
+Keep the tone professional but conversational. Focus on practical, actionable insights."""
+
 
 class OpportunityIQAgent:
     """
@@ -60,9 +88,15 @@ class OpportunityIQAgent:
         model: Claude model to use
         scenarios_directory: Path to scenarios directory
         default_scenarios: List of loaded default scenarios
+        match_store: Optional MatchStore for incremental re-matching
+        insight_cache: InsightCache of generated LLM insights
     """
 
-    def __init__(self, scenarios_directory: str = "data/scenarios"):
+    def __init__(
+        self,
+        scenarios_directory: str = "data/scenarios",
+        match_store_path: Optional[str] = None
+    ):
         """
         Initialize the OpportunityIQ Agent.
 
@@ -70,9 +104,16 @@ class OpportunityIQAgent:
         - ANTHROPIC_API_KEY (required)
         - CLAUDE_MODEL (optional - defaults to claude-sonnet-4-5-20250929)
         - SCENARIOS_DIRECTORY (optional - defaults to data/scenarios)
+        - MATCH_STORE_PATH (optional - enables incremental re-matching)
+        - INSIGHT_CACHE_PATH (optional - persists generated insights across runs)
+        - INSIGHTS_MAX_CONCURRENCY (optional - defaults to 10)
+        - SCENARIO_BUNDLE_PATH (optional - precompiled scenario bundle for fast startup)
 
         Args:
             scenarios_directory: Path to directory containing scenario JSON files
+            match_store_path: Optional SQLite file for stored match results;
+                when set, analyze_clients() only re-matches clients and
+                scenarios that changed since the previous run
 
         Raises:
             ValueError: If ANTHROPIC_API_KEY is not found in environment
@@ -97,6 +138,19 @@ class OpportunityIQAgent:
         # Initialize Claude client
         self.client = Anthropic(api_key=self.api_key)
 
+        # Open the match store for incremental runs
+        match_store_path = match_store_path or os.getenv("MATCH_STORE_PATH")
+        self.match_store = MatchStore(match_store_path) if match_store_path else None
+
+        # Cache insights in memory, or on disk when a path is configured
+        self.insight_cache = InsightCache(os.getenv("INSIGHT_CACHE_PATH", ":memory:"))
+        self.insights_max_concurrency = int(os.getenv("INSIGHTS_MAX_CONCURRENCY", "10"))
+
+        # Validated and compiled scenarios are cached per process; a bundle
+        # lets a fresh process skip validating unchanged scenario files
+        self.scenario_registry = default_registry
+        self.scenario_bundle_path = os.getenv("SCENARIO_BUNDLE_PATH")
+
         # Load default scenarios
         self.default_scenarios = []
         self._load_default_scenarios()
@@ -109,7 +163,9 @@ class OpportunityIQAgent:
         Load default scenarios from scenarios directory.
 
         Loads all JSON files from the scenarios directory and validates them
-        against the Scenario model. Logs warnings for invalid files.
+        against the Scenario model. Logs warnings for invalid files. Files
+        unchanged since they were last loaded (in this process, or when the
+        scenario bundle was written) are served from the scenario registry.
         """
         scenarios_path = Path(self.scenarios_directory)
 
@@ -117,16 +173,28 @@ class OpportunityIQAgent:
             logger.warning(f"Scenarios directory not found: {self.scenarios_directory}")
             return
 
+        if self.scenario_bundle_path and not len(self.scenario_registry):
+            self.scenario_registry.load_bundle(self.scenario_bundle_path)
+
         try:
-            self.default_scenarios = load_all_scenario_files(self.scenarios_directory)
+            self.default_scenarios = load_all_scenario_files(
+                self.scenarios_directory,
+                registry=self.scenario_registry
+            )
             logger.info(f"Loaded {len(self.default_scenarios)} scenarios from {self.scenarios_directory}")
         except Exception as e:
             logger.error(f"Failed to load default scenarios: {e}")
             self.default_scenarios = []
 
+        if self.scenario_bundle_path and self.scenario_registry.dirty:
+            try:
+                self.scenario_registry.save_bundle(self.scenario_bundle_path)
+            except OSError as e:
+                logger.warning(f"Could not save scenario bundle: {e}")
+
     def analyze_clients(
         self,
-        clients: List[Dict[str, Any]],
+        clients: Union[List[ClientProfile], Iterable[ClientProfile]],
         scenarios: Optional[List[Dict[str, Any]]] = None,
         min_match_threshold: float = 60.0,
         ranking_strategy: str = "composite",
@@ -146,7 +214,9 @@ class OpportunityIQAgent:
         5. Generate report
 
         Args:
-            clients: List of client profile dictionaries
+            clients: List of client profiles, or an iterator of them (e.g.
+                from iter_clients_from_file) to match clients as they are
+                read instead of loading the whole book first
             scenarios: Optional list of scenario dictionaries (uses defaults if None)
             min_match_threshold: Minimum match score required (0-100)
             ranking_strategy: How to rank ("composite", "revenue", "match_score", "priority")
@@ -164,7 +234,16 @@ class OpportunityIQAgent:
         Raises:
             ValueError: If inputs are invalid
         """
-        logger.info(f"Starting client analysis for {len(clients)} clients")
+        streaming = not isinstance(clients, (list, tuple))
+
+        # With a limit, match into compact records and build full
+        # Opportunity models only for the top results
+        compact = self.match_store is None and limit is not None and limit > 0
+
+        if streaming:
+            logger.info("Starting client analysis for streamed clients")
+        else:
+            logger.info(f"Starting client analysis for {len(clients)} clients")
 
         # 1. Load scenarios
         if scenarios is None:
@@ -176,15 +255,44 @@ class OpportunityIQAgent:
             scenarios_to_use = scenarios
             logger.info(f"Using {len(scenarios_to_use)} provided scenarios")
 
+        # Library scenarios are compiled once per process and reused
+        compiled_scenarios = self.scenario_registry.compile(scenarios_to_use)
+
         # 2. Match clients to scenarios
         logger.info("Matching clients to scenarios...")
-        opportunities = match_clients_to_scenarios(
-            clients=clients,
-            scenarios=scenarios_to_use,
-            min_match_threshold=min_match_threshold
-        )
-
-        logger.info(f"Found {len(opportunities)} opportunities")
+        if self.match_store is not None:
+            # Serve unchanged client-scenario pairs from the match store
+            client_counter = _CountingIterator(clients)
+            opportunities = match_clients_incremental(
+                clients=client_counter,
+                scenarios=compiled_scenarios,
+                store=self.match_store,
+                min_match_threshold=min_match_threshold
+            )
+            streaming = True
+        elif compact:
+            client_counter = _CountingIterator(clients)
+            opportunities = stream_compact_matches(
+                clients=client_counter,
+                scenarios=compiled_scenarios,
+                min_match_threshold=min_match_threshold
+            )
+            streaming = True
+        elif streaming:
+            client_counter = _CountingIterator(clients)
+            opportunities = stream_client_matches(
+                clients=client_counter,
+                scenarios=compiled_scenarios,
+                min_match_threshold=min_match_threshold
+            )
+        else:
+            opportunities = match_clients_to_scenarios(
+                clients=clients,
+                scenarios=compiled_scenarios,
+                min_match_threshold=min_match_threshold
+            )
+            clients_count = len(clients)
+            logger.info(f"Found {len(opportunities)} opportunities")
 
         # 3. Calculate revenue for each opportunity (if not already calculated)
         # Note: Revenue is calculated during matching, so this is a no-op currently
@@ -192,17 +300,42 @@ class OpportunityIQAgent:
 
         # 4. Rank opportunities
         logger.info(f"Ranking opportunities using {ranking_strategy} strategy...")
-        ranked_opportunities = rank_opportunities(
-            opportunities=opportunities,
-            ranking_strategy=ranking_strategy,
-            match_weight=match_weight,
-            revenue_weight=revenue_weight,
-            limit=limit
-        )
+        if streaming and limit is not None and limit > 0:
+            # Keep only the top `limit` matches in memory while streaming
+            opportunity_counter = _CountingIterator(opportunities)
+            ranked_opportunities = rank_top_opportunities(
+                opportunities=opportunity_counter,
+                top_n=limit,
+                ranking_strategy=ranking_strategy,
+                match_weight=match_weight,
+                revenue_weight=revenue_weight
+            )
+            clients_count = client_counter.count
+            logger.info(f"Found {opportunity_counter.count} opportunities")
 
-        # Calculate summary statistics
-        total_revenue = sum(opp.estimated_revenue for opp in ranked_opportunities)
-        avg_match_score = sum(opp.match_score for opp in ranked_opportunities) / len(ranked_opportunities) if ranked_opportunities else 0
+            if not ranked_opportunities:
+                raise ValueError("Cannot rank empty opportunities list")
+
+            if compact:
+                ranked_opportunities = materialize_opportunities(ranked_opportunities)
+        else:
+            if streaming:
+                opportunities = list(opportunities)
+                clients_count = client_counter.count
+                logger.info(f"Found {len(opportunities)} opportunities")
+
+            ranked_opportunities = rank_opportunities(
+                opportunities=opportunities,
+                ranking_strategy=ranking_strategy,
+                match_weight=match_weight,
+                revenue_weight=revenue_weight,
+                limit=limit
+            )
+
+        # Calculate summary statistics (shared with the report)
+        stats = OpportunityStats.from_opportunities(ranked_opportunities)
+        total_revenue = stats.total_revenue
+        avg_match_score = stats.average_match_score if ranked_opportunities else 0
 
         logger.info(f"Ranked {len(ranked_opportunities)} opportunities")
         logger.info(f"Total revenue potential: ${total_revenue:.2f}")
@@ -211,7 +344,8 @@ class OpportunityIQAgent:
         logger.info(f"Generating {report_format} report...")
         report = generate_report(
             opportunities=ranked_opportunities,
-            format=report_format
+            format=report_format,
+            stats=stats
         )
 
         # Return comprehensive results
@@ -219,7 +353,7 @@ class OpportunityIQAgent:
             "total_opportunities": len(ranked_opportunities),
             "total_revenue": total_revenue,
             "average_match_score": avg_match_score,
-            "clients_analyzed": len(clients),
+            "clients_analyzed": clients_count,
             "scenarios_used": len(scenarios_to_use)
         }
 
@@ -233,51 +367,111 @@ class OpportunityIQAgent:
                 "match_weight": match_weight,
                 "revenue_weight": revenue_weight,
                 "scenarios_count": len(scenarios_to_use),
-                "clients_count": len(clients)
+                "clients_count": clients_count
             }
         }
 
+    def export_matches(
+        self,
+        clients: Union[List[ClientProfile], Iterable[ClientProfile]],
+        output_file: str,
+        scenarios: Optional[List[Dict[str, Any]]] = None,
+        min_match_threshold: float = 60.0,
+        format: Optional[str] = None,
+        compression: Optional[str] = None
+    ) -> int:
+        """
+        Stream every matched opportunity straight to a file.
+
+        Opportunities are written as clients are matched, unranked and in
+        match order, so a firm-wide export never holds the full list.
+
+        Args:
+            clients: List of client profiles, or an iterator of them
+            output_file: Path to write (.csv, .ndjson/.jsonl, .md or
+                .parquet, optionally followed by .gz/.bz2/.xz)
+            scenarios: Optional list of scenario dictionaries (uses defaults if None)
+            min_match_threshold: Minimum match score required (0-100)
+            format: Export format (default: from the file extension)
+            compression: Compression (default: from the file extension)
+
+        Returns:
+            Number of opportunities written
+
+        Raises:
+            ValueError: If no scenarios are available or the format is unsupported
+        """
+        scenarios_to_use = scenarios if scenarios is not None else self.default_scenarios
+        if not scenarios_to_use:
+            raise ValueError("No scenarios available. Provide scenarios or check scenarios directory.")
+
+        compiled_scenarios = self.scenario_registry.compile(scenarios_to_use)
+
+        if self.match_store is not None:
+            opportunities = match_clients_incremental(
+                clients=clients,
+                scenarios=compiled_scenarios,
+                store=self.match_store,
+                min_match_threshold=min_match_threshold
+            )
+        else:
+            opportunities = stream_client_matches(
+                clients=clients,
+                scenarios=compiled_scenarios,
+                min_match_threshold=min_match_threshold
+            )
+
+        return export_opportunities(
+            opportunities=opportunities,
+            output_file=output_file,
+            format=format,
+            compression=compression
+        )
+
     def load_clients_from_file(self, file_path: str) -> List[ClientProfile]:
         """
-        Load client data from JSON file.
+        Load client data from a JSON, NDJSON or CSV file.
 
         Args:
-            file_path: Path to JSON file containing client data
+            file_path: Path to file containing client data
 
         Returns:
             List of ClientProfile objects
 
         Raises:
             FileNotFoundError: If file does not exist
-            ValueError: If JSON is invalid or validation fails
+            ValueError: If the file is malformed or its format unsupported
         """
-        path = Path(file_path)
+        return list(self.iter_clients_from_file(file_path))
 
-        if not path.exists():
-            raise FileNotFoundError(f"Client data file not found: {file_path}")
+    def iter_clients_from_file(self, file_path: str) -> Iterator[ClientProfile]:
+        """
+        Stream client data from a JSON, NDJSON or CSV file.
 
-        try:
-            with open(path, 'r') as f:
-                clients_data = json.load(f)
+        Records are parsed incrementally and validated as they are consumed;
+        invalid records are logged and skipped. Pass the iterator straight
+        to analyze_clients() so matching starts before the file is fully
+        read and the raw book is never held in memory.
+
+        Args:
+            file_path: Path to file containing client data
+
+        Returns:
+            Iterator of ClientProfile objects
 
-            if not isinstance(clients_data, list):
-                raise ValueError("Client data must be a JSON array")
+        Raises:
+            FileNotFoundError: If file does not exist
+            ValueError: If the file extension is unsupported
+        """
+        path = Path(file_path)
 
-            # Convert dictionaries to ClientProfile objects
-            clients = []
-            for i, client_dict in enumerate(clients_data):
-                try:
-                    client = ClientProfile(**client_dict)
-                    clients.append(client)
-                except Exception as e:
-                    logger.warning(f"Skipping client at index {i} due to validation error: {e}")
-                    continue
+        if not path.exists():
+            raise FileNotFoundError(f"Client data file not found: {file_path}")
 
-            logger.info(f"Loaded {len(clients)} clients from: {file_path}")
-            return clients
+        # Fail fast on unsupported extensions rather than on first read
+        detect_client_format(path)
 
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in client data file: {e}")
+        return iter_clients(path)
 
     def load_scenarios_from_directory(self, directory: str) -> List[Dict[str, Any]]:
         """
@@ -292,7 +486,7 @@ class OpportunityIQAgent:
         Raises:
             ValueError: If directory doesn't exist or contains no valid scenarios
         """
-        scenarios = load_all_scenario_files(directory)
+        scenarios = load_all_scenario_files(directory, registry=self.scenario_registry)
 
         if not scenarios:
             raise ValueError(f"No valid scenarios found in directory: {directory}")
@@ -338,7 +532,7 @@ class OpportunityIQAgent:
         logger.info("=== OpportunityIQ Quick Analysis ===")
 
         # Load clients
-        clients = self.load_clients_from_file(clients_file)
+        clients = self.iter_clients_from_file(clients_file)
 
         # Load scenarios if directory provided
         scenarios = None
@@ -394,7 +588,8 @@ class OpportunityIQAgent:
     def generate_insights_with_llm(
         self,
         opportunities: List[Opportunity],
-        top_n: int = 5
+        top_n: int = 5,
+        max_concurrency: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Generate AI-powered insights for top opportunities using Claude.
@@ -405,110 +600,398 @@ class OpportunityIQAgent:
         - Risk considerations and potential objections
         - Recommended next steps
 
+        Requests run concurrently (at most max_concurrency in flight), so
+        latency for N insights approaches that of a single call. Insights
+        already generated for an identical opportunity are served from the
+        insight cache without calling the API.
+
+        Called from a thread that is already running an event loop (e.g. an
+        async web handler or Jupyter), where asyncio.run() is not allowed,
+        requests are made one at a time with the synchronous client instead;
+        await generate_insights_async() there to keep them concurrent.
+
         Args:
             opportunities: List of matched opportunities
             top_n: Number of top opportunities to analyze (default: 5)
+            max_concurrency: Maximum concurrent API requests
+                (default: INSIGHTS_MAX_CONCURRENCY or 10)
 
         Returns:
-            List of dictionaries with opportunity data + AI insights
+            List of dictionaries with opportunity data + AI insights,
+            in opportunity order
 
         Example:
             insights = agent.generate_insights_with_llm(opportunities, top_n=3)
             for insight in insights:
                 print(f"Client: {insight['client_name']}")
-                print(f"Reasoning: {insight['ai_reasoning']}")
+                print(f"Reasoning: {insight['ai_insights']}")
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(
+                self.generate_insights_async(
+                    opportunities,
+                    top_n=top_n,
+                    max_concurrency=max_concurrency
+                )
+            )
+
+        logger.info("Event loop already running; generating insights sequentially")
+        return self._generate_insights_sync(opportunities, top_n=top_n)
+
+    async def generate_insights_async(
+        self,
+        opportunities: List[Opportunity],
+        top_n: int = 5,
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of generate_insights_with_llm().
+
+        Args:
+            opportunities: List of matched opportunities
+            top_n: Number of top opportunities to analyze (default: 5)
+            max_concurrency: Maximum concurrent API requests
+                (default: INSIGHTS_MAX_CONCURRENCY or 10)
+
+        Returns:
+            List of dictionaries with opportunity data + AI insights,
+            in opportunity order
         """
         logger.info(f"Generating AI insights for top {top_n} opportunities...")
 
         # Select top N opportunities
         top_opportunities = opportunities[:top_n]
-        insights = []
 
-        for idx, opp in enumerate(top_opportunities, 1):
-            logger.info(f"Generating insights for opportunity {idx}/{len(top_opportunities)}: {opp.client_name} - {opp.scenario_name}")
+        max_concurrency = max_concurrency or self.insights_max_concurrency
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        insights, pending = self._cached_insights(top_opportunities)
+
+        if pending:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async with AsyncAnthropic(api_key=self.api_key) as client:
+
+                async def generate(cache_key: str, requests: List[tuple]) -> None:
+                    idx, opp = requests[0]
+                    async with semaphore:
+                        logger.info(
+                            f"Generating insights for opportunity {idx}/{len(top_opportunities)}: "
+                            f"{opp.client_name} - {opp.scenario_name}"
+                        )
+                        try:
+                            response = await client.messages.create(
+                                **self._insight_request_params(opp)
+                            )
+                        except Exception as e:
+                            logger.error(f"  Failed to generate insights: {e}")
+                            # Return opportunity without insights on error
+                            for idx, opp in requests:
+                                insights[idx - 1] = self._insight_error(opp, idx, e)
+                            return
+
+                    result = self._record_insight(opp, idx, cache_key, response)
+                    insights[idx - 1] = result
+                    for idx, opp in requests[1:]:
+                        insights[idx - 1] = self._insight_result(
+                            opp, idx, result["ai_insights"], result["tokens_used"], cached=True
+                        )
+
+                await asyncio.gather(*(
+                    generate(cache_key, requests) for cache_key, requests in pending.items()
+                ))
+
+        self._log_insight_totals(insights, pending)
 
-            # Build context prompt
-            prompt = f"""You are a financial advisor assistant analyzing a revenue opportunity.
+        return insights
 
-**Opportunity Overview:**
-- Client: {opp.client_name}
-- Opportunity: {opp.scenario_name}
-- Match Score: {opp.match_score:.1f}%
-- Estimated Revenue: ${opp.estimated_revenue:,.2f}
-- Priority: {getattr(opp, 'priority', 'medium')}
+    def _generate_insights_sync(
+        self,
+        opportunities: List[Opportunity],
+        top_n: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate insights one request at a time with the synchronous client.
 
-**Match Details:**
-{self._format_match_details(opp)}
+        Same results and caching as generate_insights_async(); used when
+        generate_insights_with_llm() is called inside a running event loop.
+        """
+        logger.info(f"Generating AI insights for top {top_n} opportunities...")
 
-**Your Task:**
-Generate a concise analysis (200-300 words) with these sections:
+        top_opportunities = opportunities[:top_n]
+        insights, pending = self._cached_insights(top_opportunities)
 
-1. **Why This Fits** (2-3 sentences): Explain why this opportunity makes sense for this specific client based on the match criteria.
+        for cache_key, requests in pending.items():
+            idx, opp = requests[0]
+            logger.info(
+                f"Generating insights for opportunity {idx}/{len(top_opportunities)}: "
+                f"{opp.client_name} - {opp.scenario_name}"
+            )
+            try:
+                response = self.client.messages.create(**self._insight_request_params(opp))
+            except Exception as e:
+                logger.error(f"  Failed to generate insights: {e}")
+                # Return opportunity without insights on error
+                for idx, opp in requests:
+                    insights[idx - 1] = self._insight_error(opp, idx, e)
+                continue
+
+            result = self._record_insight(opp, idx, cache_key, response)
+            insights[idx - 1] = result
+            for idx, opp in requests[1:]:
+                insights[idx - 1] = self._insight_result(
+                    opp, idx, result["ai_insights"], result["tokens_used"], cached=True
+                )
 
-2. **Talking Points** (3-4 bullet points): Key points the advisor should emphasize when discussing this with the client.
+        self._log_insight_totals(insights, pending)
 
-3. **Considerations** (2-3 bullet points): Potential risks, objections, or important factors to address.
+        return insights
 
-4. **Next Steps** (2-3 action items): Specific, actionable steps the advisor should take.
+    def _cached_insights(
+        self,
+        top_opportunities: List[Opportunity]
+    ) -> tuple[List[Optional[Dict[str, Any]]], Dict[str, List[tuple]]]:
+        """
+        Serve insights from the cache and group the rest by prompt.
 
-Keep the tone professional but conversational. Focus on practical, actionable insights."""
+        Returns:
+            Tuple of (insights, pending): insights in opportunity order (None
+            where still to generate), and (idx, opportunity) pairs to
+            generate keyed by cache key, so identical prompts are requested once
+        """
+        insights: List[Optional[Dict[str, Any]]] = [None] * len(top_opportunities)
+        pending: Dict[str, List[tuple]] = {}
 
-            try:
-                # Call Claude API
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=1024,
-                    temperature=0.7,
-                    messages=[{
-                        "role": "user",
-                        "content": prompt
-                    }]
+        for idx, opp in enumerate(top_opportunities, 1):
+            cache_key = insight_cache_key(opp, self.model)
+            cached = self.insight_cache.get(cache_key)
+
+            if cached is not None:
+                insight_text, tokens_used = cached
+                logger.info(
+                    f"Using cached insights for opportunity {idx}/{len(top_opportunities)}: "
+                    f"{opp.client_name} - {opp.scenario_name}"
                 )
+                insights[idx - 1] = self._insight_result(
+                    opp, idx, insight_text, tokens_used, cached=True
+                )
+            else:
+                pending.setdefault(cache_key, []).append((idx, opp))
 
-                # Extract insight text
-                insight_text = response.content[0].text
-
-                # Track token usage
-                input_tokens = response.usage.input_tokens
-                output_tokens = response.usage.output_tokens
-                total_tokens = input_tokens + output_tokens
-
-                logger.info(f"  Generated insights ({total_tokens} tokens: {input_tokens} in, {output_tokens} out)")
-
-                # Build enhanced opportunity dict
-                insights.append({
-                    "rank": getattr(opp, 'rank', idx),
-                    "client_name": opp.client_name,
-                    "scenario_name": opp.scenario_name,
-                    "match_score": opp.match_score,
-                    "estimated_revenue": opp.estimated_revenue,
-                    "priority": getattr(opp, 'priority', 'medium'),
-                    "ai_insights": insight_text,
-                    "tokens_used": total_tokens,
-                    "opportunity": opp  # Include original object
-                })
+        return insights, pending
 
-            except Exception as e:
-                logger.error(f"  Failed to generate insights: {e}")
-                # Return opportunity without insights on error
-                insights.append({
-                    "rank": getattr(opp, 'rank', idx),
-                    "client_name": opp.client_name,
-                    "scenario_name": opp.scenario_name,
-                    "match_score": opp.match_score,
-                    "estimated_revenue": opp.estimated_revenue,
-                    "priority": getattr(opp, 'priority', 'medium'),
-                    "ai_insights": None,
-                    "error": str(e),
-                    "opportunity": opp
+    def _log_insight_totals(
+        self,
+        insights: List[Dict[str, Any]],
+        pending: Dict[str, List[tuple]]
+    ) -> None:
+        """Log tokens used by newly generated insights."""
+        # Calculate total tokens
+        total_tokens = sum(
+            i.get('tokens_used', 0) for i in insights if not i.get('cached')
+        )
+        logger.info(
+            f"AI insights generation complete. Total tokens: {total_tokens} "
+            f"({len(insights) - sum(len(r) for r in pending.values())} served from cache)"
+        )
+
+    def submit_insights_batch(
+        self,
+        opportunities: List[Opportunity],
+        top_n: int = 5
+    ) -> Optional[str]:
+        """
+        Submit insight requests through the Message Batches API.
+
+        For overnight runs: batches are processed asynchronously at a lower
+        cost. Opportunities with cached insights are not resubmitted.
+        Collect the results later with collect_insights_batch().
+
+        Args:
+            opportunities: List of matched opportunities
+            top_n: Number of top opportunities to analyze (default: 5)
+
+        Returns:
+            Batch ID, or None if every insight was already cached
+        """
+        requests = []
+        for idx, opp in enumerate(opportunities[:top_n], 1):
+            cache_key = insight_cache_key(opp, self.model)
+            if self.insight_cache.get(cache_key) is None:
+                requests.append({
+                    "custom_id": f"insight-{idx}",
+                    "params": self._insight_request_params(opp)
                 })
 
-        # Calculate total tokens
-        total_tokens = sum(i.get('tokens_used', 0) for i in insights)
-        logger.info(f"AI insights generation complete. Total tokens: {total_tokens}")
+        if not requests:
+            logger.info("All insights already cached; no batch submitted")
+            return None
+
+        batch = self.client.messages.batches.create(requests=requests)
+        logger.info(f"Submitted insights batch {batch.id} with {len(requests)} requests")
+        return batch.id
+
+    def collect_insights_batch(
+        self,
+        batch_id: Optional[str],
+        opportunities: List[Opportunity],
+        top_n: int = 5
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Collect the results of a batch from submit_insights_batch().
+
+        Pass the same opportunities (in the same order) and top_n used to
+        submit the batch. Generated insights are added to the insight cache.
+
+        Args:
+            batch_id: ID returned by submit_insights_batch() (None if
+                nothing was submitted)
+            opportunities: List of matched opportunities
+            top_n: Number of top opportunities analyzed (default: 5)
+
+        Returns:
+            List of dictionaries with opportunity data + AI insights, or
+            None if the batch is still processing
+        """
+        top_opportunities = opportunities[:top_n]
+        responses: Dict[str, Any] = {}
+
+        if batch_id is not None:
+            batch = self.client.messages.batches.retrieve(batch_id)
+            if batch.processing_status != "ended":
+                logger.info(f"Insights batch {batch_id} is still {batch.processing_status}")
+                return None
+
+            for entry in self.client.messages.batches.results(batch_id):
+                responses[entry.custom_id] = entry.result
+
+        insights = []
+        for idx, opp in enumerate(top_opportunities, 1):
+            cache_key = insight_cache_key(opp, self.model)
+            cached = self.insight_cache.get(cache_key)
+            result = responses.get(f"insight-{idx}")
+
+            if result is not None and result.type == "succeeded":
+                insights.append(self._record_insight(opp, idx, cache_key, result.message))
+            elif cached is not None:
+                insight_text, tokens_used = cached
+                insights.append(
+                    self._insight_result(opp, idx, insight_text, tokens_used, cached=True)
+                )
+            else:
+                if result is None:
+                    error = "No result in batch"
+                else:
+                    error = getattr(result, "error", None) or f"Batch request {result.type}"
+                logger.error(f"  Failed to generate insights: {error}")
+                insights.append(self._insight_error(opp, idx, error))
 
         return insights
 
+    def _insight_request_params(self, opportunity: Opportunity) -> Dict[str, Any]:
+        """
+        Build Messages API parameters for one opportunity's insight.
+
+        The shared instruction block is sent as a cached system prompt, so
+        repeated requests reuse the prefix; only the opportunity-specific
+        details vary per request.
+        """
+        prompt = f"""**Opportunity Overview:**
+- Client: {opportunity.client_name}
+- Opportunity: {opportunity.scenario_name}
+- Match Score: {opportunity.match_score:.1f}%
+- Estimated Revenue: ${opportunity.estimated_revenue:,.2f}
+- Priority: {getattr(opportunity, 'priority', 'medium')}
+
+**Match Details:**
+{self._format_match_details(opportunity)}"""
+
+        return {
+            "model": self.model,
+            "max_tokens": 1024,
+            "temperature": 0.7,
+            "system": [{
+                "type": "text",
+                "text": INSIGHT_INSTRUCTIONS,
+                "cache_control": {"type": "ephemeral"}
+            }],
+            "messages": [{
+                "role": "user",
+                "content": prompt
+            }]
+        }
+
+    def _record_insight(
+        self,
+        opportunity: Opportunity,
+        idx: int,
+        cache_key: str,
+        response: Any
+    ) -> Dict[str, Any]:
+        """Cache a Messages API response and build its insight result."""
+        # Extract insight text
+        insight_text = response.content[0].text
+
+        # Track token usage
+        usage = response.usage
+        input_tokens = usage.input_tokens
+        output_tokens = usage.output_tokens
+        total_tokens = input_tokens + output_tokens
+        cache_read_tokens = getattr(usage, "cache_read_input_tokens", None) or 0
+
+        logger.info(
+            f"  Generated insights ({total_tokens} tokens: {input_tokens} in, "
+            f"{output_tokens} out, {cache_read_tokens} prompt tokens from cache)"
+        )
+
+        self.insight_cache.put(cache_key, insight_text, total_tokens)
+
+        return self._insight_result(opportunity, idx, insight_text, total_tokens)
+
+    def _insight_result(
+        self,
+        opportunity: Opportunity,
+        idx: int,
+        insight_text: str,
+        tokens_used: int,
+        cached: bool = False
+    ) -> Dict[str, Any]:
+        """Build the enhanced opportunity dict for a generated insight."""
+        return {
+            "rank": getattr(opportunity, 'rank', idx),
+            "client_name": opportunity.client_name,
+            "scenario_name": opportunity.scenario_name,
+            "match_score": opportunity.match_score,
+            "estimated_revenue": opportunity.estimated_revenue,
+            "priority": getattr(opportunity, 'priority', 'medium'),
+            "ai_insights": insight_text,
+            "tokens_used": tokens_used,
+            "cached": cached,
+            "opportunity": opportunity  # Include original object
+        }
+
+    def _insight_error(
+        self,
+        opportunity: Opportunity,
+        idx: int,
+        error: Any
+    ) -> Dict[str, Any]:
+        """Build the opportunity dict for an insight that failed."""
+        return {
+            "rank": getattr(opportunity, 'rank', idx),
+            "client_name": opportunity.client_name,
+            "scenario_name": opportunity.scenario_name,
+            "match_score": opportunity.match_score,
+            "estimated_revenue": opportunity.estimated_revenue,
+            "priority": getattr(opportunity, 'priority', 'medium'),
+            "ai_insights": None,
+            "error": str(error),
+            "opportunity": opportunity
+        }
+
     def _format_match_details(self, opportunity: Opportunity) -> str:
         """Format match details for LLM prompt."""
         if not opportunity.match_details:
@@ -526,6 +1009,22 @@ Keep the tone professional but conversational. Focus on practical, actionable in
         return "\n".join(details)
 
 
+class _CountingIterator:
+    """Iterator wrapper that counts the items consumed from it."""
+
+    def __init__(self, items: Iterable[Any]):
+        self._items = iter(items)
+        self.count = 0
+
+    def __iter__(self) -> "_CountingIterator":
+        return self
+
+    def __next__(self) -> Any:
+        item = next(self._items)
+        self.count += 1
+        return item
+
+
 def main():
     """
     Example usage of OpportunityIQ Agent.
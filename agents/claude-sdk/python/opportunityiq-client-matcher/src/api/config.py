@@ -50,6 +50,14 @@ class APISettings(BaseSettings):
     default_match_weight: float = 0.4
     default_revenue_weight: float = 0.6
     default_ranking_strategy: str = "composite"
+
+    # Scenario Library
+    scenario_reload_interval: float = 2.0  # Seconds between change checks (0 disables hot reload)
+    scenario_bundle_path: str = ""  # Optional scenario bundle for fast startup
+    scenario_calibration_clients: str = "data/clients/sample-clients.json"  # Client file sampled to order criteria ("" disables)
+
+    # Streaming Responses
+    stream_chunk_size: int = 100  # Opportunities per streamed chunk
     
     # API Security (optional for MVP)
     api_key: str = ""  # Optional API key for authentication
@@ -0,0 +1,19 @@
+"""
+API Dependencies
+
+Shared FastAPI dependencies for route handlers.
+
+Biblical Principle: SERVE - One preloaded scenario library shared by every request
+"""
+
+from fastapi import HTTPException, Request
+
+from src.api.scenario_library import ScenarioLibrary
+
+
+def get_scenario_library(request: Request) -> ScenarioLibrary:
+    """Dependency returning the scenario library loaded at startup."""
+    library = getattr(request.app.state, "scenario_library", None)
+    if library is None:
+        raise HTTPException(status_code=503, detail="Scenario library not loaded")
+    return library
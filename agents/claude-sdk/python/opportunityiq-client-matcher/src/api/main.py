@@ -0,0 +1,170 @@
+"""
+FastAPI Main Application for OpportunityIQ Client Matcher.
+
+Long-running HTTP service: scenarios are loaded and compiled once at
+startup and hot-reloaded when the scenarios directory changes, so each
+request only pays for matching.
+
+Run:
+    uvicorn src.api.main:app --host 0.0.0.0 --port 8000
+    python -m src.api.main
+
+Biblical Principle: SERVE - Simple, accessible API for powerful opportunity matching.
+Biblical Principle: EXCELLENCE - Production-ready API with comprehensive error handling.
+"""
+
+import asyncio
+import contextlib
+import logging
+import sys
+from contextlib import asynccontextmanager
+from itertools import islice
+from pathlib import Path
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+from src.api import __version__
+from src.api.config import settings
+from src.api.routes import analysis, reports, scenarios
+from src.api.scenario_library import ScenarioLibrary
+from src.models import ClientProfile
+from src.tools import iter_clients
+from src.tools.match_clients import CALIBRATION_SAMPLE_SIZE
+
+# Configure logging
+logging.basicConfig(
+    level=getattr(logging, settings.log_level.upper()),
+    format=settings.log_format,
+    handlers=[
+        logging.FileHandler(settings.logs_dir / "api.log"),
+        logging.StreamHandler(sys.stdout),
+    ],
+)
+logger = logging.getLogger(__name__)
+
+
+def load_calibration_clients() -> list[ClientProfile]:
+    """Sample of clients used to calibrate library scenarios (empty if unavailable)."""
+    path = settings.scenario_calibration_clients
+    if not path or not Path(path).exists():
+        return []
+
+    try:
+        return list(islice(iter_clients(path), CALIBRATION_SAMPLE_SIZE))
+    except Exception as e:
+        logger.warning(f"Could not load calibration clients from {path}: {e}")
+        return []
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load the scenario library at startup and watch it for changes."""
+    logger.info("=" * 80)
+    logger.info("OpportunityIQ API Starting")
+    logger.info("=" * 80)
+    logger.info(f"Host: {settings.api_host}:{settings.api_port}")
+    logger.info(f"Scenarios Directory: {settings.scenarios_directory}")
+
+    calibration_clients = await asyncio.to_thread(load_calibration_clients)
+    library = ScenarioLibrary(
+        settings.scenarios_directory,
+        calibration_clients=calibration_clients
+    )
+    if settings.scenario_bundle_path:
+        await asyncio.to_thread(library.registry.load_bundle, settings.scenario_bundle_path)
+    await asyncio.to_thread(library.load)
+    if settings.scenario_bundle_path and library.registry.dirty:
+        await asyncio.to_thread(library.registry.save_bundle, settings.scenario_bundle_path)
+    app.state.scenario_library = library
+
+    watcher = None
+    if settings.scenario_reload_interval > 0:
+        watcher = asyncio.create_task(library.watch(settings.scenario_reload_interval))
+
+    logger.info("API Ready")
+
+    yield  # Application runs here
+
+    if watcher is not None:
+        watcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await watcher
+
+    logger.info("OpportunityIQ API Shutting Down")
+
+
+# Create FastAPI app
+app = FastAPI(
+    title="OpportunityIQ Client Matcher API",
+    description="Match financial advisor clients to revenue opportunity scenarios",
+    version=__version__,
+    lifespan=lifespan,
+    docs_url="/api/docs",
+    redoc_url="/api/redoc",
+    openapi_url="/api/openapi.json",
+)
+
+# CORS Middleware
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.cors_origins,
+    allow_credentials=settings.cors_credentials,
+    allow_methods=settings.cors_methods,
+    allow_headers=settings.cors_headers,
+)
+
+
+@app.exception_handler(Exception)
+async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    """Global exception handler."""
+    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    return JSONResponse(
+        status_code=500,
+        content={
+            "error": "Internal server error",
+            "message": str(exc),
+            "type": type(exc).__name__,
+        },
+    )
+
+
+@app.get("/")
+async def root():
+    """Root endpoint - API information."""
+    return {
+        "name": "OpportunityIQ Client Matcher API",
+        "version": __version__,
+        "status": "operational",
+        "docs": "/api/docs",
+    }
+
+
+@app.get("/health")
+async def health_check(request: Request):
+    """Health check endpoint."""
+    library = getattr(request.app.state, "scenario_library", None)
+    return {
+        "status": "healthy" if library is not None else "starting",
+        "api_version": __version__,
+        "scenarios_loaded": len(library) if library is not None else 0,
+        "scenario_library_version": library.version if library is not None else 0,
+    }
+
+
+app.include_router(analysis.router, prefix="/api", tags=["Analysis"])
+app.include_router(reports.router, prefix="/api", tags=["Reports"])
+app.include_router(scenarios.router, prefix="/api", tags=["Scenarios"])
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "src.api.main:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        reload=settings.api_reload,
+        log_level=settings.log_level.lower(),
+    )
@@ -0,0 +1,5 @@
+"""
+OpportunityIQ Client Matcher - API Routes
+
+Endpoint modules registered by src.api.main.
+"""
@@ -0,0 +1,173 @@
+"""
+Analysis API endpoints.
+
+Match and rank clients against the preloaded scenario library. Responses
+are streamed as NDJSON (one Opportunity JSON per line).
+
+Biblical Principle: SERVE - Per-request cost is only the matching work
+"""
+
+import logging
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from src.api.config import settings
+from src.api.dependencies import get_scenario_library
+from src.api.scenario_library import ScenarioLibrary
+from src.api.streaming import NDJSON_MEDIA_TYPE, ndjson_chunks
+from src.models import ClientProfile, Opportunity
+from src.services.scenario_compiler import CompiledScenario
+from src.tools import (
+    materialize_opportunities,
+    rank_opportunities,
+    rank_top_opportunities,
+    stream_client_matches,
+    stream_compact_matches
+)
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+class MatchRequest(BaseModel):
+    """Request model for the match endpoint."""
+    clients: List[ClientProfile]
+    scenario_ids: Optional[List[str]] = Field(
+        default=None,
+        description="Scenario IDs to match against (default: all loaded scenarios)"
+    )
+    min_match_threshold: float = Field(
+        default=settings.min_match_threshold,
+        ge=0.0,
+        le=100.0
+    )
+
+
+class RankRequest(MatchRequest):
+    """Request model for the rank endpoint."""
+    ranking_strategy: Literal["composite", "revenue", "match_score", "priority"] = (
+        settings.default_ranking_strategy
+    )
+    match_weight: float = Field(default=settings.default_match_weight, ge=0.0, le=1.0)
+    revenue_weight: float = Field(default=settings.default_revenue_weight, ge=0.0, le=1.0)
+    limit: Optional[int] = Field(default=None, ge=1)
+
+
+def select_scenarios(
+    library: ScenarioLibrary,
+    scenario_ids: Optional[List[str]]
+) -> list[CompiledScenario]:
+    """Compiled scenarios for a request (404 for unknown IDs)."""
+    try:
+        return library.select(scenario_ids)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=e.args[0])
+
+
+def rank_matches(
+    request: RankRequest,
+    compiled_scenarios: list[CompiledScenario]
+) -> list[Opportunity]:
+    """
+    Match and rank a request's clients.
+
+    With a limit, matches are ranked as compact records and only the top
+    results are built into full Opportunity models.
+
+    Returns:
+        Ranked opportunities (empty if nothing matched)
+
+    Raises:
+        ValueError: If the ranking weights are invalid
+    """
+    if request.limit is not None:
+        records = stream_compact_matches(
+            clients=request.clients,
+            scenarios=compiled_scenarios,
+            min_match_threshold=request.min_match_threshold,
+            calibrate=False
+        )
+        top = rank_top_opportunities(
+            opportunities=records,
+            top_n=request.limit,
+            ranking_strategy=request.ranking_strategy,
+            match_weight=request.match_weight,
+            revenue_weight=request.revenue_weight
+        )
+        return materialize_opportunities(top)
+
+    opportunities = list(stream_client_matches(
+        clients=request.clients,
+        scenarios=compiled_scenarios,
+        min_match_threshold=request.min_match_threshold,
+        calibrate=False
+    ))
+    if not opportunities:
+        return []
+
+    return rank_opportunities(
+        opportunities=opportunities,
+        ranking_strategy=request.ranking_strategy,
+        match_weight=request.match_weight,
+        revenue_weight=request.revenue_weight
+    )
+
+
+@router.post("/match")
+async def match_clients(
+    request: MatchRequest,
+    library: ScenarioLibrary = Depends(get_scenario_library)
+) -> StreamingResponse:
+    """
+    Match clients to scenarios.
+
+    Streams every opportunity above the threshold as NDJSON, in client
+    order, while matching is still running.
+    """
+    compiled_scenarios = select_scenarios(library, request.scenario_ids)
+
+    logger.info(
+        f"Matching {len(request.clients)} clients against "
+        f"{len(compiled_scenarios)} scenarios (library v{library.version})"
+    )
+
+    opportunities = stream_client_matches(
+        clients=request.clients,
+        scenarios=compiled_scenarios,
+        min_match_threshold=request.min_match_threshold,
+        calibrate=False
+    )
+
+    return StreamingResponse(
+        ndjson_chunks(opportunities, settings.stream_chunk_size),
+        media_type=NDJSON_MEDIA_TYPE
+    )
+
+
+@router.post("/rank")
+async def rank_clients(
+    request: RankRequest,
+    library: ScenarioLibrary = Depends(get_scenario_library)
+) -> StreamingResponse:
+    """
+    Match clients and rank the opportunities.
+
+    Streams ranked opportunities (best first) as NDJSON.
+    """
+    compiled_scenarios = select_scenarios(library, request.scenario_ids)
+
+    try:
+        ranked = await run_in_threadpool(rank_matches, request, compiled_scenarios)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    logger.info(f"Ranked {len(ranked)} opportunities for {len(request.clients)} clients")
+
+    return StreamingResponse(
+        ndjson_chunks(ranked, settings.stream_chunk_size),
+        media_type=NDJSON_MEDIA_TYPE
+    )
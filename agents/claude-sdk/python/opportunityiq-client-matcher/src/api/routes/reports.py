@@ -0,0 +1,85 @@
+"""
+Report generation endpoints.
+
+Match, rank and report in one request against the preloaded scenario
+library. Markdown reports are streamed line by line.
+
+Biblical Principle: SERVE - Clear, actionable reports on demand
+"""
+
+import logging
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+
+from src.api.config import settings
+from src.api.dependencies import get_scenario_library
+from src.api.routes.analysis import RankRequest, rank_matches, select_scenarios
+from src.api.scenario_library import ScenarioLibrary
+from src.api.streaming import line_chunks
+from src.services.opportunity_stats import OpportunityStats
+from src.services.report_generator import ReportGenerator
+from src.tools import generate_report
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+# Response media type per report format
+REPORT_MEDIA_TYPES = {
+    "markdown": "text/markdown",
+    "text": "text/plain",
+    "json": "application/json",
+    "summary": "text/plain",
+}
+
+
+class ReportRequest(RankRequest):
+    """Request model for the report endpoint."""
+    format: Literal["markdown", "text", "json", "summary"] = "markdown"
+
+
+@router.post("/report")
+async def create_report(
+    request: ReportRequest,
+    library: ScenarioLibrary = Depends(get_scenario_library)
+) -> Response:
+    """
+    Match, rank and generate a report.
+
+    Markdown reports are streamed as they are formatted; other formats are
+    returned whole.
+    """
+    compiled_scenarios = select_scenarios(library, request.scenario_ids)
+
+    try:
+        ranked = await run_in_threadpool(rank_matches, request, compiled_scenarios)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    if not ranked:
+        raise HTTPException(
+            status_code=422,
+            detail="No opportunities matched; lower min_match_threshold or add clients"
+        )
+
+    stats = OpportunityStats.from_opportunities(ranked)
+    media_type = REPORT_MEDIA_TYPES[request.format]
+
+    logger.info(f"Generating {request.format} report for {len(ranked)} opportunities")
+
+    if request.format == "markdown":
+        lines = ReportGenerator().iter_markdown_lines(ranked, stats)
+        return StreamingResponse(
+            line_chunks(lines, settings.stream_chunk_size),
+            media_type=media_type
+        )
+
+    report = await run_in_threadpool(
+        generate_report,
+        opportunities=ranked,
+        format=request.format,
+        stats=stats
+    )
+    return Response(content=report, media_type=media_type)
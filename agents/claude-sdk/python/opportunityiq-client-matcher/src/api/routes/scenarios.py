@@ -0,0 +1,61 @@
+"""
+Scenario management endpoints.
+
+Inspect and reload the preloaded scenario library.
+
+Biblical Principle: TRUTH - Always show which scenarios requests are matched against
+"""
+
+import logging
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from src.api.dependencies import get_scenario_library
+from src.api.scenario_library import ScenarioLibrary
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+def _library_info(library: ScenarioLibrary) -> Dict[str, Any]:
+    """Library version and load time."""
+    return {
+        "directory": str(library.directory),
+        "version": library.version,
+        "loaded_at": library.loaded_at.isoformat() if library.loaded_at else None,
+        "count": len(library),
+    }
+
+
+@router.get("/scenarios")
+async def list_scenarios(
+    library: ScenarioLibrary = Depends(get_scenario_library)
+) -> Dict[str, Any]:
+    """List all loaded scenarios."""
+    info = _library_info(library)
+    info["scenarios"] = [
+        {
+            "scenario_id": s.scenario_id,
+            "name": s.name,
+            "category": s.category,
+            "criteria_count": len(s.criteria)
+        }
+        for s in library.scenarios
+    ]
+    return info
+
+
+@router.post("/scenarios/reload")
+async def reload_scenarios(
+    library: ScenarioLibrary = Depends(get_scenario_library)
+) -> Dict[str, Any]:
+    """Reload and recompile every scenario now."""
+    try:
+        await run_in_threadpool(library.load)
+    except (FileNotFoundError, ValueError) as e:
+        logger.error(f"Scenario reload failed, keeping v{library.version}: {e}")
+        raise HTTPException(status_code=422, detail=str(e))
+
+    return _library_info(library)
@@ -0,0 +1,191 @@
+"""
+Preloaded Scenario Library
+
+Loads and compiles every scenario in the scenarios directory once, so API
+requests only pay for matching. The directory is polled for changes
+(added, removed or modified JSON files) and the library is reloaded in the
+background; requests in flight keep the snapshot they started with. Loads
+go through the scenario registry, so a reload only re-validates and
+recompiles the files that changed.
+
+Scenarios are calibrated (criterion evaluation order) against a sample of
+clients when they are compiled, before they become visible to requests;
+requests match with calibrate=False and never mutate shared scenarios.
+
+Biblical Principle: EXCELLENCE - Do the expensive work once, not per request
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from src.models import ClientProfile, Scenario
+from src.services.scenario_compiler import CompiledScenario
+from src.services.scenario_registry import ScenarioRegistry, default_registry
+from src.tools import load_all_scenario_files
+
+logger = logging.getLogger(__name__)
+
+
+# (path, mtime_ns, size) of every scenario file
+DirectorySignature = tuple[tuple[str, int, int], ...]
+
+
+class ScenarioLibrary:
+    """
+    Compiled scenarios for a directory, reloaded when files change.
+
+    Example:
+        >>> library = ScenarioLibrary("data/scenarios")
+        >>> library.load()
+        >>> opportunities = stream_client_matches(
+        ...     clients, library.select(), 60.0, calibrate=False
+        ... )
+        >>> library.reload_if_changed()  # False until a file changes
+        False
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        registry: Optional[ScenarioRegistry] = None,
+        calibration_clients: Optional[list[ClientProfile]] = None
+    ):
+        """
+        Create an empty library; call load() to populate it.
+
+        Args:
+            directory: Scenarios directory (searched recursively for .json)
+            registry: Scenario cache (default: the process-wide registry)
+            calibration_clients: Sample of clients used to order each
+                scenario's criteria by selectivity (default: no calibration)
+        """
+        self.directory = Path(directory)
+        self.registry = registry if registry is not None else default_registry
+        self.calibration_clients = calibration_clients or []
+        self.version = 0
+        self.loaded_at: Optional[datetime] = None
+
+        # Swapped as a whole so readers never see a half-reloaded library
+        self._compiled: tuple[CompiledScenario, ...] = ()
+        self._by_id: dict[str, CompiledScenario] = {}
+        self._signature: Optional[DirectorySignature] = None
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    @property
+    def scenarios(self) -> list[Scenario]:
+        """Loaded scenarios, in load order."""
+        return [compiled.scenario for compiled in self._compiled]
+
+    def load(self) -> None:
+        """
+        Load and compile every scenario in the directory.
+
+        Scenarios that fail to compile are logged and skipped.
+
+        Raises:
+            FileNotFoundError: If the directory doesn't exist
+            ValueError: If the directory contains no valid scenarios
+        """
+        signature = self._directory_signature()
+        scenarios = load_all_scenario_files(self.directory, registry=self.registry)
+        compiled_scenarios = self.registry.compile(scenarios)
+
+        if not compiled_scenarios:
+            raise ValueError(f"No valid scenarios found in directory: {self.directory}")
+
+        # Scenarios unchanged since the last load are the same (already
+        # calibrated) objects and may be in use by requests; only newly
+        # compiled ones are calibrated, before the swap publishes them
+        if self.calibration_clients:
+            published = {id(compiled) for compiled in self._compiled}
+            for compiled in compiled_scenarios:
+                if id(compiled) not in published:
+                    compiled.calibrate(self.calibration_clients)
+
+        by_id = {compiled.scenario_id: compiled for compiled in compiled_scenarios}
+
+        self._compiled, self._by_id = tuple(compiled_scenarios), by_id
+        self._signature = signature
+        self.version += 1
+        self.loaded_at = datetime.now()
+
+        logger.info(
+            f"Scenario library v{self.version}: compiled {len(compiled_scenarios)} "
+            f"scenarios from {self.directory}"
+        )
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload the library if any scenario file was added, removed or modified.
+
+        A failed reload is logged and the previous scenarios stay in use.
+
+        Returns:
+            True if the library was reloaded
+        """
+        try:
+            if self._directory_signature() == self._signature:
+                return False
+
+            logger.info(f"Scenario files changed in {self.directory}, reloading")
+            self.load()
+            return True
+
+        except Exception as e:
+            logger.error(
+                f"Scenario reload failed, keeping v{self.version}: {e}",
+                exc_info=True
+            )
+            return False
+
+    async def watch(self, interval: float) -> None:
+        """
+        Poll for scenario file changes until cancelled.
+
+        Args:
+            interval: Seconds between checks
+        """
+        logger.info(f"Watching {self.directory} for scenario changes every {interval}s")
+
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.to_thread(self.reload_if_changed)
+
+    def select(
+        self,
+        scenario_ids: Optional[Iterable[str]] = None
+    ) -> list[CompiledScenario]:
+        """
+        Get compiled scenarios for matching.
+
+        Args:
+            scenario_ids: Scenario IDs to use (default: all, in load order)
+
+        Returns:
+            List of CompiledScenario objects
+
+        Raises:
+            KeyError: If a scenario ID is not in the library
+        """
+        if scenario_ids is None:
+            return list(self._compiled)
+
+        by_id = self._by_id
+        missing = [scenario_id for scenario_id in scenario_ids if scenario_id not in by_id]
+        if missing:
+            raise KeyError(f"Unknown scenario IDs: {', '.join(missing)}")
+
+        return [by_id[scenario_id] for scenario_id in scenario_ids]
+
+    def _directory_signature(self) -> DirectorySignature:
+        """Path, modification time and size of every scenario file."""
+        signature = []
+        for path in self.directory.rglob("*.json"):
+            stat = path.stat()
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(signature))
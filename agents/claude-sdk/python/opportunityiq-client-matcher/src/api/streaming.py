@@ -0,0 +1,67 @@
+"""
+Streaming Response Helpers
+
+Group streamed output into chunks so large responses are written as they
+are produced without a round trip per opportunity.
+
+Biblical Principle: SERVE - First results reach the client while matching continues
+"""
+
+from typing import Iterable, Iterator
+
+from src.models import Opportunity
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def ndjson_chunks(
+    opportunities: Iterable[Opportunity],
+    chunk_size: int = 100
+) -> Iterator[str]:
+    """
+    Encode opportunities as NDJSON (one Opportunity JSON per line).
+
+    Args:
+        opportunities: Opportunities (may be a generator)
+        chunk_size: Opportunities per yielded chunk
+
+    Yields:
+        Chunks of NDJSON lines
+    """
+    buffer = []
+
+    for opp in opportunities:
+        buffer.append(opp.model_dump_json())
+        buffer.append("\n")
+        if len(buffer) >= 2 * chunk_size:
+            yield "".join(buffer)
+            buffer = []
+
+    if buffer:
+        yield "".join(buffer)
+
+
+def line_chunks(lines: Iterable[str], chunk_size: int = 100) -> Iterator[str]:
+    """
+    Stream lines joined with newlines (same text as "\\n".join(lines)).
+
+    Args:
+        lines: Lines to join (may be a generator)
+        chunk_size: Lines per yielded chunk
+
+    Yields:
+        Chunks of text
+    """
+    buffer = []
+    separator = ""
+
+    for line in lines:
+        buffer.append(separator)
+        buffer.append(line)
+        separator = "\n"
+        if len(buffer) >= 2 * chunk_size:
+            yield "".join(buffer)
+            buffer = []
+
+    if buffer:
+        yield "".join(buffer)
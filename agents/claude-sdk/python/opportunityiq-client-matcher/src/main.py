@@ -11,6 +11,9 @@ Usage Examples:
     # Analyze specific client file
     python -m src.main --clients data/clients/my-clients.json
 
+    # Stream a large book (NDJSON or CSV) without loading it all first
+    python -m src.main --clients data/clients/book.ndjson
+
     # Use custom scenarios directory
     python -m src.main --clients data/clients/my-clients.json --scenarios data/my-scenarios
 
@@ -23,6 +26,12 @@ Usage Examples:
     # Adjust ranking weights (favor revenue over match quality)
     python -m src.main --clients data/clients/my-clients.json --revenue-weight 0.8 --match-weight 0.2
 
+    # Daily runs: only re-match clients and scenarios that changed
+    python -m src.main --clients data/clients/book.ndjson --match-store data/match_store.sqlite
+
+    # Stream every match to a compressed CSV (also .ndjson, .md, .parquet)
+    python -m src.main --clients data/clients/book.ndjson --export reports/all.csv.gz
+
 Biblical Principle: SERVE - Simple, clear interface that makes the agent easy to use
 """
 
@@ -33,6 +42,7 @@ from pathlib import Path
 from typing import Optional
 
 from src.agent import OpportunityIQAgent
+from src.services.telemetry import configure_telemetry
 
 # Configure logging
 logging.basicConfig(
@@ -129,13 +139,22 @@ Examples:
 
   # JSON output for integrations
   python src/main.py --clients data/clients/my-clients.json --format json --output results.json
+
+  # Incremental daily run (reuses unchanged matches)
+  python src/main.py --clients data/clients/book.ndjson --match-store data/match_store.sqlite
+
+  # Stream every match to a compressed export
+  python src/main.py --clients data/clients/book.ndjson --export reports/all.ndjson.gz
         """
     )
 
     # Input arguments
     parser.add_argument(
         "--clients",
-        help="Path to client data JSON file (defaults to sample-clients.json)"
+        help=(
+            "Path to client data file: JSON array, NDJSON (.ndjson/.jsonl) or CSV "
+            "(defaults to sample-clients.json)"
+        )
     )
 
     parser.add_argument(
@@ -178,6 +197,14 @@ Examples:
         help="Limit number of opportunities to return (e.g., top 25)"
     )
 
+    parser.add_argument(
+        "--match-store",
+        help=(
+            "SQLite file of stored match results; only clients and scenarios "
+            "changed since the last run are re-matched (default: MATCH_STORE_PATH)"
+        )
+    )
+
     # Output arguments
     parser.add_argument(
         "--format",
@@ -191,6 +218,14 @@ Examples:
         help="Path to save report (prints to console if not specified)"
     )
 
+    parser.add_argument(
+        "--export",
+        help=(
+            "Stream every matched opportunity to a file: .csv, .ndjson/.jsonl, "
+            ".md or .parquet, optionally compressed (.gz, .bz2, .xz)"
+        )
+    )
+
     # Utility arguments
     parser.add_argument(
         "--list-scenarios",
@@ -204,6 +239,15 @@ Examples:
         help="Enable verbose logging (DEBUG level)"
     )
 
+    parser.add_argument(
+        "--telemetry-sample-rate",
+        type=float,
+        help=(
+            "Fraction of client-scenario matches logged in detail, e.g. 0.01 "
+            "(default: MATCH_TELEMETRY_SAMPLE_RATE or 0; batch totals are always logged)"
+        )
+    )
+
     parser.add_argument(
         "--generate-insights",
         action="store_true",
@@ -224,10 +268,13 @@ Examples:
         logging.getLogger().setLevel(logging.DEBUG)
         logger.debug("Verbose logging enabled")
 
+    if args.telemetry_sample_rate is not None:
+        configure_telemetry(sample_rate=args.telemetry_sample_rate)
+
     try:
         # Initialize agent
         logger.info("Initializing OpportunityIQ Agent...")
-        agent = OpportunityIQAgent()
+        agent = OpportunityIQAgent(match_store_path=args.match_store)
 
         # List scenarios and exit if requested
         if args.list_scenarios:
@@ -269,9 +316,9 @@ Examples:
             print("Example: python src/main.py --clients data/clients/my-clients.json", file=sys.stderr)
             return 1
 
-        # Load clients
-        logger.info(f"Loading clients from: {clients_file}")
-        clients = agent.load_clients_from_file(clients_file)
+        # Stream clients: records are parsed and validated as they are matched
+        logger.info(f"Streaming clients from: {clients_file}")
+        clients = agent.iter_clients_from_file(clients_file)
 
         # Load scenarios if directory provided
         scenarios = None
@@ -344,6 +391,17 @@ Examples:
             print("=" * 80)
             print(results["report"])
 
+        # Stream all matches to an export file (re-reads the client file)
+        if args.export:
+            exported = agent.export_matches(
+                clients=agent.iter_clients_from_file(clients_file),
+                output_file=args.export,
+                scenarios=scenarios,
+                min_match_threshold=args.min_match_threshold
+            )
+            logger.info(f"Exported {exported} opportunities to: {args.export}")
+            print(f"\n📦 Exported {exported} opportunities to: {args.export}")
+
         return 0
 
     except KeyboardInterrupt:
@@ -6,7 +6,7 @@ Exports all Pydantic models for use throughout the application.
 
 from .scenario import Scenario, MatchCriterion, RevenueFormula
 from .client_profile import ClientProfile, Portfolio, Holdings
-from .opportunity import Opportunity, MatchDetail, RevenueCalculation
+from .opportunity import Opportunity, MatchDetail, MatchExplanation, RevenueCalculation
 
 __all__ = [
     # Scenario models
@@ -20,5 +20,6 @@ __all__ = [
     # Opportunity models
     "Opportunity",
     "MatchDetail",
+    "MatchExplanation",
     "RevenueCalculation",
 ]
@@ -7,9 +7,18 @@ revenue calculations, rankings).
 EXCELLENCE Principle: Structured output ensures reliable downstream processing.
 """
 
-from typing import Optional, Literal, Any
+from collections.abc import Mapping, Sequence
+from typing import Optional, Literal, Any, Union
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    computed_field,
+    field_validator,
+    model_validator
+)
 
 
 class MatchDetail(BaseModel):
@@ -27,6 +36,83 @@ class MatchDetail(BaseModel):
     points_earned: float = Field(..., ge=0.0, description="Points earned from this criterion")
 
 
+class MatchExplanation(Sequence):
+    """
+    Compact record of a client's criterion results, expanded on demand.
+
+    Stores a bitmask of matched criteria (bit i set when criterion i was
+    met) and the actual client values, instead of one MatchDetail per
+    criterion. MatchDetail objects are built from the criteria the first
+    time the explanation is read, then cached. Reads like a list of
+    MatchDetail.
+
+    Criteria are any objects with ``to_detail(actual_value, matched)``
+    (e.g. the compiled criteria of a CompiledScenario, which pickle by
+    recompiling), in scenario order. Opportunity keeps an explanation
+    privately and exposes ``match_details`` as a real list built from it
+    on first read.
+    """
+
+    __slots__ = ("criteria", "matched_mask", "actual_values", "_details")
+
+    def __init__(
+        self,
+        criteria: Sequence[Any],
+        matched_mask: int,
+        actual_values: tuple[Any, ...]
+    ):
+        self.criteria = criteria
+        self.matched_mask = matched_mask
+        self.actual_values = actual_values
+        self._details: Optional[list[MatchDetail]] = None
+
+    @property
+    def criteria_met(self) -> int:
+        """Number of criteria that were met."""
+        return self.matched_mask.bit_count()
+
+    def matched(self, index: int) -> bool:
+        """Whether the criterion at index was met."""
+        return bool(self.matched_mask >> index & 1)
+
+    def details(self) -> list[MatchDetail]:
+        """Build (once) and return the full MatchDetail list."""
+        if self._details is None:
+            mask = self.matched_mask
+            self._details = [
+                criterion.to_detail(actual_value, bool(mask >> i & 1))
+                for i, (criterion, actual_value) in enumerate(
+                    zip(self.criteria, self.actual_values)
+                )
+            ]
+        return self._details
+
+    def __len__(self) -> int:
+        return len(self.actual_values)
+
+    def __getitem__(self, index):
+        return self.details()[index]
+
+    def __iter__(self):
+        return iter(self.details())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, MatchExplanation)):
+            return self.details() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"MatchExplanation(criteria_met={self.criteria_met}, "
+            f"total_criteria={len(self)})"
+        )
+
+
+_MATCH_DETAILS_ADAPTER = TypeAdapter(list[MatchDetail])
+
+
 class RevenueCalculation(BaseModel):
     """
     Detailed breakdown of revenue calculation.
@@ -63,10 +149,6 @@ class Opportunity(BaseModel):
         le=100.0,
         description="Match score as percentage (0-100)"
     )
-    match_details: list[MatchDetail] = Field(
-        ...,
-        description="Detailed breakdown of criterion matching"
-    )
     total_criteria: int = Field(..., ge=1, description="Total number of criteria evaluated")
     criteria_met: int = Field(..., ge=0, description="Number of criteria that were met")
 
@@ -112,6 +194,63 @@ class Opportunity(BaseModel):
         description="Timestamp when opportunity was created"
     )
 
+    # Match details: a compact MatchExplanation from matching until first
+    # read, then the MatchDetail list (see the match_details property)
+    _match_details: Union[list[MatchDetail], MatchExplanation] = PrivateAttr(
+        default_factory=list
+    )
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def take_match_details(cls, data: Any, handler) -> "Opportunity":
+        """Route match_details input through the property setter."""
+        if not isinstance(data, dict):
+            return handler(data)
+
+        if "match_details" not in data:
+            raise ValueError("match_details is required")
+
+        data = dict(data)
+        match_details = data.pop("match_details")
+
+        opportunity = handler(data)
+        opportunity.match_details = match_details
+        return opportunity
+
+    @computed_field(description="Detailed breakdown of criterion matching")
+    @property
+    def match_details(self) -> list[MatchDetail]:
+        """Per-criterion match details, built from the match explanation on first read."""
+        match_details = self._match_details
+        if isinstance(match_details, MatchExplanation):
+            match_details = self._match_details = match_details.details()
+        return match_details
+
+    @match_details.setter
+    def match_details(self, value: Union[Sequence[Any], MatchExplanation]) -> None:
+        """Set match details from MatchDetail objects/dicts or a MatchExplanation."""
+        if isinstance(value, MatchExplanation):
+            self._match_details = value
+        else:
+            self._match_details = _MATCH_DETAILS_ADAPTER.validate_python(value)
+
+    def model_copy(
+        self,
+        *,
+        update: Optional[Mapping[str, Any]] = None,
+        deep: bool = False
+    ) -> "Opportunity":
+        """Copy the opportunity; match_details in update goes through the setter."""
+        if not update or "match_details" not in update:
+            return super().model_copy(update=update, deep=deep)
+
+        update = dict(update)
+        match_details = update.pop("match_details")
+
+        opportunity = super().model_copy(update=update, deep=deep)
+        opportunity.match_details = match_details
+        return opportunity
+
     @field_validator("match_score")
     @classmethod
     def validate_match_score_range(cls, v: float) -> float:
@@ -7,9 +7,35 @@ Business logic layer for the application.
 from .matching_engine import MatchingEngine
 from .revenue_calculator import RevenueCalculator
 from .report_generator import ReportGenerator
+from .client_index import ClientIndex
+from .match_store import MatchStore
+from .opportunity_stats import OpportunityStats
+from .opportunity_optimizer import OpportunityOptimizer, PortfolioPlan
+from .opportunity_writers import OpportunityWriter, open_opportunity_writer
+from .scenario_registry import ScenarioRegistry, default_registry
+from .telemetry import MatchTelemetry, configure_telemetry
+from .scenario_compiler import (
+    CompiledScenario,
+    compile_scenario,
+    compile_scenarios
+)
 
 __all__ = [
     "MatchingEngine",
     "RevenueCalculator",
     "ReportGenerator",
+    "ClientIndex",
+    "MatchStore",
+    "OpportunityStats",
+    "OpportunityOptimizer",
+    "PortfolioPlan",
+    "OpportunityWriter",
+    "open_opportunity_writer",
+    "ScenarioRegistry",
+    "default_registry",
+    "MatchTelemetry",
+    "configure_telemetry",
+    "CompiledScenario",
+    "compile_scenario",
+    "compile_scenarios",
 ]
@@ -0,0 +1,419 @@
+"""
+Client index service for OpportunityIQ Client Matcher.
+
+Maintains inverted indexes over a client book so scenarios can retrieve
+candidate clients instead of scanning every profile:
+- numeric fields (e.g. 'age', 'portfolio.total_value',
+  'fia_surrender_end_months'): sorted value arrays answered with bisect
+  range queries
+- categorical fields (e.g. 'risk_tolerance'): hash maps from value to
+  client IDs; predicates run once per distinct value
+- list fields (e.g. tags): element postings for 'contains'
+
+Indexes are updated incrementally as clients are added, changed or removed.
+
+TRUTH Principle: Index lookups select exactly the clients the matching
+engine would; candidates are still scored with the compiled scenario.
+"""
+
+import logging
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, Optional
+
+from ..models import ClientProfile
+from .scenario_compiler import (
+    CompiledCriterion,
+    CompiledScenario,
+    compile_field_accessor,
+    is_number,
+    safe_predicate
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FieldIndex:
+    """
+    Inverted index for a single client field.
+
+    Values are split into three buckets:
+    - numbers: parallel sorted ``keys`` / ``ids`` lists
+    - hashable values (strings, bools): ``postings`` map value -> IDs
+    - unhashable values (lists): ``others`` map ID -> value, plus element
+      postings for 'contains' lookups
+
+    Clients whose value is missing or None are not indexed; they never
+    match any operator.
+    """
+
+    def __init__(self, field: str):
+        self.field = field
+        self.accessor = compile_field_accessor(field)
+        self.keys: list[float] = []
+        self.ids: list[str] = []
+        self.postings: dict[Any, set[str]] = {}
+        self.others: dict[str, Any] = {}
+        self.elements: dict[Any, set[str]] = {}
+
+    def value_of(self, client: ClientProfile) -> Any:
+        """Read this field from a client (None if missing)."""
+        try:
+            return self.accessor(client)
+        except Exception:
+            return None
+
+    def add(self, client_id: str, value: Any) -> None:
+        """Index a client's value."""
+        if value is None:
+            return
+
+        if is_number(value):
+            position = bisect_right(self.keys, value)
+            self.keys.insert(position, value)
+            self.ids.insert(position, client_id)
+            return
+
+        try:
+            self.postings.setdefault(value, set()).add(client_id)
+        except TypeError:
+            self.others[client_id] = value
+            for element in self._hashable_elements(value):
+                self.elements.setdefault(element, set()).add(client_id)
+
+    def add_many(self, items: list[tuple[str, Any]]) -> None:
+        """Index many (client_id, value) pairs, sorting numbers once."""
+        numbers = []
+        for client_id, value in items:
+            if is_number(value):
+                numbers.append((value, client_id))
+            else:
+                self.add(client_id, value)
+
+        if not numbers:
+            return
+
+        if self.keys:
+            numbers.extend(zip(self.keys, self.ids))
+        numbers.sort(key=lambda pair: pair[0])
+        self.keys = [value for value, _ in numbers]
+        self.ids = [client_id for _, client_id in numbers]
+
+    def remove(self, client_id: str, value: Any) -> None:
+        """Remove a client's previously indexed value."""
+        if value is None:
+            return
+
+        if is_number(value):
+            low = bisect_left(self.keys, value)
+            high = bisect_right(self.keys, value)
+            position = low + self.ids[low:high].index(client_id)
+            del self.keys[position]
+            del self.ids[position]
+            return
+
+        try:
+            posting = self.postings.get(value)
+        except TypeError:
+            self.others.pop(client_id, None)
+            for element in self._hashable_elements(value):
+                element_posting = self.elements.get(element)
+                if element_posting is not None:
+                    element_posting.discard(client_id)
+                    if not element_posting:
+                        del self.elements[element]
+            return
+
+        if posting is not None:
+            posting.discard(client_id)
+            if not posting:
+                del self.postings[value]
+
+    def lookup(self, criterion: CompiledCriterion) -> set[str]:
+        """
+        Get the IDs of clients whose value satisfies a criterion.
+
+        Args:
+            criterion: Compiled criterion on this field
+
+        Returns:
+            Set of matching client IDs
+        """
+        return (
+            self._lookup_numbers(criterion)
+            | self._lookup_postings(criterion)
+            | self._lookup_others(criterion)
+        )
+
+    def _lookup_numbers(self, criterion: CompiledCriterion) -> set[str]:
+        """Range queries over the sorted numeric bucket."""
+        keys, ids = self.keys, self.ids
+        operator, expected = criterion.operator, criterion.expected
+
+        if is_number(expected):
+            if operator == "gt":
+                return set(ids[bisect_right(keys, expected):])
+            if operator == "gte":
+                return set(ids[bisect_left(keys, expected):])
+            if operator == "lt":
+                return set(ids[:bisect_left(keys, expected)])
+            if operator == "lte":
+                return set(ids[:bisect_right(keys, expected)])
+            if operator == "eq":
+                return set(ids[bisect_left(keys, expected):bisect_right(keys, expected)])
+
+        if operator == "in" and isinstance(expected, (list, tuple)):
+            matched: set[str] = set()
+            for member in expected:
+                if is_number(member) or isinstance(member, bool):
+                    matched.update(ids[bisect_left(keys, member):bisect_right(keys, member)])
+            return matched
+
+        # Anything else (e.g. comparing numbers to strings) is checked value
+        # by value so results match the compiled predicate exactly
+        return {
+            client_id for value, client_id in zip(keys, ids)
+            if safe_predicate(criterion, value)
+        }
+
+    def _lookup_postings(self, criterion: CompiledCriterion) -> set[str]:
+        """Evaluate the predicate once per distinct hashable value."""
+        matched: set[str] = set()
+        for value, posting in self.postings.items():
+            if safe_predicate(criterion, value):
+                matched |= posting
+        return matched
+
+    def _lookup_others(self, criterion: CompiledCriterion) -> set[str]:
+        """Unhashable values: element postings for 'contains', else scan."""
+        if not self.others:
+            return set()
+
+        if criterion.operator == "contains":
+            try:
+                return set(self.elements.get(criterion.expected, ()))
+            except TypeError:
+                pass
+
+        return {
+            client_id for client_id, value in self.others.items()
+            if safe_predicate(criterion, value)
+        }
+
+    @staticmethod
+    def _hashable_elements(value: Any) -> list[Any]:
+        """Hashable elements of a list-like value (for 'contains')."""
+        if not isinstance(value, (list, tuple, set, frozenset)):
+            return []
+        elements = []
+        for element in value:
+            try:
+                hash(element)
+            except TypeError:
+                continue
+            elements.append(element)
+        return elements
+
+
+class ClientIndex:
+    """
+    Incrementally maintained index over a client book.
+
+    Example:
+        >>> index = ClientIndex(clients)
+        >>> index.upsert(updated_client)
+        >>> matches = index.match(compile_scenario(scenario), min_score=60.0)
+    """
+
+    def __init__(
+        self,
+        clients: Optional[Iterable[ClientProfile]] = None,
+        fields: Optional[Iterable[str]] = None
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            clients: Optional initial client book
+            fields: Fields to index up front; other fields are indexed on
+                first use by a scenario
+        """
+        self.clients: dict[str, ClientProfile] = {}
+        self._sequence: dict[str, int] = {}
+        self._next_sequence = 0
+        self._fields: dict[str, FieldIndex] = {}
+
+        for field in fields or ():
+            self._fields[field] = FieldIndex(field)
+
+        if clients is not None:
+            self.add_many(clients)
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def __contains__(self, client_id: str) -> bool:
+        return client_id in self.clients
+
+    @property
+    def fields(self) -> list[str]:
+        """Fields currently indexed."""
+        return list(self._fields)
+
+    def add_many(self, clients: Iterable[ClientProfile]) -> None:
+        """
+        Add (or replace) many clients, bulk-building numeric indexes.
+
+        Args:
+            clients: Client profiles to index
+        """
+        new_clients = []
+        for client in clients:
+            if client.client_id in self.clients:
+                self.upsert(client)
+            else:
+                self._register(client)
+                new_clients.append(client)
+
+        for field_index in self._fields.values():
+            field_index.add_many(
+                [(c.client_id, field_index.value_of(c)) for c in new_clients]
+            )
+
+    def upsert(self, client: ClientProfile) -> None:
+        """
+        Add a client or update its indexed values in place.
+
+        An updated client keeps its original position in book order.
+
+        Args:
+            client: Client profile to index
+        """
+        previous = self.clients.get(client.client_id)
+
+        if previous is None:
+            self._register(client)
+        else:
+            self.clients[client.client_id] = client
+
+        for field_index in self._fields.values():
+            if previous is not None:
+                old_value = field_index.value_of(previous)
+                new_value = field_index.value_of(client)
+                if old_value == new_value and type(old_value) is type(new_value):
+                    continue
+                field_index.remove(client.client_id, old_value)
+                field_index.add(client.client_id, new_value)
+            else:
+                field_index.add(client.client_id, field_index.value_of(client))
+
+    def remove(self, client_id: str) -> None:
+        """
+        Remove a client from the index.
+
+        Args:
+            client_id: ID of the client to remove
+
+        Raises:
+            KeyError: If the client is not indexed
+        """
+        client = self.clients.pop(client_id)
+        del self._sequence[client_id]
+
+        for field_index in self._fields.values():
+            field_index.remove(client_id, field_index.value_of(client))
+
+    def ensure_fields(self, fields: Iterable[str]) -> None:
+        """Index any fields not yet indexed, from the current book."""
+        for field in fields:
+            if field in self._fields:
+                continue
+            field_index = FieldIndex(field)
+            field_index.add_many(
+                [(cid, field_index.value_of(c)) for cid, c in self.clients.items()]
+            )
+            self._fields[field] = field_index
+            logger.debug(f"Indexed field '{field}' for {len(self.clients)} clients")
+
+    def lookup(self, criterion: CompiledCriterion) -> set[str]:
+        """
+        Get the IDs of all clients satisfying a single criterion.
+
+        Args:
+            criterion: Compiled criterion
+
+        Returns:
+            Set of matching client IDs
+        """
+        self.ensure_fields([criterion.field])
+        return self._fields[criterion.field].lookup(criterion)
+
+    def candidates(self, compiled: CompiledScenario, min_score: float = 0.0) -> list[str]:
+        """
+        Retrieve the clients that could reach a scenario's threshold.
+
+        Clients must satisfy every criterion the threshold makes required,
+        so candidates are the intersection of those criteria's postings.
+        When no criterion is required, candidate sets are typically most
+        of the book and a scan with early termination is cheaper than a
+        union of postings, so every client is a candidate.
+
+        Args:
+            compiled: Compiled scenario
+            min_score: Minimum match score (0-100)
+
+        Returns:
+            Candidate client IDs in book order
+        """
+        if min_score <= 0:
+            return list(self.clients)
+
+        plan = compiled.plan(min_score)
+        if plan.impossible:
+            return []
+
+        required = [
+            c for c in compiled.criteria
+            if compiled.total_weight - c.weight < plan.required_points
+        ]
+        if not required:
+            return list(self.clients)
+
+        postings = sorted((self.lookup(c) for c in required), key=len)
+        candidate_ids = postings[0].intersection(*postings[1:])
+
+        return sorted(candidate_ids, key=self._sequence.__getitem__)
+
+    def match(
+        self,
+        compiled: CompiledScenario,
+        min_score: float = 0.0
+    ) -> list[tuple[ClientProfile, float]]:
+        """
+        Match a scenario against the indexed book.
+
+        Candidates come from the indexes; only they are scored.
+
+        Args:
+            compiled: Compiled scenario
+            min_score: Minimum match score (0-100)
+
+        Returns:
+            List of (client, match_score) in book order
+        """
+        matches = []
+        for client_id in self.candidates(compiled, min_score):
+            client = self.clients[client_id]
+            match_score = compiled.score_above(client, min_score)
+            if match_score is not None:
+                matches.append((client, match_score))
+        return matches
+
+    def sequence_of(self, client_id: str) -> int:
+        """Position of a client in book (insertion) order."""
+        return self._sequence[client_id]
+
+    def _register(self, client: ClientProfile) -> None:
+        # self.clients preserves book order: updates keep their position
+        self.clients[client.client_id] = client
+        self._sequence[client.client_id] = self._next_sequence
+        self._next_sequence += 1
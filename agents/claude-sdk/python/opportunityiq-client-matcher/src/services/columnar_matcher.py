@@ -0,0 +1,312 @@
+"""
+Columnar matching service for OpportunityIQ Client Matcher.
+
+Loads a client book into one NumPy column per referenced field (including
+extra fields such as 'cash_percentage' and 'fia_value') and evaluates each
+scenario criterion as a vectorized boolean mask over the whole book.
+
+Column kinds:
+- numeric: float64 values, NaN for missing/None
+- categorical: integer codes into a table of distinct hashable values
+  (None included); each criterion's predicate runs once per distinct value
+- object: raw values for unhashable data (e.g. lists); predicates run
+  per row
+
+TRUTH Principle: Vectorized scores are bit-for-bit identical to
+CompiledScenario.score(), so thresholds select exactly the same matches.
+"""
+
+from operator import attrgetter
+from typing import Any, Iterable, Iterator, Optional
+
+import numpy as np
+
+from ..models import ClientProfile
+from .scenario_compiler import (
+    CompiledCriterion,
+    CompiledScenario,
+    compile_field_accessor,
+    is_number,
+    safe_predicate
+)
+
+
+# Client rows scored per chunk by ColumnarMatcher.iter_matches()
+DEFAULT_CHUNK_SIZE = 65536
+
+_NUMERIC_OPERATORS = {
+    "gt": np.greater,
+    "lt": np.less,
+    "gte": np.greater_equal,
+    "lte": np.less_equal,
+    "eq": np.equal,
+}
+
+_NUMERIC_TYPES = frozenset({int, float, type(None)})
+
+
+def _extract_values(clients: list[Any], field: str) -> list[Any]:
+    """
+    Read a field from every client, using None for missing values.
+
+    Missing fields and None values are equivalent for matching: every
+    operator treats both as not matched.
+    """
+    head, _, rest = field.partition(".")
+
+    if not rest and not (head in ClientProfile.model_fields or hasattr(ClientProfile, head)):
+        # Top-level extra field: plain dict lookups, no exceptions
+        empty: dict[str, Any] = {}
+        try:
+            return [(c.__pydantic_extra__ or empty).get(head) for c in clients]
+        except AttributeError:
+            pass
+    else:
+        try:
+            return list(map(attrgetter(field), clients))
+        except Exception:
+            pass
+
+    # Some clients lack the field (or are not ClientProfile objects)
+    accessor = compile_field_accessor(field)
+    values = []
+    append = values.append
+    for client in clients:
+        try:
+            append(accessor(client))
+        except Exception:
+            append(None)
+    return values
+
+
+class FieldColumn:
+    """
+    A single client field stored column-wise.
+    """
+
+    __slots__ = ("field", "kind", "values", "codes", "categories")
+
+    def __init__(self, field: str, raw_values: list[Any]):
+        """
+        Build a column from raw per-client values.
+
+        Args:
+            field: Field path the column was extracted from
+            raw_values: One value per client (None if absent)
+        """
+        self.field = field
+        self.values: Any = None
+        self.codes: Optional[np.ndarray] = None
+        self.categories: list[Any] = []
+
+        value_types = set(map(type, raw_values))
+
+        if value_types <= _NUMERIC_TYPES:
+            # None converts to NaN, which never satisfies a comparison
+            self.kind = "numeric"
+            self.values = np.array(raw_values, dtype=np.float64)
+            return
+
+        try:
+            distinct = dict.fromkeys(raw_values)
+        except TypeError:
+            # Unhashable values (lists, dicts) are evaluated row by row
+            self.kind = "object"
+            self.values = raw_values
+            return
+
+        self.kind = "categorical"
+        self.categories = list(distinct)
+        index = {value: code for code, value in enumerate(self.categories)}
+        self.codes = np.fromiter(
+            map(index.__getitem__, raw_values),
+            dtype=np.int64,
+            count=len(raw_values)
+        )
+
+    def mask(self, criterion: CompiledCriterion, rows: slice = slice(None)) -> np.ndarray:
+        """
+        Evaluate a criterion against every client in the column.
+
+        Args:
+            criterion: Compiled criterion referencing this column's field
+            rows: Optional slice of client rows to evaluate
+
+        Returns:
+            Boolean array, True where the criterion is met
+        """
+        if self.kind == "numeric":
+            return self._numeric_mask(criterion, self.values[rows])
+
+        if self.kind == "categorical":
+            table = np.array(
+                [safe_predicate(criterion, v) for v in self.categories],
+                dtype=bool
+            )
+            return table[self.codes[rows]]
+
+        values = self.values[rows]
+        return np.fromiter(
+            (safe_predicate(criterion, v) for v in values),
+            dtype=bool,
+            count=len(values)
+        )
+
+    def _numeric_mask(self, criterion: CompiledCriterion, values: np.ndarray) -> np.ndarray:
+        """Vectorized comparison for numeric columns (NaN never matches)."""
+        expected = criterion.expected
+        ufunc = _NUMERIC_OPERATORS.get(criterion.operator)
+
+        if ufunc is not None and is_number(expected):
+            return ufunc(values, expected)
+
+        if criterion.operator == "in" and isinstance(expected, (list, tuple)):
+            members = [float(m) for m in expected if isinstance(m, (int, float))]
+            return np.isin(values, members)
+
+        # Non-numeric expected values (or 'contains' on a number): fall back
+        # to the scalar predicate so semantics match the compiled engine
+        return np.fromiter(
+            (
+                safe_predicate(criterion, None if np.isnan(v) else v.item())
+                for v in values
+            ),
+            dtype=bool,
+            count=len(values)
+        )
+
+
+class ClientColumns:
+    """
+    A client book stored column-wise for vectorized matching.
+
+    Attributes:
+        clients: Original client objects, in row order
+        columns: Mapping of field path to FieldColumn
+    """
+
+    def __init__(self, clients: list[Any], columns: dict[str, FieldColumn]):
+        self.clients = clients
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    @classmethod
+    def from_clients(
+        cls,
+        clients: Iterable[ClientProfile],
+        fields: Iterable[str]
+    ) -> "ClientColumns":
+        """
+        Extract the given fields from clients into columns.
+
+        Args:
+            clients: Client profiles (materialized into a list)
+            fields: Field paths to extract
+
+        Returns:
+            ClientColumns with one column per field
+        """
+        clients = list(clients)
+        columns = {
+            field: FieldColumn(field, _extract_values(clients, field))
+            for field in fields
+        }
+
+        return cls(clients, columns)
+
+
+class ColumnarMatcher:
+    """
+    Scores a whole client book against compiled scenarios at once.
+
+    Example:
+        >>> matcher = ColumnarMatcher(compile_scenarios(scenarios))
+        >>> book = matcher.load_clients(clients)
+        >>> scores = matcher.score_matrix(book)  # shape (clients, scenarios)
+    """
+
+    def __init__(self, compiled_scenarios: list[CompiledScenario]):
+        """
+        Initialize with compiled scenarios.
+
+        Args:
+            compiled_scenarios: Scenarios to score, in column order
+        """
+        self.compiled_scenarios = list(compiled_scenarios)
+
+        fields: dict[str, None] = {}
+        for compiled in self.compiled_scenarios:
+            for criterion in compiled.criteria:
+                fields.setdefault(criterion.field, None)
+        self.fields = list(fields)
+
+    def load_clients(self, clients: Iterable[ClientProfile]) -> ClientColumns:
+        """Build the columns referenced by this matcher's scenarios."""
+        return ClientColumns.from_clients(clients, self.fields)
+
+    def score_matrix(
+        self,
+        book: ClientColumns,
+        start: int = 0,
+        stop: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Calculate match scores for every client and scenario.
+
+        Earned points are accumulated criterion by criterion in scenario
+        order - the column-wise equivalent of multiplying the criterion
+        mask matrix by the weight vector - so every score is bit-for-bit
+        identical to CompiledScenario.score().
+
+        Args:
+            book: Client columns from load_clients()
+            start: First client row to score
+            stop: Row after the last client to score (default: end of book)
+
+        Returns:
+            float64 array of shape (n_rows, n_scenarios), 0-100 scale
+        """
+        rows = slice(start, len(book) if stop is None else min(stop, len(book)))
+        n_rows = len(range(*rows.indices(len(book))))
+
+        scores = np.zeros((n_rows, len(self.compiled_scenarios)), dtype=np.float64)
+        mask_cache: dict[tuple[str, str, str], np.ndarray] = {}
+
+        for j, compiled in enumerate(self.compiled_scenarios):
+            if compiled.total_weight <= 0:
+                continue
+
+            earned = np.zeros(n_rows, dtype=np.float64)
+            for criterion in compiled.criteria:
+                key = (criterion.field, criterion.operator, repr(criterion.expected))
+                mask = mask_cache.get(key)
+                if mask is None:
+                    mask = book.columns[criterion.field].mask(criterion, rows)
+                    mask_cache[key] = mask
+                earned += np.where(mask, criterion.weight, 0.0)
+
+            scores[:, j] = (earned / compiled.total_weight) * 100
+
+        return scores
+
+    def iter_matches(
+        self,
+        book: ClientColumns,
+        min_match_threshold: float = 0.0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[tuple[int, int, float]]:
+        """
+        Yield (client_index, scenario_index, score) for scores above threshold.
+
+        The book is scored in chunks of rows so memory stays bounded for
+        very large books. Matches are yielded client by client, in scenario
+        order within each client - the same order as the row-by-row engine.
+        """
+        for start in range(0, len(book), chunk_size):
+            scores = self.score_matrix(book, start, start + chunk_size)
+            rows, cols = np.nonzero(scores >= min_match_threshold)
+
+            for i, j in zip(rows.tolist(), cols.tolist()):
+                yield start + i, j, float(scores[i, j])
@@ -0,0 +1,130 @@
+"""
+Insight cache service for OpportunityIQ Client Matcher.
+
+Stores LLM-generated opportunity insights in SQLite so an opportunity that
+was already explained is never sent to the model again. Entries are keyed
+by (client hash, scenario ID, match details hash): the match details hash
+covers everything else the prompt is built from (scores, revenue, priority,
+per-criterion results) plus the model, so a cached insight is only reused
+for an identical prompt.
+
+TRUTH Principle: Cached insights are served only for the exact inputs that
+produced them.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Optional, Union
+
+from ..models import Opportunity
+
+logger = logging.getLogger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS insights (
+    cache_key TEXT PRIMARY KEY,
+    insight TEXT NOT NULL,
+    tokens_used INTEGER NOT NULL
+) WITHOUT ROWID
+"""
+
+
+def _digest(data) -> str:
+    """SHA-256 of a canonical JSON encoding."""
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def insight_cache_key(opportunity: Opportunity, model: str) -> str:
+    """
+    Build the cache key for an opportunity's insight.
+
+    Args:
+        opportunity: Opportunity the insight explains
+        model: Model that generates the insight
+
+    Returns:
+        "<client hash>:<scenario id>:<match details hash>"
+    """
+    client_hash = _digest([opportunity.client_id, opportunity.client_name])
+    details_hash = _digest({
+        "model": model,
+        "scenario_name": opportunity.scenario_name,
+        "match_score": opportunity.match_score,
+        "estimated_revenue": opportunity.estimated_revenue,
+        "priority": opportunity.priority,
+        "match_details": [d.model_dump(mode="json") for d in opportunity.match_details],
+    })
+    return f"{client_hash[:16]}:{opportunity.scenario_id}:{details_hash[:32]}"
+
+
+class InsightCache:
+    """
+    SQLite-backed cache of generated insights.
+
+    Example:
+        >>> cache = InsightCache("data/insight_cache.sqlite")
+        >>> key = insight_cache_key(opportunity, "claude-sonnet-4-5-20250929")
+        >>> cache.put(key, "Why this fits...", tokens_used=640)
+        >>> cache.get(key)
+        ('Why this fits...', 640)
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        """
+        Open (or create) an insight cache.
+
+        Args:
+            path: SQLite database file, or ":memory:" for a cache that
+                lives only as long as this object
+        """
+        self.path = str(path)
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM insights").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._connection.close()
+
+    def get(self, cache_key: str) -> Optional[tuple[str, int]]:
+        """
+        Look up a cached insight.
+
+        Args:
+            cache_key: Key from insight_cache_key()
+
+        Returns:
+            Tuple of (insight text, tokens used to generate it), or None
+        """
+        return self._connection.execute(
+            "SELECT insight, tokens_used FROM insights WHERE cache_key = ?",
+            (cache_key,)
+        ).fetchone()
+
+    def put(self, cache_key: str, insight: str, tokens_used: int) -> None:
+        """
+        Store (or replace) an insight and commit.
+
+        Args:
+            cache_key: Key from insight_cache_key()
+            insight: Generated insight text
+            tokens_used: Tokens the generation used
+        """
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO insights (cache_key, insight, tokens_used) "
+                "VALUES (?, ?, ?)",
+                (cache_key, insight, tokens_used)
+            )
@@ -0,0 +1,234 @@
+"""
+Match store service for OpportunityIQ Client Matcher.
+
+Persists match results in SQLite keyed by (client hash, scenario hash), so
+repeated runs only re-match what changed:
+- a client whose profile changed gets a new hash and is re-matched
+- a scenario whose definition changed gets a new hash and is re-run
+- every unchanged pair is served from the store
+
+Each stored pair holds its exact match score (so any threshold can be
+answered without re-evaluating) and, once the pair has matched, the full
+Opportunity as JSON. Served opportunities keep the ID and timestamp they
+were first created with.
+
+TRUTH Principle: Hashes cover every field of the client and scenario, so a
+stored result is only reused for inputs identical to those that produced it.
+"""
+
+import hashlib
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from pydantic import BaseModel
+
+from ..models import ClientProfile, Scenario
+
+logger = logging.getLogger(__name__)
+
+
+# Bump when matching or revenue semantics change; older stores are cleared
+MATCH_STORE_VERSION = 1
+
+# Host parameters per SQL statement (below SQLite's historical 999 limit)
+_QUERY_CHUNK_SIZE = 900
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    client_hash TEXT NOT NULL,
+    scenario_hash TEXT NOT NULL,
+    match_score REAL NOT NULL,
+    opportunity TEXT,
+    PRIMARY KEY (client_hash, scenario_hash)
+) WITHOUT ROWID
+"""
+
+# (match_score, opportunity JSON or None) per (client hash, scenario hash)
+StoredMatch = tuple[float, Optional[str]]
+
+
+def _fingerprint(model: BaseModel) -> str:
+    """
+    SHA-256 of a model's JSON encoding.
+
+    Fields serialize in declaration order and extra fields in the order they
+    were loaded, so the same record always hashes the same; a record whose
+    extra fields are merely reordered is re-matched once, never mismatched.
+    """
+    return hashlib.sha256(model.model_dump_json().encode("utf-8")).hexdigest()
+
+
+def client_fingerprint(client: ClientProfile) -> str:
+    """
+    Hash every field of a client profile (including extra fields).
+
+    Args:
+        client: Client profile
+
+    Returns:
+        Hex digest that changes whenever any profile value changes
+    """
+    return _fingerprint(client)
+
+
+def scenario_fingerprint(scenario: Scenario) -> str:
+    """
+    Hash every field of a scenario definition.
+
+    Args:
+        scenario: Scenario
+
+    Returns:
+        Hex digest that changes whenever the scenario changes
+    """
+    return _fingerprint(scenario)
+
+
+class MatchStore:
+    """
+    SQLite-backed store of client-scenario match results.
+
+    Example:
+        >>> store = MatchStore("data/match_store.sqlite")
+        >>> stored = store.get_many([client_fingerprint(c)], [scenario_fingerprint(s)])
+        >>> store.put_many([(client_hash, scenario_hash, 75.0, None)])
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        """
+        Open (or create) a match store.
+
+        Args:
+            path: SQLite database file, or ":memory:" for a store that
+                lives only as long as this object
+        """
+        self.path = str(path)
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != MATCH_STORE_VERSION:
+            if version:
+                logger.info(
+                    f"Match store {self.path} is version {version}, "
+                    f"expected {MATCH_STORE_VERSION}: clearing stored matches"
+                )
+            self._connection.execute("DROP TABLE IF EXISTS matches")
+            self._connection.execute(f"PRAGMA user_version = {MATCH_STORE_VERSION}")
+
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+
+    def __enter__(self) -> "MatchStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._connection.close()
+
+    def get_many(
+        self,
+        client_hashes: Iterable[str],
+        scenario_hashes: Iterable[str]
+    ) -> dict[tuple[str, str], StoredMatch]:
+        """
+        Fetch stored results for every pair of the given hashes.
+
+        Args:
+            client_hashes: Client fingerprints
+            scenario_hashes: Scenario fingerprints
+
+        Returns:
+            Dict mapping (client_hash, scenario_hash) to
+            (match_score, opportunity JSON or None); pairs never stored
+            are absent
+        """
+        client_hashes = list(dict.fromkeys(client_hashes))
+        wanted_scenarios = set(scenario_hashes)
+        stored: dict[tuple[str, str], StoredMatch] = {}
+
+        for start in range(0, len(client_hashes), _QUERY_CHUNK_SIZE):
+            chunk = client_hashes[start:start + _QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._connection.execute(
+                "SELECT client_hash, scenario_hash, match_score, opportunity "
+                f"FROM matches WHERE client_hash IN ({placeholders})",
+                chunk
+            )
+            for client_hash, scenario_hash, match_score, opportunity in rows:
+                if scenario_hash in wanted_scenarios:
+                    stored[(client_hash, scenario_hash)] = (match_score, opportunity)
+
+        return stored
+
+    def put_many(
+        self,
+        rows: Iterable[tuple[str, str, float, Optional[str]]]
+    ) -> None:
+        """
+        Store (or replace) results and commit.
+
+        Args:
+            rows: (client_hash, scenario_hash, match_score, opportunity
+                JSON or None) tuples
+        """
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO matches "
+                "(client_hash, scenario_hash, match_score, opportunity) "
+                "VALUES (?, ?, ?, ?)",
+                rows
+            )
+
+    def retain(
+        self,
+        client_hashes: Iterable[str],
+        scenario_hashes: Iterable[str]
+    ) -> int:
+        """
+        Delete results for clients or scenarios no longer in use.
+
+        Args:
+            client_hashes: Fingerprints of the current client book
+            scenario_hashes: Fingerprints of the current scenarios
+
+        Returns:
+            Number of stored pairs deleted
+        """
+        with self._connection:
+            connection = self._connection
+            connection.execute("CREATE TEMP TABLE keep_clients (hash TEXT PRIMARY KEY)")
+            connection.execute("CREATE TEMP TABLE keep_scenarios (hash TEXT PRIMARY KEY)")
+            try:
+                connection.executemany(
+                    "INSERT OR IGNORE INTO keep_clients VALUES (?)",
+                    ((h,) for h in client_hashes)
+                )
+                connection.executemany(
+                    "INSERT OR IGNORE INTO keep_scenarios VALUES (?)",
+                    ((h,) for h in scenario_hashes)
+                )
+                deleted = connection.execute(
+                    "DELETE FROM matches "
+                    "WHERE client_hash NOT IN (SELECT hash FROM keep_clients) "
+                    "OR scenario_hash NOT IN (SELECT hash FROM keep_scenarios)"
+                ).rowcount
+            finally:
+                connection.execute("DROP TABLE keep_clients")
+                connection.execute("DROP TABLE keep_scenarios")
+
+        logger.info(f"Pruned {deleted} stale pairs from match store {self.path}")
+        return deleted
@@ -0,0 +1,476 @@
+"""
+Opportunity portfolio optimizer for OpportunityIQ Client Matcher.
+
+Advisors can't act on every matched opportunity: each has a limited time
+budget and can only execute opportunities they hold the licenses for.
+For each group (an advisor's book or a single client) the optimizer picks
+the revenue-maximizing subset of opportunities that fits the time budget,
+as a 0/1 knapsack:
+
+- duplicate opportunities (same client and scenario) are collapsed,
+  keeping the highest revenue
+- opportunities needing licenses the group doesn't hold are excluded
+- hours are discretized (default: quarter hours, rounded up so a plan
+  never exceeds its budget) and solved exactly with a vectorized dynamic
+  program, or with a revenue-per-hour greedy when the DP table would be
+  too large
+- greedy plans report the fractional (LP relaxation) upper bound, so
+  their distance from optimal is known
+
+Groups are independent; large batches are solved across a process pool.
+Workers receive plain tuples of revenues and time units and send back
+selected indices, never Opportunity models.
+
+SERVE Principle: Help each advisor spend limited hours where they serve clients best.
+"""
+
+import logging
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Literal, Optional, Sequence, Union
+
+from ..models import Opportunity
+
+logger = logging.getLogger(__name__)
+
+
+# Default time granularity for the knapsack
+TIME_RESOLUTION_HOURS = 0.25
+
+# Largest DP table (items x time units) method="auto" solves exactly
+DP_MAX_CELLS = 2_000_000
+
+# Total opportunities at which optimize_groups() uses a process pool
+# (on machines with more than one CPU)
+PARALLEL_MIN_OPPORTUNITIES = 20000
+
+OPTIMIZATION_METHODS = ("auto", "dp", "greedy")
+
+# A knapsack problem: (revenues, time units, capacity, method)
+KnapsackProblem = tuple[tuple[float, ...], tuple[int, ...], int, str]
+
+
+class PortfolioPlan:
+    """
+    The selected opportunities for one advisor or client.
+
+    Attributes:
+        group_id: Advisor or client ID the plan is for
+        selected: Chosen opportunities, highest revenue first
+        total_revenue: Estimated revenue of the selection
+        total_hours: Estimated hours of the selection
+        time_budget_hours: Time budget the plan was solved for
+        upper_bound: Bound on achievable revenue (the optimum for DP plans,
+            the fractional knapsack bound for greedy plans)
+        method: "dp" (optimal) or "greedy"
+        ineligible: Opportunities excluded for missing licenses
+        duplicates_removed: Duplicate client-scenario opportunities collapsed
+    """
+
+    __slots__ = (
+        "group_id",
+        "selected",
+        "total_revenue",
+        "total_hours",
+        "time_budget_hours",
+        "upper_bound",
+        "method",
+        "ineligible",
+        "duplicates_removed",
+    )
+
+    def __init__(
+        self,
+        group_id: str,
+        selected: list[Opportunity],
+        total_revenue: float,
+        total_hours: float,
+        time_budget_hours: float,
+        upper_bound: float,
+        method: str,
+        ineligible: int = 0,
+        duplicates_removed: int = 0
+    ):
+        self.group_id = group_id
+        self.selected = selected
+        self.total_revenue = total_revenue
+        self.total_hours = total_hours
+        self.time_budget_hours = time_budget_hours
+        self.upper_bound = upper_bound
+        self.method = method
+        self.ineligible = ineligible
+        self.duplicates_removed = duplicates_removed
+
+    @property
+    def optimality_gap(self) -> float:
+        """Revenue the plan may be leaving on the table (0 for DP plans)."""
+        return max(self.upper_bound - self.total_revenue, 0.0)
+
+    def to_dict(self) -> dict:
+        """Plan summary with the selected opportunity IDs."""
+        return {
+            "group_id": self.group_id,
+            "selected_opportunity_ids": [opp.opportunity_id for opp in self.selected],
+            "opportunities_selected": len(self.selected),
+            "total_revenue": self.total_revenue,
+            "total_hours": self.total_hours,
+            "time_budget_hours": self.time_budget_hours,
+            "upper_bound": self.upper_bound,
+            "optimality_gap": self.optimality_gap,
+            "method": self.method,
+            "ineligible": self.ineligible,
+            "duplicates_removed": self.duplicates_removed,
+        }
+
+
+def solve_knapsack(
+    revenues: Sequence[float],
+    units: Sequence[int],
+    capacity: int,
+    method: str = "auto"
+) -> tuple[list[int], float, str]:
+    """
+    Pick the revenue-maximizing items whose units fit the capacity.
+
+    Args:
+        revenues: Revenue per item (non-negative)
+        units: Time units per item (non-negative integers)
+        capacity: Time units available
+        method: "dp" (exact), "greedy" (revenue per unit), or "auto" (dp
+            when the table has at most DP_MAX_CELLS cells)
+
+    Returns:
+        Tuple of (selected item indices in ascending order, upper bound on
+        revenue - the optimum for dp, the fractional bound for greedy -
+        and the method used)
+    """
+    # Items that take no time are always worth taking
+    free = [i for i, w in enumerate(units) if w == 0]
+    free_revenue = sum(revenues[i] for i in free)
+
+    candidates = [
+        i for i, w in enumerate(units)
+        if 0 < w <= capacity and revenues[i] > 0
+    ]
+
+    upper_bound = free_revenue + _fractional_bound(revenues, units, capacity, candidates)
+
+    if not candidates:
+        return free, upper_bound, "dp"
+
+    if method == "auto":
+        method = "dp" if len(candidates) * (capacity + 1) <= DP_MAX_CELLS else "greedy"
+
+    if method == "dp":
+        chosen = _knapsack_dp(revenues, units, capacity, candidates)
+        # The DP optimum is itself the tightest bound
+        upper_bound = free_revenue + sum(revenues[i] for i in chosen)
+    else:
+        chosen = _knapsack_greedy(revenues, units, capacity, candidates)
+
+    return sorted(free + chosen), upper_bound, method
+
+
+def _solve_problem(problem: KnapsackProblem) -> tuple[list[int], float, str]:
+    """Solve a packed knapsack problem (process pool entry point)."""
+    return solve_knapsack(*problem)
+
+
+def _knapsack_dp(
+    revenues: Sequence[float],
+    units: Sequence[int],
+    capacity: int,
+    candidates: list[int]
+) -> list[int]:
+    """
+    Exact 0/1 knapsack over integer time units.
+
+    best[c] holds the best revenue using at most c units; each item
+    updates the whole row at once with NumPy, and a boolean table of
+    "item taken at capacity c" is kept for backtracking.
+    """
+    # Deferred import keeps NumPy off the import path until a plan is solved
+    import numpy as np
+
+    best = np.zeros(capacity + 1, dtype=np.float64)
+    taken = np.zeros((len(candidates), capacity + 1), dtype=bool)
+
+    for row, i in enumerate(candidates):
+        w = units[i]
+        with_item = best[:capacity + 1 - w] + revenues[i]
+        take = with_item > best[w:]
+        taken[row, w:] = take
+        best[w:] = np.where(take, with_item, best[w:])
+
+    chosen = []
+    c = capacity
+    for row in range(len(candidates) - 1, -1, -1):
+        if taken[row, c]:
+            i = candidates[row]
+            chosen.append(i)
+            c -= units[i]
+
+    return chosen
+
+
+def _knapsack_greedy(
+    revenues: Sequence[float],
+    units: Sequence[int],
+    capacity: int,
+    candidates: list[int]
+) -> list[int]:
+    """
+    Revenue-per-unit greedy, or the single best item if that earns more.
+
+    The better of the two is within a factor of 2 of optimal.
+    """
+    by_density = sorted(candidates, key=lambda i: revenues[i] / units[i], reverse=True)
+
+    chosen = []
+    chosen_revenue = 0.0
+    remaining = capacity
+    for i in by_density:
+        if units[i] <= remaining:
+            chosen.append(i)
+            chosen_revenue += revenues[i]
+            remaining -= units[i]
+
+    best_single = max(candidates, key=lambda i: revenues[i])
+    if revenues[best_single] > chosen_revenue:
+        return [best_single]
+
+    return chosen
+
+
+def _fractional_bound(
+    revenues: Sequence[float],
+    units: Sequence[int],
+    capacity: int,
+    candidates: list[int]
+) -> float:
+    """LP relaxation bound: fill by revenue per unit, last item fractionally."""
+    bound = 0.0
+    remaining = capacity
+
+    for i in sorted(candidates, key=lambda i: revenues[i] / units[i], reverse=True):
+        if units[i] <= remaining:
+            bound += revenues[i]
+            remaining -= units[i]
+        else:
+            bound += revenues[i] * remaining / units[i]
+            break
+
+    return bound
+
+
+class OpportunityOptimizer:
+    """
+    Chooses revenue-maximizing opportunities under time and license limits.
+
+    Example:
+        >>> optimizer = OpportunityOptimizer(
+        ...     time_budget_hours=20.0,
+        ...     licenses={"ADV-1": ["Series 7", "Series 65"]}
+        ... )
+        >>> plans = optimizer.optimize_groups({"ADV-1": advisor_opportunities})
+        >>> plan = plans["ADV-1"]
+        >>> print(f"${plan.total_revenue:,.0f} in {plan.total_hours}h")
+    """
+
+    def __init__(
+        self,
+        time_budget_hours: Union[float, dict[str, float]] = 40.0,
+        licenses: Optional[Union[list[str], dict[str, list[str]]]] = None,
+        method: Literal["auto", "dp", "greedy"] = "auto",
+        default_time_hours: float = 1.0,
+        time_resolution_hours: float = TIME_RESOLUTION_HOURS,
+        max_workers: Optional[int] = None
+    ):
+        """
+        Initialize the optimizer.
+
+        Args:
+            time_budget_hours: Hours available per group, or a mapping of
+                group ID to hours (groups not in it get 0)
+            licenses: Licenses held by every group, or a mapping of group ID
+                to licenses (groups not in it hold none); None disables
+                the license constraint
+            method: Knapsack method (see solve_knapsack)
+            default_time_hours: Hours assumed for opportunities without
+                an estimate
+            time_resolution_hours: Time discretization for the knapsack
+            max_workers: Worker processes for optimize_groups
+                (default: CPU count)
+
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        if method not in OPTIMIZATION_METHODS:
+            raise ValueError(f"Unsupported optimization method: {method}")
+        if time_resolution_hours <= 0:
+            raise ValueError("time_resolution_hours must be positive")
+        if default_time_hours < 0:
+            raise ValueError("default_time_hours cannot be negative")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.time_budget_hours = time_budget_hours
+        self.licenses = licenses
+        self.method = method
+        self.default_time_hours = default_time_hours
+        self.time_resolution_hours = time_resolution_hours
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def optimize(self, group_id: str, opportunities: list[Opportunity]) -> PortfolioPlan:
+        """
+        Plan a single group.
+
+        Args:
+            group_id: Advisor or client ID (looks up budget and licenses)
+            opportunities: The group's opportunities
+
+        Returns:
+            PortfolioPlan for the group
+        """
+        eligible, problem, ineligible, duplicates = self._prepare(group_id, opportunities)
+        return self._plan(group_id, eligible, problem, solve_knapsack(*problem), ineligible, duplicates)
+
+    def optimize_groups(
+        self,
+        groups: dict[str, list[Opportunity]]
+    ) -> dict[str, PortfolioPlan]:
+        """
+        Plan every group, across a process pool for large batches.
+
+        Args:
+            groups: Mapping of group ID to its opportunities
+
+        Returns:
+            Mapping of group ID to PortfolioPlan, in input order
+        """
+        prepared = {
+            group_id: self._prepare(group_id, opportunities)
+            for group_id, opportunities in groups.items()
+        }
+        problems = [problem for _, problem, _, _ in prepared.values()]
+
+        total = sum(len(problem[0]) for problem in problems)
+        workers = min(self.max_workers, len(problems))
+
+        if workers > 1 and total >= PARALLEL_MIN_OPPORTUNITIES:
+            logger.info(
+                f"Optimizing {len(problems)} groups ({total} opportunities) "
+                f"across {workers} workers"
+            )
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context()
+            ) as executor:
+                solutions = list(executor.map(
+                    _solve_problem,
+                    problems,
+                    chunksize=max(1, len(problems) // (workers * 4))
+                ))
+        else:
+            solutions = [solve_knapsack(*problem) for problem in problems]
+
+        return {
+            group_id: self._plan(group_id, eligible, problem, solution, ineligible, duplicates)
+            for (group_id, (eligible, problem, ineligible, duplicates)), solution
+            in zip(prepared.items(), solutions)
+        }
+
+    def _prepare(
+        self,
+        group_id: str,
+        opportunities: list[Opportunity]
+    ) -> tuple[list[Opportunity], KnapsackProblem, int, int]:
+        """
+        Deduplicate, apply licenses and discretize a group's opportunities.
+
+        Returns:
+            Tuple of (eligible opportunities, knapsack problem, ineligible
+            count, duplicates removed)
+        """
+        # Collapse duplicate client-scenario pairs, keeping the best revenue
+        unique: dict[tuple[str, str], Opportunity] = {}
+        for opp in opportunities:
+            key = (opp.client_id, opp.scenario_id)
+            current = unique.get(key)
+            if current is None or opp.estimated_revenue > current.estimated_revenue:
+                unique[key] = opp
+        duplicates = len(opportunities) - len(unique)
+
+        held = self._licenses_for(group_id)
+        eligible = [
+            opp for opp in unique.values()
+            if held is None or not opp.required_licenses or held.issuperset(opp.required_licenses)
+        ]
+        ineligible = len(unique) - len(eligible)
+
+        resolution = self.time_resolution_hours
+        units = tuple(
+            # Round up so a plan never exceeds its budget
+            math.ceil(round(self._hours(opp) / resolution, 9))
+            for opp in eligible
+        )
+        capacity = math.floor(round(self._budget_for(group_id) / resolution, 9))
+
+        problem = (
+            tuple(opp.estimated_revenue for opp in eligible),
+            units,
+            max(capacity, 0),
+            self.method
+        )
+        return eligible, problem, ineligible, duplicates
+
+    def _plan(
+        self,
+        group_id: str,
+        eligible: list[Opportunity],
+        problem: KnapsackProblem,
+        solution: tuple[list[int], float, str],
+        ineligible: int,
+        duplicates: int
+    ) -> PortfolioPlan:
+        """Build a PortfolioPlan from a knapsack solution."""
+        indices, upper_bound, method = solution
+        selected = sorted(
+            (eligible[i] for i in indices),
+            key=lambda opp: opp.estimated_revenue,
+            reverse=True
+        )
+
+        return PortfolioPlan(
+            group_id=group_id,
+            selected=selected,
+            total_revenue=sum(opp.estimated_revenue for opp in selected),
+            total_hours=sum(self._hours(opp) for opp in selected),
+            time_budget_hours=self._budget_for(group_id),
+            upper_bound=upper_bound,
+            method=method,
+            ineligible=ineligible,
+            duplicates_removed=duplicates
+        )
+
+    def _hours(self, opportunity: Opportunity) -> float:
+        """Estimated hours, or the default for opportunities without one."""
+        if opportunity.estimated_time_hours is None:
+            return self.default_time_hours
+        return opportunity.estimated_time_hours
+
+    def _budget_for(self, group_id: str) -> float:
+        """Time budget for a group."""
+        if isinstance(self.time_budget_hours, dict):
+            return self.time_budget_hours.get(group_id, 0.0)
+        return self.time_budget_hours
+
+    def _licenses_for(self, group_id: str) -> Optional[frozenset[str]]:
+        """Licenses held by a group (None when licenses aren't constrained)."""
+        if self.licenses is None:
+            return None
+        if isinstance(self.licenses, dict):
+            return frozenset(self.licenses.get(group_id, ()))
+        return frozenset(self.licenses)
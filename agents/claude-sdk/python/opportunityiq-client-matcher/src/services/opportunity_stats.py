@@ -0,0 +1,233 @@
+"""
+Opportunity statistics service for OpportunityIQ Client Matcher.
+
+Computes every summary statistic the reports and tools need in a single
+pass over the opportunities: totals and averages, high-priority, quick-win
+and high-value counts, counts and revenue grouped by priority, category,
+client and scenario, and revenue / match score percentiles.
+
+Sums are accumulated in input order, so totals are identical to summing
+the list directly.
+
+TRUTH Principle: One set of numbers, shared by every report format.
+"""
+
+import logging
+from array import array
+from typing import Any, Iterable
+
+from ..models import Opportunity
+
+logger = logging.getLogger(__name__)
+
+
+# Percentiles reported by default
+DEFAULT_PERCENTILES = (25, 50, 75, 90, 95)
+
+
+class OpportunityStats:
+    """
+    One-pass aggregate statistics over opportunities.
+
+    Example:
+        >>> stats = OpportunityStats.from_opportunities(opportunities)
+        >>> print(f"${stats.total_revenue:,.2f} across {stats.count} opportunities")
+        >>> stats.revenue_by("scenario_category")
+        {'annuity': 12500.0, 'rebalance': 4300.0}
+        >>> stats.revenue_percentiles()
+        {25: 1500.0, 50: 2500.0, 75: 6000.0, 90: 11000.0, 95: 13500.0}
+    """
+
+    # Opportunity fields that can be grouped by
+    GROUP_FIELDS = ("priority", "scenario_category", "client_id", "scenario_id")
+
+    def __init__(self, high_value_threshold: float = 5000.0):
+        """
+        Initialize empty statistics.
+
+        Args:
+            high_value_threshold: Minimum revenue counted as high-value
+        """
+        self.high_value_threshold = high_value_threshold
+
+        self.count = 0
+        self.total_revenue = 0.0
+        self.total_match_score = 0.0
+        self.high_priority_count = 0
+        self.quick_wins_count = 0
+        self.high_value_count = 0
+
+        # field -> value -> [count, revenue], in first-seen order
+        self._groups: dict[str, dict[Any, list]] = {
+            field: {} for field in self.GROUP_FIELDS
+        }
+
+        # Raw values for percentiles (8 bytes per opportunity each)
+        self._revenues = array("d")
+        self._match_scores = array("d")
+
+    @classmethod
+    def from_opportunities(
+        cls,
+        opportunities: Iterable[Opportunity],
+        high_value_threshold: float = 5000.0
+    ) -> "OpportunityStats":
+        """
+        Aggregate statistics over opportunities in one pass.
+
+        Args:
+            opportunities: Opportunities (any iterable, consumed once)
+            high_value_threshold: Minimum revenue counted as high-value
+
+        Returns:
+            OpportunityStats
+        """
+        stats = cls(high_value_threshold)
+        stats.update(opportunities)
+        return stats
+
+    def update(self, opportunities: Iterable[Opportunity]) -> None:
+        """
+        Add opportunities to the statistics.
+
+        Args:
+            opportunities: Opportunities to add
+        """
+        by_priority = self._groups["priority"]
+        by_category = self._groups["scenario_category"]
+        by_client = self._groups["client_id"]
+        by_scenario = self._groups["scenario_id"]
+        revenues = self._revenues
+        match_scores = self._match_scores
+        high_value_threshold = self.high_value_threshold
+
+        count = self.count
+        total_revenue = self.total_revenue
+        total_match_score = self.total_match_score
+        high_priority_count = self.high_priority_count
+        quick_wins_count = self.quick_wins_count
+        high_value_count = self.high_value_count
+
+        for opp in opportunities:
+            revenue = opp.estimated_revenue
+            match_score = opp.match_score
+            priority = opp.priority
+
+            count += 1
+            total_revenue += revenue
+            total_match_score += match_score
+            revenues.append(revenue)
+            match_scores.append(match_score)
+
+            if priority == "high":
+                high_priority_count += 1
+            if opp.is_quick_win():
+                quick_wins_count += 1
+            if revenue >= high_value_threshold:
+                high_value_count += 1
+
+            _add_to_group(by_priority, priority, revenue)
+            _add_to_group(by_category, opp.scenario_category, revenue)
+            _add_to_group(by_client, opp.client_id, revenue)
+            _add_to_group(by_scenario, opp.scenario_id, revenue)
+
+        self.count = count
+        self.total_revenue = total_revenue
+        self.total_match_score = total_match_score
+        self.high_priority_count = high_priority_count
+        self.quick_wins_count = quick_wins_count
+        self.high_value_count = high_value_count
+
+    @property
+    def average_match_score(self) -> float:
+        """Mean match score (0.0 when empty)."""
+        return self.total_match_score / self.count if self.count else 0.0
+
+    @property
+    def average_revenue(self) -> float:
+        """Mean estimated revenue (0.0 when empty)."""
+        return self.total_revenue / self.count if self.count else 0.0
+
+    @property
+    def unique_clients(self) -> int:
+        """Number of distinct clients."""
+        return len(self._groups["client_id"])
+
+    @property
+    def unique_scenarios(self) -> int:
+        """Number of distinct scenarios."""
+        return len(self._groups["scenario_id"])
+
+    def count_by(self, field: str) -> dict[Any, int]:
+        """
+        Opportunity counts grouped by a field.
+
+        Args:
+            field: One of GROUP_FIELDS
+
+        Returns:
+            Dict of field value -> count, in first-seen order
+        """
+        return {value: group[0] for value, group in self._group(field).items()}
+
+    def revenue_by(self, field: str) -> dict[Any, float]:
+        """
+        Estimated revenue totals grouped by a field.
+
+        Args:
+            field: One of GROUP_FIELDS
+
+        Returns:
+            Dict of field value -> total revenue, in first-seen order
+        """
+        return {value: group[1] for value, group in self._group(field).items()}
+
+    def revenue_percentiles(
+        self,
+        percentiles: Iterable[float] = DEFAULT_PERCENTILES
+    ) -> dict[float, float]:
+        """Estimated revenue percentiles (linear interpolation)."""
+        return _percentiles(self._revenues, percentiles)
+
+    def match_score_percentiles(
+        self,
+        percentiles: Iterable[float] = DEFAULT_PERCENTILES
+    ) -> dict[float, float]:
+        """Match score percentiles (linear interpolation)."""
+        return _percentiles(self._match_scores, percentiles)
+
+    def _group(self, field: str) -> dict[Any, list]:
+        groups = self._groups.get(field)
+        if groups is None:
+            raise ValueError(
+                f"Unsupported group field: {field}. "
+                f"Expected one of: {', '.join(self.GROUP_FIELDS)}"
+            )
+        return groups
+
+
+def _add_to_group(groups: dict[Any, list], value: Any, revenue: float) -> None:
+    """Count one opportunity and its revenue under a group value."""
+    group = groups.get(value)
+    if group is None:
+        groups[value] = [1, revenue]
+    else:
+        group[0] += 1
+        group[1] += revenue
+
+
+def _percentiles(values: array, percentiles: Iterable[float]) -> dict[float, float]:
+    """
+    Percentiles of a value array, matching numpy's default (linear) method.
+
+    Returns an empty dict when there are no values.
+    """
+    percentiles = list(percentiles)
+    if not values:
+        return {}
+
+    # Deferred import keeps NumPy off the import path for small reports
+    import numpy as np
+
+    results = np.percentile(np.frombuffer(values, dtype=np.float64), percentiles)
+    return {p: float(v) for p, v in zip(percentiles, results)}
@@ -0,0 +1,455 @@
+"""
+Streaming opportunity writers for OpportunityIQ Client Matcher.
+
+Writers consume opportunities one at a time and write them incrementally,
+so exporting a firm-wide opportunity list never needs the whole list in
+memory:
+- CSV: same columns as export_opportunities_csv
+- NDJSON: one full opportunity (model JSON) per line
+- Markdown: the markdown report's per-opportunity sections, with summary
+  statistics written at the end once every opportunity has been seen
+- Parquet: typed CSV columns in row groups (requires pyarrow)
+
+Text formats can be compressed with gzip, bz2 or xz; Parquet uses its own
+column compression (e.g. snappy, zstd).
+
+SERVE Principle: Exports that scale with the firm, not with available memory.
+"""
+
+import bz2
+import csv
+import gzip
+import logging
+import lzma
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, Literal, Optional, TextIO, Union
+
+from ..models import Opportunity
+from .opportunity_stats import OpportunityStats
+from .report_generator import ReportGenerator
+
+logger = logging.getLogger(__name__)
+
+ExportFormat = Literal["csv", "ndjson", "markdown", "parquet"]
+Compression = Literal["gzip", "bz2", "xz"]
+
+# File extensions recognised for each export format
+EXPORT_EXTENSIONS: dict[str, ExportFormat] = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".md": "markdown",
+    ".markdown": "markdown",
+    ".parquet": "parquet",
+}
+
+# Compression recognised from a trailing file extension
+COMPRESSION_EXTENSIONS: dict[str, Compression] = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+}
+
+_COMPRESSED_OPENERS = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+
+# Columns written by the CSV and Parquet writers
+CSV_COLUMNS = [
+    "rank",
+    "client_id",
+    "client_name",
+    "scenario_id",
+    "scenario_name",
+    "category",
+    "priority",
+    "match_score",
+    "estimated_revenue",
+    "criteria_met",
+    "total_criteria",
+    "estimated_time_hours",
+    "composite_score",
+    "is_quick_win",
+    "is_high_value"
+]
+
+# Opportunities buffered per Parquet row group
+PARQUET_ROW_GROUP_SIZE = 10000
+
+
+def detect_export_format(
+    file_path: Union[str, Path]
+) -> tuple[ExportFormat, Optional[Compression]]:
+    """
+    Detect export format and compression from a file name.
+
+    Args:
+        file_path: Output path, e.g. 'opportunities.csv.gz'
+
+    Returns:
+        Tuple of (format, compression or None)
+
+    Raises:
+        ValueError: If the extension is not recognised
+    """
+    suffixes = [suffix.lower() for suffix in Path(file_path).suffixes]
+
+    compression = detect_compression(file_path)
+    if compression is not None:
+        suffixes.pop()
+
+    export_format = EXPORT_EXTENSIONS.get(suffixes[-1]) if suffixes else None
+    if export_format is None:
+        raise ValueError(
+            f"Unsupported export file name '{Path(file_path).name}'. "
+            f"Expected one of: {', '.join(EXPORT_EXTENSIONS)} "
+            f"(optionally followed by {', '.join(COMPRESSION_EXTENSIONS)})"
+        )
+
+    return export_format, compression
+
+
+def detect_compression(file_path: Union[str, Path]) -> Optional[Compression]:
+    """
+    Detect compression from a trailing .gz, .bz2 or .xz extension.
+
+    Args:
+        file_path: Output path, e.g. 'opportunities.csv.gz'
+
+    Returns:
+        "gzip", "bz2", "xz" or None
+    """
+    return COMPRESSION_EXTENSIONS.get(Path(file_path).suffix.lower())
+
+
+def csv_row(opp: Opportunity) -> dict[str, Any]:
+    """Format an opportunity as a CSV row (values as written to the file)."""
+    return {
+        "rank": opp.rank,
+        "client_id": opp.client_id,
+        "client_name": opp.client_name,
+        "scenario_id": opp.scenario_id,
+        "scenario_name": opp.scenario_name,
+        "category": opp.scenario_category,
+        "priority": opp.priority,
+        "match_score": f"{opp.match_score:.2f}",
+        "estimated_revenue": f"{opp.estimated_revenue:.2f}",
+        "criteria_met": opp.criteria_met,
+        "total_criteria": opp.total_criteria,
+        "estimated_time_hours": opp.estimated_time_hours or "",
+        "composite_score": f"{opp.composite_score:.2f}" if opp.composite_score else "",
+        "is_quick_win": opp.is_quick_win(),
+        "is_high_value": opp.is_high_value()
+    }
+
+
+class OpportunityWriter:
+    """
+    Base class for streaming opportunity writers.
+
+    Use as a context manager; call write() per opportunity or
+    write_all() with any iterable. If the block raises, the writer is
+    closed with ``failed`` set, so formats with a closing section don't
+    present a partial export as complete.
+
+    Example:
+        >>> with CsvOpportunityWriter("reports/all.csv.gz", compression="gzip") as writer:
+        ...     writer.write_all(stream_client_matches(clients, scenarios, 60.0))
+    """
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        compression: Optional[str] = None
+    ):
+        """
+        Open the output file.
+
+        Args:
+            file_path: Path to write (parent directories are created)
+            compression: "gzip", "bz2", "xz" or None
+        """
+        self.file_path = Path(file_path)
+        self.compression = compression
+        self.count = 0
+        self.failed = False
+
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self) -> "OpportunityWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is not None:
+            self.failed = True
+        self.close()
+
+    def write(self, opp: Opportunity) -> None:
+        """Write one opportunity."""
+        self._write(opp)
+        self.count += 1
+
+    def write_all(self, opportunities: Iterable[Opportunity]) -> int:
+        """
+        Write every opportunity from an iterable.
+
+        Returns:
+            Number of opportunities written by this call
+        """
+        start = self.count
+        for opp in opportunities:
+            self.write(opp)
+        return self.count - start
+
+    def close(self) -> None:
+        """Flush and close the output file."""
+        raise NotImplementedError
+
+    def _write(self, opp: Opportunity) -> None:
+        raise NotImplementedError
+
+    def _open_text(self) -> TextIO:
+        """Open the output as (optionally compressed) UTF-8 text."""
+        if self.compression is None:
+            return open(self.file_path, "w", newline="", encoding="utf-8")
+
+        opener = _COMPRESSED_OPENERS.get(self.compression)
+        if opener is None:
+            raise ValueError(
+                f"Unsupported compression: {self.compression}. "
+                f"Expected one of: {', '.join(_COMPRESSED_OPENERS)}"
+            )
+        return opener(self.file_path, "wt", newline="", encoding="utf-8")
+
+
+class CsvOpportunityWriter(OpportunityWriter):
+    """Writes opportunities as CSV rows (same columns as export_opportunities_csv)."""
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        compression: Optional[str] = None
+    ):
+        super().__init__(file_path, compression)
+        self._file = self._open_text()
+        self._writer = csv.DictWriter(self._file, fieldnames=CSV_COLUMNS)
+        self._writer.writeheader()
+
+    def _write(self, opp: Opportunity) -> None:
+        self._writer.writerow(csv_row(opp))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class NdjsonOpportunityWriter(OpportunityWriter):
+    """Writes one full opportunity (model JSON) per line."""
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        compression: Optional[str] = None
+    ):
+        super().__init__(file_path, compression)
+        self._file = self._open_text()
+
+    def _write(self, opp: Opportunity) -> None:
+        self._file.write(opp.model_dump_json())
+        self._file.write("\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class MarkdownOpportunityWriter(OpportunityWriter):
+    """
+    Writes the markdown report incrementally.
+
+    Opportunity sections are formatted exactly as in the markdown report.
+    Statistics are aggregated while writing and appended as the closing
+    Summary Statistics section, since they are only known at the end. A
+    failed export gets no Summary Statistics section.
+    """
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        compression: Optional[str] = None
+    ):
+        super().__init__(file_path, compression)
+        self._file = self._open_text()
+        self._generator = ReportGenerator()
+        self._stats = OpportunityStats()
+
+        self._file.write("\n".join([
+            "# OpportunityIQ Client Matcher Report\n",
+            f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            "---\n",
+            "## Opportunity Details\n",
+        ]))
+        self._file.write("\n")
+
+    def _write(self, opp: Opportunity) -> None:
+        self._stats.update((opp,))
+        self._file.write("\n".join(self._generator.markdown_opportunity_lines(opp)))
+        self._file.write("\n")
+
+    def close(self) -> None:
+        if self.failed:
+            self._file.close()
+            return
+
+        stats = self._stats
+        self._file.write("\n".join([
+            "## Summary Statistics\n",
+            f"- **Total Opportunities:** {stats.count}",
+            f"- **Total Estimated Revenue:** ${stats.total_revenue:,.2f}",
+            f"- **Average Match Score:** {stats.average_match_score:.1f}%",
+            f"- **High Priority Opportunities:** {stats.high_priority_count}",
+            f"- **Quick Wins:** {stats.quick_wins_count}",
+        ]))
+        self._file.write("\n")
+        self._file.close()
+
+
+class ParquetOpportunityWriter(OpportunityWriter):
+    """
+    Writes typed opportunity columns to Parquet in row groups.
+
+    Requires the optional pyarrow package.
+    """
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        compression: Optional[str] = "snappy",
+        row_group_size: int = PARQUET_ROW_GROUP_SIZE
+    ):
+        """
+        Open the Parquet file.
+
+        Args:
+            file_path: Path to write
+            compression: Parquet codec ("snappy", "zstd", "gzip", ...) or None
+            row_group_size: Opportunities buffered per row group
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Parquet export requires pyarrow. Install it with: pip install pyarrow"
+            ) from e
+
+        super().__init__(file_path, compression)
+        self.row_group_size = row_group_size
+
+        self._pa = pa
+        self._schema = pa.schema([
+            ("rank", pa.int64()),
+            ("client_id", pa.string()),
+            ("client_name", pa.string()),
+            ("scenario_id", pa.string()),
+            ("scenario_name", pa.string()),
+            ("category", pa.string()),
+            ("priority", pa.string()),
+            ("match_score", pa.float64()),
+            ("estimated_revenue", pa.float64()),
+            ("criteria_met", pa.int64()),
+            ("total_criteria", pa.int64()),
+            ("estimated_time_hours", pa.float64()),
+            ("composite_score", pa.float64()),
+            ("is_quick_win", pa.bool_()),
+            ("is_high_value", pa.bool_()),
+        ])
+        self._writer = pq.ParquetWriter(
+            str(self.file_path),
+            self._schema,
+            compression=compression or "none"
+        )
+        self._columns: dict[str, list] = {name: [] for name in CSV_COLUMNS}
+
+    def _write(self, opp: Opportunity) -> None:
+        columns = self._columns
+        columns["rank"].append(opp.rank)
+        columns["client_id"].append(opp.client_id)
+        columns["client_name"].append(opp.client_name)
+        columns["scenario_id"].append(opp.scenario_id)
+        columns["scenario_name"].append(opp.scenario_name)
+        columns["category"].append(opp.scenario_category)
+        columns["priority"].append(opp.priority)
+        columns["match_score"].append(opp.match_score)
+        columns["estimated_revenue"].append(opp.estimated_revenue)
+        columns["criteria_met"].append(opp.criteria_met)
+        columns["total_criteria"].append(opp.total_criteria)
+        columns["estimated_time_hours"].append(opp.estimated_time_hours)
+        columns["composite_score"].append(opp.composite_score)
+        columns["is_quick_win"].append(opp.is_quick_win())
+        columns["is_high_value"].append(opp.is_high_value())
+
+        if len(columns["rank"]) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._columns["rank"]:
+            return
+        self._writer.write_table(
+            self._pa.table(self._columns, schema=self._schema)
+        )
+        self._columns = {name: [] for name in CSV_COLUMNS}
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+_WRITERS: dict[str, type[OpportunityWriter]] = {
+    "csv": CsvOpportunityWriter,
+    "ndjson": NdjsonOpportunityWriter,
+    "markdown": MarkdownOpportunityWriter,
+    "parquet": ParquetOpportunityWriter,
+}
+
+
+def open_opportunity_writer(
+    file_path: Union[str, Path],
+    format: Optional[ExportFormat] = None,
+    compression: Optional[str] = None
+) -> OpportunityWriter:
+    """
+    Open a streaming writer for a file.
+
+    Args:
+        file_path: Output path
+        format: "csv", "ndjson", "markdown" or "parquet"
+            (default: from the file extension)
+        compression: "gzip", "bz2" or "xz" for text formats, or a Parquet
+            codec (default: from a .gz/.bz2/.xz extension, whether or not
+            format is given; snappy for Parquet)
+
+    Returns:
+        OpportunityWriter (use as a context manager)
+
+    Raises:
+        ValueError: If the format or compression is unsupported
+    """
+    if format is None:
+        format, detected_compression = detect_export_format(file_path)
+    else:
+        detected_compression = detect_compression(file_path)
+    compression = compression or detected_compression
+
+    writer_class = _WRITERS.get(format)
+    if writer_class is None:
+        raise ValueError(f"Unsupported export format: {format}")
+
+    if writer_class is ParquetOpportunityWriter and compression is None:
+        return writer_class(file_path)
+
+    return writer_class(file_path, compression=compression)
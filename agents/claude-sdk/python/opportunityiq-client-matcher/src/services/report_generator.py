@@ -7,10 +7,11 @@ SERVE Principle: Clear, actionable reports that help advisors make decisions.
 """
 
 import logging
-from typing import Literal
+from typing import Iterator, Literal, Optional
 from datetime import datetime
 
 from ..models import Opportunity
+from .opportunity_stats import OpportunityStats
 
 logger = logging.getLogger(__name__)
 
@@ -20,12 +21,15 @@ class ReportGenerator:
     Generates formatted reports from opportunity data.
 
     Supports multiple output formats: markdown, text, json, summary.
+    Summary statistics are aggregated once (OpportunityStats) and shared
+    by every format.
     """
 
     def generate_report(
         self,
         opportunities: list[Opportunity],
-        format: Literal["markdown", "text", "json", "summary"] = "markdown"
+        format: Literal["markdown", "text", "json", "summary"] = "markdown",
+        stats: Optional[OpportunityStats] = None
     ) -> str:
         """
         Generate a formatted report from opportunities.
@@ -33,6 +37,8 @@ class ReportGenerator:
         Args:
             opportunities: List of matched opportunities
             format: Output format (markdown, text, json, summary)
+            stats: Precomputed statistics for these opportunities
+                (aggregated here if not given)
 
         Returns:
             Formatted report as string
@@ -47,101 +53,147 @@ class ReportGenerator:
             f"Generating {format} report for {len(opportunities)} opportunities"
         )
 
+        if format not in ("markdown", "text", "json", "summary"):
+            raise ValueError(f"Unsupported report format: {format}")
+
+        if stats is None:
+            stats = OpportunityStats.from_opportunities(opportunities)
+
         if format == "markdown":
-            return self._generate_markdown(opportunities)
+            return self._generate_markdown(opportunities, stats)
         elif format == "text":
-            return self._generate_text(opportunities)
+            return self._generate_text(opportunities, stats)
         elif format == "json":
-            return self._generate_json(opportunities)
-        elif format == "summary":
-            return self._generate_summary(opportunities)
+            return self._generate_json(opportunities, stats)
         else:
-            raise ValueError(f"Unsupported report format: {format}")
+            return self._generate_summary(opportunities, stats)
 
-    def _generate_markdown(self, opportunities: list[Opportunity]) -> str:
+    def _generate_markdown(
+        self,
+        opportunities: list[Opportunity],
+        stats: OpportunityStats
+    ) -> str:
         """
         Generate a markdown formatted report.
 
         Args:
             opportunities: List of opportunities
+            stats: Statistics for the opportunities
 
         Returns:
             Markdown formatted report
         """
-        lines = []
+        return "\n".join(self.iter_markdown_lines(opportunities, stats))
+
+    def iter_markdown_lines(
+        self,
+        opportunities: list[Opportunity],
+        stats: OpportunityStats
+    ) -> Iterator[str]:
+        """
+        Yield the markdown report line by line.
+
+        Joining the lines with newlines gives exactly the markdown report;
+        use this to stream a large report instead of building the string.
+
+        Args:
+            opportunities: List of opportunities
+            stats: Statistics for the opportunities
 
+        Yields:
+            Report lines
+        """
         # Header
-        lines.append("# OpportunityIQ Client Matcher Report\n")
-        lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        lines.append(f"**Total Opportunities:** {len(opportunities)}\n")
-        lines.append("---\n")
+        yield "# OpportunityIQ Client Matcher Report\n"
+        yield f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        yield f"**Total Opportunities:** {len(opportunities)}\n"
+        yield "---\n"
 
         # Summary statistics
-        total_revenue = sum(opp.estimated_revenue for opp in opportunities)
-        avg_match_score = sum(opp.match_score for opp in opportunities) / len(opportunities)
-        high_priority = sum(1 for opp in opportunities if opp.priority == "high")
-
-        lines.append("## Summary Statistics\n")
-        lines.append(f"- **Total Estimated Revenue:** ${total_revenue:,.2f}")
-        lines.append(f"- **Average Match Score:** {avg_match_score:.1f}%")
-        lines.append(f"- **High Priority Opportunities:** {high_priority}")
-        lines.append(f"- **Quick Wins:** {sum(1 for opp in opportunities if opp.is_quick_win())}\n")
-        lines.append("---\n")
+        yield "## Summary Statistics\n"
+        yield f"- **Total Estimated Revenue:** ${stats.total_revenue:,.2f}"
+        yield f"- **Average Match Score:** {stats.average_match_score:.1f}%"
+        yield f"- **High Priority Opportunities:** {stats.high_priority_count}"
+        yield f"- **Quick Wins:** {stats.quick_wins_count}\n"
+        yield "---\n"
 
         # Detailed opportunities
-        lines.append("## Opportunity Details\n")
+        yield "## Opportunity Details\n"
 
         for opp in opportunities:
-            lines.append(f"### {opp.rank}. {opp.scenario_name}\n")
-            lines.append(f"**Client:** {opp.client_name} (ID: {opp.client_id})")
-            lines.append(f"**Category:** {opp.scenario_category}")
-            lines.append(f"**Priority:** {opp.priority.upper()}")
-            lines.append(f"**Match Score:** {opp.match_score:.1f}%")
-            lines.append(f"**Estimated Revenue:** ${opp.estimated_revenue:,.2f}")
+            yield from self.markdown_opportunity_lines(opp)
 
-            if opp.estimated_time_hours:
-                lines.append(f"**Estimated Time:** {opp.estimated_time_hours} hours")
-
-            # Match details
-            lines.append(f"\n**Match Details:**")
-            lines.append(f"- Criteria Met: {opp.criteria_met} / {opp.total_criteria}")
-            for detail in opp.match_details[:3]:  # Show top 3
-                status = "✓" if detail.matched else "✗"
-                lines.append(
-                    f"  - {status} {detail.criterion_field}: "
-                    f"{detail.actual_value} {detail.operator} {detail.expected_value}"
-                )
-
-            # Revenue breakdown
-            lines.append(f"\n**Revenue Calculation:**")
-            rev_calc = opp.revenue_calculation
-            lines.append(f"- Formula Type: {rev_calc.formula_type}")
-            lines.append(f"- Base Rate: {rev_calc.base_rate}")
-            if rev_calc.multiplier_value:
-                lines.append(f"- Multiplier Value: ${rev_calc.multiplier_value:,.2f}")
-            lines.append(f"- Calculated: ${rev_calc.calculated_amount:,.2f}")
-            if rev_calc.min_applied or rev_calc.max_applied:
-                adjustments = []
-                if rev_calc.min_applied:
-                    adjustments.append("minimum applied")
-                if rev_calc.max_applied:
-                    adjustments.append("maximum applied")
-                lines.append(f"- Adjustments: {', '.join(adjustments)}")
-
-            # Compliance notes
-            if opp.compliance_notes:
-                lines.append(f"\n**Compliance:** {opp.compliance_notes}")
-
-            lines.append("\n---\n")
+    def markdown_opportunity_lines(self, opp: Opportunity) -> list[str]:
+        """
+        Format one opportunity's section of the markdown report.
 
-        return "\n".join(lines)
+        Args:
+            opp: Opportunity to format
 
-    def _generate_text(self, opportunities: list[Opportunity]) -> str:
+        Returns:
+            Report lines (to be joined with newlines)
+        """
+        lines = []
+
+        # Streamed exports are unranked: title without a rank number
+        if opp.rank is not None:
+            lines.append(f"### {opp.rank}. {opp.scenario_name}\n")
+        else:
+            lines.append(f"### {opp.scenario_name}\n")
+        lines.append(f"**Client:** {opp.client_name} (ID: {opp.client_id})")
+        lines.append(f"**Category:** {opp.scenario_category}")
+        lines.append(f"**Priority:** {opp.priority.upper()}")
+        lines.append(f"**Match Score:** {opp.match_score:.1f}%")
+        lines.append(f"**Estimated Revenue:** ${opp.estimated_revenue:,.2f}")
+
+        if opp.estimated_time_hours:
+            lines.append(f"**Estimated Time:** {opp.estimated_time_hours} hours")
+
+        # Match details
+        lines.append(f"\n**Match Details:**")
+        lines.append(f"- Criteria Met: {opp.criteria_met} / {opp.total_criteria}")
+        for detail in opp.match_details[:3]:  # Show top 3
+            status = "✓" if detail.matched else "✗"
+            lines.append(
+                f"  - {status} {detail.criterion_field}: "
+                f"{detail.actual_value} {detail.operator} {detail.expected_value}"
+            )
+
+        # Revenue breakdown
+        lines.append(f"\n**Revenue Calculation:**")
+        rev_calc = opp.revenue_calculation
+        lines.append(f"- Formula Type: {rev_calc.formula_type}")
+        lines.append(f"- Base Rate: {rev_calc.base_rate}")
+        if rev_calc.multiplier_value:
+            lines.append(f"- Multiplier Value: ${rev_calc.multiplier_value:,.2f}")
+        lines.append(f"- Calculated: ${rev_calc.calculated_amount:,.2f}")
+        if rev_calc.min_applied or rev_calc.max_applied:
+            adjustments = []
+            if rev_calc.min_applied:
+                adjustments.append("minimum applied")
+            if rev_calc.max_applied:
+                adjustments.append("maximum applied")
+            lines.append(f"- Adjustments: {', '.join(adjustments)}")
+
+        # Compliance notes
+        if opp.compliance_notes:
+            lines.append(f"\n**Compliance:** {opp.compliance_notes}")
+
+        lines.append("\n---\n")
+
+        return lines
+
+    def _generate_text(
+        self,
+        opportunities: list[Opportunity],
+        stats: OpportunityStats
+    ) -> str:
         """
         Generate a plain text report.
 
         Args:
             opportunities: List of opportunities
+            stats: Statistics for the opportunities
 
         Returns:
             Plain text report
@@ -158,14 +210,11 @@ class ReportGenerator:
         lines.append("")
 
         # Summary
-        total_revenue = sum(opp.estimated_revenue for opp in opportunities)
-        avg_match_score = sum(opp.match_score for opp in opportunities) / len(opportunities)
-
         lines.append("SUMMARY STATISTICS")
         lines.append("-" * 70)
-        lines.append(f"Total Estimated Revenue:    ${total_revenue:,.2f}")
-        lines.append(f"Average Match Score:        {avg_match_score:.1f}%")
-        lines.append(f"High Priority Opportunities: {sum(1 for opp in opportunities if opp.priority == 'high')}")
+        lines.append(f"Total Estimated Revenue:    ${stats.total_revenue:,.2f}")
+        lines.append(f"Average Match Score:        {stats.average_match_score:.1f}%")
+        lines.append(f"High Priority Opportunities: {stats.high_priority_count}")
         lines.append("")
 
         # Opportunities
@@ -188,12 +237,17 @@ class ReportGenerator:
 
         return "\n".join(lines)
 
-    def _generate_json(self, opportunities: list[Opportunity]) -> str:
+    def _generate_json(
+        self,
+        opportunities: list[Opportunity],
+        stats: OpportunityStats
+    ) -> str:
         """
         Generate a JSON report.
 
         Args:
             opportunities: List of opportunities
+            stats: Statistics for the opportunities
 
         Returns:
             JSON formatted report
@@ -204,7 +258,7 @@ class ReportGenerator:
         data = {
             "generated_at": datetime.now().isoformat(),
             "total_opportunities": len(opportunities),
-            "total_revenue": sum(opp.estimated_revenue for opp in opportunities),
+            "total_revenue": stats.total_revenue,
             "opportunities": [
                 opp.model_dump(mode="json") for opp in opportunities
             ]
@@ -212,30 +266,30 @@ class ReportGenerator:
 
         return json.dumps(data, indent=2)
 
-    def _generate_summary(self, opportunities: list[Opportunity]) -> str:
+    def _generate_summary(
+        self,
+        opportunities: list[Opportunity],
+        stats: OpportunityStats
+    ) -> str:
         """
         Generate a brief summary report.
 
         Args:
             opportunities: List of opportunities
+            stats: Statistics for the opportunities
 
         Returns:
             Summary report
         """
         lines = []
 
-        total_revenue = sum(opp.estimated_revenue for opp in opportunities)
-        avg_match_score = sum(opp.match_score for opp in opportunities) / len(opportunities)
-        high_priority = sum(1 for opp in opportunities if opp.priority == "high")
-        quick_wins = sum(1 for opp in opportunities if opp.is_quick_win())
-
         lines.append("OpportunityIQ Summary")
         lines.append("=" * 50)
         lines.append(f"Total Opportunities: {len(opportunities)}")
-        lines.append(f"Estimated Revenue:   ${total_revenue:,.2f}")
-        lines.append(f"Avg Match Score:     {avg_match_score:.1f}%")
-        lines.append(f"High Priority:       {high_priority}")
-        lines.append(f"Quick Wins:          {quick_wins}")
+        lines.append(f"Estimated Revenue:   ${stats.total_revenue:,.2f}")
+        lines.append(f"Avg Match Score:     {stats.average_match_score:.1f}%")
+        lines.append(f"High Priority:       {stats.high_priority_count}")
+        lines.append(f"Quick Wins:          {stats.quick_wins_count}")
         lines.append("")
 
         lines.append("Top 5 Opportunities:")
@@ -3,170 +3,201 @@ Revenue calculation service for OpportunityIQ Client Matcher.
 
 Business logic for estimating potential revenue from matched opportunities.
 
+Revenue formulas are compiled once per scenario: tier strings are parsed
+and sorted into breakpoint arrays with cumulative revenue per tier, and
+the multiplier field is resolved to a direct accessor. Single clients are
+priced with a binary search over the breakpoints; whole columns of clients
+are priced at once with NumPy ``searchsorted``.
+
 EXCELLENCE Principle: Accurate revenue calculations with transparent methodology.
 """
 
 import logging
-from typing import Optional
+import math
+from bisect import bisect_left
+from typing import Any, Optional
 
 from ..models import (
     ClientProfile,
     Scenario,
+    RevenueFormula,
     RevenueCalculation
 )
+from .scenario_compiler import compile_field_accessor
+from .telemetry import MatchTelemetry
 
 logger = logging.getLogger(__name__)
 
 
-class RevenueCalculator:
+class CompiledRevenueFormula:
     """
-    Calculates estimated revenue for matched opportunities.
-
-    Supports multiple revenue formula types: percentage, flat_fee, tiered, aum_based.
+    A revenue formula with tiers and multiplier access resolved up front.
+
+    Tiered formulas whose ranges don't overlap (each tier ends at or before
+    the next begins, only the last may be unbounded) are evaluated from
+    cumulative tier totals: revenue for a value in tier k is the sum of
+    tiers 0..k-1 plus the partial amount in tier k, added in the same order
+    as a tier-by-tier walk, so results are bit-for-bit identical. Other tier
+    layouts fall back to the tier walk over the pre-parsed tiers.
     """
 
-    def calculate_revenue(
-        self,
-        client: ClientProfile,
-        scenario: Scenario
-    ) -> RevenueCalculation:
+    __slots__ = (
+        "formula",
+        "formula_type",
+        "base_rate",
+        "multiplier_field",
+        "_accessor",
+        "_tiers",
+        "_lowers",
+        "_uppers",
+        "_rates",
+        "_cumulative",
+        "_searchable",
+    )
+
+    def __init__(self, formula: RevenueFormula):
         """
-        Calculate estimated revenue for a client-scenario match.
+        Compile a revenue formula.
 
         Args:
-            client: Client profile
-            scenario: Matched scenario
-
-        Returns:
-            RevenueCalculation with detailed breakdown
+            formula: Revenue formula to compile
 
         Raises:
-            ValueError: If formula type is unsupported or required data is missing
+            ValueError: If the formula is missing required settings or has
+                invalid tier ranges
         """
-        formula = scenario.revenue_formula
         formula_type = formula.formula_type
 
-        # Route to appropriate calculation method
-        if formula_type == "percentage":
-            calculated = self._calculate_percentage(client, formula)
-        elif formula_type == "flat_fee":
-            calculated = self._calculate_flat_fee(client, formula)
-        elif formula_type == "tiered":
-            calculated = self._calculate_tiered(client, formula)
-        elif formula_type == "aum_based":
-            calculated = self._calculate_aum_based(client, formula)
-        else:
+        if formula_type not in ("percentage", "flat_fee", "tiered", "aum_based"):
             raise ValueError(f"Unsupported formula type: {formula_type}")
 
-        # Apply min/max constraints
-        final_amount = calculated
-        min_applied = False
-        max_applied = False
-
-        if formula.min_revenue is not None and calculated < formula.min_revenue:
-            final_amount = formula.min_revenue
-            min_applied = True
-            logger.debug(
-                f"Applied minimum revenue: ${calculated:.2f} -> ${final_amount:.2f}"
-            )
-
-        if formula.max_revenue is not None and calculated > formula.max_revenue:
-            final_amount = formula.max_revenue
-            max_applied = True
-            logger.debug(
-                f"Applied maximum revenue cap: ${calculated:.2f} -> ${final_amount:.2f}"
-            )
-
-        # Get multiplier value if used
-        multiplier_value = None
-        if formula.multiplier_field:
-            multiplier_value = self._get_multiplier_value(client, formula)
+        if formula_type == "percentage" and not formula.multiplier_field:
+            raise ValueError("Percentage formula requires multiplier_field")
 
-        logger.info(
-            f"Revenue calculated for client {client.client_id}: "
-            f"${final_amount:.2f} (formula: {formula_type})"
+        if formula_type == "tiered":
+            if not formula.tiers:
+                raise ValueError("Tiered formula requires tiers dictionary")
+            if not formula.multiplier_field:
+                raise ValueError("Tiered formula requires multiplier_field")
+
+        self.formula = formula
+        self.formula_type = formula_type
+        self.base_rate = formula.base_rate
+        self.multiplier_field = formula.multiplier_field
+        self._accessor = (
+            compile_field_accessor(formula.multiplier_field)
+            if formula.multiplier_field else None
         )
 
-        return RevenueCalculation(
-            formula_type=formula_type,
-            base_rate=formula.base_rate,
-            multiplier_value=multiplier_value,
-            calculated_amount=calculated,
-            final_amount=final_amount,
-            min_applied=min_applied,
-            max_applied=max_applied
+        self._tiers: list[tuple[tuple[float, Optional[float]], float]] = []
+        self._lowers: list[float] = []
+        self._uppers: list[float] = []
+        self._rates: list[float] = []
+        self._cumulative: list[float] = []
+        self._searchable = False
+
+        if formula_type == "tiered":
+            self._compile_tiers(formula.tiers)
+
+    def _compile_tiers(self, tiers: dict[str, float]) -> None:
+        """Parse tiers once and precompute cumulative totals per breakpoint."""
+        self._tiers = _parse_and_sort_tiers(tiers)
+
+        self._lowers = [lower for (lower, _), _ in self._tiers]
+        self._uppers = [
+            math.inf if upper is None else upper
+            for (_, upper), _ in self._tiers
+        ]
+        self._rates = [rate for _, rate in self._tiers]
+
+        self._searchable = all(
+            upper is not None and upper <= next_lower
+            for ((_, upper), _), next_lower in zip(self._tiers, self._lowers[1:])
         )
 
-    def _calculate_percentage(
-        self,
-        client: ClientProfile,
-        formula: "RevenueFormula"
-    ) -> float:
-        """
-        Calculate revenue as percentage of a client field.
-
-        Example: 1% of portfolio value = 0.01 * portfolio_value
+        # _cumulative[k]: revenue from tiers 0..k-1 filled completely,
+        # summed in tier order
+        total = 0.0
+        self._cumulative = [total]
+        for lower, upper, rate in zip(self._lowers, self._uppers, self._rates):
+            total += (upper - lower) * rate
+            self._cumulative.append(total)
 
-        Args:
-            client: Client profile
-            formula: Revenue formula
+    def multiplier_value(self, client: ClientProfile) -> Optional[float]:
+        """
+        Read the formula's multiplier field from a client.
 
         Returns:
-            Calculated revenue amount
+            Numeric multiplier, or None if the formula has no multiplier field
+
+        Raises:
+            ValueError: If field doesn't exist or is not numeric
         """
-        if not formula.multiplier_field:
-            raise ValueError("Percentage formula requires multiplier_field")
+        if self._accessor is None:
+            return None
 
-        multiplier = self._get_multiplier_value(client, formula)
-        return formula.base_rate * multiplier
+        try:
+            value = self._accessor(client)
+        except (AttributeError, KeyError):
+            raise ValueError(
+                f"Field '{self.multiplier_field}' not found in client profile"
+            )
 
-    def _calculate_flat_fee(
-        self,
-        client: ClientProfile,
-        formula: "RevenueFormula"
-    ) -> float:
+        # Ensure value is numeric
+        if not isinstance(value, (int, float)):
+            raise ValueError(
+                f"Multiplier field '{self.multiplier_field}' must be numeric, "
+                f"got {type(value).__name__}"
+            )
+
+        return float(value)
+
+    def calculate(self, client: ClientProfile, multiplier: Optional[float]) -> float:
         """
-        Calculate revenue as flat fee.
+        Calculate raw revenue (before min/max) for a client.
 
         Args:
-            client: Client profile (unused, but kept for interface consistency)
-            formula: Revenue formula
+            client: Client profile
+            multiplier: Value from multiplier_value()
 
         Returns:
-            Flat fee amount (base_rate)
+            Calculated revenue amount
         """
-        return formula.base_rate
+        if self.formula_type == "flat_fee":
+            return self.base_rate
 
-    def _calculate_tiered(
-        self,
-        client: ClientProfile,
-        formula: "RevenueFormula"
-    ) -> float:
-        """
-        Calculate revenue using tiered rates.
+        if self.formula_type == "aum_based" and multiplier is None:
+            # Default to portfolio value if no multiplier field specified
+            return self.base_rate * client.portfolio.total_value
 
-        Example tiers: {'0-100000': 0.01, '100000-500000': 0.008, '500000+': 0.005}
+        if self.formula_type == "tiered":
+            return self.tiered_amount(multiplier)
 
-        Args:
-            client: Client profile
-            formula: Revenue formula
+        return self.base_rate * multiplier
 
-        Returns:
-            Calculated revenue based on tiers
+    def tiered_amount(self, value: float) -> float:
         """
-        if not formula.tiers:
-            raise ValueError("Tiered formula requires tiers dictionary")
+        Calculate tiered revenue for a single value.
 
-        if not formula.multiplier_field:
-            raise ValueError("Tiered formula requires multiplier_field")
+        Example tiers: {'0-100000': 0.01, '100000-500000': 0.008, '500000+': 0.005}
+        """
+        if not self._searchable or value != value:
+            return self._walk_tiers(value)
 
-        value = self._get_multiplier_value(client, formula)
-        total_revenue = 0.0
+        # Tiers 0..k-1 start below the value
+        k = bisect_left(self._lowers, value)
+        if k == 0:
+            return 0.0
+
+        upper = self._uppers[k - 1]
+        tier_amount = min(value, upper) - self._lowers[k - 1]
+        return self._cumulative[k - 1] + tier_amount * self._rates[k - 1]
 
-        # Sort tiers by lower bound
-        sorted_tiers = self._parse_and_sort_tiers(formula.tiers)
+    def _walk_tiers(self, value: float) -> float:
+        """Tier-by-tier evaluation, for overlapping tier layouts (and NaN)."""
+        total_revenue = 0.0
 
-        for (lower, upper), rate in sorted_tiers:
+        for (lower, upper), rate in self._tiers:
             if value <= lower:
                 # Haven't reached this tier yet
                 continue
@@ -188,106 +219,405 @@ class RevenueCalculator:
 
         return total_revenue
 
-    def _calculate_aum_based(
+    def calculate_column(self, values: Any, portfolio_values: Any = None) -> Any:
+        """
+        Calculate raw revenue for a whole column of multiplier values.
+
+        Args:
+            values: float64 array of multiplier values (ignored for
+                flat_fee; unused when aum_based has no multiplier field)
+            portfolio_values: float64 array of portfolio totals, for
+                aum_based formulas without a multiplier field
+
+        Returns:
+            float64 array of calculated amounts
+        """
+        import numpy as np
+
+        if self.formula_type == "flat_fee":
+            return np.full(len(values), self.base_rate, dtype=np.float64)
+
+        if self.formula_type == "aum_based" and self._accessor is None:
+            return self.base_rate * portfolio_values
+
+        if self.formula_type != "tiered":
+            return self.base_rate * values
+
+        if not self._searchable:
+            return np.array([self._walk_tiers(v) for v in values.tolist()], dtype=np.float64)
+
+        lowers = np.array(self._lowers, dtype=np.float64)
+        uppers = np.array(self._uppers, dtype=np.float64)
+        rates = np.array(self._rates, dtype=np.float64)
+        cumulative = np.array(self._cumulative, dtype=np.float64)
+
+        k = np.searchsorted(lowers, values, side="left")
+        tier = np.maximum(k - 1, 0)
+
+        amounts = cumulative[tier] + (
+            np.minimum(values, uppers[tier]) - lowers[tier]
+        ) * rates[tier]
+        amounts = np.where(k == 0, 0.0, amounts)
+
+        # NaN sorts past every breakpoint; match the tier walk instead
+        nan_rows = np.isnan(values)
+        if nan_rows.any():
+            amounts[nan_rows] = [self._walk_tiers(v) for v in values[nan_rows].tolist()]
+
+        return amounts
+
+
+class RevenueBatch:
+    """
+    Revenue for a column of clients against one scenario.
+
+    Attributes:
+        formula: Compiled formula used
+        multiplier_values: Multiplier per client (None where not used)
+        calculated: float64 array of raw amounts
+        final: float64 array after min/max adjustments
+        min_applied: bool array, True where the minimum was applied
+        max_applied: bool array, True where the maximum cap was applied
+        errors: Mapping of row index to error for clients that could not
+            be priced
+    """
+
+    def __init__(
         self,
-        client: ClientProfile,
-        formula: "RevenueFormula"
-    ) -> float:
+        formula: CompiledRevenueFormula,
+        multiplier_values: list[Optional[float]],
+        calculated: Any,
+        final: Any,
+        min_applied: Any,
+        max_applied: Any,
+        errors: dict[int, Exception]
+    ):
+        self.formula = formula
+        self.multiplier_values = multiplier_values
+        self.calculated = calculated
+        self.final = final
+        self.min_applied = min_applied
+        self.max_applied = max_applied
+        self.errors = errors
+        self._rows: Optional[list[tuple[float, float, bool, bool]]] = None
+
+    def __len__(self) -> int:
+        return len(self.multiplier_values)
+
+    def calculation(self, index: int) -> RevenueCalculation:
+        """
+        Build the RevenueCalculation for one row.
+
+        Raises:
+            ValueError: If the client at index could not be priced
+        """
+        error = self.errors.get(index)
+        if error is not None:
+            raise error
+
+        if self._rows is None:
+            # Convert the arrays to Python scalars once, not per row
+            self._rows = list(zip(
+                self.calculated.tolist(),
+                self.final.tolist(),
+                self.min_applied.tolist(),
+                self.max_applied.tolist()
+            ))
+        calculated, final, min_applied, max_applied = self._rows[index]
+
+        return RevenueCalculation(
+            formula_type=self.formula.formula_type,
+            base_rate=self.formula.base_rate,
+            multiplier_value=self.multiplier_values[index],
+            calculated_amount=calculated,
+            final_amount=final,
+            min_applied=min_applied,
+            max_applied=max_applied
+        )
+
+
+class RevenueCalculator:
+    """
+    Calculates estimated revenue for matched opportunities.
+
+    Supports multiple revenue formula types: percentage, flat_fee, tiered, aum_based.
+    Formulas are compiled once per scenario and cached per calculator.
+
+    Calculations are counted in ``self.telemetry`` rather than logged one
+    line per client; call ``calculator.telemetry.flush()`` after a batch.
+    """
+
+    def __init__(self, telemetry: Optional[MatchTelemetry] = None):
         """
-        Calculate revenue based on Assets Under Management (AUM).
+        Initialize the revenue calculator.
 
-        Convenience method that uses portfolio value by default.
+        Args:
+            telemetry: Batch telemetry to record calculations in
+                (default: a new MatchTelemetry for this calculator)
+        """
+        self._compiled: dict[int, tuple[RevenueFormula, CompiledRevenueFormula]] = {}
+        self.telemetry = (
+            telemetry if telemetry is not None else MatchTelemetry("revenue_calculator")
+        )
+
+    def compile(self, scenario: Scenario) -> CompiledRevenueFormula:
+        """
+        Get the compiled revenue formula for a scenario, compiling on first use.
 
         Args:
-            client: Client profile
-            formula: Revenue formula
+            scenario: Scenario whose revenue formula to compile
 
         Returns:
-            Calculated revenue
+            CompiledRevenueFormula for the scenario
+
+        Raises:
+            ValueError: If formula type is unsupported or required settings
+                are missing
         """
-        # Default to portfolio value if no multiplier field specified
-        if not formula.multiplier_field:
-            multiplier = client.portfolio.total_value
-        else:
-            multiplier = self._get_multiplier_value(client, formula)
+        formula = scenario.revenue_formula
+        cached = self._compiled.get(id(formula))
+        if cached is not None and cached[0] is formula:
+            return cached[1]
 
-        return formula.base_rate * multiplier
+        compiled = CompiledRevenueFormula(formula)
+        # Keep a reference to the formula so its id cannot be reused
+        self._compiled[id(formula)] = (formula, compiled)
+        return compiled
 
-    def _get_multiplier_value(
+    def calculate_revenue(
         self,
         client: ClientProfile,
-        formula: "RevenueFormula"
-    ) -> float:
+        scenario: Scenario
+    ) -> RevenueCalculation:
         """
-        Extract multiplier value from client profile.
+        Calculate estimated revenue for a client-scenario match.
 
         Args:
             client: Client profile
-            formula: Revenue formula with multiplier_field
+            scenario: Matched scenario
 
         Returns:
-            Numeric value to use as multiplier
+            RevenueCalculation with detailed breakdown
 
         Raises:
-            ValueError: If field doesn't exist or is not numeric
+            ValueError: If formula type is unsupported or required data is missing
         """
-        if not formula.multiplier_field:
-            raise ValueError("No multiplier field specified")
+        compiled = self.compile(scenario)
+        formula = compiled.formula
+        formula_type = compiled.formula_type
 
-        # Navigate nested fields using dot notation
-        parts = formula.multiplier_field.split(".")
-        value = client
+        multiplier_value = compiled.multiplier_value(client)
+        calculated = compiled.calculate(client, multiplier_value)
 
-        for part in parts:
-            if hasattr(value, part):
-                value = getattr(value, part)
-            else:
-                raise ValueError(
-                    f"Field '{formula.multiplier_field}' not found in client profile"
-                )
+        # Apply min/max constraints
+        final_amount, min_applied, max_applied = _apply_limits(formula, calculated)
 
-        # Ensure value is numeric
-        if not isinstance(value, (int, float)):
+        revenue_calc = RevenueCalculation(
+            formula_type=formula_type,
+            base_rate=formula.base_rate,
+            multiplier_value=multiplier_value,
+            calculated_amount=calculated,
+            final_amount=final_amount,
+            min_applied=min_applied,
+            max_applied=max_applied
+        )
+
+        if self.telemetry.record_revenue(final_amount, formula_type, min_applied, max_applied):
+            logger.info(
+                f"Revenue calculated for client {client.client_id}: "
+                f"${final_amount:.2f} (formula: {formula_type}, calculated: "
+                f"${calculated:.2f}, min applied: {min_applied}, max applied: {max_applied})"
+            )
+
+        return revenue_calc
+
+    def estimate_revenue(
+        self,
+        client: ClientProfile,
+        scenario: Scenario
+    ) -> float:
+        """
+        Calculate only the final revenue amount for a client-scenario match.
+
+        Same amount as calculate_revenue(...).final_amount, without building
+        the RevenueCalculation breakdown. Amounts the breakdown would reject
+        (negative or NaN) raise here too, so both fail for the same clients.
+
+        Args:
+            client: Client profile
+            scenario: Matched scenario
+
+        Returns:
+            Final revenue amount after min/max adjustments
+
+        Raises:
+            ValueError: If formula type is unsupported, required data is
+                missing or the amount is not a valid revenue
+        """
+        compiled = self.compile(scenario)
+        calculated = compiled.calculate(client, compiled.multiplier_value(client))
+        final_amount, min_applied, max_applied = _apply_limits(compiled.formula, calculated)
+
+        if not (calculated >= 0 and final_amount >= 0):
             raise ValueError(
-                f"Multiplier field '{formula.multiplier_field}' must be numeric, "
-                f"got {type(value).__name__}"
+                f"Invalid revenue for client {client.client_id}: "
+                f"calculated ${calculated:.2f}, final ${final_amount:.2f}"
             )
 
-        return float(value)
+        if self.telemetry.record_revenue(
+            final_amount, compiled.formula_type, min_applied, max_applied
+        ):
+            logger.info(
+                f"Revenue estimated for client {client.client_id}: "
+                f"${final_amount:.2f} (formula: {compiled.formula_type})"
+            )
 
-    def _parse_and_sort_tiers(
+        return final_amount
+
+    def calculate_revenue_batch(
         self,
-        tiers: dict[str, float]
-    ) -> list[tuple[tuple[float, Optional[float]], float]]:
+        clients: list[ClientProfile],
+        scenario: Scenario
+    ) -> RevenueBatch:
         """
-        Parse and sort tier ranges.
+        Calculate revenue for a column of clients against one scenario.
 
-        Converts string ranges like "0-100000" or "500000+" into numeric tuples.
+        Multiplier values are read once per client; the formula (including
+        tier lookup via searchsorted) and min/max adjustments run as NumPy
+        array operations over the whole column. Amounts are identical to
+        calculate_revenue().
 
         Args:
-            tiers: Dictionary of tier ranges to rates
+            clients: Matched clients
+            scenario: Scenario with the revenue formula
 
         Returns:
-            Sorted list of ((lower, upper), rate) tuples
+            RevenueBatch aligned with clients; use batch.calculation(i) for
+            a RevenueCalculation and batch.errors for clients that could
+            not be priced
+
+        Raises:
+            ValueError: If formula type is unsupported or required settings
+                are missing
         """
-        parsed_tiers = []
-
-        for range_str, rate in tiers.items():
-            if "+" in range_str:
-                # Unlimited upper bound (e.g., "500000+")
-                lower = float(range_str.replace("+", ""))
-                upper = None
-            elif "-" in range_str:
-                # Bounded range (e.g., "0-100000")
-                lower_str, upper_str = range_str.split("-")
-                lower = float(lower_str)
-                upper = float(upper_str)
-            else:
-                raise ValueError(f"Invalid tier range format: {range_str}")
+        import numpy as np
+
+        compiled = self.compile(scenario)
+        formula = compiled.formula
+
+        multiplier_values: list[Optional[float]] = []
+        errors: dict[int, Exception] = {}
+
+        for i, client in enumerate(clients):
+            try:
+                multiplier_values.append(compiled.multiplier_value(client))
+            except ValueError as e:
+                multiplier_values.append(None)
+                errors[i] = e
+
+        values = np.array(
+            [math.nan if v is None else v for v in multiplier_values],
+            dtype=np.float64
+        )
+        portfolio_values = None
+        if compiled.formula_type == "aum_based" and compiled.multiplier_field is None:
+            portfolio_values = np.array(
+                [client.portfolio.total_value for client in clients],
+                dtype=np.float64
+            )
+
+        calculated = compiled.calculate_column(values, portfolio_values)
+
+        # Apply min/max constraints (max is checked against the raw amount,
+        # as in calculate_revenue)
+        final = calculated.copy()
+        min_applied = np.zeros(len(clients), dtype=bool)
+        max_applied = np.zeros(len(clients), dtype=bool)
+
+        if formula.min_revenue is not None:
+            min_applied = calculated < formula.min_revenue
+            final[min_applied] = formula.min_revenue
+
+        if formula.max_revenue is not None:
+            max_applied = calculated > formula.max_revenue
+            final[max_applied] = formula.max_revenue
+
+        logger.info(
+            f"Revenue calculated for {len(clients) - len(errors)} clients "
+            f"(formula: {compiled.formula_type}, scenario: {scenario.scenario_id})"
+        )
+
+        return RevenueBatch(
+            compiled,
+            multiplier_values,
+            calculated,
+            final,
+            min_applied,
+            max_applied,
+            errors
+        )
+
+
+def _apply_limits(
+    formula: RevenueFormula,
+    calculated: float
+) -> tuple[float, bool, bool]:
+    """
+    Apply a formula's min/max revenue to a calculated amount.
+
+    Returns:
+        Tuple of (final_amount, min_applied, max_applied)
+    """
+    final_amount = calculated
+    min_applied = False
+    max_applied = False
+
+    if formula.min_revenue is not None and calculated < formula.min_revenue:
+        final_amount = formula.min_revenue
+        min_applied = True
+
+    if formula.max_revenue is not None and calculated > formula.max_revenue:
+        final_amount = formula.max_revenue
+        max_applied = True
+
+    return final_amount, min_applied, max_applied
+
+
+def _parse_and_sort_tiers(
+    tiers: dict[str, float]
+) -> list[tuple[tuple[float, Optional[float]], float]]:
+    """
+    Parse and sort tier ranges.
+
+    Converts string ranges like "0-100000" or "500000+" into numeric tuples.
+
+    Args:
+        tiers: Dictionary of tier ranges to rates
+
+    Returns:
+        Sorted list of ((lower, upper), rate) tuples
+
+    Raises:
+        ValueError: If a tier range is malformed
+    """
+    parsed_tiers = []
+
+    for range_str, rate in tiers.items():
+        if "+" in range_str:
+            # Unlimited upper bound (e.g., "500000+")
+            lower = float(range_str.replace("+", ""))
+            upper = None
+        elif "-" in range_str:
+            # Bounded range (e.g., "0-100000")
+            lower_str, upper_str = range_str.split("-")
+            lower = float(lower_str)
+            upper = float(upper_str)
+        else:
+            raise ValueError(f"Invalid tier range format: {range_str}")
 
-            parsed_tiers.append(((lower, upper), rate))
+        parsed_tiers.append(((lower, upper), rate))
 
-        # Sort by lower bound
-        parsed_tiers.sort(key=lambda x: x[0][0])
+    # Sort by lower bound
+    parsed_tiers.sort(key=lambda x: x[0][0])
 
-        return parsed_tiers
+    return parsed_tiers
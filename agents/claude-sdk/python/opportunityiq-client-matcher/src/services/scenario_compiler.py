@@ -0,0 +1,599 @@
+"""
+Scenario compiler for OpportunityIQ Client Matcher.
+
+Compiles scenario criteria once into flat predicate closures with
+pre-resolved client field accessors. The matching hot loop then does no
+string splitting, operator dispatch or model construction; matches keep
+a compact MatchExplanation (matched-criteria bitmask plus actual values)
+and MatchDetail objects are only built when an explanation is read.
+
+TRUTH Principle: Compiled scenarios produce exactly the same scores and
+match details as criterion-by-criterion evaluation.
+"""
+
+import math
+from operator import attrgetter
+from typing import Any, Callable, Optional
+
+from ..models import (
+    ClientProfile,
+    Scenario,
+    MatchCriterion,
+    MatchDetail,
+    MatchExplanation
+)
+
+
+FieldAccessor = Callable[[ClientProfile], Any]
+Predicate = Callable[[Any], bool]
+
+
+# Field accessors
+
+def compile_field_accessor(field_path: str) -> FieldAccessor:
+    """
+    Resolve a dotted client field path into a direct accessor.
+
+    Declared and computed ClientProfile fields are read with a C-level
+    attrgetter. Scenario-specific extra fields (e.g. 'fia_value') are read
+    straight from ``__pydantic_extra__`` instead of going through Pydantic's
+    ``__getattr__`` fallback.
+
+    Args:
+        field_path: Field path in dot notation (e.g. 'portfolio.total_value')
+
+    Returns:
+        Callable taking a client and returning the field value
+
+        The accessor raises AttributeError (or KeyError for extra fields)
+        when the field is missing from a client.
+    """
+    head, _, rest = field_path.partition(".")
+
+    if head in ClientProfile.model_fields or hasattr(ClientProfile, head):
+        return attrgetter(field_path)
+
+    nested = attrgetter(rest) if rest else None
+
+    if nested is None:
+        def get_extra(client: ClientProfile) -> Any:
+            return client.__pydantic_extra__[head]
+    else:
+        def get_extra(client: ClientProfile) -> Any:
+            return nested(client.__pydantic_extra__[head])
+
+    return get_extra
+
+
+# Operator predicate factories
+
+def _compile_gt(expected: Any) -> Predicate:
+    """Greater than comparison."""
+    def predicate(actual: Any) -> bool:
+        return actual is not None and actual > expected
+    return predicate
+
+
+def _compile_lt(expected: Any) -> Predicate:
+    """Less than comparison."""
+    def predicate(actual: Any) -> bool:
+        return actual is not None and actual < expected
+    return predicate
+
+
+def _compile_gte(expected: Any) -> Predicate:
+    """Greater than or equal comparison."""
+    def predicate(actual: Any) -> bool:
+        return actual is not None and actual >= expected
+    return predicate
+
+
+def _compile_lte(expected: Any) -> Predicate:
+    """Less than or equal comparison."""
+    def predicate(actual: Any) -> bool:
+        return actual is not None and actual <= expected
+    return predicate
+
+
+def _compile_eq(expected: Any) -> Predicate:
+    """Equality comparison."""
+    def predicate(actual: Any) -> bool:
+        return actual is not None and actual == expected
+    return predicate
+
+
+def _compile_contains(expected: Any) -> Predicate:
+    """Contains comparison (expected value in actual string or list)."""
+    def predicate(actual: Any) -> bool:
+        if actual is None:
+            return False
+        try:
+            return expected in actual
+        except TypeError:
+            return False
+    return predicate
+
+
+def _compile_in(expected: Any) -> Predicate:
+    """In comparison (actual value in expected list)."""
+    if not isinstance(expected, (list, tuple)):
+        return lambda actual: False
+
+    try:
+        members = frozenset(expected)
+    except TypeError:
+        # Unhashable members (e.g. nested lists) fall back to list scans
+        members = expected
+
+    def predicate(actual: Any) -> bool:
+        if actual is None:
+            return False
+        try:
+            return actual in members
+        except TypeError:
+            return actual in expected
+    return predicate
+
+
+OPERATOR_COMPILERS: dict[str, Callable[[Any], Predicate]] = {
+    "gt": _compile_gt,
+    "lt": _compile_lt,
+    "gte": _compile_gte,
+    "lte": _compile_lte,
+    "eq": _compile_eq,
+    "contains": _compile_contains,
+    "in": _compile_in,
+}
+
+
+# Compiled criteria and scenarios
+
+class CompiledCriterion:
+    """
+    A single scenario criterion with its accessor and predicate resolved.
+    """
+
+    __slots__ = ("field", "operator", "expected", "weight", "accessor", "predicate")
+
+    def __init__(self, criterion: MatchCriterion):
+        """
+        Compile a criterion.
+
+        Args:
+            criterion: Criterion to compile
+
+        Raises:
+            ValueError: If the criterion uses an unsupported operator
+        """
+        operator_compiler = OPERATOR_COMPILERS.get(criterion.operator)
+        if operator_compiler is None:
+            raise ValueError(f"Unsupported operator: {criterion.operator}")
+
+        self.field = criterion.field
+        self.operator = criterion.operator
+        self.expected = criterion.value
+        self.weight = criterion.weight
+        self.accessor = compile_field_accessor(criterion.field)
+        self.predicate = operator_compiler(criterion.value)
+
+    def __reduce__(self):
+        # Accessors and predicates are closures; pickle the criterion and
+        # recompile it on load (e.g. opportunities sent to worker processes)
+        return (
+            CompiledCriterion,
+            (
+                MatchCriterion(
+                    field=self.field,
+                    operator=self.operator,
+                    value=self.expected,
+                    weight=self.weight
+                ),
+            )
+        )
+
+    def evaluate(self, client: ClientProfile) -> tuple[Any, bool]:
+        """
+        Evaluate the criterion against a client.
+
+        Missing fields and incomparable values count as not matched with
+        no actual value, as in MatchingEngine's error handling.
+
+        Returns:
+            Tuple of (actual_value, matched)
+        """
+        try:
+            actual = self.accessor(client)
+            return actual, bool(self.predicate(actual))
+        except Exception:
+            return None, False
+
+    def to_detail(self, actual_value: Any, matched: bool) -> MatchDetail:
+        """Build the MatchDetail for an evaluation result."""
+        return MatchDetail(
+            criterion_field=self.field,
+            operator=self.operator,
+            expected_value=self.expected,
+            actual_value=actual_value,
+            matched=matched,
+            weight=self.weight,
+            points_earned=self.weight if matched else 0.0
+        )
+
+
+def is_number(value: Any) -> bool:
+    """True for int/float values that compare numerically (not bool or NaN)."""
+    return (
+        isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and not (isinstance(value, float) and math.isnan(value))
+    )
+
+
+def safe_predicate(criterion: CompiledCriterion, value: Any) -> bool:
+    """Evaluate a criterion's predicate on a value, treating None and errors as no match."""
+    if value is None:
+        return False
+    try:
+        return bool(criterion.predicate(value))
+    except Exception:
+        return False
+
+
+class ThresholdPlan:
+    """
+    Criterion evaluation order for matching against a minimum score.
+
+    Criteria whose failure alone makes the threshold unreachable are
+    "required" and run first as a prefilter. The remaining criteria run in
+    order of expected lost points (weight x estimated failure rate), so
+    clients that cannot reach the threshold are rejected after as few
+    criteria as possible.
+
+    Attributes:
+        min_score: Threshold (0-100) the plan was built for
+        impossible: True when no client can reach the threshold
+        required_fields: Fields of the prefilter criteria
+        steps: Tuple of (accessor, predicate, weight, bit, max_remaining)
+            where max_remaining is the most points still available after
+            the step
+        evaluate: Generated straight-line function taking a client and
+            returning the bitmask of matched criteria, or None as soon as
+            the threshold becomes unreachable
+    """
+
+    __slots__ = (
+        "min_score",
+        "required_points",
+        "impossible",
+        "required_fields",
+        "steps",
+        "evaluate",
+    )
+
+    def __init__(
+        self,
+        criteria: tuple[CompiledCriterion, ...],
+        total_weight: float,
+        pass_rates: tuple[float, ...],
+        min_score: float
+    ):
+        self.min_score = min_score
+
+        # Tolerance keeps borderline clients for exact scoring instead of
+        # rejecting them on accumulated floating-point error
+        tolerance = 1e-9 * max(total_weight, 1.0)
+        self.required_points = (min_score / 100) * total_weight - tolerance
+        self.impossible = (
+            min_score > 0 and total_weight <= 0
+        ) or self.required_points > total_weight
+
+        required = [
+            i for i, c in enumerate(criteria)
+            if total_weight - c.weight < self.required_points
+        ]
+        optional = [i for i in range(len(criteria)) if i not in required]
+
+        required.sort(key=lambda i: (pass_rates[i], i))
+        optional.sort(key=lambda i: (-criteria[i].weight * (1.0 - pass_rates[i]), i))
+        order = required + optional
+
+        self.required_fields = tuple(criteria[i].field for i in required)
+
+        steps = []
+        remaining = sum(criteria[i].weight for i in order)
+        for i in order:
+            criterion = criteria[i]
+            remaining -= criterion.weight
+            steps.append((
+                criterion.accessor,
+                criterion.predicate,
+                criterion.weight,
+                1 << i,
+                max(remaining, 0.0)
+            ))
+        self.steps = tuple(steps)
+        self.evaluate = _generate_plan_function(self.steps, self.required_points)
+
+
+def _generate_plan_function(
+    steps: tuple[tuple[FieldAccessor, Predicate, float, int, float], ...],
+    required_points: float
+) -> Callable[[ClientProfile], Optional[int]]:
+    """
+    Generate a straight-line evaluation function for a threshold plan.
+
+    Unrolling the steps into one function (constants inlined, accessors and
+    predicates bound as globals) removes per-criterion loop and tuple
+    unpacking overhead from the hot path.
+    """
+    namespace: dict[str, Any] = {}
+    lines = ["def evaluate(client):", "    earned = 0.0", "    mask = 0"]
+
+    for k, (accessor, predicate, weight, bit, max_remaining) in enumerate(steps):
+        namespace[f"accessor_{k}"] = accessor
+        namespace[f"predicate_{k}"] = predicate
+        lines += [
+            "    try:",
+            f"        matched = predicate_{k}(accessor_{k}(client))",
+            "    except Exception:",
+            "        matched = False",
+            "    if matched:",
+            f"        earned += {weight!r}",
+            f"        mask |= {bit}",
+            f"    elif earned + {max_remaining!r} < {required_points!r}:",
+            "        return None",
+        ]
+
+    lines.append("    return mask")
+    exec(compile("\n".join(lines), "<threshold plan>", "exec"), namespace)
+    return namespace["evaluate"]
+
+
+class CompiledScenario:
+    """
+    A scenario compiled for fast repeated matching.
+
+    Holds the original scenario plus a flat tuple of (accessor, predicate,
+    weight) steps. Use ``score`` in hot loops, ``score_above`` when only
+    matches over a threshold matter, ``explain_compact`` to record a match
+    for later explanation, and ``explain`` when match details are needed
+    now.
+    """
+
+    __slots__ = (
+        "scenario",
+        "scenario_id",
+        "criteria",
+        "total_weight",
+        "pass_rates",
+        "_steps",
+        "_plans",
+        "_mask_scores",
+    )
+
+    def __init__(self, scenario: Scenario):
+        """
+        Compile a scenario.
+
+        Args:
+            scenario: Scenario to compile
+
+        Raises:
+            ValueError: If scenario has no criteria or invalid operator
+        """
+        if not scenario.criteria:
+            raise ValueError(f"Scenario {scenario.scenario_id} has no criteria")
+
+        self.scenario = scenario
+        self.scenario_id = scenario.scenario_id
+        self.criteria = tuple(CompiledCriterion(c) for c in scenario.criteria)
+
+        total_weight = 0.0
+        for criterion in self.criteria:
+            total_weight += criterion.weight
+        self.total_weight = total_weight
+
+        self._steps = tuple(
+            (c.accessor, c.predicate, c.weight) for c in self.criteria
+        )
+
+        # Estimated pass rate per criterion; refined by calibrate()
+        self.pass_rates = tuple(0.5 for _ in self.criteria)
+        self._plans: dict[float, ThresholdPlan] = {}
+        self._mask_scores: dict[int, float] = {}
+
+    def score(self, client: ClientProfile) -> float:
+        """
+        Calculate the match score (0-100) for a client.
+
+        Args:
+            client: Client profile to evaluate
+
+        Returns:
+            Match score as percentage
+        """
+        earned_points = 0.0
+
+        for accessor, predicate, weight in self._steps:
+            try:
+                if predicate(accessor(client)):
+                    earned_points += weight
+            except Exception:
+                # Missing field or incomparable value: criterion not met
+                pass
+
+        if self.total_weight > 0:
+            return (earned_points / self.total_weight) * 100
+        return 0.0
+
+    def calibrate(self, clients: list[ClientProfile]) -> None:
+        """
+        Estimate criterion selectivity from a sample of clients.
+
+        Pass rates decide the evaluation order of threshold plans; they
+        never change scores.
+
+        Args:
+            clients: Sample of client profiles
+        """
+        if not clients:
+            return
+
+        passed = [0] * len(self.criteria)
+        for client in clients:
+            for i, criterion in enumerate(self.criteria):
+                if criterion.evaluate(client)[1]:
+                    passed[i] += 1
+
+        self.pass_rates = tuple(count / len(clients) for count in passed)
+        self._plans.clear()
+
+    def plan(self, min_score: float) -> ThresholdPlan:
+        """
+        Get the (cached) evaluation plan for a threshold.
+
+        Args:
+            min_score: Minimum match score (0-100)
+
+        Returns:
+            ThresholdPlan for the threshold
+        """
+        plan = self._plans.get(min_score)
+        if plan is None:
+            plan = ThresholdPlan(
+                self.criteria,
+                self.total_weight,
+                self.pass_rates,
+                min_score
+            )
+            self._plans[min_score] = plan
+        return plan
+
+    def score_above(self, client: ClientProfile, min_score: float) -> Optional[float]:
+        """
+        Calculate the match score only if it can reach a threshold.
+
+        Evaluates criteria in the threshold plan's order and stops as soon
+        as the remaining criteria cannot lift the client to min_score.
+
+        Args:
+            client: Client profile to evaluate
+            min_score: Minimum match score (0-100)
+
+        Returns:
+            Exact match score (identical to score()) if it is at least
+            min_score, otherwise None
+        """
+        if min_score <= 0:
+            return self.score(client)
+
+        plan = self._plans.get(min_score) or self.plan(min_score)
+        if plan.impossible:
+            return None
+
+        mask = plan.evaluate(client)
+        if mask is None:
+            return None
+
+        match_score = self._mask_scores.get(mask)
+        if match_score is None:
+            match_score = self._score_mask(mask)
+        return match_score if match_score >= min_score else None
+
+    def _score_mask(self, mask: int) -> float:
+        """Exact score for a set of matched criteria, summed in scenario order."""
+        match_score = self._mask_scores.get(mask)
+        if match_score is None:
+            earned_points = 0.0
+            for i, criterion in enumerate(self.criteria):
+                if mask >> i & 1:
+                    earned_points += criterion.weight
+
+            if self.total_weight > 0:
+                match_score = (earned_points / self.total_weight) * 100
+            else:
+                match_score = 0.0
+            self._mask_scores[mask] = match_score
+        return match_score
+
+    def explain(self, client: ClientProfile) -> tuple[float, list[MatchDetail]]:
+        """
+        Calculate the match score and build per-criterion match details.
+
+        Args:
+            client: Client profile to evaluate
+
+        Returns:
+            Tuple of (match_score_percentage, list of match details)
+        """
+        match_details = []
+        earned_points = 0.0
+
+        for criterion in self.criteria:
+            actual_value, matched = criterion.evaluate(client)
+            if matched:
+                earned_points += criterion.weight
+            match_details.append(criterion.to_detail(actual_value, matched))
+
+        if self.total_weight > 0:
+            match_score = (earned_points / self.total_weight) * 100
+        else:
+            match_score = 0.0
+
+        return match_score, match_details
+
+    def explain_compact(self, client: ClientProfile) -> tuple[float, MatchExplanation]:
+        """
+        Calculate the match score and record criterion results compactly.
+
+        Same score as explain(); the MatchExplanation holds a bitmask of
+        matched criteria and the actual values, and builds the same match
+        details as explain() only when read.
+
+        Args:
+            client: Client profile to evaluate
+
+        Returns:
+            Tuple of (match_score_percentage, MatchExplanation)
+        """
+        mask = 0
+        actual_values = []
+
+        for i, criterion in enumerate(self.criteria):
+            actual_value, matched = criterion.evaluate(client)
+            actual_values.append(actual_value)
+            if matched:
+                mask |= 1 << i
+
+        explanation = MatchExplanation(self.criteria, mask, tuple(actual_values))
+        return self._score_mask(mask), explanation
+
+
+def compile_scenario(scenario: Scenario) -> CompiledScenario:
+    """
+    Compile a scenario for fast matching.
+
+    Args:
+        scenario: Scenario to compile
+
+    Returns:
+        CompiledScenario wrapping the scenario
+
+    Example:
+        >>> compiled = compile_scenario(scenario)
+        >>> scores = [compiled.score(client) for client in clients]
+    """
+    return CompiledScenario(scenario)
+
+
+def compile_scenarios(scenarios: list[Scenario]) -> list[CompiledScenario]:
+    """
+    Compile a list of scenarios, preserving order.
+
+    Args:
+        scenarios: Scenarios to compile
+
+    Returns:
+        List of CompiledScenario objects
+    """
+    return [CompiledScenario(scenario) for scenario in scenarios]
@@ -0,0 +1,315 @@
+"""
+Scenario registry service for OpportunityIQ Client Matcher.
+
+Caches validated (and, on request, compiled) scenarios per file, keyed by
+file path + modification time + content hash:
+- a file whose mtime and size are unchanged is served without being read
+- a file that was touched but whose content hash is unchanged is served
+  without being re-validated
+- only files whose content changed are parsed and validated again
+
+The registry can be saved as a bundle (one JSON file holding every cached
+file's signature and validated scenarios) and loaded by a fresh process,
+which then only re-validates files changed since the bundle was written.
+Compiled matchers hold generated code and are not serialized; they are
+compiled once per process, on first use.
+
+EXCELLENCE Principle: Scenario libraries load in proportion to what changed.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Union
+
+from pydantic import BaseModel, ValidationError
+
+from ..models import Scenario
+from .scenario_compiler import CompiledScenario, compile_scenario
+
+logger = logging.getLogger(__name__)
+
+
+# Bump when the bundle layout or scenario semantics change; older bundles are ignored
+SCENARIO_BUNDLE_VERSION = 1
+
+
+class _BundleFile(BaseModel):
+    """One cached scenario file in a bundle."""
+    path: str
+    mtime_ns: int
+    size: int
+    sha256: str
+    scenarios: list[Scenario]
+
+
+class _Bundle(BaseModel):
+    """Serialized registry contents."""
+    version: int
+    files: list[_BundleFile]
+
+
+class _RegistryEntry:
+    """Cached scenarios for one file version."""
+
+    __slots__ = ("mtime_ns", "size", "sha256", "scenarios")
+
+    def __init__(
+        self,
+        mtime_ns: int,
+        size: int,
+        sha256: str,
+        scenarios: tuple[Scenario, ...]
+    ):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.sha256 = sha256
+        self.scenarios = scenarios
+
+
+class ScenarioRegistry:
+    """
+    Cache of validated, compiled scenarios keyed by file path, mtime and hash.
+
+    Example:
+        >>> registry = ScenarioRegistry()
+        >>> registry.load_bundle("data/scenario_bundle.json")
+        >>> scenarios = load_all_scenario_files("data/scenarios", registry=registry)
+        >>> compiled = registry.compile(scenarios)  # compiled once per process
+        >>> if registry.dirty:
+        ...     registry.save_bundle("data/scenario_bundle.json")
+    """
+
+    def __init__(self):
+        """Create an empty registry."""
+        self._entries: dict[str, _RegistryEntry] = {}
+        self._lock = threading.RLock()
+
+        # id(scenario) -> compiled matcher, for scenarios held by an entry
+        self._owned: set[int] = set()
+        self._compiled: dict[int, CompiledScenario] = {}
+
+        # True when entries changed since the last bundle load or save
+        self.dirty = False
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load_file(
+        self,
+        file_path: Union[str, Path],
+        loader: Callable[[Path], list[Scenario]]
+    ) -> list[Scenario]:
+        """
+        Get a file's scenarios, validating them only if the file changed.
+
+        Args:
+            file_path: Scenario JSON file
+            loader: Parses and validates the file (e.g. load_scenarios);
+                called only when the file's content changed
+
+        Returns:
+            List of Scenario objects (the cached instances)
+
+        Raises:
+            Whatever the loader raises for an invalid file
+        """
+        path = Path(file_path)
+        key = os.path.abspath(path)
+        stat = path.stat()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if (
+                entry is not None
+                and entry.mtime_ns == stat.st_mtime_ns
+                and entry.size == stat.st_size
+            ):
+                self.hits += 1
+                return list(entry.scenarios)
+
+            sha256 = hashlib.sha256(path.read_bytes()).hexdigest()
+
+            if entry is not None and entry.sha256 == sha256:
+                # Touched but unchanged: keep the validated scenarios
+                entry.mtime_ns = stat.st_mtime_ns
+                entry.size = stat.st_size
+                self.dirty = True
+                self.hits += 1
+                return list(entry.scenarios)
+
+            self.misses += 1
+            scenarios = tuple(loader(path))
+
+            self._set_entry(
+                key,
+                _RegistryEntry(stat.st_mtime_ns, stat.st_size, sha256, scenarios)
+            )
+            return list(scenarios)
+
+    def retain(self, directory: Union[str, Path], file_paths: Iterable[Union[str, Path]]) -> int:
+        """
+        Drop cached files under a directory that are no longer present.
+
+        Args:
+            directory: Scenarios directory that was scanned
+            file_paths: Files found in it
+
+        Returns:
+            Number of cached files dropped
+        """
+        prefix = os.path.join(os.path.abspath(directory), "")
+        keep = {os.path.abspath(file_path) for file_path in file_paths}
+
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if key.startswith(prefix) and key not in keep
+            ]
+            for key in stale:
+                self._set_entry(key, None)
+
+        if stale:
+            logger.info(f"Dropped {len(stale)} removed scenario files from registry")
+        return len(stale)
+
+    def compile(self, scenarios: Iterable[Scenario]) -> list[CompiledScenario]:
+        """
+        Compile scenarios, reusing compiled matchers for cached scenarios.
+
+        Scenarios that fail to compile are logged and skipped.
+
+        Args:
+            scenarios: Scenarios (typically from load_file)
+
+        Returns:
+            List of CompiledScenario objects, in input order
+        """
+        compiled_scenarios = []
+
+        with self._lock:
+            for scenario in scenarios:
+                key = id(scenario)
+                compiled = self._compiled.get(key)
+
+                if compiled is None or compiled.scenario is not scenario:
+                    try:
+                        compiled = compile_scenario(scenario)
+                    except Exception as e:
+                        logger.error(f"Error compiling scenario {scenario.scenario_id}: {e}")
+                        continue
+                    if key in self._owned:
+                        self._compiled[key] = compiled
+
+                compiled_scenarios.append(compiled)
+
+        return compiled_scenarios
+
+    def save_bundle(self, bundle_path: Union[str, Path]) -> int:
+        """
+        Write every cached file's signature and validated scenarios.
+
+        Args:
+            bundle_path: Bundle file to write (parent directories are created)
+
+        Returns:
+            Number of files in the bundle
+        """
+        path = Path(bundle_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._lock:
+            bundle = _Bundle(
+                version=SCENARIO_BUNDLE_VERSION,
+                files=[
+                    _BundleFile(
+                        path=key,
+                        mtime_ns=entry.mtime_ns,
+                        size=entry.size,
+                        sha256=entry.sha256,
+                        scenarios=list(entry.scenarios)
+                    )
+                    for key, entry in self._entries.items()
+                ]
+            )
+            data = bundle.model_dump_json(exclude_unset=True)
+            self.dirty = False
+
+        # Write then rename so readers never see a partial bundle
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_text(data, encoding="utf-8")
+        os.replace(temp_path, path)
+
+        logger.info(f"Saved scenario bundle with {len(bundle.files)} files: {path}")
+        return len(bundle.files)
+
+    def load_bundle(self, bundle_path: Union[str, Path]) -> int:
+        """
+        Load cached files from a bundle.
+
+        Missing, unreadable or outdated bundles are ignored (logged), so the
+        registry simply falls back to validating files.
+
+        Args:
+            bundle_path: Bundle file written by save_bundle()
+
+        Returns:
+            Number of files loaded from the bundle
+        """
+        path = Path(bundle_path)
+        if not path.exists():
+            logger.info(f"No scenario bundle at {path}; scenarios will be validated from files")
+            return 0
+
+        try:
+            bundle = _Bundle.model_validate_json(path.read_bytes())
+        except (OSError, ValidationError) as e:
+            logger.warning(f"Ignoring unreadable scenario bundle {path}: {e}")
+            return 0
+
+        if bundle.version != SCENARIO_BUNDLE_VERSION:
+            logger.info(
+                f"Scenario bundle {path} is version {bundle.version}, "
+                f"expected {SCENARIO_BUNDLE_VERSION}: ignoring"
+            )
+            return 0
+
+        with self._lock:
+            for bundle_file in bundle.files:
+                self._set_entry(
+                    bundle_file.path,
+                    _RegistryEntry(
+                        bundle_file.mtime_ns,
+                        bundle_file.size,
+                        bundle_file.sha256,
+                        tuple(bundle_file.scenarios)
+                    )
+                )
+            self.dirty = False
+
+        logger.info(f"Loaded scenario bundle with {len(bundle.files)} files: {path}")
+        return len(bundle.files)
+
+    def _set_entry(self, key: str, entry: Optional[_RegistryEntry]) -> None:
+        """Replace (or remove, if entry is None) a file's cached scenarios."""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            for scenario in old.scenarios:
+                self._owned.discard(id(scenario))
+                self._compiled.pop(id(scenario), None)
+
+        if entry is not None:
+            self._entries[key] = entry
+            self._owned.update(id(scenario) for scenario in entry.scenarios)
+
+        self.dirty = True
+
+
+# Process-wide registry shared by agents and services
+default_registry = ScenarioRegistry()
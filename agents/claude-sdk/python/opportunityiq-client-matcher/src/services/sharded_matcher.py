@@ -0,0 +1,266 @@
+"""
+Sharded matching service for OpportunityIQ Client Matcher.
+
+Splits a client book into contiguous shards and matches them in a process
+pool. Each worker receives the scenarios once (at pool start-up), compiles
+them and keeps its own RevenueCalculator. With the "fork" start method
+workers also inherit the client book, so shards are just index ranges;
+otherwise each shard carries its client profiles. Workers send back
+compact opportunity records (plain tuples of scores, matched-criteria
+bitmasks, actual values and revenue figures) rather than pickled Opportunity models, which would
+cost more to transfer than to compute. Pairs that fail in a worker are
+logged there and counted in the shard result, so the parent's telemetry
+accounts for them.
+
+TRUTH Principle: Records hold exactly the values the single-process engine
+computes; the parent materializes them into identical Opportunity objects.
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterator, NamedTuple, Optional
+
+from ..models import ClientProfile, Scenario
+from .revenue_calculator import RevenueCalculator
+from .scenario_compiler import CompiledScenario, compile_scenario
+from .telemetry import MatchTelemetry
+
+logger = logging.getLogger(__name__)
+
+
+# Shards queued per worker; more, smaller shards balance uneven books
+SHARDS_PER_WORKER = 4
+
+
+class OpportunityRecord(NamedTuple):
+    """
+    Compact result for one matched client-scenario pair.
+
+    Attributes:
+        client_index: Position of the client in the matched book
+        scenario_index: Position of the scenario in the compiled list
+        match_score: Exact match score (0-100)
+        matched_mask: Bitmask of matched criteria (bit i = criterion i)
+        actual_values: Actual client value per criterion, in scenario order
+        revenue: RevenueCalculation field values as a dict
+    """
+    client_index: int
+    scenario_index: int
+    match_score: float
+    matched_mask: int
+    actual_values: tuple[Any, ...]
+    revenue: dict[str, Any]
+
+
+class ShardResult(NamedTuple):
+    """
+    Outcome of matching one shard.
+
+    Attributes:
+        records: Opportunity records in book order, then scenario order
+        errors: Client-scenario pairs that failed to match or price
+    """
+    records: list[OpportunityRecord]
+    errors: int
+
+
+# Per-process worker state, set once by _init_worker()
+_worker_scenarios: list[CompiledScenario] = []
+_worker_revenue_calculator: Optional[RevenueCalculator] = None
+_worker_clients: Optional[list[ClientProfile]] = None
+
+
+def _init_worker(
+    scenarios: list[Scenario],
+    pass_rates: list[tuple[float, ...]],
+    clients: Optional[list[ClientProfile]] = None
+) -> None:
+    """
+    Compile scenarios once per worker process.
+
+    Compiled scenarios hold generated functions and cannot be pickled, so
+    workers recompile them and reuse the parent's calibrated pass rates to
+    get the same evaluation plans.
+
+    Args:
+        scenarios: Scenarios to compile, in the parent's order
+        pass_rates: Calibrated pass rates per scenario
+        clients: Whole client book, when inherited by forked workers
+    """
+    global _worker_scenarios, _worker_revenue_calculator, _worker_clients
+
+    _worker_scenarios = []
+    for scenario, rates in zip(scenarios, pass_rates):
+        compiled = compile_scenario(scenario)
+        compiled.pass_rates = rates
+        _worker_scenarios.append(compiled)
+
+    # The parent counts workers' matches; worker-side telemetry is never flushed
+    _worker_revenue_calculator = RevenueCalculator(
+        MatchTelemetry("sharded_worker", enabled=False)
+    )
+    _worker_clients = clients
+
+
+def _match_shard(
+    start: int,
+    stop: int,
+    clients: Optional[list[ClientProfile]],
+    min_match_threshold: float
+) -> ShardResult:
+    """
+    Match one shard of clients in a worker process.
+
+    Args:
+        start: Book position of the shard's first client
+        stop: Book position after the shard's last client
+        clients: Clients in the shard, or None to read them from the
+            inherited book
+        min_match_threshold: Minimum match score (0-100)
+
+    Returns:
+        ShardResult with the shard's records and its error count
+    """
+    if clients is None:
+        clients = _worker_clients[start:stop]
+
+    records = []
+    errors = 0
+
+    for offset, client in enumerate(clients):
+        for j, compiled in enumerate(_worker_scenarios):
+            try:
+                match_score = compiled.score_above(client, min_match_threshold)
+                if match_score is None:
+                    continue
+
+                _score, explanation = compiled.explain_compact(client)
+                revenue_calc = _worker_revenue_calculator.calculate_revenue(
+                    client,
+                    compiled.scenario
+                )
+
+                records.append(OpportunityRecord(
+                    start + offset,
+                    j,
+                    match_score,
+                    explanation.matched_mask,
+                    explanation.actual_values,
+                    revenue_calc.model_dump()
+                ))
+
+            except Exception as e:
+                errors += 1
+                logger.error(
+                    f"Error matching client {client.client_id} to scenario {compiled.scenario_id}: {e}",
+                    exc_info=True
+                )
+
+    return ShardResult(records, errors)
+
+
+class ShardedMatcher:
+    """
+    Matches a client book across a pool of worker processes.
+
+    Example:
+        >>> matcher = ShardedMatcher(compile_scenarios(scenarios), max_workers=8)
+        >>> for record in matcher.iter_records(clients, min_match_threshold=60.0):
+        ...     print(record.client_index, record.scenario_index, record.match_score)
+    """
+
+    def __init__(
+        self,
+        compiled_scenarios: list[CompiledScenario],
+        max_workers: Optional[int] = None
+    ):
+        """
+        Initialize with compiled scenarios.
+
+        Args:
+            compiled_scenarios: Compiled (and optionally calibrated) scenarios
+            max_workers: Worker processes (default: CPU count)
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.compiled_scenarios = list(compiled_scenarios)
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def shard_bounds(self, n_clients: int) -> list[tuple[int, int]]:
+        """
+        Split a book of n_clients into contiguous (start, stop) shards.
+        """
+        n_shards = min(n_clients, self.max_workers * SHARDS_PER_WORKER)
+        if n_shards == 0:
+            return []
+
+        shard_size = -(-n_clients // n_shards)
+        return [
+            (start, min(start + shard_size, n_clients))
+            for start in range(0, n_clients, shard_size)
+        ]
+
+    def iter_records(
+        self,
+        clients: list[ClientProfile],
+        min_match_threshold: float = 0.0,
+        telemetry: Optional[MatchTelemetry] = None
+    ) -> Iterator[OpportunityRecord]:
+        """
+        Yield opportunity records for matches above threshold.
+
+        Shards are contiguous and their results are consumed in submission
+        order, so merging the per-shard streams is a concatenation: records
+        come out in book order, then scenario order - the same order as the
+        single-process engine. Each shard's records are yielded as soon as
+        it completes, while later shards are still being matched.
+
+        Workers log failed pairs in their own process; each shard's error
+        count is added to telemetry before its records are yielded.
+
+        Args:
+            clients: Client book to match
+            min_match_threshold: Minimum match score (0-100)
+            telemetry: Parent telemetry that counts failed pairs
+
+        Yields:
+            OpportunityRecord for each match above threshold
+        """
+        bounds = self.shard_bounds(len(clients))
+        if not bounds:
+            return
+
+        logger.info(
+            f"Sharded matching {len(clients)} clients in {len(bounds)} shards "
+            f"across {self.max_workers} workers"
+        )
+
+        # Forked workers inherit the book instead of unpickling shards
+        context = multiprocessing.get_context()
+        share_book = context.get_start_method() == "fork"
+
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(
+                [c.scenario for c in self.compiled_scenarios],
+                [c.pass_rates for c in self.compiled_scenarios],
+                clients if share_book else None
+            )
+        ) as executor:
+            shard_results = executor.map(
+                _match_shard,
+                [start for start, _ in bounds],
+                [stop for _, stop in bounds],
+                [None if share_book else clients[start:stop] for start, stop in bounds],
+                [min_match_threshold] * len(bounds)
+            )
+
+            for result in shard_results:
+                if telemetry is not None and result.errors:
+                    telemetry.record_error(result.errors)
+                yield from result.records
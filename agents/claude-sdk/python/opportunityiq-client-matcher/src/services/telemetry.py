@@ -0,0 +1,254 @@
+"""
+Matching telemetry service for OpportunityIQ Client Matcher.
+
+Hot loops (scoring, pricing and building opportunities) emit one event per
+client-scenario pair. Instead of formatting and writing a log line for
+each, events are aggregated into counters and histograms and flushed as a
+single structured log record per batch. A deterministic sample of pairs
+(every Nth event) can still be logged in detail for debugging; unsampled
+pairs never format a message, and disabled telemetry records nothing.
+
+Configuration (environment variables, or configure_telemetry()):
+- MATCH_TELEMETRY: "on" (default) or "off"
+- MATCH_TELEMETRY_SAMPLE_RATE: fraction of pairs logged in detail
+  (default 0.0, e.g. 0.001 logs one pair in a thousand)
+
+TRUTH Principle: Every batch accounts for its decisions without drowning the log.
+"""
+
+import json
+import logging
+import os
+import time
+from bisect import bisect_right
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Match score histogram: ten 10-point buckets, 100% falls in the last
+MATCH_SCORE_BUCKETS = tuple(f"{low}-{low + 10}" for low in range(0, 100, 10))
+
+# Revenue histogram bucket edges and labels
+REVENUE_BUCKET_EDGES = (100.0, 1000.0, 10000.0, 100000.0)
+REVENUE_BUCKETS = ("<100", "100-1k", "1k-10k", "10k-100k", "100k+")
+
+_enabled = os.getenv("MATCH_TELEMETRY", "on").strip().lower() not in ("off", "0", "false", "no")
+_sample_rate = float(os.getenv("MATCH_TELEMETRY_SAMPLE_RATE", "0") or 0)
+
+
+def configure_telemetry(
+    enabled: Optional[bool] = None,
+    sample_rate: Optional[float] = None
+) -> None:
+    """
+    Change telemetry defaults for batches created from now on.
+
+    Args:
+        enabled: Aggregate and flush per-batch telemetry
+        sample_rate: Fraction of pairs (0.0-1.0) logged in detail
+
+    Raises:
+        ValueError: If sample_rate is outside 0.0-1.0
+    """
+    global _enabled, _sample_rate
+
+    if sample_rate is not None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0.0 and 1.0")
+        _sample_rate = sample_rate
+
+    if enabled is not None:
+        _enabled = enabled
+
+
+class MatchTelemetry:
+    """
+    Per-batch counters and histograms for matching and pricing.
+
+    Create one per batch (matching call, calculator instance or request);
+    instances are not shared across threads.
+
+    Example:
+        >>> telemetry = MatchTelemetry("match_clients_to_scenarios")
+        >>> telemetry.record_unmatched()
+        >>> if telemetry.record_match(82.5):
+        ...     logger.info("sampled pair detail")  # formatted only when sampled
+        >>> telemetry.flush()  # one structured INFO record for the batch
+    """
+
+    __slots__ = (
+        "name",
+        "enabled",
+        "sample_every",
+        "started",
+        "pairs",
+        "matches",
+        "errors",
+        "revenue_calculations",
+        "revenue_total",
+        "min_applied",
+        "max_applied",
+        "formula_types",
+        "match_scores",
+        "revenue_amounts",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        enabled: Optional[bool] = None,
+        sample_rate: Optional[float] = None
+    ):
+        """
+        Create empty telemetry for a batch.
+
+        Args:
+            name: Batch name reported on flush
+            enabled: Record events (default: MATCH_TELEMETRY)
+            sample_rate: Fraction of pairs logged in detail
+                (default: MATCH_TELEMETRY_SAMPLE_RATE)
+        """
+        self.name = name
+        self.enabled = _enabled if enabled is None else enabled
+
+        rate = _sample_rate if sample_rate is None else sample_rate
+        # Every Nth event is sampled; 0 disables sampling
+        self.sample_every = round(1 / rate) if rate > 0 else 0
+
+        self._reset()
+
+    def _reset(self) -> None:
+        """Clear counters and restart the batch clock."""
+        self.started = time.perf_counter()
+        self.pairs = 0
+        self.matches = 0
+        self.errors = 0
+        self.revenue_calculations = 0
+        self.revenue_total = 0.0
+        self.min_applied = 0
+        self.max_applied = 0
+        self.formula_types: dict[str, int] = {}
+        self.match_scores = [0] * len(MATCH_SCORE_BUCKETS)
+        self.revenue_amounts = [0] * len(REVENUE_BUCKETS)
+
+    def record_match(self, match_score: float) -> bool:
+        """
+        Count a pair that met the threshold (or was scored without one).
+
+        Args:
+            match_score: Match score (0-100)
+
+        Returns:
+            True if this match is sampled for detailed logging
+        """
+        if not self.enabled:
+            return False
+
+        self.pairs += 1
+        self.matches += 1
+        self.match_scores[min(int(match_score // 10), 9)] += 1
+
+        return bool(self.sample_every) and self.matches % self.sample_every == 0
+
+    def record_unmatched(self, count: int = 1) -> None:
+        """
+        Count pairs scored below the threshold.
+
+        Args:
+            count: Number of pairs (vectorized engines count in bulk)
+        """
+        if self.enabled:
+            self.pairs += count
+
+    def record_revenue(
+        self,
+        amount: float,
+        formula_type: str,
+        min_applied: bool = False,
+        max_applied: bool = False
+    ) -> bool:
+        """
+        Count a revenue calculation.
+
+        Args:
+            amount: Final revenue amount
+            formula_type: Revenue formula type
+            min_applied: Minimum revenue was applied
+            max_applied: Maximum revenue cap was applied
+
+        Returns:
+            True if this calculation is sampled for detailed logging
+        """
+        if not self.enabled:
+            return False
+
+        self.revenue_calculations += 1
+        self.revenue_total += amount
+        self.min_applied += min_applied
+        self.max_applied += max_applied
+        self.formula_types[formula_type] = self.formula_types.get(formula_type, 0) + 1
+        self.revenue_amounts[bisect_right(REVENUE_BUCKET_EDGES, amount)] += 1
+
+        return (
+            bool(self.sample_every)
+            and self.revenue_calculations % self.sample_every == 0
+        )
+
+    def record_error(self, count: int = 1) -> None:
+        """
+        Count pairs that failed to match or price.
+
+        Args:
+            count: Number of pairs (sharded workers report per shard)
+        """
+        if self.enabled:
+            self.errors += count
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Aggregated events since the last flush.
+
+        Returns:
+            Dictionary with pair, match, error and revenue counts plus
+            match score and revenue histograms
+        """
+        return {
+            "batch": self.name,
+            "elapsed_seconds": round(time.perf_counter() - self.started, 6),
+            "pairs": self.pairs,
+            "matches": self.matches,
+            "errors": self.errors,
+            "match_score_histogram": dict(zip(MATCH_SCORE_BUCKETS, self.match_scores)),
+            "revenue": {
+                "calculations": self.revenue_calculations,
+                "total": round(self.revenue_total, 2),
+                "min_applied": self.min_applied,
+                "max_applied": self.max_applied,
+                "formula_types": dict(self.formula_types),
+                "histogram": dict(zip(REVENUE_BUCKETS, self.revenue_amounts)),
+            },
+        }
+
+    def flush(self) -> Optional[dict[str, Any]]:
+        """
+        Log the batch's aggregated events as one structured record and reset.
+
+        The summary is logged at INFO as JSON and attached to the record as
+        ``record.telemetry`` for structured log handlers.
+
+        Returns:
+            The summary, or None if telemetry is disabled or nothing was recorded
+        """
+        if not self.enabled or not (self.pairs or self.revenue_calculations or self.errors):
+            return None
+
+        summary = self.summary()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Telemetry {self.name}: {json.dumps(summary, separators=(',', ':'))}",
+                extra={"telemetry": summary}
+            )
+
+        self._reset()
+        return summary
@@ -8,9 +8,20 @@ from .load_scenarios import (
     load_scenarios,
     load_all_scenario_files
 )
+from .load_clients import (
+    load_clients,
+    iter_clients,
+    iter_client_batches,
+    iter_client_records
+)
 from .match_clients import (
     match_client_to_scenarios,
-    match_clients_to_scenarios
+    match_clients_to_scenarios,
+    match_clients_incremental,
+    match_indexed_clients,
+    materialize_opportunities,
+    stream_client_matches,
+    stream_compact_matches
 )
 from .calculate_revenue import (
     calculate_revenue,
@@ -19,14 +30,17 @@ from .calculate_revenue import (
 )
 from .rank_opportunities import (
     rank_opportunities,
+    rank_top_opportunities,
     filter_opportunities,
     get_top_opportunities,
-    group_opportunities_by_client
+    group_opportunities_by_client,
+    optimize_opportunity_portfolio
 )
 from .generate_report import (
     generate_report,
     generate_client_report,
     generate_summary_statistics,
+    export_opportunities,
     export_opportunities_csv
 )
 
@@ -34,21 +48,34 @@ __all__ = [
     # Load scenarios
     "load_scenarios",
     "load_all_scenario_files",
+    # Load clients
+    "load_clients",
+    "iter_clients",
+    "iter_client_batches",
+    "iter_client_records",
     # Match clients
     "match_client_to_scenarios",
     "match_clients_to_scenarios",
+    "match_clients_incremental",
+    "match_indexed_clients",
+    "materialize_opportunities",
+    "stream_client_matches",
+    "stream_compact_matches",
     # Calculate revenue
     "calculate_revenue",
     "calculate_revenues_batch",
     "estimate_total_revenue",
     # Rank opportunities
     "rank_opportunities",
+    "rank_top_opportunities",
     "filter_opportunities",
     "get_top_opportunities",
     "group_opportunities_by_client",
+    "optimize_opportunity_portfolio",
     # Generate reports
     "generate_report",
     "generate_client_report",
     "generate_summary_statistics",
+    "export_opportunities",
     "export_opportunities_csv",
 ]
@@ -14,6 +14,7 @@ from ..models import (
     Scenario,
     RevenueCalculation
 )
+from ..services.opportunity_stats import OpportunityStats
 from ..services.revenue_calculator import RevenueCalculator
 
 logger = logging.getLogger(__name__)
@@ -78,7 +79,8 @@ def calculate_revenues_batch(
     """
     Calculate revenues for multiple client-scenario combinations.
 
-    Batch processing for revenue calculations.
+    Batch processing for revenue calculations. Each scenario's formula is
+    compiled once and evaluated over all clients as a NumPy column.
 
     Args:
         clients: Single client or list of clients
@@ -110,12 +112,22 @@ def calculate_revenues_batch(
     results = {}
     errors = []
 
-    for client in clients:
-        for scenario in scenarios:
+    # Price each scenario's formula over the whole client column at once
+    batches = []
+    for scenario in scenarios:
+        try:
+            batches.append(calculator.calculate_revenue_batch(clients, scenario))
+        except Exception as e:
+            batches.append(e)
+
+    for i, client in enumerate(clients):
+        for scenario, batch in zip(scenarios, batches):
             key = (client.client_id, scenario.scenario_id)
 
             try:
-                revenue_calc = calculator.calculate_revenue(client, scenario)
+                if isinstance(batch, Exception):
+                    raise batch
+                revenue_calc = batch.calculation(i)
                 results[key] = revenue_calc
 
             except Exception as e:
@@ -175,41 +187,23 @@ def estimate_total_revenue(
 
     logger.info(f"Calculating total revenue from {len(opportunities)} opportunities")
 
-    # Calculate total
-    total = sum(opp.estimated_revenue for opp in opportunities)
+    # Aggregate every dimension in one pass
+    stats = OpportunityStats.from_opportunities(opportunities)
+    total = stats.total_revenue
 
-    # By priority
+    # By priority (fixed order, levels with revenue only)
+    revenue_by_priority = stats.revenue_by("priority")
     by_priority = {}
     for priority in ["high", "medium", "low"]:
-        priority_rev = sum(
-            opp.estimated_revenue
-            for opp in opportunities
-            if opp.priority == priority
-        )
+        priority_rev = revenue_by_priority.get(priority, 0)
         if priority_rev > 0:
             by_priority[priority] = priority_rev
 
     # By category
-    by_category = {}
-    categories = set(opp.scenario_category for opp in opportunities)
-    for category in categories:
-        category_rev = sum(
-            opp.estimated_revenue
-            for opp in opportunities
-            if opp.scenario_category == category
-        )
-        by_category[category] = category_rev
+    by_category = stats.revenue_by("scenario_category")
 
     # By client
-    by_client = {}
-    client_ids = set(opp.client_id for opp in opportunities)
-    for client_id in client_ids:
-        client_rev = sum(
-            opp.estimated_revenue
-            for opp in opportunities
-            if opp.client_id == client_id
-        )
-        by_client[client_id] = client_rev
+    by_client = stats.revenue_by("client_id")
 
     result = {
         "total": total,
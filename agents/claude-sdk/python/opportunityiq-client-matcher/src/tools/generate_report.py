@@ -7,10 +7,16 @@ SERVE Principle: Clear, actionable reports that help advisors make decisions.
 """
 
 import logging
-from typing import Literal, Optional
+from typing import Iterable, Literal, Optional
 from pathlib import Path
 
 from ..models import Opportunity
+from ..services.opportunity_stats import OpportunityStats
+from ..services.opportunity_writers import (
+    CsvOpportunityWriter,
+    ExportFormat,
+    open_opportunity_writer
+)
 from ..services.report_generator import ReportGenerator
 
 logger = logging.getLogger(__name__)
@@ -19,7 +25,8 @@ logger = logging.getLogger(__name__)
 def generate_report(
     opportunities: list[Opportunity],
     format: Literal["markdown", "text", "json", "summary"] = "markdown",
-    output_file: Optional[str] = None
+    output_file: Optional[str] = None,
+    stats: Optional[OpportunityStats] = None
 ) -> str:
     """
     Generate a formatted report from opportunities.
@@ -30,6 +37,8 @@ def generate_report(
         opportunities: List of opportunities to report on
         format: Output format (markdown, text, json, summary)
         output_file: Optional path to save report to file
+        stats: Precomputed OpportunityStats for these opportunities, to
+            share one aggregation pass with other callers
 
     Returns:
         Formatted report as string
@@ -58,7 +67,7 @@ def generate_report(
 
     # Generate report
     generator = ReportGenerator()
-    report = generator.generate_report(opportunities, format=format)
+    report = generator.generate_report(opportunities, format=format, stats=stats)
 
     # Save to file if requested
     if output_file:
@@ -131,13 +140,14 @@ def generate_summary_statistics(
     """
     Generate summary statistics from opportunities.
 
-    Provides key metrics and aggregations.
+    Provides key metrics and aggregations, computed in a single pass.
 
     Args:
         opportunities: List of opportunities
 
     Returns:
-        Dictionary with summary statistics
+        Dictionary with summary statistics, including revenue and match
+        score percentiles (25th, 50th, 75th, 90th, 95th)
 
     Example:
         >>> stats = generate_summary_statistics(opportunities)
@@ -161,34 +171,29 @@ def generate_summary_statistics(
     logger.info(f"Generating statistics for {len(opportunities)} opportunities")
 
     # Calculate metrics
-    total_revenue = sum(opp.estimated_revenue for opp in opportunities)
-    avg_match_score = sum(opp.match_score for opp in opportunities) / len(opportunities)
-    avg_revenue = total_revenue / len(opportunities)
-    high_priority = sum(1 for opp in opportunities if opp.priority == "high")
-    quick_wins = sum(1 for opp in opportunities if opp.is_quick_win())
-    high_value = sum(1 for opp in opportunities if opp.is_high_value())
-    unique_clients = len(set(opp.client_id for opp in opportunities))
-    unique_scenarios = len(set(opp.scenario_id for opp in opportunities))
+    aggregate = OpportunityStats.from_opportunities(opportunities)
 
     stats = {
-        "total_opportunities": len(opportunities),
-        "total_revenue": total_revenue,
-        "avg_match_score": avg_match_score,
-        "avg_revenue": avg_revenue,
-        "high_priority_count": high_priority,
-        "quick_wins_count": quick_wins,
-        "high_value_count": high_value,
-        "unique_clients": unique_clients,
-        "unique_scenarios": unique_scenarios,
-        "by_priority": _count_by_field(opportunities, "priority"),
-        "by_category": _count_by_field(opportunities, "scenario_category"),
-        "revenue_by_priority": _sum_revenue_by_field(opportunities, "priority"),
-        "revenue_by_category": _sum_revenue_by_field(opportunities, "scenario_category"),
+        "total_opportunities": aggregate.count,
+        "total_revenue": aggregate.total_revenue,
+        "avg_match_score": aggregate.average_match_score,
+        "avg_revenue": aggregate.average_revenue,
+        "high_priority_count": aggregate.high_priority_count,
+        "quick_wins_count": aggregate.quick_wins_count,
+        "high_value_count": aggregate.high_value_count,
+        "unique_clients": aggregate.unique_clients,
+        "unique_scenarios": aggregate.unique_scenarios,
+        "by_priority": aggregate.count_by("priority"),
+        "by_category": aggregate.count_by("scenario_category"),
+        "revenue_by_priority": aggregate.revenue_by("priority"),
+        "revenue_by_category": aggregate.revenue_by("scenario_category"),
+        "revenue_percentiles": aggregate.revenue_percentiles(),
+        "match_score_percentiles": aggregate.match_score_percentiles(),
     }
 
     logger.info(
-        f"Statistics generated: ${total_revenue:,.2f} total revenue, "
-        f"{avg_match_score:.1f}% avg match"
+        f"Statistics generated: ${aggregate.total_revenue:,.2f} total revenue, "
+        f"{aggregate.average_match_score:.1f}% avg match"
     )
 
     return stats
@@ -219,56 +224,11 @@ def export_opportunities_csv(
     if not opportunities:
         raise ValueError("Cannot export empty opportunities list")
 
-    import csv
-
     logger.info(f"Exporting {len(opportunities)} opportunities to CSV: {output_file}")
 
-    # Create output directory if needed
-    output_path = Path(output_file)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Define CSV columns
-    columns = [
-        "rank",
-        "client_id",
-        "client_name",
-        "scenario_id",
-        "scenario_name",
-        "category",
-        "priority",
-        "match_score",
-        "estimated_revenue",
-        "criteria_met",
-        "total_criteria",
-        "estimated_time_hours",
-        "composite_score",
-        "is_quick_win",
-        "is_high_value"
-    ]
-
     try:
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=columns)
-            writer.writeheader()
-
-            for opp in opportunities:
-                writer.writerow({
-                    "rank": opp.rank,
-                    "client_id": opp.client_id,
-                    "client_name": opp.client_name,
-                    "scenario_id": opp.scenario_id,
-                    "scenario_name": opp.scenario_name,
-                    "category": opp.scenario_category,
-                    "priority": opp.priority,
-                    "match_score": f"{opp.match_score:.2f}",
-                    "estimated_revenue": f"{opp.estimated_revenue:.2f}",
-                    "criteria_met": opp.criteria_met,
-                    "total_criteria": opp.total_criteria,
-                    "estimated_time_hours": opp.estimated_time_hours or "",
-                    "composite_score": f"{opp.composite_score:.2f}" if opp.composite_score else "",
-                    "is_quick_win": opp.is_quick_win(),
-                    "is_high_value": opp.is_high_value()
-                })
+        with CsvOpportunityWriter(output_file) as writer:
+            writer.write_all(opportunities)
 
         logger.info(f"CSV export complete: {output_file}")
 
@@ -277,21 +237,50 @@ def export_opportunities_csv(
         raise
 
 
-# Private helper functions
+def export_opportunities(
+    opportunities: Iterable[Opportunity],
+    output_file: str,
+    format: Optional[ExportFormat] = None,
+    compression: Optional[str] = None
+) -> int:
+    """
+    Stream opportunities to a CSV, NDJSON, Markdown or Parquet file.
+
+    Opportunities are written as they are consumed, so a generator (e.g.
+    stream_client_matches) can be exported without holding the full list
+    in memory.
+
+    Args:
+        opportunities: Opportunities to export (any iterable, consumed once)
+        output_file: Path to save the export
+        format: "csv", "ndjson", "markdown" or "parquet"
+            (default: from the file extension)
+        compression: "gzip", "bz2" or "xz" for text formats, or a Parquet
+            codec (default: from a .gz/.bz2/.xz extension)
+
+    Returns:
+        Number of opportunities written
+
+    Raises:
+        ValueError: If the format or compression is unsupported
+        ImportError: If Parquet is requested without pyarrow installed
 
-def _count_by_field(opportunities: list[Opportunity], field: str) -> dict[str, int]:
-    """Count opportunities by a field value."""
-    counts = {}
-    for opp in opportunities:
-        value = getattr(opp, field)
-        counts[value] = counts.get(value, 0) + 1
-    return counts
+    Example:
+        >>> export_opportunities(
+        ...     stream_client_matches(iter_clients("data/clients.csv"), scenarios, 60.0),
+        ...     "reports/all_opportunities.csv.gz"
+        ... )
+        48210
+    """
+    logger.info(f"Streaming opportunities export to: {output_file}")
 
+    try:
+        with open_opportunity_writer(output_file, format, compression) as writer:
+            count = writer.write_all(opportunities)
+
+        logger.info(f"Export complete: {count} opportunities written to {output_file}")
+        return count
 
-def _sum_revenue_by_field(opportunities: list[Opportunity], field: str) -> dict[str, float]:
-    """Sum revenue by a field value."""
-    totals = {}
-    for opp in opportunities:
-        value = getattr(opp, field)
-        totals[value] = totals.get(value, 0.0) + opp.estimated_revenue
-    return totals
+    except Exception as e:
+        logger.error(f"Error exporting to {output_file}: {e}", exc_info=True)
+        raise
@@ -0,0 +1,389 @@
+"""
+Load clients tool for OpportunityIQ Client Matcher.
+
+Streams client profiles from NDJSON, CSV or JSON array files. Records are
+parsed incrementally and validated one at a time as they are consumed, so
+memory stays bounded by the consumer rather than the file size and
+matching can start before the file is fully read.
+
+Supported formats (detected from the file extension):
+- .ndjson / .jsonl: one client object per line
+- .csv: one client per row; nested fields use dotted column names
+  (e.g. 'portfolio.total_value'), list/object cells hold JSON
+- .json: a JSON array of client objects
+
+HONOR Principle: Invalid client records are reported and skipped, never
+silently altered.
+"""
+
+import csv
+import json
+import logging
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterator, Literal, Optional, Union
+
+from pydantic import ValidationError
+
+from ..models import ClientProfile
+
+logger = logging.getLogger(__name__)
+
+ClientFileFormat = Literal["json", "ndjson", "csv"]
+
+# File extensions recognised for each client file format
+FORMAT_EXTENSIONS: dict[str, ClientFileFormat] = {
+    ".json": "json",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".csv": "csv",
+}
+
+# Characters read per chunk when streaming JSON arrays
+JSON_CHUNK_SIZE = 65536
+
+# Characters that can continue a JSON number
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+
+# Default number of clients per batch for iter_client_batches()
+DEFAULT_BATCH_SIZE = 1000
+
+
+def detect_client_format(file_path: Union[str, Path]) -> ClientFileFormat:
+    """
+    Detect a client file's format from its extension.
+
+    Args:
+        file_path: Path to client data file
+
+    Returns:
+        "json", "ndjson" or "csv"
+
+    Raises:
+        ValueError: If the extension is not recognised
+    """
+    suffix = Path(file_path).suffix.lower()
+    file_format = FORMAT_EXTENSIONS.get(suffix)
+
+    if file_format is None:
+        raise ValueError(
+            f"Unsupported client file extension '{suffix}'. "
+            f"Expected one of: {', '.join(FORMAT_EXTENSIONS)}"
+        )
+
+    return file_format
+
+
+def iter_client_records(
+    file_path: Union[str, Path],
+    file_format: Optional[ClientFileFormat] = None
+) -> Iterator[Any]:
+    """
+    Stream raw client records (dictionaries) from a file.
+
+    Args:
+        file_path: Path to client data file
+        file_format: "json", "ndjson" or "csv" (default: from extension)
+
+    Yields:
+        One record per client, in file order: a dictionary, or whatever
+        value a JSON/NDJSON file holds in its place (iter_clients skips
+        records that aren't objects)
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If the format is unsupported or the file is malformed
+    """
+    path = Path(file_path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"Client data file not found: {file_path}")
+
+    file_format = file_format or detect_client_format(path)
+
+    if file_format == "ndjson":
+        yield from _iter_ndjson(path)
+    elif file_format == "csv":
+        yield from _iter_csv(path)
+    elif file_format == "json":
+        yield from _iter_json_array(path)
+    else:
+        raise ValueError(f"Unsupported client file format: {file_format}")
+
+
+def iter_clients(
+    file_path: Union[str, Path],
+    file_format: Optional[ClientFileFormat] = None
+) -> Iterator[ClientProfile]:
+    """
+    Stream validated client profiles from a file.
+
+    Each record is validated as it is consumed. Records that aren't
+    objects or fail validation are logged and skipped.
+
+    Args:
+        file_path: Path to client data file
+        file_format: "json", "ndjson" or "csv" (default: from extension)
+
+    Yields:
+        ClientProfile objects, in file order
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If the format is unsupported or the file is malformed
+
+    Example:
+        >>> for client in iter_clients("data/clients/book.ndjson"):
+        ...     print(client.client_id)
+    """
+    loaded = 0
+    skipped = 0
+
+    for i, record in enumerate(iter_client_records(file_path, file_format)):
+        if not isinstance(record, dict):
+            skipped += 1
+            logger.warning(
+                f"Skipping client at index {i}: expected an object, got {type(record).__name__}"
+            )
+            continue
+
+        try:
+            client = ClientProfile.model_validate(record)
+        except ValidationError as e:
+            skipped += 1
+            logger.warning(f"Skipping client at index {i} due to validation error: {e}")
+            continue
+
+        loaded += 1
+        yield client
+
+    logger.info(
+        f"Loaded {loaded} clients from: {file_path}"
+        + (f" ({skipped} skipped)" if skipped else "")
+    )
+
+
+def iter_client_batches(
+    file_path: Union[str, Path],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    file_format: Optional[ClientFileFormat] = None
+) -> Iterator[list[ClientProfile]]:
+    """
+    Stream validated client profiles in fixed-size batches.
+
+    Args:
+        file_path: Path to client data file
+        batch_size: Maximum clients per batch
+        file_format: "json", "ndjson" or "csv" (default: from extension)
+
+    Yields:
+        Lists of up to batch_size ClientProfile objects
+
+    Raises:
+        ValueError: If batch_size is less than 1
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    clients = iter_clients(file_path, file_format)
+    while True:
+        batch = list(islice(clients, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def load_clients(
+    file_path: Union[str, Path],
+    file_format: Optional[ClientFileFormat] = None
+) -> list[ClientProfile]:
+    """
+    Load all client profiles from a file into a list.
+
+    Args:
+        file_path: Path to client data file
+        file_format: "json", "ndjson" or "csv" (default: from extension)
+
+    Returns:
+        List of ClientProfile objects (invalid records skipped)
+
+    Example:
+        >>> clients = load_clients("data/clients/sample-clients.json")
+        >>> print(f"Loaded {len(clients)} clients")
+    """
+    return list(iter_clients(file_path, file_format))
+
+
+# Private helper functions
+
+def _iter_ndjson(path: Path) -> Iterator[Any]:
+    """Parse one JSON object per non-blank line."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {line_number} of {path}: {e}")
+
+            yield record
+
+
+def _iter_json_array(path: Path) -> Iterator[Any]:
+    """
+    Incrementally parse the elements of a top-level JSON array.
+
+    Reads the file in chunks and decodes one element at a time, so only
+    the current element (plus one chunk) is held in memory. Accepts
+    exactly what json.load accepts for an array; elements are yielded
+    whatever their type, for iter_clients to validate.
+    """
+    decoder = json.JSONDecoder()
+
+    with open(path, "r", encoding="utf-8") as f:
+        buffer = ""
+        position = 0
+        expect_element = True
+        comma_pending = False
+        started = False
+
+        while True:
+            position = _skip_whitespace(buffer, position)
+
+            # Refill when the buffer runs dry
+            if position >= len(buffer):
+                chunk = f.read(JSON_CHUNK_SIZE)
+                if not chunk:
+                    if not started:
+                        raise ValueError("Client data must be a JSON array")
+                    raise ValueError(f"Invalid JSON in client data file: unterminated array in {path}")
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+
+            char = buffer[position]
+
+            if not started:
+                if char != "[":
+                    raise ValueError("Client data must be a JSON array")
+                position += 1
+                started = True
+                continue
+
+            if char == "]":
+                if comma_pending:
+                    raise ValueError(f"Invalid JSON in client data file: trailing ',' in {path}")
+                _check_end_of_file(f, buffer[position + 1:], path)
+                return
+
+            if char == ",":
+                if expect_element:
+                    raise ValueError(f"Invalid JSON in client data file: unexpected ',' in {path}")
+                position += 1
+                expect_element = True
+                comma_pending = True
+                continue
+
+            if not expect_element:
+                raise ValueError(f"Invalid JSON in client data file: expected ',' in {path}")
+
+            try:
+                record, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as e:
+                chunk = f.read(JSON_CHUNK_SIZE)
+                if not chunk:
+                    raise ValueError(f"Invalid JSON in client data file: {e}")
+                # Element spans the chunk boundary: read more and retry
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+
+            if all(c in _NUMBER_CHARS for c in buffer[end:]):
+                # A number or literal at the end of the buffer may continue
+                # in the next chunk ("-2." + "5e3"); read ahead before
+                # accepting it
+                chunk = f.read(JSON_CHUNK_SIZE)
+                if chunk:
+                    buffer = buffer[position:] + chunk
+                    position = 0
+                    continue
+
+            yield record
+            position = end
+            expect_element = False
+            comma_pending = False
+
+            # Drop consumed text so the buffer doesn't grow with the file
+            if position > JSON_CHUNK_SIZE:
+                buffer = buffer[position:]
+                position = 0
+
+
+def _check_end_of_file(f: Any, rest: str, path: Path) -> None:
+    """Raise if anything but whitespace follows the closing bracket."""
+    while True:
+        if rest.strip(" \t\r\n"):
+            raise ValueError(f"Invalid JSON in client data file: extra data after array in {path}")
+        rest = f.read(JSON_CHUNK_SIZE)
+        if not rest:
+            return
+
+
+def _skip_whitespace(text: str, position: int) -> int:
+    """Index of the first non-whitespace character at or after position."""
+    while position < len(text) and text[position] in " \t\r\n":
+        position += 1
+    return position
+
+
+def _iter_csv(path: Path) -> Iterator[dict[str, Any]]:
+    """Parse one client per CSV row, nesting dotted column names."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+
+        if reader.fieldnames is None:
+            return
+
+        columns = [(name, name.split(".")) for name in reader.fieldnames]
+
+        for row in reader:
+            record: dict[str, Any] = {}
+
+            for name, parts in columns:
+                text = row.get(name)
+                if text is None or text.strip() == "":
+                    # Empty cells are treated as absent fields
+                    continue
+
+                target = record
+                for part in parts[:-1]:
+                    target = target.setdefault(part, {})
+                target[parts[-1]] = _parse_csv_value(parts[0], text.strip())
+
+            yield record
+
+
+def _parse_csv_value(head: str, text: str) -> Any:
+    """
+    Convert a CSV cell to a Python value.
+
+    Declared ClientProfile fields keep their text (Pydantic converts it,
+    e.g. '65' -> 65 for age) unless the cell holds a JSON list or object.
+    Extra fields have no schema, so numbers, booleans and JSON values are
+    decoded here - otherwise 'fia_value' would stay a string and numeric
+    criteria could never match it.
+    """
+    if head in ClientProfile.model_fields and text[0] not in "[{":
+        return text
+
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+
+    if text.lower() in ("true", "false"):
+        return text.lower() == "true"
+
+    return text
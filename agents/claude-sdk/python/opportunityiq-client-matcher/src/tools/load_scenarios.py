@@ -9,11 +9,12 @@ TRUTH Principle: All scenario loading is observable with clear error messages.
 import json
 import logging
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from pydantic import ValidationError
 
 from ..models import Scenario
+from ..services.scenario_registry import ScenarioRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -116,14 +117,21 @@ def load_scenarios(
     return scenarios
 
 
-def load_all_scenario_files(scenarios_dir: Union[str, Path]) -> list[Scenario]:
+def load_all_scenario_files(
+    scenarios_dir: Union[str, Path],
+    registry: Optional[ScenarioRegistry] = None
+) -> list[Scenario]:
     """
     Load all scenario JSON files from a directory.
 
-    Recursively searches for .json files in the directory.
+    Recursively searches for .json files in the directory. With a registry,
+    files unchanged since they were last loaded (same path, mtime and
+    content hash) are served from the cache instead of being re-validated.
 
     Args:
         scenarios_dir: Path to directory containing scenario JSON files
+        registry: Optional ScenarioRegistry caching validated scenarios
+            (e.g. services.scenario_registry.default_registry)
 
     Returns:
         List of all Scenario objects from all files
@@ -162,7 +170,10 @@ def load_all_scenario_files(scenarios_dir: Union[str, Path]) -> list[Scenario]:
 
     for json_file in json_files:
         try:
-            scenarios = load_scenarios(json_file)
+            if registry is not None:
+                scenarios = registry.load_file(json_file, load_scenarios)
+            else:
+                scenarios = load_scenarios(json_file)
             all_scenarios.extend(scenarios)
             logger.debug(f"Loaded {len(scenarios)} scenarios from {json_file.name}")
         except Exception as e:
@@ -170,6 +181,9 @@ def load_all_scenario_files(scenarios_dir: Union[str, Path]) -> list[Scenario]:
             errors.append(error_msg)
             logger.error(error_msg)
 
+    if registry is not None:
+        registry.retain(dir_path, json_files)
+
     # Report results
     if errors:
         logger.warning(f"Encountered {len(errors)} errors while loading files")
@@ -7,21 +7,119 @@ TRUTH Principle: Every matching decision is transparent and traceable.
 """
 
 import logging
-from typing import Union
+from itertools import chain, islice
+from typing import Iterable, Iterator, Literal, Optional, Union
 from datetime import datetime
 import uuid
 
 from ..models import (
     ClientProfile,
     Scenario,
+    MatchExplanation,
     Opportunity,
-    MatchDetail
+    RevenueCalculation
+)
+from ..services.client_index import ClientIndex
+from ..services.match_store import (
+    MatchStore,
+    client_fingerprint,
+    scenario_fingerprint
 )
-from ..services.matching_engine import MatchingEngine
 from ..services.revenue_calculator import RevenueCalculator
+from ..services.scenario_compiler import CompiledScenario, compile_scenario
+from ..services.telemetry import MatchTelemetry
 
 logger = logging.getLogger(__name__)
 
+# Book size at which engine="auto" switches to vectorized columnar matching
+COLUMNAR_MIN_CLIENTS = 1000
+
+# Clients sampled to estimate criterion selectivity for early termination
+CALIBRATION_SAMPLE_SIZE = 256
+
+MATCHING_ENGINES = ("auto", "compiled", "columnar", "sharded")
+
+# Clients looked up in (and written to) the match store per round trip
+MATCH_STORE_BATCH_SIZE = 500
+
+
+class CompactOpportunity:
+    """
+    Lightweight stand-in for an Opportunity during matching and ranking.
+
+    Holds references to the client and compiled scenario plus the two
+    numbers ranking needs - a few dozen bytes instead of an Opportunity
+    with its UUID, MatchDetail list and RevenueCalculation. Ranking tools
+    accept it in place of an Opportunity (they read match_score,
+    estimated_revenue and priority, and set rank and composite_score);
+    call materialize() for the results that are actually returned.
+    """
+
+    __slots__ = (
+        "client",
+        "compiled",
+        "match_score",
+        "estimated_revenue",
+        "rank",
+        "composite_score",
+    )
+
+    def __init__(
+        self,
+        client: ClientProfile,
+        compiled: CompiledScenario,
+        match_score: float,
+        estimated_revenue: float
+    ):
+        self.client = client
+        self.compiled = compiled
+        self.match_score = match_score
+        self.estimated_revenue = estimated_revenue
+        self.rank: Optional[int] = None
+        self.composite_score: Optional[float] = None
+
+    @property
+    def client_id(self) -> str:
+        return self.client.client_id
+
+    @property
+    def client_name(self) -> str:
+        return self.client.name
+
+    @property
+    def scenario_id(self) -> str:
+        return self.compiled.scenario_id
+
+    @property
+    def scenario_name(self) -> str:
+        return self.compiled.scenario.name
+
+    @property
+    def priority(self) -> str:
+        return self.compiled.scenario.priority
+
+    def materialize(
+        self,
+        revenue_calculator: Optional[RevenueCalculator] = None
+    ) -> Opportunity:
+        """
+        Build the full Opportunity (match details + revenue breakdown).
+
+        Args:
+            revenue_calculator: Calculator to reuse across many records
+
+        Returns:
+            Opportunity with this record's rank and composite_score
+        """
+        opportunity = _build_opportunity(
+            self.client,
+            self.compiled,
+            revenue_calculator or RevenueCalculator()
+        )
+        opportunity.rank = self.rank
+        opportunity.composite_score = self.composite_score
+        return opportunity
+
 
 def match_client_to_scenarios(
     client: ClientProfile,
@@ -51,85 +149,18 @@ def match_client_to_scenarios(
         >>> opportunities = match_client_to_scenarios(client, scenarios, min_match_threshold=60.0)
         >>> print(f"Found {len(opportunities)} opportunities above 60% match")
     """
-    # Validate threshold
-    if not 0.0 <= min_match_threshold <= 100.0:
-        raise ValueError("min_match_threshold must be between 0.0 and 100.0")
-
-    # Convert single scenario to list
-    if isinstance(scenarios, Scenario):
-        scenarios = [scenarios]
-
-    logger.info(
-        f"Matching client {client.client_id} against {len(scenarios)} scenarios "
-        f"(threshold: {min_match_threshold}%)"
+    compiled_scenarios = _prepare_scenarios(scenarios, min_match_threshold)
+    telemetry = MatchTelemetry(f"match_client_to_scenarios:{client.client_id}")
+
+    opportunities = _match_compiled(
+        client,
+        compiled_scenarios,
+        min_match_threshold,
+        RevenueCalculator(telemetry),
+        telemetry
     )
 
-    # Initialize engines
-    matching_engine = MatchingEngine()
-    revenue_calculator = RevenueCalculator()
-
-    opportunities = []
-
-    for scenario in scenarios:
-        try:
-            # Calculate match score
-            match_score, match_details = matching_engine.match_client_to_scenario(
-                client, scenario
-            )
-
-            # Skip if below threshold
-            if match_score < min_match_threshold:
-                logger.debug(
-                    f"Skipping scenario {scenario.scenario_id}: "
-                    f"match score {match_score:.1f}% below threshold"
-                )
-                continue
-
-            # Calculate revenue
-            revenue_calc = revenue_calculator.calculate_revenue(client, scenario)
-
-            # Count criteria met
-            criteria_met = sum(1 for d in match_details if d.matched)
-            total_criteria = len(match_details)
-
-            # Create opportunity
-            opportunity = Opportunity(
-                opportunity_id=str(uuid.uuid4()),
-                client_id=client.client_id,
-                client_name=client.name,
-                scenario_id=scenario.scenario_id,
-                scenario_name=scenario.name,
-                scenario_category=scenario.category,
-                match_score=match_score,
-                match_details=match_details,
-                total_criteria=total_criteria,
-                criteria_met=criteria_met,
-                estimated_revenue=revenue_calc.final_amount,
-                revenue_calculation=revenue_calc,
-                priority=scenario.priority,
-                estimated_time_hours=scenario.estimated_time_hours,
-                required_licenses=scenario.required_licenses,
-                compliance_notes=scenario.compliance_notes,
-                created_at=datetime.utcnow()
-            )
-
-            opportunities.append(opportunity)
-
-            logger.info(
-                f"Created opportunity: {scenario.name} for {client.name} "
-                f"(match: {match_score:.1f}%, revenue: ${revenue_calc.final_amount:,.2f})"
-            )
-
-        except Exception as e:
-            logger.error(
-                f"Error matching client {client.client_id} to scenario {scenario.scenario_id}: {e}",
-                exc_info=True
-            )
-            # Continue processing other scenarios
-
-    logger.info(
-        f"Matched client {client.client_id}: found {len(opportunities)} opportunities"
-    )
+    telemetry.flush()
 
     return opportunities
 
@@ -137,23 +168,37 @@ def match_client_to_scenarios(
 def match_clients_to_scenarios(
     clients: Union[list[ClientProfile], ClientProfile],
     scenarios: Union[list[Scenario], Scenario],
-    min_match_threshold: float = 0.0
+    min_match_threshold: float = 0.0,
+    engine: Literal["auto", "compiled", "columnar", "sharded"] = "auto",
+    max_workers: Optional[int] = None
 ) -> list[Opportunity]:
     """
     Match multiple clients against one or more scenarios.
 
-    Batch processing for matching multiple client profiles.
+    Batch processing for matching multiple client profiles. All engines
+    return identical opportunities in the same order:
+    - "compiled": scores each client row by row with compiled scenarios
+    - "columnar": loads the book into NumPy columns and scores every
+      client against every scenario with vectorized masks
+    - "sharded": splits the book across a process pool; workers match
+      their shards with compiled scenarios. Opt-in only: it starts worker
+      processes, which is unsafe from threads of a running server
+    - "auto": columnar for books of COLUMNAR_MIN_CLIENTS or more, else
+      compiled
 
     Args:
         clients: Single client or list of clients to evaluate
         scenarios: Single scenario or list of scenarios to match against
         min_match_threshold: Minimum match score (0-100) to include in results
+        engine: Matching engine to use (default: "auto")
+        max_workers: Worker processes for the sharded engine
+            (default: CPU count)
 
     Returns:
         List of all Opportunity objects for all clients above threshold
 
     Raises:
-        ValueError: If min_match_threshold is invalid
+        ValueError: If min_match_threshold or engine is invalid
 
     Example:
         >>> clients = [client1, client2, client3]
@@ -165,35 +210,726 @@ def match_clients_to_scenarios(
     if isinstance(clients, ClientProfile):
         clients = [clients]
 
-    # Convert single scenario to list
-    if isinstance(scenarios, Scenario):
-        scenarios = [scenarios]
+    if engine not in MATCHING_ENGINES:
+        raise ValueError(f"Unsupported matching engine: {engine}")
+
+    if engine == "auto":
+        engine = "columnar" if len(clients) >= COLUMNAR_MIN_CLIENTS else "compiled"
+
+    # Compile scenarios once for the whole batch. Row-by-row engines order
+    # criteria by observed selectivity so early termination kicks in after
+    # as few criteria as possible; the columnar engine evaluates them all
+    compiled_scenarios = _prepare_scenarios(
+        scenarios,
+        min_match_threshold,
+        None if engine == "columnar" else clients[:CALIBRATION_SAMPLE_SIZE]
+    )
+    telemetry = MatchTelemetry("match_clients_to_scenarios")
+    revenue_calculator = RevenueCalculator(telemetry)
 
     logger.info(
-        f"Batch matching {len(clients)} clients against {len(scenarios)} scenarios"
+        f"Batch matching {len(clients)} clients against {len(compiled_scenarios)} scenarios"
     )
 
+    if engine == "columnar":
+        all_opportunities = _match_columnar(
+            clients,
+            compiled_scenarios,
+            min_match_threshold,
+            revenue_calculator,
+            telemetry
+        )
+        telemetry.flush()
+
+        logger.info(
+            f"Batch matching complete: {len(all_opportunities)} total opportunities "
+            f"from {len(clients)} clients (columnar)"
+        )
+
+        return all_opportunities
+
+    if engine == "sharded":
+        all_opportunities = _match_sharded(
+            clients,
+            compiled_scenarios,
+            min_match_threshold,
+            max_workers,
+            telemetry
+        )
+        telemetry.flush()
+
+        logger.info(
+            f"Batch matching complete: {len(all_opportunities)} total opportunities "
+            f"from {len(clients)} clients (sharded)"
+        )
+
+        return all_opportunities
+
     all_opportunities = []
 
     for client in clients:
         try:
-            opportunities = match_client_to_scenarios(
+            opportunities = _match_compiled(
                 client,
-                scenarios,
-                min_match_threshold
+                compiled_scenarios,
+                min_match_threshold,
+                revenue_calculator,
+                telemetry
             )
             all_opportunities.extend(opportunities)
 
         except Exception as e:
+            telemetry.record_error()
             logger.error(
                 f"Error matching client {client.client_id}: {e}",
                 exc_info=True
             )
             # Continue processing other clients
 
+    telemetry.flush()
+
     logger.info(
         f"Batch matching complete: {len(all_opportunities)} total opportunities "
         f"from {len(clients)} clients"
     )
 
     return all_opportunities
+
+
+def stream_client_matches(
+    clients: Iterable[ClientProfile],
+    scenarios: Union[list[Scenario], Scenario],
+    min_match_threshold: float = 0.0,
+    calibrate: bool = True
+) -> Iterator[Opportunity]:
+    """
+    Match a stream of clients against scenarios, yielding as it goes.
+
+    Clients are consumed lazily (e.g. from load_clients.iter_clients), so
+    only the calibration sample is buffered and the first opportunities
+    are yielded before the whole book has been read. Opportunities come
+    out in the same order as match_clients_to_scenarios.
+
+    Args:
+        clients: Iterable of client profiles (may be a generator)
+        scenarios: Single scenario or list of scenarios to match against
+        min_match_threshold: Minimum match score (0-100) to include in results
+        calibrate: Order criteria by selectivity on the head of the stream.
+            Pass False for shared, precompiled scenarios (e.g. a
+            ScenarioLibrary) that were calibrated when loaded
+
+    Yields:
+        Opportunity objects for matches above threshold
+
+    Raises:
+        ValueError: If min_match_threshold is invalid
+
+    Example:
+        >>> clients = iter_clients("data/clients/book.ndjson")
+        >>> for opportunity in stream_client_matches(clients, scenarios, 60.0):
+        ...     print(opportunity.client_name, opportunity.scenario_name)
+    """
+    clients = iter(clients)
+
+    # Calibrate on the head of the stream, then replay it
+    calibration_sample = None
+    if calibrate:
+        calibration_sample = list(islice(clients, CALIBRATION_SAMPLE_SIZE))
+
+    compiled_scenarios = _prepare_scenarios(
+        scenarios,
+        min_match_threshold,
+        calibration_sample
+    )
+    telemetry = MatchTelemetry("stream_client_matches")
+    revenue_calculator = RevenueCalculator(telemetry)
+
+    clients_matched = 0
+    opportunities_found = 0
+
+    for client in chain(calibration_sample or (), clients):
+        clients_matched += 1
+        try:
+            opportunities = _match_compiled(
+                client,
+                compiled_scenarios,
+                min_match_threshold,
+                revenue_calculator,
+                telemetry
+            )
+        except Exception as e:
+            telemetry.record_error()
+            logger.error(
+                f"Error matching client {client.client_id}: {e}",
+                exc_info=True
+            )
+            continue
+
+        opportunities_found += len(opportunities)
+        yield from opportunities
+
+    telemetry.flush()
+
+    logger.info(
+        f"Stream matching complete: {opportunities_found} total opportunities "
+        f"from {clients_matched} clients"
+    )
+
+
+def stream_compact_matches(
+    clients: Iterable[ClientProfile],
+    scenarios: Union[list[Scenario], Scenario],
+    min_match_threshold: float = 0.0,
+    calibrate: bool = True
+) -> Iterator[CompactOpportunity]:
+    """
+    Match a stream of clients, yielding compact records instead of Opportunities.
+
+    Same matches, scores, revenue and order as stream_client_matches, but
+    no match details, revenue breakdowns or Opportunity models are built.
+    Rank or filter the records, then materialize only the survivors:
+
+        >>> matches = stream_compact_matches(clients, scenarios, 60.0)
+        >>> top = rank_top_opportunities(matches, top_n=25)
+        >>> opportunities = materialize_opportunities(top)
+
+    Args:
+        clients: Iterable of client profiles (may be a generator)
+        scenarios: Single scenario or list of scenarios to match against
+        min_match_threshold: Minimum match score (0-100) to include in results
+        calibrate: Order criteria by selectivity on the head of the stream
+            (see stream_client_matches)
+
+    Yields:
+        CompactOpportunity for each match above threshold
+
+    Raises:
+        ValueError: If min_match_threshold is invalid
+    """
+    clients = iter(clients)
+
+    # Calibrate on the head of the stream, then replay it
+    calibration_sample = None
+    if calibrate:
+        calibration_sample = list(islice(clients, CALIBRATION_SAMPLE_SIZE))
+
+    compiled_scenarios = _prepare_scenarios(
+        scenarios,
+        min_match_threshold,
+        calibration_sample
+    )
+    telemetry = MatchTelemetry("stream_compact_matches")
+    revenue_calculator = RevenueCalculator(telemetry)
+
+    clients_matched = 0
+    opportunities_found = 0
+
+    for client in chain(calibration_sample or (), clients):
+        clients_matched += 1
+
+        for compiled in compiled_scenarios:
+            try:
+                match_score = compiled.score_above(client, min_match_threshold)
+                if match_score is None:
+                    telemetry.record_unmatched()
+                    continue
+
+                estimated_revenue = revenue_calculator.estimate_revenue(
+                    client,
+                    compiled.scenario
+                )
+            except Exception as e:
+                telemetry.record_error()
+                logger.error(
+                    f"Error matching client {client.client_id} to scenario {compiled.scenario_id}: {e}",
+                    exc_info=True
+                )
+                continue
+
+            telemetry.record_match(match_score)
+            opportunities_found += 1
+            yield CompactOpportunity(client, compiled, match_score, estimated_revenue)
+
+    telemetry.flush()
+
+    logger.info(
+        f"Compact matching complete: {opportunities_found} total opportunities "
+        f"from {clients_matched} clients"
+    )
+
+
+def materialize_opportunities(
+    records: Iterable[CompactOpportunity]
+) -> list[Opportunity]:
+    """
+    Build full Opportunity models for compact records, keeping their order.
+
+    Args:
+        records: Compact records (e.g. the ranked top N)
+
+    Returns:
+        Opportunity objects with match details, revenue breakdown, rank and
+        composite_score; records that fail to build are logged and skipped
+    """
+    revenue_calculator = RevenueCalculator()
+    opportunities = []
+
+    for record in records:
+        try:
+            opportunities.append(record.materialize(revenue_calculator))
+        except Exception as e:
+            logger.error(
+                f"Error building opportunity for client {record.client_id} "
+                f"and scenario {record.scenario_id}: {e}",
+                exc_info=True
+            )
+
+    return opportunities
+
+
+def match_indexed_clients(
+    index: ClientIndex,
+    scenarios: Union[list[Scenario], Scenario],
+    min_match_threshold: float = 0.0
+) -> list[Opportunity]:
+    """
+    Match an indexed client book against one or more scenarios.
+
+    Instead of scanning every client, each scenario retrieves candidate
+    clients from the index (range lookups on numeric fields, hash lookups
+    on categorical fields) and only candidates are scored. Keep one index
+    for the book and update it as clients change (``index.upsert(client)``).
+
+    Args:
+        index: ClientIndex over the client book
+        scenarios: Single scenario or list of scenarios to match against
+        min_match_threshold: Minimum match score (0-100) to include in results
+
+    Returns:
+        List of Opportunity objects above threshold, in the same order as
+        match_clients_to_scenarios (book order, then scenario order)
+
+    Raises:
+        ValueError: If min_match_threshold is invalid
+
+    Example:
+        >>> index = ClientIndex(clients)
+        >>> opportunities = match_indexed_clients(index, scenarios, 60.0)
+        >>> index.upsert(updated_client)
+        >>> new_scenario_opps = match_indexed_clients(index, new_scenario, 60.0)
+    """
+    compiled_scenarios = _prepare_scenarios(scenarios, min_match_threshold)
+    telemetry = MatchTelemetry("match_indexed_clients")
+    revenue_calculator = RevenueCalculator(telemetry)
+
+    matches = []
+    for position, compiled in enumerate(compiled_scenarios):
+        for client, score in index.match(compiled, min_match_threshold):
+            telemetry.record_match(score)
+            matches.append((index.sequence_of(client.client_id), position, client))
+
+    matches.sort(key=lambda match: (match[0], match[1]))
+
+    opportunities = []
+    for _sequence, position, client in matches:
+        compiled = compiled_scenarios[position]
+        try:
+            opportunities.append(
+                _build_opportunity(client, compiled, revenue_calculator)
+            )
+        except Exception as e:
+            telemetry.record_error()
+            logger.error(
+                f"Error matching client {client.client_id} to scenario {compiled.scenario_id}: {e}",
+                exc_info=True
+            )
+
+    telemetry.flush()
+
+    logger.info(
+        f"Indexed matching complete: {len(opportunities)} opportunities "
+        f"from {len(index)} indexed clients and {len(compiled_scenarios)} scenarios"
+    )
+
+    return opportunities
+
+
+def match_clients_incremental(
+    clients: Iterable[ClientProfile],
+    scenarios: Union[list[Scenario], Scenario],
+    store: MatchStore,
+    min_match_threshold: float = 0.0,
+    prune: bool = False
+) -> Iterator[Opportunity]:
+    """
+    Match clients against scenarios, reusing results from a match store.
+
+    Pairs whose client and scenario are unchanged since they were stored
+    are served from the store; only new or changed clients and scenarios
+    are scored. Stored scores are exact, so the threshold can change
+    between runs without re-matching. Opportunities come out in the same
+    order as match_clients_to_scenarios.
+
+    Args:
+        clients: Iterable of client profiles (may be a generator)
+        scenarios: Single scenario or list of scenarios to match against
+        store: MatchStore holding results of earlier runs
+        min_match_threshold: Minimum match score (0-100) to include in results
+        prune: Delete stored pairs for clients and scenarios not in this
+            run once the book has been consumed
+
+    Yields:
+        Opportunity objects for matches above threshold
+
+    Raises:
+        ValueError: If min_match_threshold is invalid
+
+    Example:
+        >>> store = MatchStore("data/match_store.sqlite")
+        >>> opportunities = list(match_clients_incremental(clients, scenarios, store, 60.0))
+        >>> # Tomorrow: only changed clients and scenarios are re-matched
+        >>> opportunities = list(match_clients_incremental(clients, scenarios, store, 60.0))
+    """
+    compiled_scenarios = _prepare_scenarios(scenarios, min_match_threshold)
+    scenario_hashes = [scenario_fingerprint(c.scenario) for c in compiled_scenarios]
+    telemetry = MatchTelemetry("match_clients_incremental")
+    revenue_calculator = RevenueCalculator(telemetry)
+
+    seen_client_hashes: set[str] = set()
+    clients_matched = 0
+    pairs_reused = 0
+    pairs_scored = 0
+    opportunities_found = 0
+
+    clients = iter(clients)
+
+    while True:
+        batch = list(islice(clients, MATCH_STORE_BATCH_SIZE))
+        if not batch:
+            break
+
+        client_hashes = [client_fingerprint(client) for client in batch]
+        stored = store.get_many(client_hashes, scenario_hashes)
+        if prune:
+            seen_client_hashes.update(client_hashes)
+
+        updates = []
+        opportunities = []
+
+        for client, client_hash in zip(batch, client_hashes):
+            clients_matched += 1
+
+            for compiled, scenario_hash in zip(compiled_scenarios, scenario_hashes):
+                try:
+                    entry = stored.get((client_hash, scenario_hash))
+                    if entry is None:
+                        pairs_scored += 1
+                        match_score, payload = compiled.score(client), None
+                    else:
+                        pairs_reused += 1
+                        match_score, payload = entry
+
+                    if match_score >= min_match_threshold:
+                        telemetry.record_match(match_score)
+                        if payload is None:
+                            opportunity = _build_opportunity(
+                                client,
+                                compiled,
+                                revenue_calculator
+                            )
+                            payload = opportunity.model_dump_json()
+                        else:
+                            opportunity = Opportunity.model_validate_json(payload)
+                        opportunities.append(opportunity)
+                    else:
+                        telemetry.record_unmatched()
+
+                    if entry is None or entry[1] != payload:
+                        updates.append((client_hash, scenario_hash, match_score, payload))
+
+                except Exception as e:
+                    telemetry.record_error()
+                    logger.error(
+                        f"Error matching client {client.client_id} to scenario {compiled.scenario_id}: {e}",
+                        exc_info=True
+                    )
+
+        store.put_many(updates)
+
+        opportunities_found += len(opportunities)
+        yield from opportunities
+
+    if prune:
+        store.retain(seen_client_hashes, scenario_hashes)
+
+    telemetry.flush()
+
+    logger.info(
+        f"Incremental matching complete: {opportunities_found} total opportunities "
+        f"from {clients_matched} clients ({pairs_reused} pairs reused, "
+        f"{pairs_scored} pairs scored)"
+    )
+
+
+# Private helper functions
+
+def _prepare_scenarios(
+    scenarios: Union[list[Scenario], Scenario],
+    min_match_threshold: float,
+    calibration_sample: Optional[list[ClientProfile]] = None
+) -> list[CompiledScenario]:
+    """
+    Validate the threshold and compile scenarios for matching.
+
+    Invalid scenarios are skipped (and logged). Already-compiled scenarios
+    (e.g. preloaded by a long-running service) are used as-is.
+
+    Args:
+        scenarios: Single scenario or list of scenarios (or compiled scenarios)
+        min_match_threshold: Minimum match score (0-100)
+        calibration_sample: Clients to estimate criterion selectivity from
+            (default: leave the scenarios' evaluation order unchanged)
+
+    Returns:
+        List of CompiledScenario objects
+
+    Raises:
+        ValueError: If min_match_threshold is invalid
+    """
+    # Validate threshold
+    if not 0.0 <= min_match_threshold <= 100.0:
+        raise ValueError("min_match_threshold must be between 0.0 and 100.0")
+
+    # Convert single scenario to list
+    if isinstance(scenarios, Scenario):
+        scenarios = [scenarios]
+
+    compiled_scenarios = []
+
+    for scenario in scenarios:
+        if isinstance(scenario, CompiledScenario):
+            compiled_scenarios.append(scenario)
+            continue
+        try:
+            compiled_scenarios.append(compile_scenario(scenario))
+        except Exception as e:
+            logger.error(f"Error compiling scenario {scenario.scenario_id}: {e}")
+
+    if calibration_sample is not None:
+        for compiled in compiled_scenarios:
+            compiled.calibrate(calibration_sample)
+
+    return compiled_scenarios
+
+
+def _match_compiled(
+    client: ClientProfile,
+    compiled_scenarios: list[CompiledScenario],
+    min_match_threshold: float,
+    revenue_calculator: RevenueCalculator,
+    telemetry: MatchTelemetry
+) -> list[Opportunity]:
+    """
+    Match one client against compiled scenarios.
+
+    Scores each scenario without building match details, stopping early
+    once the threshold is unreachable; details and revenue are only
+    computed for scenarios that meet the threshold. Pairs are counted in
+    telemetry; only sampled matches are logged.
+    """
+    opportunities = []
+
+    for compiled in compiled_scenarios:
+        scenario = compiled.scenario
+
+        try:
+            # Fast score first - stops as soon as the threshold is out of
+            # reach and builds no detail objects for non-matches
+            match_score = compiled.score_above(client, min_match_threshold)
+
+            # Skip if below threshold
+            if match_score is None:
+                telemetry.record_unmatched()
+                continue
+
+            opportunity = _build_opportunity(client, compiled, revenue_calculator)
+            opportunities.append(opportunity)
+
+            if telemetry.record_match(match_score):
+                logger.info(
+                    f"Created opportunity: {scenario.name} for {client.name} "
+                    f"(match: {match_score:.1f}%, revenue: ${opportunity.estimated_revenue:,.2f})"
+                )
+
+        except Exception as e:
+            telemetry.record_error()
+            logger.error(
+                f"Error matching client {client.client_id} to scenario {scenario.scenario_id}: {e}",
+                exc_info=True
+            )
+            # Continue processing other scenarios
+
+    return opportunities
+
+
+def _match_columnar(
+    clients: list[ClientProfile],
+    compiled_scenarios: list[CompiledScenario],
+    min_match_threshold: float,
+    revenue_calculator: RevenueCalculator,
+    telemetry: MatchTelemetry
+) -> list[Opportunity]:
+    """
+    Match a client book using the vectorized columnar engine.
+
+    Scores the whole book at once, then builds opportunities (match details
+    and revenue) only for client-scenario pairs that meet the threshold.
+    Results are in the same order as the row-by-row engine.
+    """
+    # Deferred import keeps NumPy off the import path for small batches
+    from ..services.columnar_matcher import ColumnarMatcher
+
+    matcher = ColumnarMatcher(compiled_scenarios)
+    book = matcher.load_clients(clients)
+
+    opportunities = []
+    matches = 0
+
+    for i, j, score in matcher.iter_matches(book, min_match_threshold):
+        client = book.clients[i]
+        compiled = compiled_scenarios[j]
+        matches += 1
+
+        try:
+            opportunities.append(
+                _build_opportunity(client, compiled, revenue_calculator)
+            )
+            telemetry.record_match(score)
+        except Exception as e:
+            telemetry.record_error()
+            logger.error(
+                f"Error matching client {client.client_id} to scenario {compiled.scenario_id}: {e}",
+                exc_info=True
+            )
+
+    telemetry.record_unmatched(len(book.clients) * len(compiled_scenarios) - matches)
+
+    return opportunities
+
+
+def _match_sharded(
+    clients: list[ClientProfile],
+    compiled_scenarios: list[CompiledScenario],
+    min_match_threshold: float,
+    max_workers: Optional[int],
+    telemetry: MatchTelemetry
+) -> list[Opportunity]:
+    """
+    Match a client book across worker processes.
+
+    Workers score, explain and price matches; the parent only turns their
+    compact records into Opportunity objects and counts them, and the
+    pairs workers failed on, in telemetry. Results are in the same order
+    as the row-by-row engine.
+    """
+    # Deferred import keeps multiprocessing machinery off the default path
+    from ..services.sharded_matcher import ShardedMatcher
+
+    matcher = ShardedMatcher(compiled_scenarios, max_workers=max_workers)
+
+    opportunities = []
+    errors_before = telemetry.errors
+
+    for record in matcher.iter_records(clients, min_match_threshold, telemetry):
+        opportunities.append(_opportunity_from_record(
+            clients[record.client_index],
+            compiled_scenarios[record.scenario_index],
+            record
+        ))
+
+        revenue = record.revenue
+        telemetry.record_match(record.match_score)
+        telemetry.record_revenue(
+            revenue["final_amount"],
+            revenue["formula_type"],
+            revenue["min_applied"],
+            revenue["max_applied"]
+        )
+
+    # Failed pairs are counted as errors, not as unmatched
+    failed = telemetry.errors - errors_before
+    telemetry.record_unmatched(
+        len(clients) * len(compiled_scenarios) - len(opportunities) - failed
+    )
+
+    return opportunities
+
+
+def _opportunity_from_record(
+    client: ClientProfile,
+    compiled: CompiledScenario,
+    record
+) -> Opportunity:
+    """
+    Materialize a worker's OpportunityRecord into an Opportunity.
+
+    Builds the same Opportunity as _build_opportunity() from values the
+    worker already computed, without re-evaluating or re-pricing.
+    """
+    return _make_opportunity(
+        client,
+        compiled,
+        record.match_score,
+        MatchExplanation(compiled.criteria, record.matched_mask, record.actual_values),
+        RevenueCalculation(**record.revenue)
+    )
+
+
+def _build_opportunity(
+    client: ClientProfile,
+    compiled: CompiledScenario,
+    revenue_calculator: RevenueCalculator
+) -> Opportunity:
+    """
+    Build the full Opportunity (match explanation + revenue) for a matched pair.
+
+    Match details are kept as a compact MatchExplanation and only built
+    when read (e.g. for the handful of opportunities a report displays).
+    """
+    match_score, match_details = compiled.explain_compact(client)
+
+    # Calculate revenue
+    revenue_calc = revenue_calculator.calculate_revenue(client, compiled.scenario)
+
+    return _make_opportunity(client, compiled, match_score, match_details, revenue_calc)
+
+
+def _make_opportunity(
+    client: ClientProfile,
+    compiled: CompiledScenario,
+    match_score: float,
+    match_details: MatchExplanation,
+    revenue_calc: RevenueCalculation
+) -> Opportunity:
+    """Create the Opportunity for a scored, explained and priced pair."""
+    scenario = compiled.scenario
+
+    return Opportunity(
+        opportunity_id=str(uuid.uuid4()),
+        client_id=client.client_id,
+        client_name=client.name,
+        scenario_id=scenario.scenario_id,
+        scenario_name=scenario.name,
+        scenario_category=scenario.category,
+        match_score=match_score,
+        match_details=match_details,
+        total_criteria=len(match_details),
+        criteria_met=match_details.criteria_met,
+        estimated_revenue=revenue_calc.final_amount,
+        revenue_calculation=revenue_calc,
+        priority=scenario.priority,
+        estimated_time_hours=scenario.estimated_time_hours,
+        required_licenses=scenario.required_licenses,
+        compliance_notes=scenario.compliance_notes,
+        created_at=datetime.utcnow()
+    )
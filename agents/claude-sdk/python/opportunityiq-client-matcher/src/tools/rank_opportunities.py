@@ -6,13 +6,19 @@ Ranks and prioritizes opportunities using composite scoring.
 SERVE Principle: Clear prioritization helps advisors focus on best opportunities.
 """
 
+import heapq
 import logging
-from typing import Literal, Callable, Optional
+from operator import itemgetter
+from typing import Literal, Callable, Iterable, Optional, Union
 
 from ..models import Opportunity
+from ..services.opportunity_optimizer import OpportunityOptimizer, PortfolioPlan
 
 logger = logging.getLogger(__name__)
 
+# Plan key for clients missing from advisor_by_client
+UNASSIGNED_ADVISOR = "unassigned"
+
 
 def rank_opportunities(
     opportunities: list[Opportunity],
@@ -25,7 +31,10 @@ def rank_opportunities(
     """
     Rank and prioritize opportunities.
 
-    Assigns rank numbers to opportunities based on chosen strategy.
+    Assigns rank numbers to opportunities based on chosen strategy. With a
+    limit, only the top opportunities are selected (bounded heap, no full
+    sort) and only they get rank and composite_score assigned. Ties keep
+    their input order.
 
     Args:
         opportunities: List of opportunities to rank
@@ -37,6 +46,7 @@ def rank_opportunities(
         match_weight: Weight for match score in composite (0.0-1.0, default 0.4)
         revenue_weight: Weight for revenue in composite (0.0-1.0, default 0.6)
         descending: True for highest first, False for lowest first
+        limit: Optional number of top opportunities to return
 
     Returns:
         List of opportunities with rank and composite_score assigned
@@ -53,60 +63,88 @@ def rank_opportunities(
     if not opportunities:
         raise ValueError("Cannot rank empty opportunities list")
 
-    # Validate weights for composite strategy
-    if ranking_strategy == "composite":
-        if not abs((match_weight + revenue_weight) - 1.0) < 0.001:
-            raise ValueError(
-                f"match_weight and revenue_weight must sum to 1.0 "
-                f"(got {match_weight + revenue_weight})"
-            )
-
     logger.info(
         f"Ranking {len(opportunities)} opportunities using '{ranking_strategy}' strategy"
     )
 
-    # Choose ranking function
-    if ranking_strategy == "revenue":
-        score_func = lambda opp: opp.estimated_revenue
-    elif ranking_strategy == "match_score":
-        score_func = lambda opp: opp.match_score
-    elif ranking_strategy == "composite":
-        score_func = lambda opp: _calculate_composite_score(
-            opp, match_weight, revenue_weight
-        )
-    elif ranking_strategy == "priority":
-        score_func = lambda opp: _priority_to_score(opp.priority)
-    else:
-        raise ValueError(f"Unsupported ranking strategy: {ranking_strategy}")
+    if limit is not None and limit <= 0:
+        limit = None
 
-    # Calculate scores and sort
-    for opp in opportunities:
-        if ranking_strategy == "composite":
-            opp.composite_score = score_func(opp)
-
-    sorted_opps = sorted(
+    sorted_opps = _select_ranked(
         opportunities,
-        key=score_func,
-        reverse=descending
+        ranking_strategy,
+        match_weight,
+        revenue_weight,
+        descending,
+        limit
     )
 
-    # Assign ranks
-    for rank, opp in enumerate(sorted_opps, start=1):
-        opp.rank = rank
-
     logger.info(
         f"Ranking complete. Top opportunity: {sorted_opps[0].scenario_name} "
         f"for {sorted_opps[0].client_name}"
     )
 
-    # Apply limit if specified
-    if limit is not None and limit > 0:
-        sorted_opps = sorted_opps[:limit]
+    if limit is not None:
         logger.info(f"Applied limit: returning top {len(sorted_opps)} opportunities")
 
     return sorted_opps
 
 
+def rank_top_opportunities(
+    opportunities: Iterable[Opportunity],
+    top_n: int = 100,
+    ranking_strategy: Literal["revenue", "match_score", "composite", "priority"] = "composite",
+    match_weight: float = 0.4,
+    revenue_weight: float = 0.6,
+    descending: bool = True
+) -> list[Opportunity]:
+    """
+    Rank the top N opportunities from a stream.
+
+    Consumes any iterable (e.g. stream_client_matches) in one pass and
+    keeps only the best top_n in a bounded heap, so memory is O(top_n)
+    however many matches flow through. Results are identical to
+    rank_opportunities(list(opportunities), ..., limit=top_n).
+
+    Args:
+        opportunities: Iterable of opportunities (may be a generator), or
+            of CompactOpportunity records from stream_compact_matches
+        top_n: Number of top opportunities to keep
+        ranking_strategy: Strategy to use for ranking (see rank_opportunities)
+        match_weight: Weight for match score in composite (0.0-1.0, default 0.4)
+        revenue_weight: Weight for revenue in composite (0.0-1.0, default 0.6)
+        descending: True for highest first, False for lowest first
+
+    Returns:
+        Up to top_n opportunities with rank and composite_score assigned
+        (empty if the stream was empty)
+
+    Raises:
+        ValueError: If top_n is less than 1 or weights don't sum to 1.0
+
+    Example:
+        >>> matches = stream_client_matches(iter_clients("book.ndjson"), scenarios, 60.0)
+        >>> top_100 = rank_top_opportunities(matches, top_n=100)
+    """
+    if top_n < 1:
+        raise ValueError("top_n must be at least 1")
+
+    ranked = _select_ranked(
+        opportunities,
+        ranking_strategy,
+        match_weight,
+        revenue_weight,
+        descending,
+        top_n
+    )
+
+    logger.info(
+        f"Selected top {len(ranked)} opportunities using '{ranking_strategy}' strategy"
+    )
+
+    return ranked
+
+
 def filter_opportunities(
     opportunities: list[Opportunity],
     min_match_score: Optional[float] = None,
@@ -221,9 +259,14 @@ def get_top_opportunities(
 
     logger.info(f"Getting top {top_n} opportunities from {len(opportunities)} total")
 
-    ranked = rank_opportunities(opportunities, ranking_strategy=ranking_strategy)
+    if top_n <= 0:
+        return []
 
-    return ranked[:top_n]
+    return rank_opportunities(
+        opportunities,
+        ranking_strategy=ranking_strategy,
+        limit=top_n
+    )
 
 
 def group_opportunities_by_client(
@@ -257,8 +300,160 @@ def group_opportunities_by_client(
     return grouped
 
 
+def optimize_opportunity_portfolio(
+    opportunities: list[Opportunity],
+    time_budget_hours: Union[float, dict[str, float]] = 40.0,
+    advisor_by_client: Optional[dict[str, str]] = None,
+    licenses: Optional[Union[list[str], dict[str, list[str]]]] = None,
+    method: Literal["auto", "dp", "greedy"] = "auto",
+    default_time_hours: float = 1.0,
+    max_workers: Optional[int] = None
+) -> dict[str, PortfolioPlan]:
+    """
+    Pick the revenue-maximizing opportunities each advisor or client can act on.
+
+    Groups opportunities per client (or per advisor, with advisor_by_client),
+    collapses duplicate client-scenario opportunities, drops those needing
+    licenses the group doesn't hold, and solves a time-budget knapsack per
+    group (exact DP, or revenue-per-hour greedy for very large groups).
+    Large batches of groups are solved across a process pool.
+
+    Args:
+        opportunities: List of opportunities
+        time_budget_hours: Hours available per group, or a mapping of group
+            ID to hours (default 40.0)
+        advisor_by_client: Mapping of client_id to advisor ID; plans are per
+            advisor. Clients not in the mapping are planned under
+            "unassigned". Default: plans are per client
+        licenses: Licenses held by every group, or a mapping of group ID to
+            licenses; None ignores license requirements
+        method: "auto" (default), "dp" (always exact) or "greedy"
+        default_time_hours: Hours assumed when an opportunity has no estimate
+        max_workers: Worker processes for large batches (default: CPU count)
+
+    Returns:
+        Dictionary mapping advisor or client ID to its PortfolioPlan
+
+    Raises:
+        ValueError: If method or another setting is invalid
+
+    Example:
+        >>> plans = optimize_opportunity_portfolio(
+        ...     opportunities,
+        ...     time_budget_hours=20.0,
+        ...     advisor_by_client={"C001": "ADV-1", "C002": "ADV-1"},
+        ...     licenses={"ADV-1": ["Series 7", "Series 65"]}
+        ... )
+        >>> for advisor_id, plan in plans.items():
+        ...     print(f"{advisor_id}: ${plan.total_revenue:,.0f} in {plan.total_hours}h")
+    """
+    optimizer = OpportunityOptimizer(
+        time_budget_hours=time_budget_hours,
+        licenses=licenses,
+        method=method,
+        default_time_hours=default_time_hours,
+        max_workers=max_workers
+    )
+
+    if advisor_by_client is None:
+        groups = group_opportunities_by_client(opportunities)
+    else:
+        groups = {}
+        for opp in opportunities:
+            advisor_id = advisor_by_client.get(opp.client_id, UNASSIGNED_ADVISOR)
+            groups.setdefault(advisor_id, []).append(opp)
+
+        if UNASSIGNED_ADVISOR in groups:
+            logger.warning(
+                f"{len(groups[UNASSIGNED_ADVISOR])} opportunities belong to clients "
+                f"without an advisor; planned under '{UNASSIGNED_ADVISOR}'"
+            )
+
+    logger.info(f"Optimizing opportunity portfolios for {len(groups)} groups")
+
+    plans = optimizer.optimize_groups(groups)
+
+    total_revenue = sum(plan.total_revenue for plan in plans.values())
+    selected = sum(len(plan.selected) for plan in plans.values())
+    logger.info(
+        f"Selected {selected} of {len(opportunities)} opportunities "
+        f"(${total_revenue:,.2f} estimated revenue)"
+    )
+
+    return plans
+
+
 # Private helper functions
 
+def _select_ranked(
+    opportunities: Iterable[Opportunity],
+    ranking_strategy: str,
+    match_weight: float,
+    revenue_weight: float,
+    descending: bool,
+    limit: Optional[int]
+) -> list[Opportunity]:
+    """
+    Order opportunities by strategy and assign rank/composite_score.
+
+    Each ranking key is computed once and carried alongside its
+    opportunity. Without a limit the keys are sorted; with one, heapq's
+    nlargest/nsmallest keep a bounded heap. Both are stable, so ties keep
+    input order and the top-K matches the head of the full sort.
+    """
+    score_func = _ranking_score_function(ranking_strategy, match_weight, revenue_weight)
+
+    keyed = ((score_func(opp), opp) for opp in opportunities)
+    by_score = itemgetter(0)
+
+    if limit is None:
+        selected = sorted(keyed, key=by_score, reverse=descending)
+    elif descending:
+        selected = heapq.nlargest(limit, keyed, key=by_score)
+    else:
+        selected = heapq.nsmallest(limit, keyed, key=by_score)
+
+    ranked = []
+    for rank, (score, opp) in enumerate(selected, start=1):
+        if ranking_strategy == "composite":
+            opp.composite_score = score
+        opp.rank = rank
+        ranked.append(opp)
+
+    return ranked
+
+
+def _ranking_score_function(
+    ranking_strategy: str,
+    match_weight: float,
+    revenue_weight: float
+) -> Callable[[Opportunity], float]:
+    """
+    Get the ranking key function for a strategy.
+
+    Raises:
+        ValueError: If the strategy is unsupported or composite weights
+            don't sum to 1.0
+    """
+    if ranking_strategy == "revenue":
+        return lambda opp: opp.estimated_revenue
+    if ranking_strategy == "match_score":
+        return lambda opp: opp.match_score
+    if ranking_strategy == "composite":
+        if not abs((match_weight + revenue_weight) - 1.0) < 0.001:
+            raise ValueError(
+                f"match_weight and revenue_weight must sum to 1.0 "
+                f"(got {match_weight + revenue_weight})"
+            )
+        return lambda opp: _calculate_composite_score(
+            opp, match_weight, revenue_weight
+        )
+    if ranking_strategy == "priority":
+        return lambda opp: _priority_to_score(opp.priority)
+
+    raise ValueError(f"Unsupported ranking strategy: {ranking_strategy}")
+
+
 def _calculate_composite_score(
     opportunity: Opportunity,
     match_weight: float,
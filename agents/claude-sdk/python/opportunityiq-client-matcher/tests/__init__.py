@@ -0,0 +1,10 @@
+"""
+Unit tests for OpportunityIQ Client Matcher.
+
+Every matching engine is checked against the reference MatchingEngine on
+synthetic client books and scenario libraries (see benchmark.py), so
+optimizations cannot change which opportunities are found or their scores.
+
+Run from the project root:
+    pytest tests/
+"""
@@ -0,0 +1,34 @@
+"""
+Shared fixtures: a small synthetic client book and scenario library.
+"""
+
+import logging
+import random
+
+import pytest
+
+import benchmark
+from src.models import ClientProfile, Scenario
+
+# Thresholds covering "everything", typical cut-offs and exact matches only
+THRESHOLDS = [0.0, 40.0, 60.0, 80.0, 100.0]
+
+
+@pytest.fixture(autouse=True)
+def quiet_logging():
+    """Keep per-run summary logging out of test output."""
+    logging.disable(logging.INFO)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(scope="session")
+def clients() -> list[ClientProfile]:
+    rng = random.Random(7)
+    return [ClientProfile.model_validate(benchmark.generate_client(rng, i)) for i in range(300)]
+
+
+@pytest.fixture(scope="session")
+def scenarios() -> list[Scenario]:
+    rng = random.Random(11)
+    return [Scenario.model_validate(benchmark.generate_scenario(rng, i)) for i in range(12)]
@@ -0,0 +1,214 @@
+"""
+Tests for the HTTP API.
+
+The app is started with its real lifespan against a temporary scenarios
+directory. Streamed responses must carry the same opportunities, in the
+same order, as calling the matching and ranking tools directly.
+"""
+
+import json
+import random
+import time
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+import benchmark
+from src.api import main
+from src.api.config import settings
+from src.models import Opportunity
+from src.tools import match_clients_to_scenarios, rank_opportunities
+
+THRESHOLD = 50.0
+
+
+def dump(opportunities):
+    return [
+        o.model_dump(mode="json", exclude={"opportunity_id", "created_at"})
+        for o in opportunities
+    ]
+
+
+def parse_ndjson(text: str) -> list[Opportunity]:
+    return [Opportunity.model_validate_json(line) for line in text.splitlines()]
+
+
+def write_scenarios(path, scenarios) -> None:
+    path.write_text(
+        json.dumps([s.model_dump(mode="json") for s in scenarios]), encoding="utf-8"
+    )
+
+
+@pytest.fixture
+def scenarios_dir(tmp_path, scenarios):
+    directory = tmp_path / "scenarios"
+    directory.mkdir()
+    write_scenarios(directory / "first.json", scenarios[:6])
+    write_scenarios(directory / "second.json", scenarios[6:])
+    return directory
+
+
+@pytest.fixture
+def api(scenarios_dir, monkeypatch):
+    monkeypatch.setattr(settings, "scenarios_directory", str(scenarios_dir))
+    monkeypatch.setattr(settings, "scenario_calibration_clients", "")
+    monkeypatch.setattr(settings, "scenario_bundle_path", "")
+    monkeypatch.setattr(settings, "scenario_reload_interval", 0.05)
+    monkeypatch.setattr(settings, "stream_chunk_size", 7)
+
+    with TestClient(main.app) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def book(clients) -> list[dict]:
+    return [c.model_dump(mode="json") for c in clients[:60]]
+
+
+def test_health_reports_loaded_library(api, scenarios):
+    health = api.get("/health").json()
+
+    assert health["status"] == "healthy"
+    assert health["scenarios_loaded"] == len(scenarios)
+    assert health["scenario_library_version"] == 1
+
+
+def test_match_streams_the_matched_opportunities(api, clients, scenarios, book):
+    response = api.post("/api/match", json={"clients": book, "min_match_threshold": THRESHOLD})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    expected = match_clients_to_scenarios(clients[:60], scenarios, THRESHOLD)
+    assert expected
+    assert dump(parse_ndjson(response.text)) == dump(expected)
+
+
+def test_match_selected_scenarios(api, clients, scenarios, book):
+    ids = [scenarios[3].scenario_id, scenarios[8].scenario_id]
+
+    response = api.post("/api/match", json={
+        "clients": book, "scenario_ids": ids, "min_match_threshold": 0.0
+    })
+
+    streamed = parse_ndjson(response.text)
+    assert len(streamed) == 2 * len(book)
+    assert {o.scenario_id for o in streamed} == set(ids)
+
+
+@pytest.mark.parametrize("limit", [None, 1, 10])
+@pytest.mark.parametrize("strategy", ["composite", "revenue", "priority"])
+def test_rank_matches_rank_opportunities(api, clients, scenarios, book, strategy, limit):
+    response = api.post("/api/rank", json={
+        "clients": book,
+        "min_match_threshold": THRESHOLD,
+        "ranking_strategy": strategy,
+        "limit": limit,
+    })
+
+    assert response.status_code == 200
+    expected = rank_opportunities(
+        match_clients_to_scenarios(clients[:60], scenarios, THRESHOLD),
+        strategy,
+        limit=limit
+    )
+    assert dump(parse_ndjson(response.text)) == dump(expected)
+
+
+def test_rank_rejects_invalid_weights(api, book):
+    response = api.post("/api/rank", json={
+        "clients": book, "match_weight": 0.5, "revenue_weight": 0.7
+    })
+
+    assert response.status_code == 422
+    assert "must sum to 1.0" in response.json()["detail"]
+
+
+def test_report_markdown_is_streamed(api, clients, scenarios, book):
+    response = api.post("/api/report", json={
+        "clients": book, "min_match_threshold": THRESHOLD, "limit": 5
+    })
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/markdown")
+    text = response.text
+    assert text.startswith("# OpportunityIQ Client Matcher Report")
+    top = rank_opportunities(
+        match_clients_to_scenarios(clients[:60], scenarios, THRESHOLD), limit=5
+    )
+    for opp in top:
+        assert f"### {opp.rank}. {opp.scenario_name}" in text
+
+
+def test_report_json(api, book):
+    response = api.post("/api/report", json={
+        "clients": book, "min_match_threshold": THRESHOLD, "limit": 5, "format": "json"
+    })
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/json")
+    assert json.loads(response.text)
+
+
+def test_report_without_matches_is_rejected(api):
+    response = api.post("/api/report", json={"clients": []})
+
+    assert response.status_code == 422
+    assert "No opportunities matched" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("path", ["/api/match", "/api/rank", "/api/report"])
+def test_unknown_scenario_is_404(api, book, path):
+    response = api.post(path, json={"clients": book[:3], "scenario_ids": ["NOPE-1"]})
+
+    assert response.status_code == 404
+    assert "NOPE-1" in response.json()["detail"]
+
+
+def wait_for_version(api, version: int, timeout: float = 5.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        health = api.get("/health").json()
+        if health["scenario_library_version"] >= version or time.monotonic() > deadline:
+            return health
+        time.sleep(0.02)
+
+
+def test_hot_reload_picks_up_new_and_removed_files(api, scenarios_dir, book):
+    rng = random.Random(99)
+    added = benchmark.generate_scenario(rng, 900)
+    (scenarios_dir / "third.json").write_text(json.dumps([added]), encoding="utf-8")
+
+    health = wait_for_version(api, 2)
+
+    assert health["scenario_library_version"] == 2
+    listed = api.get("/api/scenarios").json()
+    assert added["scenario_id"] in {s["scenario_id"] for s in listed["scenarios"]}
+    response = api.post("/api/match", json={
+        "clients": book[:5], "scenario_ids": [added["scenario_id"]], "min_match_threshold": 0.0
+    })
+    assert len(parse_ndjson(response.text)) == 5
+
+    (scenarios_dir / "third.json").unlink()
+    wait_for_version(api, 3)
+
+    response = api.post("/api/match", json={
+        "clients": book[:5], "scenario_ids": [added["scenario_id"]]
+    })
+    assert response.status_code == 404
+
+
+def test_failed_reload_keeps_previous_library(api, scenarios_dir, scenarios):
+    (scenarios_dir / "first.json").write_text("not json", encoding="utf-8")
+    (scenarios_dir / "second.json").write_text("[]", encoding="utf-8")
+    time.sleep(0.3)
+
+    health = api.get("/health").json()
+    assert health["scenario_library_version"] == 1
+    assert health["scenarios_loaded"] == len(scenarios)
+
+    response = api.post("/api/scenarios/reload")
+    assert response.status_code == 422
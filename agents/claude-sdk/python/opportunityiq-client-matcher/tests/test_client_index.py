@@ -0,0 +1,85 @@
+"""
+Tests for ClientIndex and indexed matching.
+
+The index must return exactly the matches a full scan finds, including
+after clients are updated, added and removed.
+"""
+
+import pytest
+
+from src.models import ClientProfile
+from src.services import ClientIndex
+from src.tools import match_clients_to_scenarios, match_indexed_clients
+
+from .conftest import THRESHOLDS
+
+
+def keys(opportunities):
+    return [(o.client_id, o.scenario_id, o.match_score) for o in opportunities]
+
+
+def scan(clients, scenarios, threshold):
+    return keys(match_clients_to_scenarios(clients, scenarios, threshold, engine="compiled"))
+
+
+def changed(client: ClientProfile, **updates) -> ClientProfile:
+    data = client.model_dump()
+    data.update(updates)
+    return ClientProfile.model_validate(data)
+
+
+@pytest.mark.parametrize("threshold", THRESHOLDS)
+def test_indexed_matches_full_scan(clients, scenarios, threshold):
+    index = ClientIndex(clients)
+
+    assert keys(match_indexed_clients(index, scenarios, threshold)) == scan(
+        clients, scenarios, threshold
+    )
+
+
+@pytest.mark.parametrize("threshold", [0.0, 60.0, 80.0])
+def test_upsert_and_remove_keep_index_exact(clients, scenarios, threshold):
+    index = ClientIndex(clients)
+    # Index every field the scenarios use before the book changes
+    match_indexed_clients(index, scenarios, threshold)
+
+    book = {c.client_id: c for c in clients}
+    for position, client in enumerate(clients[::10]):
+        updated = changed(
+            client,
+            age=client.age + 7,
+            portfolio_value=client.portfolio_value * (0.5 if position % 2 else 2.0),
+        )
+        index.upsert(updated)
+        book[client.client_id] = updated
+
+    for client in clients[5::25]:
+        index.remove(client.client_id)
+        del book[client.client_id]
+
+    for position, client in enumerate(clients[:3]):
+        added = changed(client, client_id=f"NEW-{position}")
+        index.upsert(added)
+        book[added.client_id] = added
+
+    assert len(index) == len(book)
+    assert keys(match_indexed_clients(index, scenarios, threshold)) == scan(
+        list(book.values()), scenarios, threshold
+    )
+
+
+def test_updated_client_keeps_book_position(clients):
+    index = ClientIndex(clients)
+    client = clients[3]
+
+    index.upsert(changed(client, age=client.age + 1))
+
+    assert index.sequence_of(client.client_id) == 3
+    assert list(index.clients)[3] == client.client_id
+
+
+def test_remove_unknown_client_raises(clients):
+    index = ClientIndex(clients[:5])
+
+    with pytest.raises(KeyError):
+        index.remove("missing")
@@ -0,0 +1,90 @@
+"""
+Tests for compact opportunity records.
+
+Ranking CompactOpportunity records and materializing the top N must give
+the same Opportunity objects, ranks and composite scores as ranking full
+opportunities.
+"""
+
+import pytest
+
+from src.models import RevenueFormula
+from src.tools import (
+    match_clients_to_scenarios,
+    materialize_opportunities,
+    rank_opportunities,
+    rank_top_opportunities,
+    stream_compact_matches,
+)
+
+STRATEGIES = ["composite", "revenue", "match_score", "priority"]
+
+
+def dump(opportunities):
+    return [
+        o.model_dump(mode="json", exclude={"opportunity_id", "created_at"})
+        for o in opportunities
+    ]
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_ranked_records_materialize_to_ranked_opportunities(clients, scenarios, strategy):
+    book = clients[:150]
+    full = rank_opportunities(
+        match_clients_to_scenarios(book, scenarios, 50.0, engine="compiled"),
+        strategy,
+        limit=20
+    )
+
+    records = rank_top_opportunities(
+        stream_compact_matches(iter(book), scenarios, 50.0),
+        top_n=20,
+        ranking_strategy=strategy
+    )
+    materialized = materialize_opportunities(records)
+
+    assert len(materialized) == 20
+    assert dump(materialized) == dump(full)
+
+
+def test_record_fields_match_materialized_opportunity(clients, scenarios):
+    records = list(stream_compact_matches(iter(clients[:30]), scenarios, 40.0))
+    assert records
+
+    for record, opportunity in zip(records, materialize_opportunities(records)):
+        assert (
+            record.client_id,
+            record.client_name,
+            record.scenario_id,
+            record.scenario_name,
+            record.priority,
+            record.match_score,
+            record.estimated_revenue,
+        ) == (
+            opportunity.client_id,
+            opportunity.client_name,
+            opportunity.scenario_id,
+            opportunity.scenario_name,
+            opportunity.priority,
+            opportunity.match_score,
+            opportunity.estimated_revenue,
+        )
+        assert opportunity.revenue_calculation.final_amount == record.estimated_revenue
+        assert (opportunity.rank, opportunity.composite_score) == (None, None)
+
+
+def test_invalid_revenue_is_dropped_by_both_paths(clients, scenarios):
+    # Negative net worth prices to negative revenue, which validation rejects
+    book = [
+        client.model_copy(update={"net_worth": -50_000.0}) if i % 3 == 0 else client
+        for i, client in enumerate(clients[:30])
+    ]
+    formula = RevenueFormula(formula_type="percentage", base_rate=0.01, multiplier_field="net_worth")
+    scenario = scenarios[0].model_copy(update={"revenue_formula": formula})
+
+    full = match_clients_to_scenarios(book, scenario, 0.0, engine="compiled")
+    records = list(stream_compact_matches(iter(book), [scenario], 0.0))
+
+    assert len(full) == len(book) - 10
+    assert [r.client_id for r in records] == [o.client_id for o in full]
+    assert dump(materialize_opportunities(records)) == dump(full)
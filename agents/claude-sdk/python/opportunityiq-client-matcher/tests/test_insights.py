@@ -0,0 +1,246 @@
+"""
+Tests for LLM insight generation and the insight cache.
+
+The Anthropic clients are replaced by fakes that record requests, so these
+tests check caching, request deduplication, concurrency and the batch
+submit/collect round trip without calling the API.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import ClassVar
+
+import pytest
+
+from src import agent as agent_module
+from src.agent import OpportunityIQAgent
+from src.services.insight_cache import InsightCache, insight_cache_key
+from src.tools import match_clients_to_scenarios, rank_opportunities
+
+MODEL = "test-model"
+
+
+def fake_response(prompt: str, input_tokens: int = 100, output_tokens: int = 20):
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=f"Insight for {prompt.splitlines()[1]}")],
+        usage=SimpleNamespace(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_read_input_tokens=0
+        )
+    )
+
+
+class FakeAsyncAnthropic:
+    """Stands in for AsyncAnthropic; records prompts and peak concurrency."""
+
+    prompts: ClassVar[list[str]] = []
+    in_flight = 0
+    peak = 0
+    # Prompt fragments whose requests fail
+    fail_for: ClassVar[set[str]] = set()
+
+    def __init__(self, api_key=None):
+        self.messages = SimpleNamespace(create=self._create)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def _create(self, **params):
+        cls = type(self)
+        prompt = params["messages"][0]["content"]
+        cls.prompts.append(prompt)
+        cls.in_flight += 1
+        cls.peak = max(cls.peak, cls.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if any(name in prompt for name in cls.fail_for):
+                raise RuntimeError("overloaded")
+            return fake_response(prompt)
+        finally:
+            cls.in_flight -= 1
+
+
+class FakeBatches:
+    """Stands in for client.messages.batches."""
+
+    def __init__(self):
+        self.submitted = None
+        self.status = "in_progress"
+        self.failed_ids: set[str] = set()
+
+    def create(self, requests):
+        self.submitted = requests
+        return SimpleNamespace(id="batch-1")
+
+    def retrieve(self, batch_id):
+        return SimpleNamespace(id=batch_id, processing_status=self.status)
+
+    def results(self, batch_id):
+        for request in self.submitted:
+            if request["custom_id"] in self.failed_ids:
+                result = SimpleNamespace(type="errored", error="invalid_request")
+            else:
+                message = fake_response(request["params"]["messages"][0]["content"])
+                result = SimpleNamespace(type="succeeded", message=message)
+            yield SimpleNamespace(custom_id=request["custom_id"], result=result)
+
+
+@pytest.fixture(scope="module")
+def opportunities(clients, scenarios):
+    matches = match_clients_to_scenarios(clients[:60], scenarios, min_match_threshold=60.0)
+    return rank_opportunities(matches, limit=8)
+
+
+@pytest.fixture
+def agent(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("CLAUDE_MODEL", MODEL)
+    monkeypatch.setenv("SCENARIOS_DIRECTORY", str(tmp_path))
+    for name in ("INSIGHT_CACHE_PATH", "MATCH_STORE_PATH", "SCENARIO_BUNDLE_PATH",
+                 "INSIGHTS_MAX_CONCURRENCY"):
+        monkeypatch.delenv(name, raising=False)
+
+    monkeypatch.setattr(FakeAsyncAnthropic, "prompts", [])
+    monkeypatch.setattr(FakeAsyncAnthropic, "peak", 0)
+    monkeypatch.setattr(FakeAsyncAnthropic, "fail_for", set())
+    monkeypatch.setattr(agent_module, "AsyncAnthropic", FakeAsyncAnthropic)
+
+    agent = OpportunityIQAgent()
+    agent.client = SimpleNamespace(messages=SimpleNamespace(batches=FakeBatches()))
+    return agent
+
+
+# ============================================================================
+# InsightCache
+# ============================================================================
+
+
+def test_cache_persists_across_connections(tmp_path, opportunities):
+    path = tmp_path / "cache" / "insights.sqlite"
+    key = insight_cache_key(opportunities[0], MODEL)
+
+    cache = InsightCache(path)
+    assert cache.get(key) is None
+    cache.put(key, "first", 10)
+    cache.put(key, "second", 12)
+    cache.close()
+
+    reopened = InsightCache(path)
+    assert reopened.get(key) == ("second", 12)
+    assert len(reopened) == 1
+
+
+def test_cache_key_covers_prompt_inputs(opportunities):
+    opportunity = opportunities[0]
+    key = insight_cache_key(opportunity, MODEL)
+
+    assert insight_cache_key(opportunity.model_copy(), MODEL) == key
+    assert insight_cache_key(opportunity, "other-model") != key
+    for update in (
+        {"match_score": opportunity.match_score - 1},
+        {"estimated_revenue": opportunity.estimated_revenue + 1},
+        {"priority": "low" if opportunity.priority != "low" else "high"},
+        {"client_name": "Someone Else"},
+    ):
+        assert insight_cache_key(opportunity.model_copy(update=update), MODEL) != key
+
+    # match_details is a property backed by a private attribute
+    changed = opportunity.model_copy()
+    changed.match_details = opportunity.match_details[1:]
+    assert insight_cache_key(changed, MODEL) != key
+
+
+# ============================================================================
+# Concurrent generation
+# ============================================================================
+
+
+def test_insights_keep_order_and_are_cached(agent, opportunities):
+    insights = agent.generate_insights_with_llm(opportunities, top_n=6, max_concurrency=3)
+
+    assert [i["client_name"] for i in insights] == [o.client_name for o in opportunities[:6]]
+    assert all(i["ai_insights"].startswith("Insight for") for i in insights)
+    assert not any(i["cached"] for i in insights)
+    assert len(FakeAsyncAnthropic.prompts) == 6
+    assert 1 < FakeAsyncAnthropic.peak <= 3
+    assert len(agent.insight_cache) == 6
+
+    again = agent.generate_insights_with_llm(opportunities, top_n=6)
+
+    assert len(FakeAsyncAnthropic.prompts) == 6
+    assert all(i["cached"] for i in again)
+    assert [i["ai_insights"] for i in again] == [i["ai_insights"] for i in insights]
+    assert [i["tokens_used"] for i in again] == [120] * 6
+
+
+def test_identical_prompts_are_requested_once(agent, opportunities):
+    repeated = [opportunities[0], opportunities[1], opportunities[0]]
+
+    insights = agent.generate_insights_with_llm(repeated, top_n=3)
+
+    assert len(FakeAsyncAnthropic.prompts) == 2
+    assert insights[2]["ai_insights"] == insights[0]["ai_insights"]
+    assert (insights[0]["cached"], insights[2]["cached"]) == (False, True)
+
+
+def test_failed_requests_are_reported_and_not_cached(agent, opportunities):
+    failing = opportunities[1]
+    FakeAsyncAnthropic.fail_for = {
+        f"Client: {failing.client_name}\n- Opportunity: {failing.scenario_name}\n"
+    }
+
+    insights = agent.generate_insights_with_llm(opportunities, top_n=3)
+
+    assert insights[1]["ai_insights"] is None
+    assert insights[1]["error"] == "overloaded"
+    assert insights[0]["ai_insights"] and insights[2]["ai_insights"]
+    assert agent.insight_cache.get(insight_cache_key(failing, MODEL)) is None
+    assert len(agent.insight_cache) == 2
+
+
+def test_invalid_concurrency_raises(agent, opportunities):
+    with pytest.raises(ValueError, match="max_concurrency"):
+        asyncio.run(agent.generate_insights_async(opportunities, max_concurrency=-1))
+
+
+# ============================================================================
+# Message Batches
+# ============================================================================
+
+
+def test_batch_submit_and_collect(agent, opportunities):
+    batches = agent.client.messages.batches
+    agent.generate_insights_with_llm(opportunities, top_n=2)
+
+    batch_id = agent.submit_insights_batch(opportunities, top_n=5)
+
+    # Cached insights are not resubmitted
+    assert batch_id == "batch-1"
+    assert [r["custom_id"] for r in batches.submitted] == [
+        "insight-3", "insight-4", "insight-5"
+    ]
+    assert batches.submitted[0]["params"] == agent._insight_request_params(opportunities[2])
+
+    assert agent.collect_insights_batch(batch_id, opportunities, top_n=5) is None
+
+    batches.status = "ended"
+    batches.failed_ids = {"insight-4"}
+    insights = agent.collect_insights_batch(batch_id, opportunities, top_n=5)
+
+    assert [i["client_name"] for i in insights] == [o.client_name for o in opportunities[:5]]
+    assert [i.get("cached") for i in insights] == [True, True, False, None, False]
+    assert insights[3]["error"] == "invalid_request"
+    assert len(agent.insight_cache) == 4
+
+
+def test_batch_is_skipped_when_everything_is_cached(agent, opportunities):
+    agent.generate_insights_with_llm(opportunities, top_n=3)
+
+    assert agent.submit_insights_batch(opportunities, top_n=3) is None
+
+    insights = agent.collect_insights_batch(None, opportunities, top_n=3)
+    assert all(i["cached"] for i in insights)
@@ -0,0 +1,129 @@
+"""
+Tests for the streaming client loader.
+
+The incremental JSON array parser must yield exactly the elements
+json.load returns, at any chunk size, and reject everything json.load
+rejects.
+"""
+
+import importlib
+import json
+import logging
+import random
+
+import pytest
+
+import benchmark
+from src.tools import iter_client_records, iter_clients, load_clients
+
+# The module, not the load_clients function src.tools re-exports
+load_clients_module = importlib.import_module("src.tools.load_clients")
+
+CHUNK_SIZES = [1, 2, 3, 7, 64, 65536]
+
+MALFORMED = {
+    "trailing_comma": '[{"a": 1},]',
+    "trailing_comma_space": '[{"a": 1} , \n]',
+    "leading_comma": '[,{"a": 1}]',
+    "double_comma": '[{"a": 1},,{"b": 2}]',
+    "missing_comma": '[{"a": 1} {"b": 2}]',
+    "unterminated": '[{"a": 1}',
+    "unterminated_element": '[{"a": "x',
+    "bad_element": '[{"a": }]',
+    "extra_data": '[{"a": 1}] {"b": 2}',
+    "truncated_number": '[1, -2.]',
+    "empty_file": "",
+    "whitespace_only": "  \n ",
+}
+
+
+@pytest.fixture(params=CHUNK_SIZES)
+def chunk_size(request, monkeypatch):
+    monkeypatch.setattr(load_clients_module, "JSON_CHUNK_SIZE", request.param)
+    return request.param
+
+
+def client_records(count: int) -> list[dict]:
+    rng = random.Random(3)
+    records = [benchmark.generate_client(rng, i) for i in range(count)]
+    # Quotes, backslashes, brackets and braces inside strings
+    records[0]["name"] = 'Pat "The {Boss}" O\'Neil [Jr.], \\ tab\t'
+    records[1]["advisor_notes"] = "}]{[ ,, \"}\" é中 \U0001F4B0"
+    return records
+
+
+def write(tmp_path, text: str, name: str = "clients.json"):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_json_array_matches_json_load(tmp_path, chunk_size, indent):
+    path = write(tmp_path, json.dumps(client_records(25), indent=indent, ensure_ascii=False))
+
+    with open(path, encoding="utf-8") as f:
+        expected = json.load(f)
+
+    assert list(iter_client_records(path)) == expected
+
+
+@pytest.mark.parametrize("text", ["[]", "  [ \n ]  \n", '\n[1, -2.5e3, "x", null, true, [], {}]\n'])
+def test_scalar_and_empty_arrays_match_json_load(tmp_path, chunk_size, text):
+    path = write(tmp_path, text)
+
+    assert list(iter_client_records(path)) == json.loads(text)
+
+
+@pytest.mark.parametrize("name", sorted(MALFORMED))
+def test_malformed_json_is_rejected(tmp_path, chunk_size, name):
+    text = MALFORMED[name]
+    with pytest.raises(ValueError):
+        json.loads(text)
+
+    path = write(tmp_path, text)
+
+    with pytest.raises(ValueError):
+        list(iter_client_records(path))
+
+
+@pytest.mark.parametrize("text", ['{"a": 1}', '"clients"', "12"])
+def test_non_array_json_is_rejected(tmp_path, chunk_size, text):
+    path = write(tmp_path, text)
+
+    with pytest.raises(ValueError, match="must be a JSON array"):
+        list(iter_client_records(path))
+
+
+def test_non_object_elements_are_skipped_and_logged(tmp_path, chunk_size, caplog):
+    records = client_records(3)
+    path = write(tmp_path, json.dumps([records[0], 42, records[1], "x", records[2]]))
+
+    with caplog.at_level(logging.WARNING):
+        clients = load_clients(path)
+
+    assert [c.client_id for c in clients] == [r["client_id"] for r in records]
+    skipped = [r.getMessage() for r in caplog.records if "Skipping client" in r.getMessage()]
+    assert len(skipped) == 2
+    assert "index 1" in skipped[0] and "int" in skipped[0]
+    assert "index 3" in skipped[1] and "str" in skipped[1]
+
+
+def test_invalid_clients_are_skipped(tmp_path):
+    records = client_records(3)
+    del records[1]["age"]
+    path = write(tmp_path, json.dumps(records))
+
+    assert [c.client_id for c in iter_clients(path)] == [
+        records[0]["client_id"], records[2]["client_id"]
+    ]
+
+
+def test_ndjson_matches_json_array(tmp_path):
+    records = client_records(10)
+    json_path = write(tmp_path, json.dumps(records))
+    ndjson_path = write(
+        tmp_path, "\n".join(json.dumps(r) for r in records) + "\n\n", "clients.ndjson"
+    )
+
+    assert load_clients(ndjson_path) == load_clients(json_path)
@@ -0,0 +1,97 @@
+"""
+Tests for compact match explanations.
+
+A MatchExplanation (matched-criteria bitmask plus actual values) must read
+exactly like the MatchDetail list explain() builds, and an Opportunity
+holding one must serialize, copy and pickle like one holding the list.
+"""
+
+import pickle
+
+import pytest
+
+from src.models import MatchExplanation, Opportunity, Scenario
+from src.services.matching_engine import MatchingEngine
+from src.services.scenario_compiler import compile_scenario
+from src.tools import match_clients_to_scenarios
+
+
+def dump(opportunities):
+    return [
+        o.model_dump(mode="json", exclude={"opportunity_id", "created_at"})
+        for o in opportunities
+    ]
+
+
+@pytest.fixture(scope="module")
+def wide_scenario(scenarios) -> Scenario:
+    """A scenario with 70 criteria, so the mask needs more than 64 bits."""
+    criteria = [c for s in scenarios for c in s.criteria]
+    criteria = (criteria * (70 // len(criteria) + 1))[:70]
+    return scenarios[0].model_copy(update={"scenario_id": "WIDE-70", "criteria": criteria})
+
+
+def test_explanation_reads_like_explain(clients, scenarios, wide_scenario):
+    engine = MatchingEngine()
+
+    for scenario in [*scenarios, wide_scenario]:
+        compiled = compile_scenario(scenario)
+        for client in clients[:60]:
+            score, details = compiled.explain(client)
+            compact_score, explanation = compiled.explain_compact(client)
+
+            assert compact_score == score
+            assert len(explanation) == len(details) == len(scenario.criteria)
+            assert explanation.criteria_met == sum(d.matched for d in details)
+            assert [explanation.matched(i) for i in range(len(details))] == [
+                d.matched for d in details
+            ]
+            assert explanation.matched_mask < 1 << len(details)
+            assert list(explanation) == details
+            assert explanation == details
+            assert engine.match_client_to_scenario(client, scenario) == (score, details)
+
+
+def test_details_are_built_lazily_once(clients, scenarios):
+    _score, explanation = compile_scenario(scenarios[0]).explain_compact(clients[0])
+
+    assert explanation._details is None
+    first = explanation[0]
+    assert explanation._details is not None
+    assert explanation[0] is first
+    assert explanation[:2] == explanation.details()[:2]
+    assert "criteria_met" in repr(explanation)
+
+
+def test_opportunity_with_explanation_serializes_like_list(clients, scenarios):
+    opportunities = match_clients_to_scenarios(clients[:40], scenarios, 0.0, engine="compiled")
+    assert isinstance(opportunities[0]._match_details, MatchExplanation)
+
+    as_json = [o.model_dump_json() for o in opportunities]
+    reloaded = [Opportunity.model_validate_json(j) for j in as_json]
+
+    assert all(isinstance(o._match_details, list) for o in reloaded)
+    assert dump(reloaded) == dump(opportunities)
+    assert [o.model_dump_json() for o in reloaded] == as_json
+
+
+def test_opportunity_with_explanation_pickles(clients, scenarios):
+    opportunities = match_clients_to_scenarios(clients[:10], scenarios, 0.0, engine="compiled")
+
+    restored = pickle.loads(pickle.dumps(opportunities))
+
+    assert dump(restored) == dump(opportunities)
+
+
+def test_model_copy_keeps_and_replaces_match_details(clients, scenarios):
+    opportunity = match_clients_to_scenarios(clients[0], scenarios[0], 0.0)[0]
+    details = list(opportunity.match_details)
+
+    assert opportunity.model_copy().match_details == details
+    assert opportunity.model_copy(deep=True).match_details == details
+
+    replaced = opportunity.model_copy(update={"match_details": details[:1], "rank": 3})
+    assert replaced.match_details == details[:1]
+    assert replaced.model_dump()["match_details"] == [details[0].model_dump()]
+    assert replaced.rank == 3
+    assert opportunity.match_details == details
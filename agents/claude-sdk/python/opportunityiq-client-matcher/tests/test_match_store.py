@@ -0,0 +1,84 @@
+"""
+Tests for incremental matching with a MatchStore.
+
+Results must equal a fresh run whether pairs are reused from the store or
+rescored after clients or scenarios change.
+"""
+
+import pytest
+
+from src.models import ClientProfile, Scenario
+from src.services import MatchStore
+from src.tools import match_clients_incremental, match_clients_to_scenarios
+
+
+def dump(opportunities):
+    return [
+        o.model_dump(mode="json", exclude={"opportunity_id", "created_at"})
+        for o in opportunities
+    ]
+
+
+def fresh(clients, scenarios, threshold):
+    return dump(match_clients_to_scenarios(clients, scenarios, threshold, engine="compiled"))
+
+
+def incremental(clients, scenarios, store, threshold, **kwargs):
+    return dump(match_clients_incremental(iter(clients), scenarios, store, threshold, **kwargs))
+
+
+@pytest.fixture
+def store():
+    with MatchStore() as match_store:
+        yield match_store
+
+
+def test_second_run_reuses_stored_pairs(clients, scenarios, store):
+    first = incremental(clients, scenarios, store, 60.0)
+    stored = len(store)
+
+    second = incremental(clients, scenarios, store, 60.0)
+
+    assert first == second == fresh(clients, scenarios, 60.0)
+    assert stored == len(clients) * len(scenarios)
+    assert len(store) == stored
+
+
+@pytest.mark.parametrize("threshold", [0.0, 40.0, 80.0])
+def test_threshold_change_reuses_exact_scores(clients, scenarios, store, threshold):
+    incremental(clients, scenarios, store, 60.0)
+
+    assert incremental(clients, scenarios, store, threshold) == fresh(
+        clients, scenarios, threshold
+    )
+
+
+def test_changed_clients_and_scenarios_are_rescored(clients, scenarios, store):
+    incremental(clients, scenarios, store, 60.0)
+
+    updated_clients = list(clients)
+    for position in range(0, len(clients), 20):
+        data = clients[position].model_dump()
+        data["age"] += 15
+        data["portfolio_value"] *= 3
+        updated_clients[position] = ClientProfile.model_validate(data)
+
+    updated_scenarios = list(scenarios)
+    data = scenarios[0].model_dump()
+    data["criteria"][0]["weight"] = 1.0
+    data["revenue_formula"]["base_rate"] *= 2
+    updated_scenarios[0] = Scenario.model_validate(data)
+
+    assert incremental(updated_clients, updated_scenarios, store, 60.0) == fresh(
+        updated_clients, updated_scenarios, 60.0
+    )
+
+
+def test_prune_drops_stale_pairs(clients, scenarios, store):
+    incremental(clients, scenarios, store, 60.0)
+
+    kept_clients, kept_scenarios = clients[:100], scenarios[:6]
+    result = incremental(kept_clients, kept_scenarios, store, 60.0, prune=True)
+
+    assert result == fresh(kept_clients, kept_scenarios, 60.0)
+    assert len(store) == len(kept_clients) * len(kept_scenarios)
@@ -0,0 +1,100 @@
+"""
+Equivalence tests for the matching engines.
+
+Each engine must find the same (client, scenario, score) matches, in the
+same order, as scoring every pair with the reference MatchingEngine.
+"""
+
+import pytest
+
+from src.services.matching_engine import MatchingEngine
+from src.tools import (
+    match_clients_to_scenarios,
+    materialize_opportunities,
+    stream_client_matches,
+    stream_compact_matches,
+)
+
+from .conftest import THRESHOLDS
+
+
+def reference_matches(clients, scenarios, threshold):
+    """(client_id, scenario_id, score) for every pair at or above threshold."""
+    engine = MatchingEngine()
+    matches = []
+    for client in clients:
+        for scenario in scenarios:
+            score, _details = engine.match_client_to_scenario(client, scenario)
+            if score >= threshold:
+                matches.append((client.client_id, scenario.scenario_id, score))
+    return matches
+
+
+def keys(opportunities):
+    return [(o.client_id, o.scenario_id, o.match_score) for o in opportunities]
+
+
+def dump(opportunities):
+    return [
+        o.model_dump(mode="json", exclude={"opportunity_id", "created_at"})
+        for o in opportunities
+    ]
+
+
+# ============================================================================
+# Engines vs MatchingEngine
+# ============================================================================
+
+
+@pytest.mark.parametrize("threshold", THRESHOLDS)
+@pytest.mark.parametrize("engine", ["compiled", "columnar", "auto"])
+def test_engine_matches_reference(clients, scenarios, engine, threshold):
+    opportunities = match_clients_to_scenarios(clients, scenarios, threshold, engine=engine)
+
+    assert keys(opportunities) == reference_matches(clients, scenarios, threshold)
+
+
+@pytest.mark.parametrize("threshold", [0.0, 60.0, 100.0])
+def test_sharded_engine_matches_compiled(clients, scenarios, threshold):
+    compiled = match_clients_to_scenarios(clients, scenarios, threshold, engine="compiled")
+    sharded = match_clients_to_scenarios(
+        clients, scenarios, threshold, engine="sharded", max_workers=2
+    )
+
+    assert keys(sharded) == reference_matches(clients, scenarios, threshold)
+    assert dump(sharded) == dump(compiled)
+
+
+@pytest.mark.parametrize("threshold", THRESHOLDS)
+def test_streaming_matches_reference(clients, scenarios, threshold):
+    streamed = list(stream_client_matches(iter(clients), scenarios, threshold))
+
+    assert keys(streamed) == reference_matches(clients, scenarios, threshold)
+
+
+@pytest.mark.parametrize("threshold", THRESHOLDS)
+def test_compact_records_match_full_opportunities(clients, scenarios, threshold):
+    full = match_clients_to_scenarios(clients, scenarios, threshold, engine="compiled")
+    compact = list(stream_compact_matches(iter(clients), scenarios, threshold))
+
+    assert keys(compact) == reference_matches(clients, scenarios, threshold)
+    assert [o.estimated_revenue for o in compact] == [o.estimated_revenue for o in full]
+    assert dump(materialize_opportunities(compact)) == dump(full)
+
+
+def test_match_details_match_reference(clients, scenarios):
+    engine = MatchingEngine()
+    opportunities = match_clients_to_scenarios(clients[:50], scenarios, 0.0, engine="compiled")
+    by_id = {s.scenario_id: s for s in scenarios}
+    clients_by_id = {c.client_id: c for c in clients}
+
+    for opportunity in opportunities:
+        _score, details = engine.match_client_to_scenario(
+            clients_by_id[opportunity.client_id], by_id[opportunity.scenario_id]
+        )
+        assert opportunity.match_details == details
+
+
+def test_invalid_engine_raises(clients, scenarios):
+    with pytest.raises(ValueError):
+        match_clients_to_scenarios(clients, scenarios, 60.0, engine="gpu")
@@ -0,0 +1,60 @@
+"""
+Tests for the advisor-capacity knapsack solver.
+"""
+
+import itertools
+import random
+
+import pytest
+
+from src.services.opportunity_optimizer import solve_knapsack
+
+
+def brute_force(revenues, units, capacity):
+    """Best total revenue over every subset that fits the capacity."""
+    best = 0.0
+    for size in range(len(revenues) + 1):
+        for subset in itertools.combinations(range(len(revenues)), size):
+            if sum(units[i] for i in subset) <= capacity:
+                best = max(best, sum(revenues[i] for i in subset))
+    return best
+
+
+def random_problems(count, seed=3):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(0, 10)
+        revenues = [round(rng.uniform(0, 1000), 2) for _ in range(n)]
+        units = [rng.randint(0, 8) for _ in range(n)]
+        yield revenues, units, rng.randint(0, 20)
+
+
+@pytest.mark.parametrize("revenues,units,capacity", list(random_problems(200)))
+def test_dp_is_optimal(revenues, units, capacity):
+    selected, upper_bound, method = solve_knapsack(revenues, units, capacity, "dp")
+    best = brute_force(revenues, units, capacity)
+
+    assert method == "dp"
+    assert selected == sorted(selected)
+    assert sum(units[i] for i in selected) <= capacity
+    assert sum(revenues[i] for i in selected) == pytest.approx(best)
+    assert upper_bound == pytest.approx(best)
+
+
+@pytest.mark.parametrize("revenues,units,capacity", list(random_problems(200, seed=5)))
+def test_greedy_is_feasible_and_bounded(revenues, units, capacity):
+    selected, upper_bound, method = solve_knapsack(revenues, units, capacity, "greedy")
+    best = brute_force(revenues, units, capacity)
+    revenue = sum(revenues[i] for i in selected)
+
+    # With nothing to choose between, free items are the exact optimum
+    assert method == ("greedy" if any(
+        0 < w <= capacity and r > 0 for r, w in zip(revenues, units)
+    ) else "dp")
+    assert sum(units[i] for i in selected) <= capacity
+    assert best / 2 - 1e-6 <= revenue <= best + 1e-6
+    assert upper_bound >= best - 1e-6
+
+
+def test_auto_uses_dp_for_small_tables():
+    assert solve_knapsack([100.0, 60.0, 50.0], [3, 2, 2], 4, "auto") == ([1, 2], 110.0, "dp")
@@ -0,0 +1,144 @@
+"""
+Tests for one-pass opportunity statistics.
+
+OpportunityStats must produce exactly the totals, counts and groupings the
+per-metric sum() and rescan aggregates produced before it existed.
+"""
+
+import numpy as np
+import pytest
+
+from src.services import OpportunityStats
+from src.tools import (
+    estimate_total_revenue,
+    generate_summary_statistics,
+    match_clients_to_scenarios,
+)
+
+
+@pytest.fixture(scope="module")
+def opportunities(clients, scenarios):
+    return match_clients_to_scenarios(clients, scenarios, min_match_threshold=40.0)
+
+
+def baseline_summary(opportunities) -> dict:
+    """generate_summary_statistics as it aggregated before OpportunityStats."""
+    def count_by(field):
+        counts = {}
+        for opp in opportunities:
+            value = getattr(opp, field)
+            counts[value] = counts.get(value, 0) + 1
+        return counts
+
+    def revenue_by(field):
+        totals = {}
+        for opp in opportunities:
+            value = getattr(opp, field)
+            totals[value] = totals.get(value, 0.0) + opp.estimated_revenue
+        return totals
+
+    total_revenue = sum(opp.estimated_revenue for opp in opportunities)
+    return {
+        "total_opportunities": len(opportunities),
+        "total_revenue": total_revenue,
+        "avg_match_score": sum(opp.match_score for opp in opportunities) / len(opportunities),
+        "avg_revenue": total_revenue / len(opportunities),
+        "high_priority_count": sum(1 for opp in opportunities if opp.priority == "high"),
+        "quick_wins_count": sum(1 for opp in opportunities if opp.is_quick_win()),
+        "high_value_count": sum(1 for opp in opportunities if opp.is_high_value()),
+        "unique_clients": len({opp.client_id for opp in opportunities}),
+        "unique_scenarios": len({opp.scenario_id for opp in opportunities}),
+        "by_priority": count_by("priority"),
+        "by_category": count_by("scenario_category"),
+        "revenue_by_priority": revenue_by("priority"),
+        "revenue_by_category": revenue_by("scenario_category"),
+    }
+
+
+def baseline_total_revenue(opportunities) -> dict:
+    """estimate_total_revenue as it aggregated before OpportunityStats."""
+    by_priority = {}
+    for priority in ["high", "medium", "low"]:
+        priority_rev = sum(
+            opp.estimated_revenue for opp in opportunities if opp.priority == priority
+        )
+        if priority_rev > 0:
+            by_priority[priority] = priority_rev
+
+    return {
+        "total": sum(opp.estimated_revenue for opp in opportunities),
+        "by_priority": by_priority,
+        "by_category": {
+            category: sum(
+                opp.estimated_revenue for opp in opportunities
+                if opp.scenario_category == category
+            )
+            for category in {opp.scenario_category for opp in opportunities}
+        },
+        "by_client": {
+            client_id: sum(
+                opp.estimated_revenue for opp in opportunities if opp.client_id == client_id
+            )
+            for client_id in {opp.client_id for opp in opportunities}
+        },
+    }
+
+
+def test_summary_statistics_match_baseline(opportunities):
+    stats = generate_summary_statistics(opportunities)
+
+    assert len(opportunities) > 500
+    revenue_percentiles = stats.pop("revenue_percentiles")
+    match_score_percentiles = stats.pop("match_score_percentiles")
+    # Exact, including group order (first seen)
+    expected = baseline_summary(opportunities)
+    assert stats == expected
+    for key in ("by_priority", "by_category", "revenue_by_priority", "revenue_by_category"):
+        assert list(stats[key]) == list(expected[key]), key
+
+    percentiles = [25, 50, 75, 90, 95]
+    revenues = [opp.estimated_revenue for opp in opportunities]
+    scores = [opp.match_score for opp in opportunities]
+    assert revenue_percentiles == dict(zip(percentiles, np.percentile(revenues, percentiles)))
+    assert match_score_percentiles == dict(zip(percentiles, np.percentile(scores, percentiles)))
+
+
+def test_total_revenue_matches_baseline(opportunities):
+    assert estimate_total_revenue(opportunities) == baseline_total_revenue(opportunities)
+
+
+def test_incremental_updates_equal_one_pass(opportunities):
+    one_pass = OpportunityStats.from_opportunities(opportunities)
+
+    chunked = OpportunityStats()
+    for start in range(0, len(opportunities), 97):
+        chunked.update(opp for opp in opportunities[start:start + 97])
+
+    for field in OpportunityStats.GROUP_FIELDS:
+        assert chunked.count_by(field) == one_pass.count_by(field)
+        assert chunked.revenue_by(field) == one_pass.revenue_by(field)
+    assert (chunked.count, chunked.total_revenue, chunked.total_match_score) == (
+        one_pass.count, one_pass.total_revenue, one_pass.total_match_score
+    )
+    assert chunked.revenue_percentiles([10, 99]) == one_pass.revenue_percentiles([10, 99])
+
+
+def test_high_value_threshold(opportunities):
+    stats = OpportunityStats.from_opportunities(opportunities, high_value_threshold=1_000.0)
+
+    assert stats.high_value_count == sum(opp.is_high_value(1_000.0) for opp in opportunities)
+
+
+def test_empty_statistics():
+    stats = OpportunityStats.from_opportunities([])
+
+    assert (stats.count, stats.total_revenue) == (0, 0.0)
+    assert (stats.average_revenue, stats.average_match_score) == (0.0, 0.0)
+    assert (stats.unique_clients, stats.unique_scenarios) == (0, 0)
+    assert stats.revenue_percentiles() == {}
+    assert stats.count_by("priority") == {}
+
+
+def test_unsupported_group_field_raises():
+    with pytest.raises(ValueError, match="Unsupported group field"):
+        OpportunityStats().revenue_by("advisor_id")
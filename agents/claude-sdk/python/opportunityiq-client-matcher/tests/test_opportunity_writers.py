@@ -0,0 +1,233 @@
+"""
+Tests for the streaming opportunity writers.
+
+Each format is written with each compression and read back. CSV and
+Markdown output must match what the list-based CSV export and markdown
+report produced before the writers existed.
+"""
+
+import bz2
+import csv
+import gzip
+import io
+import lzma
+
+import pytest
+
+from src.models import Opportunity
+from src.services.opportunity_writers import (
+    CSV_COLUMNS,
+    detect_export_format,
+    open_opportunity_writer,
+)
+from src.tools import (
+    export_opportunities,
+    match_clients_to_scenarios,
+    rank_opportunities,
+)
+
+COMPRESSIONS = {None: "", "gzip": ".gz", "bz2": ".bz2", "xz": ".xz"}
+
+_OPENERS = {None: open, "gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+
+
+@pytest.fixture(scope="module")
+def opportunities(clients, scenarios) -> list[Opportunity]:
+    matches = match_clients_to_scenarios(clients[:80], scenarios, min_match_threshold=60.0)
+    return rank_opportunities(matches)
+
+
+def read_text(path, compression) -> str:
+    with _OPENERS[compression](path, "rt", newline="", encoding="utf-8") as f:
+        return f.read()
+
+
+def baseline_csv(opportunities) -> str:
+    """CSV as export_opportunities_csv wrote it before the streaming writers."""
+    out = io.StringIO(newline="")
+    writer = csv.DictWriter(out, fieldnames=CSV_COLUMNS)
+    writer.writeheader()
+    for opp in opportunities:
+        writer.writerow({
+            "rank": opp.rank,
+            "client_id": opp.client_id,
+            "client_name": opp.client_name,
+            "scenario_id": opp.scenario_id,
+            "scenario_name": opp.scenario_name,
+            "category": opp.scenario_category,
+            "priority": opp.priority,
+            "match_score": f"{opp.match_score:.2f}",
+            "estimated_revenue": f"{opp.estimated_revenue:.2f}",
+            "criteria_met": opp.criteria_met,
+            "total_criteria": opp.total_criteria,
+            "estimated_time_hours": opp.estimated_time_hours or "",
+            "composite_score": f"{opp.composite_score:.2f}" if opp.composite_score else "",
+            "is_quick_win": opp.is_quick_win(),
+            "is_high_value": opp.is_high_value()
+        })
+    return out.getvalue()
+
+
+def baseline_markdown_details(opportunities) -> str:
+    """The Opportunity Details sections of the pre-streaming markdown report."""
+    lines = []
+    for opp in opportunities:
+        lines.append(f"### {opp.rank}. {opp.scenario_name}\n")
+        lines.append(f"**Client:** {opp.client_name} (ID: {opp.client_id})")
+        lines.append(f"**Category:** {opp.scenario_category}")
+        lines.append(f"**Priority:** {opp.priority.upper()}")
+        lines.append(f"**Match Score:** {opp.match_score:.1f}%")
+        lines.append(f"**Estimated Revenue:** ${opp.estimated_revenue:,.2f}")
+        if opp.estimated_time_hours:
+            lines.append(f"**Estimated Time:** {opp.estimated_time_hours} hours")
+        lines.append("\n**Match Details:**")
+        lines.append(f"- Criteria Met: {opp.criteria_met} / {opp.total_criteria}")
+        for detail in opp.match_details[:3]:
+            status = "✓" if detail.matched else "✗"
+            lines.append(
+                f"  - {status} {detail.criterion_field}: "
+                f"{detail.actual_value} {detail.operator} {detail.expected_value}"
+            )
+        lines.append("\n**Revenue Calculation:**")
+        rev_calc = opp.revenue_calculation
+        lines.append(f"- Formula Type: {rev_calc.formula_type}")
+        lines.append(f"- Base Rate: {rev_calc.base_rate}")
+        if rev_calc.multiplier_value:
+            lines.append(f"- Multiplier Value: ${rev_calc.multiplier_value:,.2f}")
+        lines.append(f"- Calculated: ${rev_calc.calculated_amount:,.2f}")
+        if rev_calc.min_applied or rev_calc.max_applied:
+            adjustments = []
+            if rev_calc.min_applied:
+                adjustments.append("minimum applied")
+            if rev_calc.max_applied:
+                adjustments.append("maximum applied")
+            lines.append(f"- Adjustments: {', '.join(adjustments)}")
+        if opp.compliance_notes:
+            lines.append(f"\n**Compliance:** {opp.compliance_notes}")
+        lines.append("\n---\n")
+    return "\n".join(lines)
+
+
+def write(path, opportunities, **kwargs) -> int:
+    with open_opportunity_writer(path, **kwargs) as writer:
+        return writer.write_all(opportunities)
+
+
+@pytest.mark.parametrize("compression", list(COMPRESSIONS))
+def test_csv_matches_baseline_export(tmp_path, opportunities, compression):
+    path = tmp_path / f"out.csv{COMPRESSIONS[compression]}"
+
+    assert write(path, opportunities) == len(opportunities)
+
+    assert opportunities
+    assert read_text(path, compression) == baseline_csv(opportunities)
+
+
+@pytest.mark.parametrize("compression", list(COMPRESSIONS))
+def test_ndjson_round_trips(tmp_path, opportunities, compression):
+    path = tmp_path / f"out.ndjson{COMPRESSIONS[compression]}"
+
+    write(path, opportunities)
+
+    lines = read_text(path, compression).splitlines()
+    assert [Opportunity.model_validate_json(line) for line in lines] == opportunities
+
+
+@pytest.mark.parametrize("compression", list(COMPRESSIONS))
+def test_markdown_matches_baseline_report(tmp_path, opportunities, compression):
+    path = tmp_path / f"out.md{COMPRESSIONS[compression]}"
+
+    write(path, opportunities)
+
+    text = read_text(path, compression)
+    assert text.startswith("# OpportunityIQ Client Matcher Report\n")
+    details = text.split("## Opportunity Details\n\n", 1)[1]
+    details, summary = details.split("## Summary Statistics\n", 1)
+    assert details == baseline_markdown_details(opportunities) + "\n"
+
+    total_revenue = sum(opp.estimated_revenue for opp in opportunities)
+    avg_match_score = sum(opp.match_score for opp in opportunities) / len(opportunities)
+    assert summary.splitlines()[1:] == [
+        f"- **Total Opportunities:** {len(opportunities)}",
+        f"- **Total Estimated Revenue:** ${total_revenue:,.2f}",
+        f"- **Average Match Score:** {avg_match_score:.1f}%",
+        f"- **High Priority Opportunities:** {sum(o.priority == 'high' for o in opportunities)}",
+        f"- **Quick Wins:** {sum(o.is_quick_win() for o in opportunities)}",
+    ]
+
+
+@pytest.mark.parametrize("compression", [None, "snappy", "gzip", "zstd"])
+def test_parquet_matches_csv_columns(tmp_path, opportunities, compression):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "out.parquet"
+
+    write(path, opportunities, compression=compression)
+
+    table = pq.read_table(path)
+    assert table.column_names == CSV_COLUMNS
+    assert table.column("client_id").to_pylist() == [o.client_id for o in opportunities]
+    assert table.column("estimated_revenue").to_pylist() == [
+        o.estimated_revenue for o in opportunities
+    ]
+
+
+@pytest.mark.parametrize("export_format, suffix", [
+    ("csv", ".csv"), ("ndjson", ".ndjson"), ("markdown", ".md")
+])
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "xz"])
+def test_explicit_format_still_detects_compression(
+    tmp_path, opportunities, export_format, suffix, compression
+):
+    path = tmp_path / f"out{suffix}{COMPRESSIONS[compression]}"
+
+    write(path, opportunities[:5], format=export_format)
+
+    # Fails to decompress if the file was written as plain text
+    assert read_text(path, compression).count(opportunities[0].client_id) >= 1
+
+
+def test_export_opportunities_streams_a_generator(tmp_path, opportunities):
+    path = tmp_path / "reports" / "all.csv.gz"
+
+    count = export_opportunities((opp for opp in opportunities), str(path))
+
+    assert count == len(opportunities)
+    assert read_text(path, "gzip") == baseline_csv(opportunities)
+
+
+def test_failed_markdown_export_has_no_summary(tmp_path, opportunities):
+    path = tmp_path / "out.md"
+
+    def failing():
+        yield from opportunities[:3]
+        raise RuntimeError("matching failed")
+
+    with pytest.raises(RuntimeError), open_opportunity_writer(path) as writer:
+        writer.write_all(failing())
+
+    text = path.read_text(encoding="utf-8")
+    assert writer.failed
+    assert f"{opportunities[2].rank}. {opportunities[2].scenario_name}" in text
+    assert "## Summary Statistics" not in text
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("a.csv", ("csv", None)),
+    ("a.CSV.GZ", ("csv", "gzip")),
+    ("a.jsonl.bz2", ("ndjson", "bz2")),
+    ("a.markdown.xz", ("markdown", "xz")),
+    ("a.parquet", ("parquet", None)),
+])
+def test_detect_export_format(name, expected):
+    assert detect_export_format(name) == expected
+
+
+@pytest.mark.parametrize("name", ["a.txt", "a.gz", "a"])
+def test_detect_export_format_rejects_unknown(name):
+    with pytest.raises(ValueError):
+        detect_export_format(name)
+
+
+def test_unknown_compression_raises(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        open_opportunity_writer(tmp_path / "out.csv", compression="zip")
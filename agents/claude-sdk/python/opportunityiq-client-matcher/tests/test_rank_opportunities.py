@@ -0,0 +1,100 @@
+"""
+Tests for top-K opportunity ranking.
+
+Selecting the top K through a bounded heap must return exactly the head of
+the full sort, ties in input order, with the same rank and composite_score.
+"""
+
+from itertools import pairwise
+
+import pytest
+
+from src.models import Opportunity
+from src.tools import (
+    get_top_opportunities,
+    match_clients_to_scenarios,
+    rank_opportunities,
+    rank_top_opportunities,
+)
+
+STRATEGIES = ["composite", "revenue", "match_score", "priority"]
+
+
+@pytest.fixture(scope="module")
+def matches(clients, scenarios) -> list[Opportunity]:
+    return match_clients_to_scenarios(clients[:120], scenarios, min_match_threshold=50.0)
+
+
+def fresh(matches) -> list[Opportunity]:
+    """Unranked copies; ranking assigns rank and composite_score in place."""
+    return [opp.model_copy() for opp in matches]
+
+
+def ranked_keys(opportunities) -> list[tuple]:
+    return [
+        (o.client_id, o.scenario_id, o.rank, o.composite_score)
+        for o in opportunities
+    ]
+
+
+@pytest.mark.parametrize("descending", [True, False])
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_limit_equals_head_of_full_sort(matches, strategy, descending):
+    full = rank_opportunities(fresh(matches), strategy, descending=descending)
+
+    for limit in (1, 7, len(matches), len(matches) + 10):
+        top = rank_opportunities(fresh(matches), strategy, descending=descending, limit=limit)
+        assert ranked_keys(top) == ranked_keys(full[:limit]), limit
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_full_sort_is_stable(matches, strategy):
+    full = rank_opportunities(fresh(matches), strategy)
+    key = {
+        "composite": lambda o: o.composite_score,
+        "revenue": lambda o: o.estimated_revenue,
+        "match_score": lambda o: o.match_score,
+        "priority": lambda o: {"high": 3, "medium": 2, "low": 1}[o.priority],
+    }[strategy]
+    position = {(o.client_id, o.scenario_id): i for i, o in enumerate(matches)}
+
+    for a, b in pairwise(full):
+        assert key(a) >= key(b)
+        if key(a) == key(b):
+            assert position[(a.client_id, a.scenario_id)] < position[(b.client_id, b.scenario_id)]
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_rank_top_from_stream_equals_limit(matches, strategy):
+    expected = rank_opportunities(fresh(matches), strategy, limit=25)
+
+    top = rank_top_opportunities(
+        (opp for opp in fresh(matches)), top_n=25, ranking_strategy=strategy
+    )
+
+    assert ranked_keys(top) == ranked_keys(expected)
+
+
+def test_get_top_opportunities_passes_limit_through(matches):
+    full = rank_opportunities(fresh(matches))
+
+    top = get_top_opportunities(fresh(matches), top_n=10)
+
+    assert ranked_keys(top) == ranked_keys(full[:10])
+    assert get_top_opportunities(fresh(matches), top_n=0) == []
+
+
+def test_only_selected_opportunities_are_ranked(matches):
+    opportunities = fresh(matches)
+
+    top = rank_opportunities(opportunities, limit=5)
+
+    selected = {id(o) for o in top}
+    assert [o.rank for o in top] == [1, 2, 3, 4, 5]
+    assert all(o.rank is None for o in opportunities if id(o) not in selected)
+
+
+def test_rank_top_rejects_non_positive_top_n(matches):
+    with pytest.raises(ValueError, match="top_n"):
+        rank_top_opportunities(fresh(matches), top_n=0)
+    assert rank_top_opportunities(iter(()), top_n=5) == []
@@ -0,0 +1,174 @@
+"""
+Tests for compiled revenue formulas.
+
+Tiered amounts from the cumulative-tier lookup (bisect for one client,
+searchsorted for a column) must equal the tier-by-tier walk exactly, and
+batch pricing must equal pricing each client on its own.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.models import RevenueFormula
+from src.services.revenue_calculator import CompiledRevenueFormula, RevenueCalculator
+
+TIER_LAYOUTS = {
+    "contiguous": {"0-100000": 0.01, "100000-500000": 0.008, "500000+": 0.005},
+    "gaps": {"0-100000": 0.01, "250000-500000": 0.008, "1000000+": 0.004},
+    "offset_start": {"50000-100000": 0.02, "100000+": 0.01},
+    "bounded_last": {"0-100000": 0.01, "100000-200000": 0.005},
+    "unsorted": {"500000+": 0.005, "0-100000": 0.01, "100000-500000": 0.008},
+    "overlapping": {"0-200000": 0.01, "100000-300000": 0.005, "250000+": 0.002},
+}
+
+
+def reference_tiered(tiers: dict[str, float], value: float) -> float:
+    """Tier-by-tier walk, as calculate_revenue priced tiers before compilation."""
+    parsed = []
+    for range_str, rate in tiers.items():
+        if "+" in range_str:
+            parsed.append(((float(range_str.replace("+", "")), None), rate))
+        else:
+            lower, upper = range_str.split("-")
+            parsed.append(((float(lower), float(upper)), rate))
+    parsed.sort(key=lambda tier: tier[0][0])
+
+    total_revenue = 0.0
+    for (lower, upper), rate in parsed:
+        if value <= lower:
+            continue
+        if upper is None:
+            total_revenue += (value - lower) * rate
+            break
+        total_revenue += (min(value, upper) - lower) * rate
+        if value <= upper:
+            break
+    return total_revenue
+
+
+def tier_values(tiers: dict[str, float]) -> list[float]:
+    """Values at, just around and between every tier boundary, plus values <= 0."""
+    boundaries = set()
+    for range_str in tiers:
+        boundaries.update(float(b) for b in range_str.replace("+", "").split("-"))
+
+    values = {-1_000_000.0, -1.0, -0.0, 0.0, 0.01, 1e12}
+    for boundary in boundaries:
+        values.update({
+            boundary,
+            math.nextafter(boundary, -math.inf),
+            math.nextafter(boundary, math.inf),
+            boundary - 0.5,
+            boundary + 0.5,
+        })
+
+    rng = np.random.default_rng(5)
+    values.update(rng.uniform(-1_000.0, 2_000_000.0, 200).tolist())
+    return sorted(values)
+
+
+def tiered_formula(tiers, field="portfolio_value", **limits) -> RevenueFormula:
+    return RevenueFormula(
+        formula_type="tiered",
+        base_rate=0.0,
+        tiers=tiers,
+        multiplier_field=field,
+        **limits,
+    )
+
+
+@pytest.mark.parametrize("layout", sorted(TIER_LAYOUTS))
+def test_tiered_amount_matches_tier_walk(layout):
+    tiers = TIER_LAYOUTS[layout]
+    compiled = CompiledRevenueFormula(tiered_formula(tiers))
+
+    for value in tier_values(tiers):
+        assert compiled.tiered_amount(value) == reference_tiered(tiers, value), value
+
+
+@pytest.mark.parametrize("layout", sorted(TIER_LAYOUTS))
+def test_calculate_column_matches_tier_walk(layout):
+    tiers = TIER_LAYOUTS[layout]
+    compiled = CompiledRevenueFormula(tiered_formula(tiers))
+    values = tier_values(tiers)
+
+    amounts = compiled.calculate_column(np.array(values, dtype=np.float64))
+
+    assert amounts.tolist() == [reference_tiered(tiers, v) for v in values]
+
+
+def test_calculate_column_prices_nan_like_tier_walk():
+    compiled = CompiledRevenueFormula(tiered_formula(TIER_LAYOUTS["contiguous"]))
+
+    amounts = compiled.calculate_column(np.array([math.nan, 150_000.0]))
+
+    assert math.isnan(amounts[0]) == math.isnan(compiled._walk_tiers(math.nan))
+    assert amounts[1] == reference_tiered(TIER_LAYOUTS["contiguous"], 150_000.0)
+
+
+@pytest.mark.parametrize("limits, value, expected, min_applied, max_applied", [
+    ({"min_revenue": 500.0}, 10_000.0, 500.0, True, False),
+    ({"max_revenue": 2_000.0}, 400_000.0, 2_000.0, False, True),
+    ({"min_revenue": 500.0, "max_revenue": 2_000.0}, 100_000.0, 1_000.0, False, False),
+    ({"min_revenue": 1_000.0, "max_revenue": 1_000.0}, 100_000.0, 1_000.0, False, False),
+    ({"min_revenue": 250.0}, 0.0, 250.0, True, False),
+])
+def test_min_max_limits(clients, scenarios, limits, value, expected, min_applied, max_applied):
+    client = clients[0].model_copy(update={"net_worth": value})
+    scenario = _scenario_with(
+        scenarios, tiered_formula(TIER_LAYOUTS["contiguous"], field="net_worth", **limits)
+    )
+    calculator = RevenueCalculator()
+
+    calc = calculator.calculate_revenue(client, scenario)
+    batch = calculator.calculate_revenue_batch([client], scenario)
+
+    assert calc.calculated_amount == reference_tiered(TIER_LAYOUTS["contiguous"], value)
+    assert (calc.final_amount, calc.min_applied, calc.max_applied) == (
+        pytest.approx(expected), min_applied, max_applied
+    )
+    assert batch.calculation(0) == calc
+    assert calculator.estimate_revenue(client, scenario) == calc.final_amount
+
+
+@pytest.mark.parametrize("formula", [
+    tiered_formula(TIER_LAYOUTS["gaps"], min_revenue=250.0, max_revenue=5_000.0),
+    tiered_formula(TIER_LAYOUTS["overlapping"]),
+    RevenueFormula(formula_type="percentage", base_rate=0.01, multiplier_field="net_worth",
+                   min_revenue=100.0, max_revenue=25_000.0),
+    RevenueFormula(formula_type="flat_fee", base_rate=1_500.0),
+    RevenueFormula(formula_type="aum_based", base_rate=0.0075),
+    RevenueFormula(formula_type="aum_based", base_rate=0.0075, multiplier_field="cash_balance"),
+], ids=["tiered_gaps", "tiered_overlapping", "percentage", "flat_fee", "aum_default", "aum_field"])
+def test_batch_matches_per_client(clients, scenarios, formula):
+    scenario = _scenario_with(scenarios, formula)
+    calculator = RevenueCalculator()
+
+    batch = calculator.calculate_revenue_batch(clients, scenario)
+
+    assert len(batch) == len(clients)
+    assert not batch.errors
+    for i, client in enumerate(clients):
+        assert batch.calculation(i) == calculator.calculate_revenue(client, scenario)
+
+
+def test_batch_records_clients_that_cannot_be_priced(clients, scenarios):
+    formula = RevenueFormula(formula_type="percentage", base_rate=0.01, multiplier_field="name")
+    scenario = _scenario_with(scenarios, formula)
+
+    batch = RevenueCalculator().calculate_revenue_batch(clients[:3], scenario)
+
+    assert sorted(batch.errors) == [0, 1, 2]
+    with pytest.raises(ValueError, match="must be numeric"):
+        batch.calculation(1)
+
+
+def test_invalid_tier_range_raises():
+    with pytest.raises(ValueError, match="Invalid tier range"):
+        CompiledRevenueFormula(tiered_formula({"0..100000": 0.01}))
+
+
+def _scenario_with(scenarios, formula):
+    return scenarios[0].model_copy(update={"revenue_formula": formula})
@@ -0,0 +1,185 @@
+"""
+Tests for the scenario registry.
+
+Files are re-validated only when their content changes, removed files are
+dropped, and a bundle restores the validated scenarios in a new registry.
+"""
+
+import json
+import os
+import random
+
+import pytest
+
+import benchmark
+from src.models import Scenario
+from src.services import ScenarioRegistry
+from src.services.scenario_registry import SCENARIO_BUNDLE_VERSION
+from src.tools import load_all_scenario_files, load_scenarios
+
+
+class CountingLoader:
+    """load_scenarios, counting the files it actually parses."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, path):
+        self.calls.append(path.name)
+        return load_scenarios(path)
+
+
+def scenario_dicts(seed: int, count: int = 3) -> list[dict]:
+    rng = random.Random(seed)
+    return [benchmark.generate_scenario(rng, seed * 100 + i) for i in range(count)]
+
+
+def write_scenarios(path, scenarios: list[dict]) -> None:
+    path.write_text(json.dumps(scenarios), encoding="utf-8")
+
+
+def bump_mtime(path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def library(tmp_path):
+    directory = tmp_path / "scenarios"
+    directory.mkdir()
+    write_scenarios(directory / "a.json", scenario_dicts(1))
+    write_scenarios(directory / "b.json", scenario_dicts(2))
+    return directory
+
+
+def test_unchanged_file_is_served_from_cache(library):
+    registry = ScenarioRegistry()
+    loader = CountingLoader()
+
+    first = registry.load_file(library / "a.json", loader)
+    second = registry.load_file(library / "a.json", loader)
+
+    assert loader.calls == ["a.json"]
+    assert all(a is b for a, b in zip(first, second))
+    assert (registry.hits, registry.misses) == (1, 1)
+
+
+def test_touched_file_with_same_content_is_a_hit(library):
+    registry = ScenarioRegistry()
+    loader = CountingLoader()
+    first = registry.load_file(library / "a.json", loader)
+    registry.dirty = False
+
+    bump_mtime(library / "a.json")
+    second = registry.load_file(library / "a.json", loader)
+
+    assert loader.calls == ["a.json"]
+    assert all(a is b for a, b in zip(first, second))
+    assert registry.hits == 1
+    # The new mtime is recorded, so a saved bundle stays current
+    assert registry.dirty
+
+
+def test_changed_content_is_revalidated_and_recompiled(library):
+    registry = ScenarioRegistry()
+    loader = CountingLoader()
+    first = registry.load_file(library / "a.json", loader)
+    compiled_first = registry.compile(first)
+
+    changed = scenario_dicts(1)
+    changed[0]["name"] = "Renamed scenario"
+    write_scenarios(library / "a.json", changed)
+    bump_mtime(library / "a.json")
+    second = registry.load_file(library / "a.json", loader)
+    compiled_second = registry.compile(second)
+
+    assert loader.calls == ["a.json", "a.json"]
+    assert second[0].name == "Renamed scenario"
+    assert [c.scenario for c in compiled_second] == second
+    assert not any(a is b for a, b in zip(compiled_first, compiled_second))
+
+
+def test_compiled_scenarios_are_reused(library):
+    registry = ScenarioRegistry()
+    scenarios = registry.load_file(library / "a.json", CountingLoader())
+
+    first = registry.compile(scenarios)
+    second = registry.compile(registry.load_file(library / "a.json", CountingLoader()))
+
+    assert len(first) == len(scenarios)
+    assert all(a is b for a, b in zip(first, second))
+
+
+def test_deleted_file_is_dropped(library):
+    registry = ScenarioRegistry()
+    load_all_scenario_files(str(library), registry=registry)
+    assert len(registry) == 2
+
+    (library / "b.json").unlink()
+    scenarios = load_all_scenario_files(str(library), registry=registry)
+
+    assert len(registry) == 1
+    assert {s.scenario_id for s in scenarios} == {
+        s["scenario_id"] for s in scenario_dicts(1)
+    }
+
+
+def test_bundle_round_trip(library, tmp_path):
+    registry = ScenarioRegistry()
+    original = load_all_scenario_files(str(library), registry=registry)
+    bundle_path = tmp_path / "bundle" / "scenarios.json"
+
+    assert registry.save_bundle(bundle_path) == 2
+    assert not registry.dirty
+
+    restored = ScenarioRegistry()
+    loader = CountingLoader()
+    assert restored.load_bundle(bundle_path) == 2
+    scenarios = [
+        scenario
+        for name in ("a.json", "b.json")
+        for scenario in restored.load_file(library / name, loader)
+    ]
+
+    # Served from the bundle without parsing the files again
+    assert loader.calls == []
+    assert sorted(scenarios, key=lambda s: s.scenario_id) == sorted(
+        original, key=lambda s: s.scenario_id
+    )
+    assert all(isinstance(s, Scenario) for s in scenarios)
+
+    compiled = restored.compile(scenarios)
+    assert all(a is b for a, b in zip(compiled, restored.compile(scenarios)))
+
+
+def test_bundle_entries_for_changed_files_are_revalidated(library, tmp_path):
+    registry = ScenarioRegistry()
+    load_all_scenario_files(str(library), registry=registry)
+    bundle_path = tmp_path / "scenarios.bundle.json"
+    registry.save_bundle(bundle_path)
+
+    write_scenarios(library / "b.json", scenario_dicts(3, count=2))
+    bump_mtime(library / "b.json")
+
+    restored = ScenarioRegistry()
+    restored.load_bundle(bundle_path)
+    loader = CountingLoader()
+    for name in ("a.json", "b.json"):
+        restored.load_file(library / name, loader)
+
+    assert loader.calls == ["b.json"]
+
+
+@pytest.mark.parametrize("content", [
+    "not json",
+    json.dumps({"version": SCENARIO_BUNDLE_VERSION + 1, "files": []}),
+])
+def test_unreadable_or_outdated_bundle_is_ignored(tmp_path, content):
+    bundle_path = tmp_path / "bundle.json"
+    bundle_path.write_text(content, encoding="utf-8")
+
+    registry = ScenarioRegistry()
+
+    assert registry.load_bundle(bundle_path) == 0
+    assert registry.load_bundle(tmp_path / "missing.json") == 0
+    assert len(registry) == 0
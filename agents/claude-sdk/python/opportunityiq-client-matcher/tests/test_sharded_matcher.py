@@ -0,0 +1,68 @@
+"""
+Tests for the sharded matcher's error accounting.
+
+Pairs that fail in a worker process must be counted in the parent's
+telemetry exactly as the single-process engines count them.
+"""
+
+import importlib
+
+import pytest
+
+from src.models import RevenueFormula
+from src.services.telemetry import MatchTelemetry
+from src.tools import match_clients_to_scenarios
+
+# The module, not the function src.tools re-exports
+match_clients_module = importlib.import_module("src.tools.match_clients")
+
+
+@pytest.fixture
+def batches(monkeypatch) -> list[dict]:
+    """Telemetry summary of each batch, taken before flush() resets it."""
+    summaries = []
+
+    class RecordingTelemetry(MatchTelemetry):
+        __slots__ = ()
+
+        def flush(self):
+            summaries.append(self.summary())
+            return super().flush()
+
+    monkeypatch.setattr(match_clients_module, "MatchTelemetry", RecordingTelemetry)
+    return summaries
+
+
+def unpriceable(scenario):
+    """The scenario, priced from a non-numeric field so every match fails."""
+    formula = RevenueFormula(formula_type="percentage", base_rate=0.01, multiplier_field="name")
+    return scenario.model_copy(update={
+        "scenario_id": f"{scenario.scenario_id}-BROKEN",
+        "revenue_formula": formula,
+    })
+
+
+def test_worker_errors_are_counted_in_parent_telemetry(clients, scenarios, batches):
+    book = clients[:40]
+    batch = [scenarios[0], unpriceable(scenarios[1]), scenarios[2]]
+
+    sharded = match_clients_to_scenarios(book, batch, engine="sharded", max_workers=2)
+    compiled = match_clients_to_scenarios(book, batch, engine="compiled")
+
+    sharded_summary, compiled_summary = batches
+    # Threshold 0: every client matches the broken scenario and fails to price
+    assert sharded_summary["errors"] == len(book)
+    assert {o.scenario_id for o in sharded} == {scenarios[0].scenario_id, scenarios[2].scenario_id}
+    assert len(sharded) == len(compiled)
+    for key in ("pairs", "matches", "errors", "match_score_histogram"):
+        assert sharded_summary[key] == compiled_summary[key], key
+
+
+def test_record_error_counts_in_bulk():
+    telemetry = MatchTelemetry("test", enabled=True)
+
+    telemetry.record_error()
+    telemetry.record_error(4)
+
+    assert telemetry.flush()["errors"] == 5
+    assert telemetry.errors == 0
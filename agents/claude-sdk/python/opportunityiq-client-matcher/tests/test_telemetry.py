@@ -0,0 +1,162 @@
+"""
+Tests for batch matching telemetry.
+
+Counters and histograms must account for every pair, flush as a single
+structured record, and agree across the matching engines.
+"""
+
+import json
+import logging
+
+import pytest
+
+from src.services import telemetry as telemetry_module
+from src.services.matching_engine import MatchingEngine
+from src.services.revenue_calculator import RevenueCalculator
+from src.services.telemetry import MatchTelemetry, configure_telemetry
+from src.tools import match_clients_to_scenarios
+
+from .conftest import THRESHOLDS
+
+
+@pytest.fixture(autouse=True)
+def default_telemetry(monkeypatch):
+    """Enabled, unsampled defaults regardless of the environment."""
+    monkeypatch.setattr(telemetry_module, "_enabled", True)
+    monkeypatch.setattr(telemetry_module, "_sample_rate", 0.0)
+
+
+@pytest.fixture
+def flushed(caplog):
+    """Summaries attached to the structured records flushed during a test."""
+    logging.disable(logging.NOTSET)
+    caplog.set_level(logging.INFO, logger=telemetry_module.logger.name)
+
+    def summaries(batch=None):
+        return [
+            r.telemetry for r in caplog.records
+            if hasattr(r, "telemetry") and batch in (None, r.telemetry["batch"])
+        ]
+
+    return summaries
+
+
+def test_match_score_histogram_buckets():
+    telemetry = MatchTelemetry("test")
+
+    for score in (0.0, 9.99, 10.0, 55.5, 90.0, 99.9, 100.0):
+        telemetry.record_match(score)
+    telemetry.record_unmatched(3)
+
+    summary = telemetry.summary()
+    assert (summary["pairs"], summary["matches"], summary["errors"]) == (10, 7, 0)
+    assert summary["match_score_histogram"] == {
+        "0-10": 2, "10-20": 1, "20-30": 0, "30-40": 0, "40-50": 0,
+        "50-60": 1, "60-70": 0, "70-80": 0, "80-90": 0, "90-100": 3,
+    }
+
+
+def test_revenue_counters_and_histogram():
+    telemetry = MatchTelemetry("test")
+
+    telemetry.record_revenue(99.99, "flat_fee")
+    telemetry.record_revenue(100.0, "percentage", min_applied=True)
+    telemetry.record_revenue(1_000.0, "percentage")
+    telemetry.record_revenue(50_000.0, "tiered", max_applied=True)
+    telemetry.record_revenue(100_000.0, "tiered", max_applied=True)
+
+    revenue = telemetry.summary()["revenue"]
+    assert revenue["calculations"] == 5
+    assert revenue["total"] == pytest.approx(151_199.99)
+    assert (revenue["min_applied"], revenue["max_applied"]) == (1, 2)
+    assert revenue["formula_types"] == {"flat_fee": 1, "percentage": 2, "tiered": 2}
+    assert revenue["histogram"] == {
+        "<100": 1, "100-1k": 1, "1k-10k": 1, "10k-100k": 1, "100k+": 1
+    }
+
+
+def test_every_nth_event_is_sampled():
+    telemetry = MatchTelemetry("test", sample_rate=0.25)
+
+    sampled = [telemetry.record_match(50.0) for _ in range(12)]
+    sampled_revenue = [telemetry.record_revenue(10.0, "flat_fee") for _ in range(8)]
+
+    assert [i for i, s in enumerate(sampled, 1) if s] == [4, 8, 12]
+    assert [i for i, s in enumerate(sampled_revenue, 1) if s] == [4, 8]
+    assert not any(MatchTelemetry("test").record_match(50.0) for _ in range(100))
+
+
+def test_disabled_telemetry_records_nothing(flushed):
+    telemetry = MatchTelemetry("test", enabled=False)
+
+    assert telemetry.record_match(80.0) is False
+    assert telemetry.record_revenue(10.0, "flat_fee") is False
+    telemetry.record_unmatched(5)
+    telemetry.record_error(2)
+
+    assert telemetry.flush() is None
+    assert flushed() == []
+
+
+def test_flush_logs_one_structured_record_and_resets(flushed, caplog):
+    telemetry = MatchTelemetry("batch-1")
+    telemetry.record_match(70.0)
+    telemetry.record_revenue(500.0, "flat_fee")
+    telemetry.record_error()
+
+    summary = telemetry.flush()
+
+    assert flushed() == [summary]
+    assert summary["batch"] == "batch-1"
+    assert (summary["pairs"], summary["errors"]) == (1, 1)
+    message = caplog.records[-1].getMessage()
+    assert message.startswith("Telemetry batch-1: ")
+    assert json.loads(message.split(": ", 1)[1]) == summary
+
+    assert telemetry.summary()["pairs"] == 0
+    assert telemetry.flush() is None
+    assert len(flushed()) == 1
+
+
+def test_configure_telemetry():
+    with pytest.raises(ValueError, match="sample_rate"):
+        configure_telemetry(sample_rate=1.5)
+
+    configure_telemetry(enabled=False, sample_rate=0.5)
+
+    assert MatchTelemetry("test").enabled is False
+    assert MatchTelemetry("test").sample_every == 2
+    assert MatchTelemetry("test", enabled=True, sample_rate=0.0).sample_every == 0
+
+
+def test_engine_and_calculator_record_into_shared_telemetry(clients, scenarios):
+    telemetry = MatchTelemetry("test")
+    engine = MatchingEngine(telemetry)
+    calculator = RevenueCalculator(telemetry)
+
+    for client in clients[:20]:
+        engine.match_client_to_scenario(client, scenarios[0])
+        calculator.calculate_revenue(client, scenarios[0])
+
+    summary = telemetry.summary()
+    assert summary["matches"] == 20
+    assert summary["revenue"]["calculations"] == 20
+
+
+@pytest.mark.parametrize("threshold", THRESHOLDS)
+def test_engines_report_identical_counts(clients, scenarios, flushed, threshold):
+    book = clients[:80]
+    summaries = []
+
+    for engine in ("compiled", "columnar", "sharded"):
+        opportunities = match_clients_to_scenarios(
+            book, scenarios, threshold, engine=engine, max_workers=2
+        )
+        summary = flushed("match_clients_to_scenarios")[-1]
+        assert summary["pairs"] == len(book) * len(scenarios), engine
+        assert summary["matches"] == len(opportunities), engine
+        assert summary["revenue"]["calculations"] == len(opportunities), engine
+        summary.pop("elapsed_seconds")
+        summaries.append(summary)
+
+    assert summaries[0] == summaries[1] == summaries[2]
@@ -29,7 +29,7 @@ class MatchDetail(BaseModel):
         ...,
         description="The value expected by the scenario criterion"
     )
-    actual_value: str | int | float | None = Field(
+    actual_value: str | int | float | List[str | int | float] | None = Field(
         ...,
         description="The actual value from the client profile"
     )
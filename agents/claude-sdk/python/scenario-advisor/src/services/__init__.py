@@ -8,6 +8,7 @@ This module exports the core business logic services:
 - ResearchOrchestrator: Coordinates parallel research across specialists
 - ScenarioSynthesizer: Merges, validates, and enriches scenarios
 - ExecutionOrchestrator: Matches scenarios to clients and generates reports
+- ClientLoader: Columnar CSV/Parquet client loading with chunked reads
 """
 
 from .matching_engine import MatchingEngine
@@ -16,6 +17,7 @@ from .report_generator import ReportGenerator
 from .research_orchestrator import ResearchOrchestrator
 from .scenario_synthesizer import ScenarioSynthesizer
 from .execution_orchestrator import ExecutionOrchestrator
+from .client_loader import ClientColumns, ClientLoader
 
 __all__ = [
     "MatchingEngine",
@@ -24,4 +26,6 @@ __all__ = [
     "ResearchOrchestrator",
     "ScenarioSynthesizer",
     "ExecutionOrchestrator",
+    "ClientLoader",
+    "ClientColumns",
 ]
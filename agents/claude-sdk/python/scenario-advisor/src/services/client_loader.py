@@ -0,0 +1,395 @@
+"""Columnar client loader for CSV and Parquet client files.
+
+This module reads client files into typed pandas columns in a single pass,
+either whole or as bounded chunks for multi-million-row files. Scenario
+criteria are evaluated against whole columns, and ClientProfile instances
+are only built for the rows that can reach the match threshold.
+
+Columns other than CLIENT_COLUMNS are read as text and passed to
+ClientProfile as-is (blank cells are left out); dotted names such as
+"portfolio.total_value" become nested fields.
+"""
+
+import logging
+import os
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..models import ClientProfile
+from .matching_engine import normalize_criteria
+
+logger = logging.getLogger(__name__)
+
+
+# Column name -> dtype for every column the loader reads
+CLIENT_COLUMNS = {
+    "client_id": "str",
+    "name": "str",
+    "age": "int64",
+    "risk_tolerance": "str",
+    "current_assets": "float64",
+    "annual_income": "float64",
+    "goals": "str",
+    "life_events": "str",
+    "current_products": "str",
+}
+
+REQUIRED_COLUMNS = ("client_id", "name", "age", "risk_tolerance")
+
+# Columns holding ";"-separated lists
+LIST_COLUMNS = ("goals", "life_events", "current_products")
+
+# Defaults for optional columns missing from the file
+COLUMN_DEFAULTS = {
+    "current_assets": 0.0,
+    "annual_income": 0.0,
+    "goals": "",
+    "life_events": "",
+    "current_products": "",
+}
+
+COLUMNAR_SUFFIXES = (".csv", ".parquet")
+
+DEFAULT_CHUNK_SIZE = int(os.getenv("CLIENT_CHUNK_SIZE", "100000"))
+
+
+class ClientColumns:
+    """A block of clients held as typed columns.
+
+    Attributes:
+        frame: DataFrame with one column per entry in CLIENT_COLUMNS,
+            followed by any other columns in the file
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        """Wrap a loaded DataFrame.
+
+        Args:
+            frame: Client columns as produced by ClientLoader
+        """
+        self.frame = frame
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def candidates(
+        self,
+        criteria: Any,
+        min_threshold: float
+    ) -> list[ClientProfile]:
+        """Build profiles for the clients that can reach the match threshold.
+
+        Args:
+            criteria: Scenario criteria (see match_mask)
+            min_threshold: Minimum match score (0-100)
+
+        Returns:
+            List of ClientProfile instances for the candidate rows
+        """
+        return self.materialize(self.match_mask(criteria, min_threshold))
+
+    def match_mask(self, criteria: Any, min_threshold: float) -> np.ndarray:
+        """Evaluate scenario criteria against whole columns.
+
+        Each row's weighted share of met criteria is compared with the
+        threshold. Criteria on fields the loader doesn't read, or with
+        operators it can't vectorize, count as met, so the mask never drops
+        a client the matching engine would accept.
+
+        Args:
+            criteria: Scenario criteria in any form accepted by
+                normalize_criteria
+            min_threshold: Minimum match score (0-100)
+
+        Returns:
+            Boolean array, True for rows that may match
+        """
+        criteria = normalize_criteria(criteria)
+        if not criteria:
+            return np.ones(len(self.frame), dtype=bool)
+
+        total_weight = sum(weight for _, _, _, weight in criteria)
+        if total_weight <= 0:
+            return np.ones(len(self.frame), dtype=bool)
+
+        score = np.zeros(len(self.frame), dtype=np.float64)
+        for field, operator, value, weight in criteria:
+            score += self._criterion_mask(field, operator, value) * weight
+
+        return score / total_weight * 100 >= min_threshold
+
+    def materialize(self, mask: Optional[np.ndarray] = None) -> list[ClientProfile]:
+        """Build ClientProfile instances for selected rows.
+
+        Args:
+            mask: Boolean row selector (default: all rows)
+
+        Returns:
+            List of validated ClientProfile instances
+
+        Raises:
+            ValueError: If a selected row doesn't validate as a ClientProfile
+        """
+        frame = self.frame if mask is None else self.frame[mask]
+        columns = list(frame.columns)
+
+        clients = []
+        for row in zip(*(frame[column] for column in columns)):
+            client_data = dict(zip(CLIENT_COLUMNS, row))
+            client_data["age"] = int(client_data["age"])
+            client_data["current_assets"] = float(client_data["current_assets"])
+            client_data["annual_income"] = float(client_data["annual_income"])
+            for column in LIST_COLUMNS:
+                client_data[column] = _to_list(client_data[column])
+            for column, value in zip(columns[len(CLIENT_COLUMNS):], row[len(CLIENT_COLUMNS):]):
+                _set_profile_value(client_data, column, value)
+            clients.append(ClientProfile(**client_data))
+
+        return clients
+
+    def _criterion_mask(self, field: str, operator: str, value: Any) -> np.ndarray:
+        """Rows meeting one criterion, or all rows if it can't be vectorized."""
+        # Pass-through profile columns are untyped text
+        if field not in CLIENT_COLUMNS:
+            return np.ones(len(self.frame), dtype=bool)
+
+        column = self.frame[field]
+
+        try:
+            if operator == "gt":
+                met = column > value
+            elif operator == "lt":
+                met = column < value
+            elif operator == "gte":
+                met = column >= value
+            elif operator == "lte":
+                met = column <= value
+            elif operator == "eq":
+                if field in LIST_COLUMNS:
+                    return np.ones(len(self.frame), dtype=bool)
+                met = column == value
+            elif operator == "contains":
+                if not isinstance(value, str):
+                    return np.ones(len(self.frame), dtype=bool)
+                if field in LIST_COLUMNS:
+                    met = _list_contains(column, value)
+                elif column.dtype.kind in "iuf":
+                    return np.zeros(len(self.frame), dtype=bool)
+                else:
+                    met = column.str.lower().str.contains(value.lower(), regex=False)
+            elif operator == "in_range":
+                if isinstance(value, list):
+                    met = column.isin(value)
+                elif isinstance(value, tuple) and len(value) == 2:
+                    met = column.between(value[0], value[1])
+                else:
+                    return np.zeros(len(self.frame), dtype=bool)
+            else:
+                return np.ones(len(self.frame), dtype=bool)
+        except TypeError:
+            # Mismatched types never compare true in the matching engine
+            return np.zeros(len(self.frame), dtype=bool)
+
+        return met.fillna(False).to_numpy(dtype=bool)
+
+
+class ClientLoader:
+    """Load client files into typed columns.
+
+    CSV files are parsed by pandas with fixed dtypes; Parquet files are read
+    through pyarrow (optional dependency). Use load() for files that fit in
+    memory and iter_chunks() to keep memory bounded for large files.
+
+    Attributes:
+        chunk_size: Rows per chunk in iter_chunks()
+    """
+
+    def __init__(self, chunk_size: Optional[int] = None):
+        """Initialize the loader.
+
+        Args:
+            chunk_size: Rows per chunk (default: CLIENT_CHUNK_SIZE or 100000)
+
+        Raises:
+            ValueError: If chunk_size is not positive
+        """
+        self.chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        if self.chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+    def load(self, path: str) -> ClientColumns:
+        """Read a whole client file in one pass.
+
+        Args:
+            path: Path to a .csv or .parquet client file
+
+        Returns:
+            ClientColumns holding every client in the file
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file format is unsupported or invalid
+        """
+        file_path = self._check_path(path)
+
+        if file_path.suffix == ".csv":
+            frame = self._read_csv(file_path)
+        else:
+            frame = self._read_parquet(file_path)
+
+        logger.debug(f"Loaded {len(frame)} clients from {path}")
+        return ClientColumns(self._prepare(frame))
+
+    def iter_chunks(self, path: str) -> Iterator[ClientColumns]:
+        """Read a client file as consecutive chunks of at most chunk_size rows.
+
+        Args:
+            path: Path to a .csv or .parquet client file
+
+        Returns:
+            Iterator of ClientColumns, one per chunk; the file is read as
+            the iterator is consumed
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file format is unsupported or invalid
+        """
+        file_path = self._check_path(path)
+
+        if file_path.suffix == ".csv":
+            frames = self._read_csv(file_path, chunksize=self.chunk_size)
+        else:
+            frames = self._iter_parquet(file_path)
+
+        format_name = "CSV" if file_path.suffix == ".csv" else "Parquet"
+        return (
+            ClientColumns(self._prepare(frame))
+            for frame in self._guard(frames, format_name)
+        )
+
+    def _check_path(self, path: str) -> Path:
+        """Validate that the path exists and has a columnar format."""
+        file_path = Path(path)
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"Client file not found: {path}")
+
+        if file_path.suffix not in COLUMNAR_SUFFIXES:
+            raise ValueError(
+                f"Unsupported file format: {file_path.suffix}. "
+                "Supported formats: .csv, .parquet"
+            )
+
+        return file_path
+
+    def _read_csv(self, file_path: Path, chunksize: Optional[int] = None):
+        """Parse a CSV file with fixed dtypes, whole or as a chunk iterator."""
+        try:
+            return pd.read_csv(
+                file_path,
+                # Other columns stay text so every chunk parses the same way
+                dtype=defaultdict(lambda: "str", CLIENT_COLUMNS),
+                keep_default_na=False,
+                chunksize=chunksize,
+            )
+        except (pd.errors.ParserError, ValueError) as e:
+            raise ValueError(f"Invalid CSV format in client file: {e}")
+
+    def _read_parquet(self, file_path: Path) -> pd.DataFrame:
+        """Read a Parquet client file."""
+        return self._open_parquet(file_path).read().to_pandas()
+
+    def _iter_parquet(self, file_path: Path) -> Iterator[pd.DataFrame]:
+        """Read a Parquet client file in record batches."""
+        parquet_file = self._open_parquet(file_path)
+        for batch in parquet_file.iter_batches(batch_size=self.chunk_size):
+            yield batch.to_pandas()
+
+    def _open_parquet(self, file_path: Path):
+        """Open a Parquet file with pyarrow."""
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError(
+                "Reading .parquet client files requires pyarrow: pip install pyarrow"
+            )
+
+        try:
+            return pq.ParquetFile(file_path)
+        except Exception as e:
+            raise ValueError(f"Invalid Parquet client file: {e}")
+
+    def _guard(self, frames, format_name: str) -> Iterator[pd.DataFrame]:
+        """Re-raise parse errors from lazily read chunks as ValueError."""
+        iterator = iter(frames)
+        while True:
+            try:
+                frame = next(iterator)
+            except StopIteration:
+                return
+            except (pd.errors.ParserError, ValueError) as e:
+                raise ValueError(f"Invalid {format_name} format in client file: {e}")
+            yield frame
+
+    def _prepare(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Check required columns, add defaults and apply column dtypes."""
+        missing = [column for column in REQUIRED_COLUMNS if column not in frame.columns]
+        if missing:
+            raise ValueError(f"Missing required client columns: {', '.join(missing)}")
+
+        for column, default in COLUMN_DEFAULTS.items():
+            if column not in frame.columns:
+                frame[column] = default
+
+        profile_columns = [column for column in frame.columns if column not in CLIENT_COLUMNS]
+
+        try:
+            return frame[list(CLIENT_COLUMNS) + profile_columns].astype(
+                {
+                    column: dtype
+                    for column, dtype in CLIENT_COLUMNS.items()
+                    if column not in LIST_COLUMNS
+                }
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid client column types: {e}")
+
+
+def _list_contains(column: pd.Series, value: str) -> pd.Series:
+    """Rows whose list column holds the value as a whole item."""
+    if column.dtype.kind == "O" and len(column) and not isinstance(column.iloc[0], str):
+        # Parquet list columns arrive as arrays rather than ";"-joined strings
+        return column.map(lambda items: items is not None and value in list(items))
+
+    pattern = f"(?:^|;){re.escape(value)}(?:;|$)"
+    return column.str.contains(pattern, regex=True)
+
+
+def _set_profile_value(client_data: dict, column: str, value: Any) -> None:
+    """Add a pass-through column to client data, nesting dotted names."""
+    if value is None or (isinstance(value, str) and not value):
+        return
+    if isinstance(value, float) and np.isnan(value):
+        return
+
+    *parents, name = column.split(".")
+    target = client_data
+    for parent in parents:
+        target = target.setdefault(parent, {})
+    target[name] = value
+
+
+def _to_list(value: Any) -> list[str]:
+    """Convert a ";"-separated string (or Parquet list) to a list of items."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return value.split(";") if value else []
+    if isinstance(value, float) and np.isnan(value):
+        return []
+    return list(value)
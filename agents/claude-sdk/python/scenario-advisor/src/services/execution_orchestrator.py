@@ -7,7 +7,7 @@ to appropriate clients, calculating revenue potential, and generating reports.
 import logging
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Union
 
 from ..models import (
     EnrichedScenario,
@@ -15,6 +15,7 @@ from ..models import (
     Opportunity,
     ScenarioCategory
 )
+from .client_loader import COLUMNAR_SUFFIXES, ClientColumns, ClientLoader
 from .matching_engine import MatchingEngine
 from .revenue_calculator import RevenueCalculator
 from .report_generator import ReportGenerator
@@ -31,7 +32,13 @@ class ExecutionOrchestrator:
     3. Calculate revenue potential
     4. Generate prioritized reports
 
+    CSV and Parquet client files are read into typed columns; each
+    scenario's target criteria are evaluated against whole columns and
+    client profiles are only built for rows that can reach the threshold.
+    The matching engine then scores those candidates exactly.
+
     Attributes:
+        client_loader: Columnar loader for CSV and Parquet client files
         matching_engine: Engine for matching scenarios to clients
         revenue_calculator: Calculator for revenue potential
         report_generator: Generator for opportunity reports
@@ -40,6 +47,7 @@ class ExecutionOrchestrator:
     def __init__(self):
         """Initialize the execution orchestrator with component services."""
         logger.info("Initializing execution orchestrator")
+        self.client_loader = ClientLoader()
         self.matching_engine = MatchingEngine()
         self.revenue_calculator = RevenueCalculator()
         self.report_generator = ReportGenerator()
@@ -49,17 +57,20 @@ class ExecutionOrchestrator:
         self,
         scenarios: list[EnrichedScenario],
         clients_path: str,
-        min_match_threshold: float = 60.0
+        min_match_threshold: float = 60.0,
+        chunk_size: Optional[int] = None
     ) -> list[Opportunity]:
         """Execute scenario matching and generate opportunities.
 
         Args:
             scenarios: List of enriched scenarios to match
-            clients_path: Path to client profiles (JSON or CSV)
+            clients_path: Path to client profiles (JSON, CSV or Parquet)
             min_match_threshold: Minimum match score (0-100) for inclusion
+            chunk_size: Read CSV/Parquet clients in chunks of this many rows
+                to bound memory (default: read the whole file)
 
         Returns:
-            List of opportunities sorted by priority (highest revenue potential first)
+            List of opportunities sorted and ranked by priority (highest first)
 
         Example:
             >>> orchestrator = ExecutionOrchestrator()
@@ -74,81 +85,149 @@ class ExecutionOrchestrator:
             f"clients path: {clients_path}, threshold: {min_match_threshold}"
         )
 
+        # Convert enriched scenarios to base scenario format for matching
+        base_scenarios = [
+            (scenario, self._to_base_scenario(scenario)) for scenario in scenarios
+        ]
+
         # Load client profiles
         try:
-            clients = self._load_clients(clients_path)
-            logger.info(f"Loaded {len(clients)} client profiles")
+            client_batches = self._iter_client_batches(clients_path, chunk_size)
         except Exception as e:
             logger.error(f"Failed to load clients from {clients_path}: {e}", exc_info=True)
             raise
 
-        # Match scenarios to clients
         opportunities = []
-        for scenario in scenarios:
-            try:
-                # Convert enriched scenario to base scenario format for matching
-                base_scenario = self._to_base_scenario(scenario)
-
-                # Find matching clients
-                matches = await self.matching_engine.match(
-                    scenario=base_scenario,
-                    clients=clients,
-                    min_threshold=min_match_threshold
-                )
-
-                logger.debug(
-                    f"Scenario '{scenario.title}' matched to {len(matches)} clients"
-                )
-
-                # Create opportunities from matches
-                for match in matches:
-                    opportunity = Opportunity(
-                        scenario_id=scenario.metadata.get("id", scenario.title),
-                        scenario_title=scenario.title,
-                        scenario_description=scenario.description,
-                        scenario_category=scenario.category,
-                        client_id=match["client_id"],
-                        client_name=match["client_name"],
-                        match_score=match["match_score"],
-                        match_reasons=match["match_reasons"],
-                        estimated_revenue=self.revenue_calculator.calculate(
-                            scenario=base_scenario,
-                            client=match["client_profile"]
-                        ),
-                        priority_score=self._calculate_priority(
-                            match_score=match["match_score"],
-                            confidence=scenario.confidence.overall_score,
-                            actionability=scenario.actionability.overall_score
-                        ),
-                        recommended_actions=scenario.metadata.get(
-                            "recommended_actions",
-                            []
-                        ),
-                        metadata={
-                            "confidence": scenario.confidence.model_dump(),
-                            "actionability": scenario.actionability.model_dump(),
-                            "temporal": scenario.temporal_context.model_dump(),
-                            "sources": scenario.sources.model_dump()
-                        }
+        client_count = 0
+        for batch in client_batches:
+            client_count += len(batch)
+
+            for scenario, base_scenario in base_scenarios:
+                try:
+                    # Columnar batches only build profiles for candidate rows
+                    if isinstance(batch, ClientColumns):
+                        clients = batch.candidates(
+                            base_scenario["target_criteria"],
+                            min_match_threshold
+                        )
+                    else:
+                        clients = batch
+
+                    if not clients:
+                        continue
+
+                    # Score the clients against the scenario's target criteria
+                    matches = self.matching_engine.match(
+                        scenario=base_scenario,
+                        clients=clients,
+                        min_threshold=min_match_threshold
                     )
-                    opportunities.append(opportunity)
 
-            except Exception as e:
-                logger.warning(
-                    f"Failed to process scenario '{scenario.title}': {e}",
-                    exc_info=True
-                )
+                    logger.debug(
+                        f"Scenario '{scenario.name}' matched to {len(matches)} clients"
+                    )
+
+                    # Create opportunities from matches
+                    for match in matches:
+                        opportunities.append(
+                            self._create_opportunity(scenario, base_scenario, match)
+                        )
+
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to process scenario '{scenario.name}': {e}",
+                        exc_info=True
+                    )
 
+        logger.info(f"Read {client_count} clients from {clients_path}")
         logger.info(f"Created {len(opportunities)} opportunities from {len(scenarios)} scenarios")
 
-        # Sort by priority score (descending)
-        opportunities.sort(key=lambda o: o.priority_score, reverse=True)
+        # Sort by priority score (descending) and rank
+        opportunities.sort(key=lambda scored: (-scored[0], scored[1].opportunity_id))
+        ranked = [
+            opportunity.model_copy(update={"rank": rank})
+            for rank, (_, opportunity) in enumerate(opportunities, start=1)
+        ]
         logger.info("Opportunities sorted by priority")
 
-        return opportunities
+        return ranked
+
+    def _create_opportunity(
+        self,
+        scenario: EnrichedScenario,
+        base_scenario: dict,
+        match: dict
+    ) -> tuple[float, Opportunity]:
+        """Create an opportunity from a scenario-client match.
+
+        Args:
+            scenario: Matched enriched scenario
+            base_scenario: Scenario in base format (see _to_base_scenario)
+            match: Match result from the matching engine
+
+        Returns:
+            Tuple of (priority_score, opportunity) where the opportunity
+            carries the estimated revenue and priority level
+        """
+        revenue = self.revenue_calculator.calculate(
+            match["client_profile"],
+            scenario.revenue_formula
+        )
+        priority_score = self._calculate_priority(
+            match_score=match["match_score"],
+            confidence=base_scenario["confidence"],
+            actionability=scenario.actionability.composite_score / 100.0
+        )
+
+        opportunity = Opportunity(
+            opportunity_id=f"OPP-{match['client_id']}-{scenario.scenario_id}",
+            client_id=match["client_id"],
+            client_name=match["client_name"],
+            scenario_id=scenario.scenario_id,
+            scenario_name=scenario.name,
+            scenario_category=scenario.category,
+            match_score=match["match_score"],
+            match_details=match["match_details"],
+            estimated_revenue=revenue.final_amount,
+            revenue_calculation=revenue,
+            priority=self._priority_level(priority_score),
+            required_licenses=scenario.required_licenses,
+            compliance_notes=scenario.compliance_notes
+        )
+
+        return priority_score, opportunity
+
+    def _iter_client_batches(
+        self,
+        path: str,
+        chunk_size: Optional[int] = None
+    ) -> Iterable[Union[list[ClientProfile], ClientColumns]]:
+        """Open a client file as batches for matching.
+
+        JSON files are loaded as one batch of client profiles. CSV and
+        Parquet files are read into typed columns, whole or in chunks.
+
+        Args:
+            path: Path to client data file
+            chunk_size: Rows per CSV/Parquet chunk (default: whole file)
+
+        Returns:
+            Iterable of client batches
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file format is unsupported or invalid
+        """
+        if Path(path).suffix not in COLUMNAR_SUFFIXES:
+            return [self._load_clients(path)]
+
+        if chunk_size is None:
+            return [self.client_loader.load(path)]
+
+        return ClientLoader(chunk_size).iter_chunks(path)
 
     def _load_clients(self, path: str) -> list[ClientProfile]:
-        """Load client profiles from JSON or CSV file.
+        """Load client profiles from JSON, CSV or Parquet file.
 
         Args:
             path: Path to client data file
@@ -190,38 +269,14 @@ class ExecutionOrchestrator:
             except json.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON in client file: {e}")
 
-        # Load CSV file
-        elif file_path.suffix == ".csv":
-            import csv
-
-            try:
-                clients = []
-                with open(file_path, "r") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        # Convert CSV row to ClientProfile format
-                        client_data = {
-                            "client_id": row["client_id"],
-                            "name": row["name"],
-                            "age": int(row["age"]),
-                            "risk_tolerance": row["risk_tolerance"],
-                            "current_assets": float(row.get("current_assets", 0)),
-                            "annual_income": float(row.get("annual_income", 0)),
-                            "goals": row.get("goals", "").split(";") if row.get("goals") else [],
-                            "life_events": row.get("life_events", "").split(";") if row.get("life_events") else [],
-                            "current_products": row.get("current_products", "").split(";") if row.get("current_products") else []
-                        }
-                        clients.append(ClientProfile(**client_data))
-
-                return clients
-
-            except (csv.Error, KeyError, ValueError) as e:
-                raise ValueError(f"Invalid CSV format in client file: {e}")
+        # Load CSV or Parquet file
+        elif file_path.suffix in COLUMNAR_SUFFIXES:
+            return self.client_loader.load(path).materialize()
 
         else:
             raise ValueError(
                 f"Unsupported file format: {file_path.suffix}. "
-                "Supported formats: .json, .csv"
+                "Supported formats: .json, .csv, .parquet"
             )
 
     def _to_base_scenario(self, enriched: EnrichedScenario) -> dict:
@@ -237,15 +292,14 @@ class ExecutionOrchestrator:
             Dictionary with base scenario fields
         """
         return {
-            "title": enriched.title,
+            "title": enriched.name,
             "description": enriched.description,
-            "category": enriched.category.value,
-            "tags": enriched.tags,
-            "confidence": enriched.confidence.overall_score,
-            "urgency": enriched.temporal_context.urgency_level,
+            "category": enriched.category,
+            "confidence": enriched.confidence.overall_confidence,
+            "urgency": enriched.temporal_context.urgency,
             "impact": enriched.actionability.impact_score,
-            "target_criteria": enriched.metadata.get("target_criteria", {}),
-            "recommended_actions": enriched.metadata.get("recommended_actions", [])
+            "target_criteria": enriched.criteria,
+            "recommended_actions": [enriched.actionability.recommended_action]
         }
 
     def _calculate_priority(
@@ -280,3 +334,18 @@ class ExecutionOrchestrator:
         ) * 100.0
 
         return round(priority, 2)
+
+    def _priority_level(self, priority_score: float) -> str:
+        """Map a priority score (0-100) to an advisor priority level.
+
+        Args:
+            priority_score: Score from _calculate_priority
+
+        Returns:
+            "high" (70+), "medium" (50-70) or "low"
+        """
+        if priority_score >= 70.0:
+            return "high"
+        if priority_score >= 50.0:
+            return "medium"
+        return "low"
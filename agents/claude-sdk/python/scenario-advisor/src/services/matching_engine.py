@@ -6,13 +6,59 @@ meets the criteria defined in a scenario and calculates a weighted match score.
 """
 
 import logging
-from typing import Any
+from typing import Any, Iterable, NamedTuple
 
 from ..models import ClientProfile, Scenario, MatchDetail
 
 logger = logging.getLogger(__name__)
 
 
+class Criterion(NamedTuple):
+    """A single matching criterion in normalized form."""
+
+    field: str
+    operator: str
+    value: Any
+    weight: float = 1.0
+
+
+def normalize_criteria(criteria: Any) -> list[Criterion]:
+    """Convert scenario criteria to a list of Criterion tuples.
+
+    Args:
+        criteria: List of criteria (objects or dicts with field, operator,
+            value and optional weight) or a {field: value} dict of equality
+            criteria
+
+    Returns:
+        List of Criterion tuples (operator defaults to "eq", weight to 1.0)
+    """
+    if not criteria:
+        return []
+
+    if isinstance(criteria, dict):
+        return [Criterion(field, "eq", value) for field, value in criteria.items()]
+
+    normalized = []
+    for criterion in criteria:
+        if isinstance(criterion, dict):
+            normalized.append(Criterion(
+                criterion.get("field"),
+                criterion.get("operator", "eq"),
+                criterion.get("value"),
+                float(criterion.get("weight", 1.0)),
+            ))
+        else:
+            normalized.append(Criterion(
+                criterion.field,
+                criterion.operator,
+                criterion.value,
+                float(getattr(criterion, "weight", 1.0)),
+            ))
+
+    return normalized
+
+
 class MatchingEngine:
     """
     Engine for matching clients to scenarios based on defined criteria.
@@ -49,11 +95,89 @@ class MatchingEngine:
             f"Matching client {client.client_id} to scenario {scenario.scenario_id}"
         )
 
+        final_score, match_details = self.score_criteria(scenario.criteria, client)
+
+        logger.info(
+            f"Match result: {final_score:.1f}% "
+            f"({sum(1 for d in match_details if d.matched)}/{len(match_details)} criteria met)"
+        )
+
+        return final_score, match_details
+
+    def match(
+        self,
+        scenario: dict,
+        clients: Iterable[ClientProfile],
+        min_threshold: float = 0.0
+    ) -> list[dict]:
+        """
+        Match clients against a scenario in base format.
+
+        Args:
+            scenario: Scenario dictionary with "target_criteria" (see
+                normalize_criteria for the accepted forms)
+            clients: Clients to evaluate
+            min_threshold: Minimum match score (0-100) for inclusion
+
+        Returns:
+            List of match dictionaries (client_id, client_name, match_score,
+            match_reasons, match_details, client_profile) in client order
+
+        Example:
+            >>> engine = MatchingEngine()
+            >>> matches = engine.match(base_scenario, clients, min_threshold=60.0)
+            >>> for match in matches:
+            >>>     print(match["client_name"], match["match_score"])
+        """
+        criteria = normalize_criteria(scenario.get("target_criteria"))
+
+        matches = []
+        for client in clients:
+            match_score, match_details = self.score_criteria(criteria, client)
+            if match_score < min_threshold:
+                continue
+
+            matches.append({
+                "client_id": client.client_id,
+                "client_name": client.name,
+                "match_score": match_score,
+                "match_reasons": [
+                    f"{d.criterion_field} {d.operator} {d.expected_value}"
+                    for d in match_details
+                    if d.matched
+                ],
+                "match_details": match_details,
+                "client_profile": client,
+            })
+
+        logger.debug(
+            f"Scenario '{scenario.get('title')}' matched {len(matches)} clients "
+            f"at {min_threshold:.0f}%"
+        )
+
+        return matches
+
+    def score_criteria(
+        self,
+        criteria: Iterable[Any],
+        client: Any
+    ) -> tuple[float, list[MatchDetail]]:
+        """
+        Calculate the weighted match score of a client against criteria.
+
+        Args:
+            criteria: Criteria with field, operator, value and weight
+            client: Client to evaluate (ClientProfile or dictionary)
+
+        Returns:
+            Tuple of (match_score, match_details); the score is 0 when the
+            criteria have no weight
+        """
         match_details: list[MatchDetail] = []
         total_weight = 0.0
         weighted_score = 0.0
 
-        for criterion in scenario.criteria:
+        for criterion in criteria:
             met, actual_value = self._evaluate_criterion(criterion, client)
 
             points = criterion.weight if met else 0.0
@@ -75,11 +199,6 @@ class MatchingEngine:
         # Calculate final score as percentage (0-100)
         final_score = (weighted_score / total_weight * 100) if total_weight > 0 else 0.0
 
-        logger.info(
-            f"Match result: {final_score:.1f}% "
-            f"({sum(1 for d in match_details if d.met)}/{len(match_details)} criteria met)"
-        )
-
         return final_score, match_details
 
     def _evaluate_criterion(
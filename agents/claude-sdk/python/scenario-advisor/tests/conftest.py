@@ -0,0 +1,58 @@
+"""Shared fixtures: a synthetic client book written as CSV."""
+
+import csv
+import random
+
+import pytest
+
+GOALS = ["retirement income", "legacy", "growth", "tax efficiency"]
+LIFE_EVENTS = ["retirement", "inheritance", "home sale"]
+PRODUCTS = ["FIA", "VA", "MYGA", "term life"]
+
+
+def make_client_rows(count: int, seed: int = 3) -> list[dict]:
+    """Generate client rows with loader columns and ClientProfile fields."""
+    rng = random.Random(seed)
+    rows = []
+    for index in range(count):
+        rows.append({
+            "client_id": f"CLT-{index:04d}",
+            "name": f"Client {index}",
+            "age": rng.randint(25, 85),
+            "risk_tolerance": rng.choice(["conservative", "moderate", "aggressive"]),
+            "current_assets": round(rng.uniform(0, 2_000_000), 2),
+            "annual_income": round(rng.choice([0, rng.uniform(20_000, 400_000)]), 2),
+            "goals": rng.sample(GOALS, rng.randint(0, 2)),
+            "life_events": rng.sample(LIFE_EVENTS, rng.randint(0, 1)),
+            "current_products": rng.sample(PRODUCTS, rng.randint(0, 2)),
+            "investment_objective": rng.choice(["growth", "income", "preservation", "balanced"]),
+            "time_horizon_years": rng.randint(1, 30),
+            "net_worth": round(rng.uniform(50_000, 5_000_000), 2),
+            "portfolio.total_value": round(rng.uniform(10_000, 3_000_000), 2),
+            "state": rng.choice(["", "AZ", "FL", "NY"]),
+        })
+    return rows
+
+
+def write_client_csv(path, rows: list[dict]) -> None:
+    """Write rows as a client CSV (list columns joined with ";")."""
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({
+                key: ";".join(value) if isinstance(value, list) else value
+                for key, value in row.items()
+            })
+
+
+@pytest.fixture(scope="session")
+def client_rows() -> list[dict]:
+    return make_client_rows(400)
+
+
+@pytest.fixture(scope="session")
+def clients_csv(tmp_path_factory, client_rows):
+    path = tmp_path_factory.mktemp("clients") / "clients.csv"
+    write_client_csv(path, client_rows)
+    return path
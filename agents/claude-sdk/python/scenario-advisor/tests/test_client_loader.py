@@ -0,0 +1,131 @@
+"""Tests for the columnar client loader.
+
+The column mask must agree with the matching engine evaluated row by row,
+and must never drop a client the engine would accept.
+"""
+
+import numpy as np
+import pytest
+
+from src.models import MatchCriterion
+from src.services import ClientLoader, MatchingEngine
+from src.services.matching_engine import normalize_criteria
+
+THRESHOLDS = [0.0, 25.0, 50.0, 60.0, 75.0, 100.0]
+
+# Criteria on loader columns, which the mask evaluates exactly
+EXACT_CRITERIA = {
+    "dict": {"risk_tolerance": "conservative", "age": 62},
+    "numeric": [
+        {"field": "age", "operator": "gte", "value": 60, "weight": 3.0},
+        {"field": "current_assets", "operator": "lt", "value": 500_000, "weight": 1.5},
+        {"field": "annual_income", "operator": "gt", "value": 100_000},
+        {"field": "age", "operator": "lte", "value": 70, "weight": 0.5},
+    ],
+    "lists": [
+        {"field": "current_products", "operator": "contains", "value": "VA", "weight": 2.0},
+        {"field": "goals", "operator": "contains", "value": "legacy"},
+        {"field": "life_events", "operator": "contains", "value": "retirement", "weight": 0.5},
+    ],
+    "in_range": [
+        {"field": "risk_tolerance", "operator": "in_range", "value": ["conservative", "moderate"]},
+        {"field": "annual_income", "operator": "in_range", "value": (50_000, 200_000), "weight": 2.0},
+        {"field": "age", "operator": "in_range", "value": [55, 60, 65]},
+    ],
+    "text": [
+        {"field": "risk_tolerance", "operator": "contains", "value": "MOD"},
+        {"field": "name", "operator": "eq", "value": "Client 7"},
+        {"field": "age", "operator": "contains", "value": "6"},
+    ],
+    "objects": [
+        MatchCriterion(field="age", operator="gt", value=50, weight=2.0),
+        MatchCriterion(field="risk_tolerance", operator="eq", value="aggressive", weight=1.0),
+    ],
+}
+
+# Criteria the mask can't evaluate: profile fields, unknown fields, list equality
+CONSERVATIVE_CRITERIA = {
+    "missing_fields": [
+        {"field": "age", "operator": "gte", "value": 60, "weight": 2.0},
+        {"field": "net_worth", "operator": "gt", "value": 1_000_000},
+        {"field": "portfolio.total_value", "operator": "gt", "value": 500_000},
+        {"field": "no_such_field", "operator": "eq", "value": "x"},
+    ],
+    "list_equality": [
+        {"field": "goals", "operator": "eq", "value": "legacy"},
+        {"field": "risk_tolerance", "operator": "eq", "value": "moderate"},
+    ],
+}
+
+
+def engine_accepts(criteria, records, threshold) -> np.ndarray:
+    """Rows the matching engine scores at or above the threshold."""
+    engine = MatchingEngine()
+    normalized = normalize_criteria(criteria)
+    return np.array(
+        [engine.score_criteria(normalized, record)[0] >= threshold for record in records]
+    )
+
+
+@pytest.fixture(scope="module")
+def columns(clients_csv):
+    return ClientLoader().load(str(clients_csv))
+
+
+@pytest.mark.parametrize("threshold", THRESHOLDS)
+@pytest.mark.parametrize("name", sorted(EXACT_CRITERIA))
+def test_mask_matches_engine(columns, client_rows, name, threshold):
+    criteria = EXACT_CRITERIA[name]
+
+    mask = columns.match_mask(criteria, threshold)
+
+    assert mask.tolist() == engine_accepts(criteria, client_rows, threshold).tolist()
+
+
+@pytest.mark.parametrize("threshold", THRESHOLDS)
+@pytest.mark.parametrize("name", sorted(CONSERVATIVE_CRITERIA))
+def test_mask_never_drops_an_engine_match(columns, client_rows, name, threshold):
+    criteria = CONSERVATIVE_CRITERIA[name]
+    mask = columns.match_mask(criteria, threshold)
+
+    # Against the raw rows and against the profiles the orchestrator scores
+    profiles = columns.materialize()
+    for records in (client_rows, profiles):
+        accepted = engine_accepts(criteria, records, threshold)
+        assert not (accepted & ~mask).any()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 128, 10_000])
+def test_chunked_masks_match_whole_file(columns, clients_csv, chunk_size):
+    criteria = EXACT_CRITERIA["numeric"] + EXACT_CRITERIA["lists"]
+
+    chunks = list(ClientLoader(chunk_size).iter_chunks(str(clients_csv)))
+
+    assert sum(len(chunk) for chunk in chunks) == len(columns)
+    assert np.concatenate([c.match_mask(criteria, 60.0) for c in chunks]).tolist() == (
+        columns.match_mask(criteria, 60.0).tolist()
+    )
+
+
+def test_materialize_builds_profiles(columns, client_rows):
+    profiles = columns.materialize()
+
+    assert [p.client_id for p in profiles] == [row["client_id"] for row in client_rows]
+    first, row = profiles[0], client_rows[0]
+    assert first.age == row["age"]
+    assert first.net_worth == row["net_worth"]
+    assert first.portfolio.total_value == row["portfolio.total_value"]
+    assert first.state == (row["state"] or None)
+
+
+def test_missing_required_column_raises(tmp_path):
+    path = tmp_path / "clients.csv"
+    path.write_text("client_id,name,age\nCLT-1,Ann,60\n")
+
+    with pytest.raises(ValueError, match="risk_tolerance"):
+        ClientLoader().load(str(path))
+
+
+def test_invalid_chunk_size_raises():
+    with pytest.raises(ValueError):
+        ClientLoader(chunk_size=-1)
@@ -0,0 +1,157 @@
+"""Tests for the execution orchestrator.
+
+Scenarios are matched against a client file end to end: clients are read
+whole or in chunks, scored by the matching engine and priced by the
+revenue calculator.
+"""
+
+import asyncio
+
+import pytest
+
+from src.models import ClientProfile, EnrichedScenario, Opportunity
+from src.services import (
+    ClientLoader,
+    ExecutionOrchestrator,
+    MatchingEngine,
+    RevenueCalculator,
+)
+
+
+def make_scenario(scenario_id: str, criteria: list[dict], revenue_formula: dict) -> EnrichedScenario:
+    """Build a valid enriched scenario with the given criteria and formula."""
+    return EnrichedScenario(
+        scenario_id=scenario_id,
+        name=f"Scenario {scenario_id}",
+        description=f"Test scenario {scenario_id}",
+        category="annuity",
+        criteria=criteria,
+        revenue_formula=revenue_formula,
+        required_licenses=["Series 6"],
+        temporal_context={
+            "urgency": "short_term",
+            "timing_rationale": "Test scenario timing rationale",
+        },
+        confidence={
+            "source_reliability": 0.8,
+            "cross_reference_count": 1,
+            "confidence_rationale": "Test confidence rationale",
+            "overall_confidence": 0.8,
+        },
+        actionability={
+            "specificity_score": 70,
+            "urgency_score": 50,
+            "impact_score": 80,
+            "feasibility_score": 60,
+            "recommended_action": "Review the client's portfolio",
+            "advisor_talking_points": ["Discuss the client's retirement income needs"],
+        },
+        discovered_by="test",
+        sources=[{"source_type": "internal", "source_name": "test", "reliability_score": 0.8}],
+    )
+
+
+@pytest.fixture(scope="module")
+def scenarios() -> list[EnrichedScenario]:
+    return [
+        make_scenario(
+            "SCN-SENIOR",
+            [
+                {"field": "age", "operator": "gte", "value": 60, "weight": 3.0},
+                {"field": "risk_tolerance", "operator": "eq", "value": "conservative", "weight": 2.0},
+                {"field": "portfolio.total_value", "operator": "gt", "value": 250_000},
+            ],
+            {
+                "formula_type": "percentage",
+                "base_rate": 0.01,
+                "multiplier_field": "portfolio.total_value",
+                "min_revenue": 2_500.0,
+                "max_revenue": 20_000.0,
+            },
+        ),
+        make_scenario(
+            "SCN-INCOME",
+            [
+                {"field": "annual_income", "operator": "gt", "value": 100_000, "weight": 2.0},
+                {"field": "investment_objective", "operator": "eq", "value": "income"},
+                {"field": "risk_tolerance", "operator": "in_range", "value": ["conservative", "moderate"]},
+            ],
+            {
+                "formula_type": "tiered",
+                "multiplier_field": "net_worth",
+                "tiers": [
+                    {"threshold_min": 0, "threshold_max": 1_000_000, "rate": 0.01},
+                    {"threshold_min": 2_000_000, "rate": 0.005},
+                ],
+            },
+        ),
+        make_scenario(
+            "SCN-FIXED",
+            [
+                {"field": "time_horizon_years", "operator": "gte", "value": 10},
+                {"field": "net_worth", "operator": "gt", "value": 1_000_000},
+            ],
+            {"formula_type": "fixed", "fixed_amount": 1_500.0},
+        ),
+    ]
+
+
+@pytest.fixture(scope="module")
+def profiles(clients_csv) -> dict[str, ClientProfile]:
+    return {p.client_id: p for p in ClientLoader().load(str(clients_csv)).materialize()}
+
+
+def run(scenarios, clients_csv, threshold, chunk_size=None) -> list[Opportunity]:
+    return asyncio.run(
+        ExecutionOrchestrator().execute(scenarios, str(clients_csv), threshold, chunk_size)
+    )
+
+
+@pytest.mark.parametrize("threshold", [0.0, 60.0, 100.0])
+def test_execute_matches_engine(scenarios, profiles, clients_csv, threshold):
+    opportunities = run(scenarios, clients_csv, threshold)
+
+    engine = MatchingEngine()
+    expected = set()
+    for scenario in scenarios:
+        for client in profiles.values():
+            score, _ = engine.match_client_to_scenario(client, scenario)
+            if score >= threshold:
+                expected.add((scenario.scenario_id, client.client_id, score))
+
+    assert opportunities
+    assert {(o.scenario_id, o.client_id, o.match_score) for o in opportunities} == expected
+
+
+def test_execute_prices_and_ranks_opportunities(scenarios, profiles, clients_csv):
+    opportunities = run(scenarios, clients_csv, 60.0)
+    formulas = {s.scenario_id: s.revenue_formula for s in scenarios}
+    calculator = RevenueCalculator()
+
+    assert {o.scenario_id for o in opportunities} == set(formulas)
+    assert [o.rank for o in opportunities] == list(range(1, len(opportunities) + 1))
+
+    for opportunity in opportunities:
+        client = profiles[opportunity.client_id]
+        formula = formulas[opportunity.scenario_id]
+
+        assert opportunity.estimated_revenue > 0
+        assert opportunity.revenue_calculation == calculator.calculate(client, formula)
+        assert opportunity.match_details
+        assert opportunity.priority in ("high", "medium", "low")
+
+        if opportunity.scenario_id == "SCN-SENIOR":
+            assert 2_500.0 <= opportunity.estimated_revenue <= 20_000.0
+            expected = min(max(client.portfolio.total_value * 0.01, 2_500.0), 20_000.0)
+            assert opportunity.estimated_revenue == pytest.approx(expected)
+        elif opportunity.scenario_id == "SCN-FIXED":
+            assert opportunity.estimated_revenue == 1_500.0
+
+
+@pytest.mark.parametrize("chunk_size", [1, 33, 128, 10_000])
+def test_chunked_execution_matches_whole_file(scenarios, clients_csv, chunk_size):
+    whole = run(scenarios, clients_csv, 50.0)
+    chunked = run(scenarios, clients_csv, 50.0, chunk_size=chunk_size)
+
+    assert whole
+    assert [o.model_dump() for o in chunked] == [o.model_dump() for o in whole]
@@ -0,0 +1,90 @@
+"""Tests for revenue calculation across formula types and caps."""
+
+import pytest
+
+from src.models import ClientProfile, RevenueFormula
+from src.services import RevenueCalculator
+
+
+@pytest.fixture
+def client() -> ClientProfile:
+    return ClientProfile(
+        client_id="CLT-001",
+        name="Ann Lee",
+        age=62,
+        risk_tolerance="conservative",
+        investment_objective="income",
+        time_horizon_years=10,
+        annual_income=150_000.0,
+        net_worth=1_500_000.0,
+        portfolio={"total_value": 600_000.0},
+    )
+
+
+def calculate(client, **formula):
+    return RevenueCalculator().calculate(client, RevenueFormula(**formula))
+
+
+def test_fixed(client):
+    calc = calculate(client, formula_type="fixed", fixed_amount=1_200.0)
+
+    assert calc.final_amount == 1_200.0
+    assert calc.multiplier_value is None
+
+
+def test_percentage_defaults_to_portfolio_value(client):
+    calc = calculate(client, formula_type="percentage", base_rate=0.05)
+
+    assert calc.multiplier_value == 600_000.0
+    assert calc.final_amount == pytest.approx(30_000.0)
+    assert calc.applied_cap is None
+
+
+def test_multiplier_reads_named_field(client):
+    calc = calculate(client, formula_type="multiplier", base_rate=0.1, multiplier_field="annual_income")
+
+    assert calc.final_amount == pytest.approx(15_000.0)
+
+
+@pytest.mark.parametrize("bounds, expected, cap", [
+    ({"min_revenue": 40_000.0}, 40_000.0, "min"),
+    ({"max_revenue": 10_000.0}, 10_000.0, "max"),
+    ({"min_revenue": 1_000.0, "max_revenue": 50_000.0}, 30_000.0, None),
+])
+def test_caps(client, bounds, expected, cap):
+    calc = calculate(client, formula_type="percentage", base_rate=0.05, **bounds)
+
+    assert calc.calculated_amount == pytest.approx(30_000.0)
+    assert calc.final_amount == pytest.approx(expected)
+    assert calc.applied_cap == cap
+
+
+@pytest.mark.parametrize("net_worth, expected", [
+    (0.0, 0.0),
+    (50_000.0, 500.0),
+    (100_000.0, 1_000.0),
+    (150_000.0, 1_000.0),
+    (250_000.0, 1_000.0 + 50_000.0 * 0.005),
+    (1_500_000.0, 1_000.0 + 1_300_000.0 * 0.005),
+])
+def test_tiered_with_gap_and_unbounded_tier(client, net_worth, expected):
+    client = client.model_copy(update={"net_worth": net_worth})
+
+    calc = calculate(
+        client,
+        formula_type="tiered",
+        multiplier_field="net_worth",
+        tiers=[
+            {"threshold_min": 0, "threshold_max": 100_000, "rate": 0.01},
+            {"threshold_min": 200_000, "rate": 0.005},
+        ],
+    )
+
+    assert calc.final_amount == pytest.approx(expected)
+
+
+def test_missing_field_prices_at_zero(client):
+    calc = calculate(client, formula_type="percentage", base_rate=0.05, multiplier_field="no_such_field")
+
+    assert calc.multiplier_value == 0.0
+    assert calc.final_amount == 0.0
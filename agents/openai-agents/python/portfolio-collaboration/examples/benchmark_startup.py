@@ -0,0 +1,74 @@
+"""
+Startup benchmark for the portfolio collaboration CLI and API.
+
+Times cold imports of the main entry points in fresh interpreters and
+reports which heavy dependencies (Agents SDK, yfinance, pandas, NumPy)
+each one pulls in. Run from the project root:
+
+    python examples/benchmark_startup.py [--runs 5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+HEAVY_MODULES = ["agents", "yfinance", "pandas", "numpy"]
+
+TARGETS = [
+    "src.tools",
+    "src.agents",
+    "src.main",
+    "src.api.main",
+]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+__import__({module!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def time_import(module: str) -> dict:
+    """Import a module in a fresh interpreter and return timing info."""
+    code = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per target")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print(f"{'Module':<20} {'Median (s)':>12} {'Min (s)':>10}  Heavy deps loaded")
+    print("=" * 80)
+
+    for module in TARGETS:
+        results = [time_import(module) for _ in range(args.runs)]
+        seconds = [r["seconds"] for r in results]
+        loaded = ", ".join(results[-1]["loaded"]) or "-"
+        print(
+            f"{module:<20} {statistics.median(seconds):>12.3f} "
+            f"{min(seconds):>10.3f}  {loaded}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,57 +2,71 @@
 Agents package for Multi-Agent Portfolio Collaboration System.
 
 Exports all specialist agents and the Portfolio Manager for easy importing.
+
+Exports are loaded lazily on first access, so importing the package (or a
+single agent module) does not construct every agent up front.
 """
 
-from .compliance_officer import (
-    analyze_compliance,
-    calculate_bond_percentage,
-    check_concentration_limits,
-    check_suitability,
-    compliance_officer_agent,
-    get_largest_holding_percentage,
-    identify_required_disclosures,
-    perform_compliance_check,
-)
-from .equity_specialist import (
-    calculate_sector_allocations,
-    calculate_valuation_metrics,
-    classify_growth_vs_value,
-    equity_specialist_agent,
-    generate_detailed_analysis,
-    generate_equity_recommendations,
-    generate_sector_analysis,
-    perform_equity_deep_dive,
-)
-from .performance_analyst import (
-    analyze_portfolio_performance,
-    calculate_alpha,
-    calculate_holding_return,
-    calculate_percentile_rank,
-    calculate_sector_attribution,
-    calculate_sharpe_ratio,
-    calculate_total_return,
-    create_performance_analyst_tool,
-    identify_bottom_performers,
-    identify_top_performers,
-    performance_analyst_agent,
-    perform_performance_analysis,
-)
-from .portfolio_manager import (
-    portfolio_manager_agent,
-    run_comprehensive_analysis,
-    generate_client_report,
-)
-from .risk_analyst import (
-    analyze_portfolio_risk,
-    calculate_beta,
-    calculate_concentration_score,
-    calculate_var_95,
-    calculate_volatility,
-    determine_risk_rating,
-    perform_risk_analysis,
-    risk_analyst_agent,
-)
+import importlib
+from typing import Any, Dict, List
+
+# Public name -> module that defines it
+_LAZY_EXPORTS: Dict[str, str] = {
+    "analyze_compliance": "src.agents.compliance_officer",
+    "calculate_bond_percentage": "src.agents.compliance_officer",
+    "check_concentration_limits": "src.agents.compliance_officer",
+    "check_suitability": "src.agents.compliance_officer",
+    "compliance_officer_agent": "src.agents.compliance_officer",
+    "get_largest_holding_percentage": "src.agents.compliance_officer",
+    "identify_required_disclosures": "src.agents.compliance_officer",
+    "perform_compliance_check": "src.agents.compliance_officer",
+    "calculate_sector_allocations": "src.agents.equity_specialist",
+    "calculate_valuation_metrics": "src.agents.equity_specialist",
+    "classify_growth_vs_value": "src.agents.equity_specialist",
+    "equity_specialist_agent": "src.agents.equity_specialist",
+    "generate_detailed_analysis": "src.agents.equity_specialist",
+    "generate_equity_recommendations": "src.agents.equity_specialist",
+    "generate_sector_analysis": "src.agents.equity_specialist",
+    "perform_equity_deep_dive": "src.agents.equity_specialist",
+    "analyze_portfolio_performance": "src.agents.performance_analyst",
+    "calculate_alpha": "src.agents.performance_analyst",
+    "calculate_holding_return": "src.agents.performance_analyst",
+    "calculate_percentile_rank": "src.agents.performance_analyst",
+    "calculate_sector_attribution": "src.agents.performance_analyst",
+    "calculate_sharpe_ratio": "src.agents.performance_analyst",
+    "calculate_total_return": "src.agents.performance_analyst",
+    "create_performance_analyst_tool": "src.agents.performance_analyst",
+    "identify_bottom_performers": "src.agents.performance_analyst",
+    "identify_top_performers": "src.agents.performance_analyst",
+    "performance_analyst_agent": "src.agents.performance_analyst",
+    "perform_performance_analysis": "src.agents.performance_analyst",
+    "portfolio_manager_agent": "src.agents.portfolio_manager",
+    "run_comprehensive_analysis": "src.agents.portfolio_manager",
+    "generate_client_report": "src.agents.portfolio_manager",
+    "analyze_portfolio_risk": "src.agents.risk_analyst",
+    "calculate_beta": "src.agents.risk_analyst",
+    "calculate_concentration_score": "src.agents.risk_analyst",
+    "calculate_var_95": "src.agents.risk_analyst",
+    "calculate_volatility": "src.agents.risk_analyst",
+    "determine_risk_rating": "src.agents.risk_analyst",
+    "perform_risk_analysis": "src.agents.risk_analyst",
+    "risk_analyst_agent": "src.agents.risk_analyst",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining module on first access to a public name."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Portfolio Manager Agent (Orchestrator)
@@ -14,6 +14,8 @@ Usage:
     uvicorn src.api.main:app --host 0.0.0.0 --port 8000 --workers 4
 """
 
+import asyncio
+import importlib
 import logging
 import sys
 from contextlib import asynccontextmanager
@@ -24,6 +26,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from src.api.config import settings
+from src.tools.agent_scheduler import get_agent_scheduler
 
 # ============================================================================
 # Logging Configuration
@@ -77,6 +80,17 @@ async def lifespan(app: FastAPI):
     else:
         logger.info(f"✓ Examples directory found: {settings.examples_dir}")
 
+    # Load the OpenAI Agents SDK and Portfolio Manager in the background so the
+    # server accepts requests immediately and the first analysis is not slowed
+    warmup = asyncio.create_task(
+        asyncio.to_thread(importlib.import_module, "src.agents.portfolio_manager")
+    )
+    warmup.add_done_callback(
+        lambda task: logger.info("✓ Agent modules loaded")
+        if not task.cancelled() and task.exception() is None
+        else logger.warning("⚠️  Agent module warm-up failed")
+    )
+
     logger.info("=" * 80)
     logger.info("API Ready")
     logger.info("=" * 80)
@@ -165,6 +179,7 @@ async def health_check():
         "status": "healthy",
         "api_version": "1.0.0",
         "openai_configured": bool(settings.openai_api_key),
+        "agent_scheduler": get_agent_scheduler().stats_dict(),
     }
 
 
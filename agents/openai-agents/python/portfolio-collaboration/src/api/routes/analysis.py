@@ -12,10 +12,10 @@ import logging
 import time
 import uuid
 from datetime import datetime
-from typing import List
+from typing import List, Literal
 
 from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from src.api.schemas import (
     AnalysisRequest,
@@ -29,14 +29,31 @@ from src.api.schemas import (
     PortfolioListResponse,
     PortfolioSummary,
 )
-from src.agents.portfolio_manager import do_comprehensive_analysis
 from src.main import load_client_profiles, load_portfolios, get_portfolio_by_name
-from src.models.schemas import Portfolio
+from src.models.schemas import ClientProfile, Portfolio, PortfolioRecommendations
+from src.tools.agent_scheduler import AgentPriority, agent_priority, get_agent_scheduler
+from src.tools.report_generator import aiter_report_chunks
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def do_comprehensive_analysis(
+    portfolio: Portfolio, client_profile: ClientProfile
+) -> PortfolioRecommendations:
+    """
+    Run portfolio_manager.do_comprehensive_analysis, importing it on first use.
+
+    The Portfolio Manager module loads the OpenAI Agents SDK, so it is not
+    imported when the API starts (see the warm-up in src.api.main).
+    """
+    from src.agents.portfolio_manager import (
+        do_comprehensive_analysis as _do_comprehensive_analysis,
+    )
+
+    return _do_comprehensive_analysis(portfolio, client_profile)
+
+
 # ============================================================================
 # Analysis Endpoint
 # ============================================================================
@@ -48,7 +65,8 @@ async def analyze_portfolio(request: AnalysisRequest):
     Run comprehensive portfolio analysis for a client.
 
     Uses the existing do_comprehensive_analysis function from
-    portfolio_manager.py to run all specialists in parallel.
+    portfolio_manager.py to run all specialists in parallel. The analysis
+    runs at interactive priority on the shared agent scheduler.
 
     Biblical Principle: TRUTH - Transparent, comprehensive analysis.
     Biblical Principle: EXCELLENCE - Production-ready error handling.
@@ -74,8 +92,11 @@ async def analyze_portfolio(request: AnalysisRequest):
     try:
         # Run comprehensive analysis using callable tool
         # Biblical Principle: SERVE - Leveraging existing analysis infrastructure
-        recommendations = do_comprehensive_analysis(
-            request.portfolio, request.client_profile
+        recommendations = await get_agent_scheduler().run_blocking(
+            do_comprehensive_analysis,
+            request.portfolio,
+            request.client_profile,
+            description=f"Analysis {analysis_id}",
         )
 
         execution_time = time.time() - start_time
@@ -111,6 +132,63 @@ async def analyze_portfolio(request: AnalysisRequest):
         )
 
 
+# ============================================================================
+# Streaming Report Endpoint
+# ============================================================================
+
+_REPORT_MEDIA_TYPES = {"markdown": "text/markdown", "html": "text/html"}
+
+
+@router.post("/report")
+async def stream_report(
+    request: AnalysisRequest, output_format: Literal["markdown", "html"] = "markdown"
+):
+    """
+    Run portfolio analysis and stream the client report section by section.
+
+    The analysis runs in a worker thread on the shared agent scheduler; report
+    sections are then sent to the client as they are rendered instead of after
+    the whole report is built.
+
+    Args:
+        request: AnalysisRequest with client_profile and portfolio
+        output_format: "markdown" (default) or "html"
+
+    Returns:
+        StreamingResponse with the rendered report
+
+    Raises:
+        HTTPException: If analysis fails
+    """
+    logger.info(
+        f"Streaming {output_format} report for client {request.client_profile.client_id}"
+    )
+
+    try:
+        recommendations = await get_agent_scheduler().run_blocking(
+            do_comprehensive_analysis,
+            request.portfolio,
+            request.client_profile,
+            description="Report analysis",
+        )
+    except Exception as e:
+        logger.error(f"Report analysis failed: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": "AnalysisError",
+                "message": f"Portfolio analysis failed: {str(e)}",
+                "type": "ANALYSIS_FAILED",
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+
+    return StreamingResponse(
+        aiter_report_chunks(recommendations, output_format),
+        media_type=_REPORT_MEDIA_TYPES[output_format],
+    )
+
+
 # ============================================================================
 # Client Listing Endpoint
 # ============================================================================
@@ -234,6 +312,8 @@ async def compare_portfolios(request: ComparisonRequest):
     Compare multiple portfolios for a client.
 
     Runs analysis on each portfolio in parallel and ranks by suitability.
+    The analyses run at batch priority on the shared agent scheduler, so a
+    comparison yields to interactive requests.
 
     Biblical Principle: EXCELLENCE - Comprehensive comparison for informed decisions.
     Biblical Principle: PERSEVERE - Parallel execution for efficient processing.
@@ -287,13 +367,12 @@ async def compare_portfolios(request: ComparisonRequest):
         async def analyze_single_portfolio(portfolio: Portfolio):
             """Helper to analyze a single portfolio asynchronously."""
             try:
-                # Run analysis in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                recommendations = await loop.run_in_executor(
-                    None,
+                # Run analysis in a worker thread to avoid blocking
+                recommendations = await get_agent_scheduler().run_blocking(
                     do_comprehensive_analysis,
                     portfolio,
                     request.client_profile,
+                    description=f"Comparison {comparison_id} ({portfolio.portfolio_id})",
                 )
                 return portfolio.portfolio_id, recommendations, None
             except Exception as e:
@@ -302,10 +381,11 @@ async def compare_portfolios(request: ComparisonRequest):
                 )
                 return portfolio.portfolio_id, None, str(e)
 
-        # Execute all analyses in parallel
-        analysis_results = await asyncio.gather(
-            *[analyze_single_portfolio(p) for p in portfolios_to_compare]
-        )
+        # Execute all analyses in parallel, behind interactive requests
+        with agent_priority(AgentPriority.BATCH):
+            analysis_results = await asyncio.gather(
+                *[analyze_single_portfolio(p) for p in portfolios_to_compare]
+            )
 
         # Process results and check for errors
         comparison_results: List[ComparisonResult] = []
@@ -396,6 +476,7 @@ async def compare_portfolios(request: ComparisonRequest):
 __all__ = [
     "router",
     "analyze_portfolio",
+    "stream_report",
     "list_clients",
     "list_portfolios",
     "compare_portfolios",
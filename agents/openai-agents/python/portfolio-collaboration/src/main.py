@@ -33,24 +33,23 @@ from typing import Optional, Tuple
 
 from dotenv import load_dotenv
 
-from agents import Runner
-from agents.memory import SQLiteSession
-
 # Load environment variables from .env file
 # Explicitly specify the .env path relative to project root
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 ENV_PATH = PROJECT_ROOT / ".env"
 load_dotenv(dotenv_path=ENV_PATH)
 
-# Import Portfolio Manager and data models
-from src.agents.portfolio_manager import portfolio_manager_agent
+# Import data models. The OpenAI Agents SDK and the Portfolio Manager agent are
+# imported inside the functions that run agents, so listing and batch commands
+# start without loading the SDK.
 from src.data.mock_portfolios import (
     get_aggressive_example,
     get_conservative_example,
     get_moderate_example,
 )
 from src.models.schemas import ClientProfile, Portfolio
-from src.tools.report_generator import save_report_to_file
+from src.tools.agent_scheduler import AgentPriority, get_agent_scheduler
+from src.tools.report_generator import save_report_to_file, stream_report_to_file
 
 # ============================================================================
 # Logging Configuration
@@ -254,6 +253,10 @@ async def run_interactive_analysis(
     """
     logger.info("Starting interactive mode...")
 
+    from agents.memory import SQLiteSession
+
+    from src.agents.portfolio_manager import portfolio_manager_agent
+
     # Initialize session with SQLite for conversation memory
     # Create unique session ID based on client and portfolio
     from datetime import datetime
@@ -294,9 +297,9 @@ Please run a comprehensive analysis and provide recommendations.
 
     # Run the Portfolio Manager agent
     try:
-        result = await Runner.run(
+        result = await get_agent_scheduler().run(
             portfolio_manager_agent,
-            input=initial_message,
+            initial_message,
             session=session,
             context={
                 "client_profile": client_profile.model_dump(),
@@ -359,7 +362,8 @@ def run_batch_analysis(
     Run analysis in batch mode (non-interactive).
 
     This mode directly calls the analysis tools without Agent Runner,
-    suitable for automated processing of multiple portfolios.
+    suitable for automated processing of multiple portfolios. The analysis
+    runs at batch priority on the shared agent scheduler.
 
     Args:
         client_profile: Client profile object
@@ -372,14 +376,19 @@ def run_batch_analysis(
 
     try:
         # Import callable tools (not @function_tool decorated versions)
-        from src.agents.portfolio_manager import (
-            do_comprehensive_analysis,
-            do_generate_client_report,
-        )
+        from src.agents.portfolio_manager import do_comprehensive_analysis
 
         # Run comprehensive analysis
         logger.info("Running comprehensive analysis...")
-        recommendations = do_comprehensive_analysis(portfolio, client_profile)
+        recommendations = asyncio.run(
+            get_agent_scheduler().run_blocking(
+                do_comprehensive_analysis,
+                portfolio,
+                client_profile,
+                priority=AgentPriority.BATCH,
+                description=f"Batch analysis {portfolio.portfolio_id}",
+            )
+        )
 
         logger.info(f"✓ Analysis complete")
         logger.info(f"  - Risk Rating: {recommendations.risk_analysis.risk_rating.value}")
@@ -391,13 +400,10 @@ def run_batch_analysis(
             f"({recommendations.suitability_score.interpretation.value})"
         )
 
-        # Generate report
+        # Generate report, streaming each section to file as it is rendered
         logger.info("Generating report...")
-        report = do_generate_client_report(recommendations)
-
-        # Save report
         report_filename = f"{client_profile.client_id}_{portfolio.portfolio_id}_report.md"
-        report_path = save_report_to_file(report, report_filename)
+        report_path = stream_report_to_file(recommendations, report_filename)
 
         logger.info(f"✓ Report saved to: {report_path}")
         logger.info(f"\n{'=' * 80}")
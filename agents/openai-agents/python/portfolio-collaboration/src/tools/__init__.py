@@ -3,47 +3,86 @@ Tools package for Multi-Agent Portfolio Collaboration System.
 
 This package contains utility tools for parallel execution, report generation,
 suitability scoring, market data retrieval, and other shared functionality.
+
+Exports are loaded lazily on first access, so importing one tool module does
+not pull in the OpenAI Agents SDK, yfinance or pandas until they are needed.
 """
 
-from src.tools.market_data import (
-    StockPrice,
-    HistoricalData,
-    CompanyInfo,
-    DividendData,
-    fetch_current_price,
-    fetch_historical_data,
-    fetch_stock_info,
-    fetch_dividend_data,
-    fetch_financial_statement,
-    fetch_multiple_prices,
-    fetch_multiple_stock_info,
-    calculate_returns,
-    calculate_volatility,
-)
-from src.tools.parallel_execution import (
-    run_compliance_officer_async,
-    run_performance_analyst_async,
-    run_risk_analyst_async,
-    run_specialists_parallel,
-    run_specialists_parallel_async,
-    run_specialists_parallel_safe,
-    run_specialists_parallel_sync,
-)
-from src.tools.report_generator import (
-    format_compliance_section,
-    format_performance_section,
-    format_risk_section,
-    format_suitability_section,
-    generate_markdown_report,
-    save_report_to_file,
-)
-from src.tools.suitability_scoring import (
-    calculate_compliance_fit_score,
-    calculate_performance_fit_score,
-    calculate_risk_fit_score,
-    calculate_suitability_score,
-    calculate_time_horizon_fit_score,
-)
+import importlib
+from typing import Any, Dict, List
+
+# Public name -> module that defines it
+_LAZY_EXPORTS: Dict[str, str] = {
+    "StockPrice": "src.tools.market_data",
+    "HistoricalData": "src.tools.market_data",
+    "CompanyInfo": "src.tools.market_data",
+    "DividendData": "src.tools.market_data",
+    "fetch_current_price": "src.tools.market_data",
+    "fetch_historical_data": "src.tools.market_data",
+    "fetch_stock_info": "src.tools.market_data",
+    "fetch_dividend_data": "src.tools.market_data",
+    "fetch_financial_statement": "src.tools.market_data",
+    "fetch_multiple_prices": "src.tools.market_data",
+    "fetch_multiple_stock_info": "src.tools.market_data",
+    "calculate_returns": "src.tools.market_data",
+    "calculate_volatility": "src.tools.market_data",
+    "AgentCacheMissError": "src.tools.agent_cache",
+    "AgentCacheMode": "src.tools.agent_cache",
+    "AgentRunCache": "src.tools.agent_cache",
+    "get_agent_cache": "src.tools.agent_cache",
+    "run_agent_cached": "src.tools.agent_cache",
+    "set_agent_cache": "src.tools.agent_cache",
+    "AgentPriority": "src.tools.agent_scheduler",
+    "AgentScheduler": "src.tools.agent_scheduler",
+    "agent_priority": "src.tools.agent_scheduler",
+    "get_agent_scheduler": "src.tools.agent_scheduler",
+    "set_agent_scheduler": "src.tools.agent_scheduler",
+    "run_compliance_officer_async": "src.tools.parallel_execution",
+    "run_performance_analyst_async": "src.tools.parallel_execution",
+    "run_risk_analyst_async": "src.tools.parallel_execution",
+    "run_specialists_parallel": "src.tools.parallel_execution",
+    "run_specialists_parallel_async": "src.tools.parallel_execution",
+    "run_specialists_parallel_safe": "src.tools.parallel_execution",
+    "run_specialists_parallel_sync": "src.tools.parallel_execution",
+    "aiter_report_chunks": "src.tools.report_generator",
+    "format_compliance_section": "src.tools.report_generator",
+    "format_performance_section": "src.tools.report_generator",
+    "format_risk_section": "src.tools.report_generator",
+    "format_suitability_section": "src.tools.report_generator",
+    "generate_html_report": "src.tools.report_generator",
+    "generate_markdown_report": "src.tools.report_generator",
+    "generate_pdf_report": "src.tools.report_generator",
+    "iter_report_sections": "src.tools.report_generator",
+    "render_report": "src.tools.report_generator",
+    "render_report_async": "src.tools.report_generator",
+    "render_reports_parallel": "src.tools.report_generator",
+    "save_report_to_file": "src.tools.report_generator",
+    "save_reports_parallel": "src.tools.report_generator",
+    "stream_report_to_file": "src.tools.report_generator",
+    "stream_report_to_file_async": "src.tools.report_generator",
+    "calculate_compliance_fit_score": "src.tools.suitability_scoring",
+    "calculate_performance_fit_score": "src.tools.suitability_scoring",
+    "calculate_risk_fit_score": "src.tools.suitability_scoring",
+    "calculate_suitability_components_batch": "src.tools.suitability_scoring",
+    "calculate_suitability_score": "src.tools.suitability_scoring",
+    "calculate_suitability_scores_batch": "src.tools.suitability_scoring",
+    "calculate_time_horizon_fit_score": "src.tools.suitability_scoring",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining module on first access to a public name."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Market Data (Models)
@@ -61,6 +100,19 @@ __all__ = [
     "fetch_multiple_stock_info",
     "calculate_returns",
     "calculate_volatility",
+    # Agent Run Cache
+    "AgentRunCache",
+    "AgentCacheMode",
+    "AgentCacheMissError",
+    "get_agent_cache",
+    "set_agent_cache",
+    "run_agent_cached",
+    # Agent Scheduler
+    "AgentScheduler",
+    "AgentPriority",
+    "agent_priority",
+    "get_agent_scheduler",
+    "set_agent_scheduler",
     # Parallel Execution
     "run_specialists_parallel",
     "run_specialists_parallel_sync",
@@ -76,10 +128,22 @@ __all__ = [
     "format_performance_section",
     "format_suitability_section",
     "save_report_to_file",
+    "iter_report_sections",
+    "generate_html_report",
+    "generate_pdf_report",
+    "render_report",
+    "render_report_async",
+    "render_reports_parallel",
+    "save_reports_parallel",
+    "stream_report_to_file",
+    "stream_report_to_file_async",
+    "aiter_report_chunks",
     # Suitability Scoring
     "calculate_suitability_score",
     "calculate_risk_fit_score",
     "calculate_compliance_fit_score",
     "calculate_performance_fit_score",
     "calculate_time_horizon_fit_score",
+    "calculate_suitability_scores_batch",
+    "calculate_suitability_components_batch",
 ]
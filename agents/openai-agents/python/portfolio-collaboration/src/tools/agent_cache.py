@@ -0,0 +1,480 @@
+"""
+Agent Run Response Cache for Multi-Agent Portfolio Collaboration System.
+
+This module caches the final output of OpenAI Agents SDK ``Runner.run`` calls so
+that byte-identical requests (same agent, instructions, model, input and
+Runner.run options) are served from disk instead of paying full LLM latency and
+cost again.
+
+Cache Key:
+    sha256(agent name, sha256(instructions), model, serialized input, fingerprint,
+           serialized runner kwargs)
+
+    Runs whose extra Runner.run keyword arguments (e.g. a context object or
+    RunConfig) cannot be serialized are not cached.
+
+    The optional fingerprint provides semantic invalidation: register a
+    fingerprint function for an agent that summarizes the tool data it depends
+    on (e.g. the latest market data date). When that data changes the key
+    changes, and stale entries are never served.
+
+Cache Modes (AGENT_CACHE_MODE):
+    off         - Always call the LLM, never read or write the cache
+    read_write  - Serve hits from the cache, call the LLM and store on miss (default)
+    record      - Always call the LLM and overwrite the cache entry
+    replay      - Only serve from the cache; a miss raises AgentCacheMissError.
+                  Lets tests and benchmarks run fully offline.
+
+    Entries expire after AGENT_CACHE_TTL_SECONDS (default: one day), except in
+    replay mode, which serves recordings of any age.
+
+Biblical Principle: STEWARDSHIP - Don't pay twice for the same answer.
+Biblical Principle: TRUTH - Deterministic keys; stale data is never served.
+
+Usage:
+    from src.tools.agent_cache import run_agent_cached
+
+    result = await run_agent_cached(risk_analyst_agent, risk_input)
+    risk_analysis = result.final_output
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from pydantic import BaseModel, TypeAdapter
+
+from .agent_scheduler import get_agent_scheduler
+
+logger = logging.getLogger(__name__)
+
+# Default on-disk location (project_root/.cache/agent_runs)
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / ".cache" / "agent_runs"
+
+# Bump when the on-disk entry layout changes
+CACHE_FORMAT_VERSION = 1
+
+# Default maximum entry age (seconds)
+DEFAULT_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+# ============================================================================
+# Cache Mode & Errors
+# ============================================================================
+
+
+class AgentCacheMode(str, Enum):
+    """Agent run cache behaviour."""
+
+    OFF = "off"
+    READ_WRITE = "read_write"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class AgentCacheMissError(LookupError):
+    """Raised in replay mode when no cached response exists for a request."""
+
+
+@dataclass
+class CachedRunResult:
+    """
+    Minimal stand-in for the SDK's RunResult when served from the cache.
+
+    Only ``final_output`` is cached; callers in this project only read that.
+    """
+
+    final_output: Any
+    cache_key: str
+    cache_hit: bool = True
+
+
+# ============================================================================
+# Key Construction
+# ============================================================================
+
+
+def _json_default(value: Any) -> Any:
+    """JSON encoder fallback for Pydantic models, enums, dates and sets."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not cache-serializable")
+
+
+def serialize_agent_input(agent_input: Any) -> str:
+    """
+    Serialize an agent input deterministically (sorted keys, compact separators).
+
+    Args:
+        agent_input: String, list of input items, or dict of Pydantic models
+
+    Returns:
+        Canonical JSON string
+    """
+    return json.dumps(
+        agent_input, default=_json_default, sort_keys=True, separators=(",", ":")
+    )
+
+
+def _hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _agent_model_name(agent: Any) -> str:
+    """Return the agent's model as a string ("default" if the SDK default is used)."""
+    model = getattr(agent, "model", None)
+    if model is None:
+        return "default"
+    if isinstance(model, str):
+        return model
+    return getattr(model, "model", None) or type(model).__name__
+
+
+def _agent_instructions_text(agent: Any) -> str:
+    """Return the agent instructions, or the callable's qualified name if dynamic."""
+    instructions = getattr(agent, "instructions", None)
+    if instructions is None:
+        return ""
+    if isinstance(instructions, str):
+        return instructions
+    return f"{instructions.__module__}.{instructions.__qualname__}"
+
+
+def make_cache_key(
+    agent: Any,
+    agent_input: Any,
+    fingerprint: str = "",
+    runner_kwargs: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Build a deterministic cache key for an agent run.
+
+    Args:
+        agent: Agent being run
+        agent_input: Input passed to Runner.run
+        fingerprint: Optional semantic fingerprint of tool data the agent uses
+        runner_kwargs: Extra keyword arguments passed to Runner.run
+            (e.g. max_turns)
+
+    Returns:
+        Hex sha256 cache key
+
+    Raises:
+        TypeError: If agent_input or runner_kwargs cannot be serialized
+    """
+    parts = [
+        f"v{CACHE_FORMAT_VERSION}",
+        agent.name,
+        _hash_text(_agent_instructions_text(agent)),
+        _agent_model_name(agent),
+        serialize_agent_input(agent_input),
+        fingerprint,
+    ]
+    if runner_kwargs:
+        parts.append(serialize_agent_input(runner_kwargs))
+    return _hash_text("\x1f".join(parts))
+
+
+def _agent_dir_name(agent_name: str) -> str:
+    """Filesystem-safe directory name for an agent."""
+    return "".join(c if c.isalnum() else "_" for c in agent_name.lower()).strip("_")
+
+
+# ============================================================================
+# Agent Run Cache
+# ============================================================================
+
+
+class AgentRunCache:
+    """
+    Local on-disk cache of agent final outputs.
+
+    Entries are JSON files stored as ``<cache_dir>/<agent>/<key>.json`` and
+    written atomically, so concurrent runs never read partial entries.
+
+    Example:
+        >>> cache = AgentRunCache(mode=AgentCacheMode.REPLAY)
+        >>> result = await cache.run(risk_analyst_agent, risk_input)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        mode: AgentCacheMode = AgentCacheMode.READ_WRITE,
+        ttl_seconds: Optional[float] = DEFAULT_CACHE_TTL_SECONDS,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: .cache/agent_runs)
+            mode: Cache behaviour (see AgentCacheMode)
+            ttl_seconds: Maximum entry age; older entries are ignored outside
+                replay mode (default: one day, None: never expire)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.mode = AgentCacheMode(mode)
+        self.ttl_seconds = ttl_seconds
+        self._fingerprints: Dict[str, Callable[[Any], str]] = {}
+
+    # ------------------------------------------------------------------
+    # Semantic invalidation
+    # ------------------------------------------------------------------
+
+    def register_fingerprint(
+        self, agent_name: str, fingerprint_fn: Callable[[Any], str]
+    ) -> None:
+        """
+        Register a function summarizing the tool data an agent depends on.
+
+        The function receives the agent input and returns a string that changes
+        whenever the underlying tool outputs change (e.g. a market data date).
+        It becomes part of the cache key.
+
+        Args:
+            agent_name: Agent name (Agent.name)
+            fingerprint_fn: Callable mapping agent input to a fingerprint string
+        """
+        self._fingerprints[agent_name] = fingerprint_fn
+
+    def fingerprint_for(self, agent: Any, agent_input: Any) -> str:
+        """Compute the registered fingerprint for an agent run ("" if none)."""
+        fingerprint_fn = self._fingerprints.get(agent.name)
+        return fingerprint_fn(agent_input) if fingerprint_fn else ""
+
+    def invalidate(self, agent_name: Optional[str] = None) -> int:
+        """
+        Delete cached entries.
+
+        Args:
+            agent_name: Only delete this agent's entries (default: all agents)
+
+        Returns:
+            Number of entries deleted
+        """
+        if agent_name is not None:
+            directories = [self.cache_dir / _agent_dir_name(agent_name)]
+        elif self.cache_dir.exists():
+            directories = [d for d in self.cache_dir.iterdir() if d.is_dir()]
+        else:
+            directories = []
+
+        deleted = 0
+        for directory in directories:
+            if not directory.exists():
+                continue
+            for entry in directory.glob("*.json"):
+                entry.unlink(missing_ok=True)
+                deleted += 1
+
+        logger.info(f"Invalidated {deleted} cached agent run(s)")
+        return deleted
+
+    # ------------------------------------------------------------------
+    # Entry storage
+    # ------------------------------------------------------------------
+
+    def _entry_path(self, agent_name: str, key: str) -> Path:
+        return self.cache_dir / _agent_dir_name(agent_name) / f"{key}.json"
+
+    def get(self, agent: Any, key: str) -> Optional[Any]:
+        """
+        Load a cached final output.
+
+        Args:
+            agent: Agent the entry belongs to (its output_type is used to
+                rebuild Pydantic outputs)
+            key: Cache key
+
+        Returns:
+            Final output, or None on miss/expired/corrupt entry (entries
+            never expire in replay mode)
+        """
+        path = self._entry_path(agent.name, key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+        if entry.get("format_version") != CACHE_FORMAT_VERSION:
+            return None
+        if self.ttl_seconds is not None and self.mode != AgentCacheMode.REPLAY:
+            if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+                return None
+
+        output_type = getattr(agent, "output_type", None)
+        if output_type is None:
+            return entry["final_output"]
+        return TypeAdapter(output_type).validate_python(entry["final_output"])
+
+    def put(self, agent: Any, key: str, final_output: Any, fingerprint: str = "") -> None:
+        """
+        Store a final output atomically.
+
+        Args:
+            agent: Agent that produced the output
+            key: Cache key
+            final_output: RunResult.final_output (str or Pydantic model)
+            fingerprint: Semantic fingerprint used in the key (stored for reference)
+        """
+        path = self._entry_path(agent.name, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        entry = {
+            "format_version": CACHE_FORMAT_VERSION,
+            "key": key,
+            "agent_name": agent.name,
+            "model": _agent_model_name(agent),
+            "instructions_hash": _hash_text(_agent_instructions_text(agent)),
+            "fingerprint": fingerprint,
+            "created_at": time.time(),
+            "final_output": json.loads(
+                json.dumps(final_output, default=_json_default)
+            ),
+        }
+
+        # Write to a temp file in the same directory, then atomically replace
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    # ------------------------------------------------------------------
+    # Runner integration
+    # ------------------------------------------------------------------
+
+    async def run(self, agent: Any, agent_input: Any, **runner_kwargs: Any) -> Any:
+        """
+        Run an agent through the cache.
+
+        Args:
+            agent: Agent to run
+            agent_input: Input passed to Runner.run
+            **runner_kwargs: Extra keyword arguments forwarded to Runner.run
+
+        Returns:
+            The SDK RunResult on a live call (run through the shared
+            AgentScheduler), or CachedRunResult on a cache hit
+
+        Raises:
+            AgentCacheMissError: In replay mode when no entry exists, or the
+                runner kwargs cannot be serialized into a key
+        """
+        # Live calls go through the shared scheduler (concurrency, rate budget,
+        # retries). It only loads the Agents SDK when a live call is needed.
+        scheduler = get_agent_scheduler()
+
+        if self.mode == AgentCacheMode.OFF:
+            return await scheduler.run(agent, agent_input, **runner_kwargs)
+
+        fingerprint = self.fingerprint_for(agent, agent_input)
+        try:
+            key = make_cache_key(agent, agent_input, fingerprint, runner_kwargs)
+        except TypeError as e:
+            # e.g. a context object or RunConfig: the run can't be keyed safely
+            if self.mode == AgentCacheMode.REPLAY:
+                raise AgentCacheMissError(
+                    f"Cannot replay agent '{agent.name}': {e}"
+                ) from e
+            logger.debug(f"Agent cache bypassed for {agent.name}: {e}")
+            return await scheduler.run(agent, agent_input, **runner_kwargs)
+
+        if self.mode in (AgentCacheMode.READ_WRITE, AgentCacheMode.REPLAY):
+            cached_output = self.get(agent, key)
+            if cached_output is not None:
+                logger.debug(f"Agent cache hit for {agent.name} ({key[:12]})")
+                return CachedRunResult(final_output=cached_output, cache_key=key)
+            if self.mode == AgentCacheMode.REPLAY:
+                raise AgentCacheMissError(
+                    f"No cached response for agent '{agent.name}' (key {key[:12]}) "
+                    f"in replay mode. Re-run with AGENT_CACHE_MODE=record."
+                )
+
+        result = await scheduler.run(agent, agent_input, **runner_kwargs)
+        self.put(agent, key, result.final_output, fingerprint)
+        logger.debug(f"Agent cache stored {agent.name} ({key[:12]})")
+        return result
+
+
+# ============================================================================
+# Shared Cache Instance
+# ============================================================================
+
+_default_cache: Optional[AgentRunCache] = None
+
+
+def get_agent_cache() -> AgentRunCache:
+    """
+    Return the process-wide cache configured from environment variables.
+
+    Environment:
+        AGENT_CACHE_MODE: off | read_write | record | replay (default: read_write)
+        AGENT_CACHE_DIR: Cache directory (default: .cache/agent_runs)
+        AGENT_CACHE_TTL_SECONDS: Maximum entry age in seconds (default: 86400,
+            0 disables expiry)
+    """
+    global _default_cache
+    if _default_cache is None:
+        ttl = float(os.getenv("AGENT_CACHE_TTL_SECONDS", DEFAULT_CACHE_TTL_SECONDS))
+        cache_dir = os.getenv("AGENT_CACHE_DIR")
+        _default_cache = AgentRunCache(
+            cache_dir=Path(cache_dir) if cache_dir else None,
+            mode=AgentCacheMode(os.getenv("AGENT_CACHE_MODE", "read_write").lower()),
+            ttl_seconds=ttl or None,
+        )
+    return _default_cache
+
+
+def set_agent_cache(cache: Optional[AgentRunCache]) -> None:
+    """Replace the process-wide cache (None re-reads the environment on next use)."""
+    global _default_cache
+    _default_cache = cache
+
+
+async def run_agent_cached(agent: Any, agent_input: Any, **runner_kwargs: Any) -> Any:
+    """
+    Run an agent through the shared cache (drop-in for ``Runner.run``).
+
+    Args:
+        agent: Agent to run
+        agent_input: Input passed to Runner.run
+        **runner_kwargs: Extra keyword arguments forwarded to Runner.run
+
+    Returns:
+        Object with a ``final_output`` attribute
+    """
+    return await get_agent_cache().run(agent, agent_input, **runner_kwargs)
+
+
+__all__ = [
+    "AgentCacheMode",
+    "AgentCacheMissError",
+    "AgentRunCache",
+    "CachedRunResult",
+    "get_agent_cache",
+    "make_cache_key",
+    "run_agent_cached",
+    "serialize_agent_input",
+    "set_agent_cache",
+]
@@ -0,0 +1,562 @@
+"""
+Shared Agent Invocation Scheduler for Multi-Agent Portfolio Collaboration System.
+
+Every OpenAI Agents SDK ``Runner.run`` call in the project goes through one
+process-wide AgentScheduler so that fan-out (``/compare``, batch mode, parallel
+specialists) cannot overwhelm the API with concurrent requests.
+
+The scheduler provides:
+- Bounded concurrency with priority ordering (interactive before batch)
+- Request-per-minute and token-per-minute budgets (token buckets)
+- Retries with full-jitter exponential backoff for rate limits and transient errors
+- Adaptive concurrency (AIMD): halve the limit on a rate limit, grow it back
+  by one after a run of successes
+- Live statistics (queue depth, in-flight calls, retries) for monitoring
+
+The scheduler is designed for use from a single event loop thread, which is how
+both the FastAPI app and the CLI run agents.
+
+Biblical Principle: STEWARDSHIP - Spend the API budget steadily, not in bursts.
+Biblical Principle: PERSEVERE - Transient failures are retried, not surfaced.
+
+Usage:
+    from src.tools.agent_scheduler import AgentPriority, agent_priority, get_agent_scheduler
+
+    # Interactive (default priority)
+    result = await get_agent_scheduler().run(risk_analyst_agent, risk_input)
+
+    # Batch work yields to interactive requests
+    with agent_priority(AgentPriority.BATCH):
+        results = await asyncio.gather(*[run_one(p) for p in portfolios])
+
+    # Blocking analysis (no LLM call) shares the slots and priorities
+    recommendations = await get_agent_scheduler().run_blocking(
+        do_comprehensive_analysis, portfolio, client_profile
+    )
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+import os
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# HTTP status codes worth retrying (rate limit, timeouts, server errors)
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+# OpenAI SDK exception names worth retrying. Matched by name so this module
+# does not import the openai package.
+RETRYABLE_ERROR_NAMES = frozenset(
+    {"RateLimitError", "APITimeoutError", "APIConnectionError", "InternalServerError"}
+)
+
+# Rough characters-per-token ratio used to estimate request size
+CHARS_PER_TOKEN = 4
+
+
+# ============================================================================
+# Priorities
+# ============================================================================
+
+
+class AgentPriority(IntEnum):
+    """Scheduling priority (lower value runs first)."""
+
+    INTERACTIVE = 0
+    BATCH = 10
+
+
+_current_priority: contextvars.ContextVar[AgentPriority] = contextvars.ContextVar(
+    "agent_priority", default=AgentPriority.INTERACTIVE
+)
+
+
+@contextmanager
+def agent_priority(priority: AgentPriority) -> Iterator[None]:
+    """
+    Set the scheduling priority for agent calls made within this context.
+
+    Tasks created inside the block (e.g. by asyncio.gather) inherit it.
+
+    Args:
+        priority: Priority for agent calls in this context
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+# ============================================================================
+# Error Classification
+# ============================================================================
+
+
+def _is_rate_limit_error(exc: BaseException) -> bool:
+    return (
+        getattr(exc, "status_code", None) == 429
+        or type(exc).__name__ == "RateLimitError"
+    )
+
+
+def _is_retryable_error(exc: BaseException) -> bool:
+    return (
+        getattr(exc, "status_code", None) in RETRYABLE_STATUS_CODES
+        or type(exc).__name__ in RETRYABLE_ERROR_NAMES
+    )
+
+
+def _retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Read a Retry-After header from an API error, if present."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+# ============================================================================
+# Statistics
+# ============================================================================
+
+
+@dataclass
+class SchedulerStats:
+    """Snapshot of scheduler state for monitoring."""
+
+    queue_depth: int
+    in_flight: int
+    concurrency_limit: int
+    max_concurrency: int
+    submitted: int
+    completed: int
+    failed: int
+    retries: int
+    rate_limited: int
+
+
+# ============================================================================
+# Agent Scheduler
+# ============================================================================
+
+
+class AgentScheduler:
+    """
+    Priority-aware concurrency limiter and rate budget for agent invocations.
+
+    Example:
+        >>> scheduler = AgentScheduler(max_concurrency=4, requests_per_minute=60)
+        >>> result = await scheduler.run(compliance_officer_agent, compliance_input)
+        >>> print(scheduler.stats().queue_depth)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrency: Maximum agent calls in flight at once
+            requests_per_minute: Optional request budget
+            tokens_per_minute: Optional (estimated) token budget
+            max_retries: Retries per call for retryable errors
+            base_delay: Initial backoff delay in seconds
+            max_delay: Maximum backoff delay in seconds
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        # Concurrency state
+        self._concurrency_limit = max_concurrency
+        self._in_flight = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._success_streak = 0
+
+        # Token buckets start full
+        self._request_allowance = float(requests_per_minute or 0)
+        self._token_allowance = float(tokens_per_minute or 0)
+        self._last_refill = time.monotonic()
+
+        # Counters
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._retries = 0
+        self._rate_limited = 0
+
+    # ------------------------------------------------------------------
+    # Monitoring
+    # ------------------------------------------------------------------
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls waiting for a concurrency slot."""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    def stats(self) -> SchedulerStats:
+        """Return a snapshot of scheduler state."""
+        return SchedulerStats(
+            queue_depth=self.queue_depth,
+            in_flight=self._in_flight,
+            concurrency_limit=self._concurrency_limit,
+            max_concurrency=self.max_concurrency,
+            submitted=self._submitted,
+            completed=self._completed,
+            failed=self._failed,
+            retries=self._retries,
+            rate_limited=self._rate_limited,
+        )
+
+    def stats_dict(self) -> Dict[str, int]:
+        """Return scheduler statistics as a plain dict (for JSON responses)."""
+        return asdict(self.stats())
+
+    # ------------------------------------------------------------------
+    # Concurrency slots
+    # ------------------------------------------------------------------
+
+    async def _acquire_slot(self, priority: int) -> None:
+        if self._in_flight < self._concurrency_limit and not self.queue_depth:
+            self._in_flight += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # If the slot was granted just before cancellation, give it back
+            if future.done() and not future.cancelled():
+                self._release_slot()
+            raise
+
+    def _release_slot(self) -> None:
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self._concurrency_limit:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue  # Waiter was cancelled
+            self._in_flight += 1
+            future.set_result(None)
+
+    # ------------------------------------------------------------------
+    # Rate budget
+    # ------------------------------------------------------------------
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed_minutes = (now - self._last_refill) / 60.0
+        self._last_refill = now
+
+        if self.requests_per_minute:
+            self._request_allowance = min(
+                self.requests_per_minute,
+                self._request_allowance + elapsed_minutes * self.requests_per_minute,
+            )
+        if self.tokens_per_minute:
+            self._token_allowance = min(
+                self.tokens_per_minute,
+                self._token_allowance + elapsed_minutes * self.tokens_per_minute,
+            )
+
+    async def _reserve_budget(self, estimated_tokens: int) -> None:
+        """Wait until the request and token budgets allow another call."""
+        if not self.requests_per_minute and not self.tokens_per_minute:
+            return
+
+        # A single request larger than the whole budget only waits for a full bucket
+        tokens_needed = float(estimated_tokens)
+        if self.tokens_per_minute:
+            tokens_needed = min(tokens_needed, float(self.tokens_per_minute))
+
+        while True:
+            self._refill()
+            wait_seconds = 0.0
+
+            if self.requests_per_minute and self._request_allowance < 1:
+                wait_seconds = max(
+                    wait_seconds,
+                    (1 - self._request_allowance) * 60.0 / self.requests_per_minute,
+                )
+            if self.tokens_per_minute and self._token_allowance < tokens_needed:
+                wait_seconds = max(
+                    wait_seconds,
+                    (tokens_needed - self._token_allowance)
+                    * 60.0
+                    / self.tokens_per_minute,
+                )
+
+            if wait_seconds <= 0:
+                if self.requests_per_minute:
+                    self._request_allowance -= 1
+                if self.tokens_per_minute:
+                    self._token_allowance -= tokens_needed
+                return
+
+            await asyncio.sleep(wait_seconds)
+
+    def _record_actual_tokens(self, estimated_tokens: int, result: Any) -> None:
+        """Correct the token budget with actual usage reported by the SDK."""
+        if not self.tokens_per_minute:
+            return
+        usage = getattr(getattr(result, "context_wrapper", None), "usage", None)
+        actual_tokens = getattr(usage, "total_tokens", None)
+        if isinstance(actual_tokens, int) and actual_tokens > 0:
+            self._token_allowance -= actual_tokens - estimated_tokens
+
+    # ------------------------------------------------------------------
+    # Adaptive concurrency
+    # ------------------------------------------------------------------
+
+    def _on_success(self) -> None:
+        self._success_streak += 1
+        if (
+            self._concurrency_limit < self.max_concurrency
+            and self._success_streak >= self._concurrency_limit
+        ):
+            self._concurrency_limit += 1
+            self._success_streak = 0
+            self._wake_waiters()
+
+    def _on_rate_limited(self) -> None:
+        self._rate_limited += 1
+        self._success_streak = 0
+        new_limit = max(1, self._concurrency_limit // 2)
+        if new_limit < self._concurrency_limit:
+            logger.warning(
+                f"Rate limited - reducing agent concurrency "
+                f"{self._concurrency_limit} -> {new_limit}"
+            )
+            self._concurrency_limit = new_limit
+
+    def _backoff_delay(self, attempt: int, exc: BaseException) -> float:
+        retry_after = _retry_after_seconds(exc)
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        # Full jitter: uniform in [0, min(max_delay, base * 2^attempt)]
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2**attempt)))
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+
+    async def submit(
+        self,
+        call: Callable[[], Awaitable[Any]],
+        priority: Optional[AgentPriority] = None,
+        estimated_tokens: int = 0,
+        description: str = "agent call",
+        budgeted: bool = True,
+    ) -> Any:
+        """
+        Run an async call under the scheduler's limits, retrying on transient errors.
+
+        Args:
+            call: Zero-argument callable returning a new awaitable for each attempt
+            priority: Scheduling priority (default: the current agent_priority context)
+            estimated_tokens: Estimated tokens for the token budget
+            description: Label used in log messages
+            budgeted: Whether the call counts against the request and token
+                budgets (False for work that makes no API request)
+
+        Returns:
+            Result of the call
+        """
+        if priority is None:
+            priority = _current_priority.get()
+        self._submitted += 1
+
+        attempt = 0
+        while True:
+            await self._acquire_slot(int(priority))
+            try:
+                if budgeted:
+                    await self._reserve_budget(estimated_tokens)
+                result = await call()
+            except Exception as exc:
+                self._release_slot()
+                if not _is_retryable_error(exc) or attempt >= self.max_retries:
+                    self._failed += 1
+                    raise
+                if _is_rate_limit_error(exc):
+                    self._on_rate_limited()
+
+                delay = self._backoff_delay(attempt, exc)
+                attempt += 1
+                self._retries += 1
+                logger.warning(
+                    f"{description} failed ({type(exc).__name__}); "
+                    f"retry {attempt}/{self.max_retries} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                self._release_slot()
+                raise
+
+            self._release_slot()
+            self._completed += 1
+            self._on_success()
+            self._record_actual_tokens(estimated_tokens, result)
+            return result
+
+    async def run(
+        self,
+        agent: Any,
+        agent_input: Any,
+        priority: Optional[AgentPriority] = None,
+        **runner_kwargs: Any,
+    ) -> Any:
+        """
+        Run an agent with ``Runner.run`` under the scheduler's limits.
+
+        Args:
+            agent: Agent to run
+            agent_input: Input passed to Runner.run
+            priority: Scheduling priority (default: the current agent_priority context)
+            **runner_kwargs: Extra keyword arguments forwarded to Runner.run
+
+        Returns:
+            The SDK RunResult
+        """
+        from agents import Runner
+
+        return await self.submit(
+            lambda: Runner.run(agent, agent_input, **runner_kwargs),
+            priority=priority,
+            estimated_tokens=estimate_agent_tokens(agent, agent_input),
+            description=f"Agent '{agent.name}'",
+        )
+
+    async def run_blocking(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        priority: Optional[AgentPriority] = None,
+        description: str = "analysis",
+    ) -> Any:
+        """
+        Run a blocking function in a worker thread under the scheduler's limits.
+
+        Used for the direct (tool-based) analysis path, so batch and comparison
+        fan-out share concurrency slots with agent calls and yield to
+        interactive requests. It does not count against the rate budgets.
+
+        Args:
+            func: Blocking function to call
+            *args: Positional arguments for func
+            priority: Scheduling priority (default: the current agent_priority context)
+            description: Label used in log messages
+
+        Returns:
+            Result of func
+        """
+        return await self.submit(
+            lambda: asyncio.to_thread(func, *args),
+            priority=priority,
+            description=description,
+            budgeted=False,
+        )
+
+
+def estimate_agent_tokens(agent: Any, agent_input: Any) -> int:
+    """
+    Roughly estimate prompt tokens for an agent call (instructions + input).
+
+    Args:
+        agent: Agent being run
+        agent_input: Input passed to Runner.run
+
+    Returns:
+        Estimated token count
+    """
+    from .agent_cache import serialize_agent_input
+
+    instructions = getattr(agent, "instructions", None)
+    instructions_chars = len(instructions) if isinstance(instructions, str) else 0
+    try:
+        input_chars = len(serialize_agent_input(agent_input))
+    except TypeError:
+        input_chars = len(str(agent_input))
+    return (instructions_chars + input_chars) // CHARS_PER_TOKEN
+
+
+# ============================================================================
+# Shared Scheduler Instance
+# ============================================================================
+
+_default_scheduler: Optional[AgentScheduler] = None
+
+
+def _env_float(name: str) -> Optional[float]:
+    value = os.getenv(name)
+    return float(value) if value else None
+
+
+def get_agent_scheduler() -> AgentScheduler:
+    """
+    Return the process-wide scheduler configured from environment variables.
+
+    Environment:
+        AGENT_MAX_CONCURRENCY: Maximum concurrent agent calls (default: 8)
+        AGENT_REQUESTS_PER_MINUTE: Optional request budget
+        AGENT_TOKENS_PER_MINUTE: Optional token budget
+        AGENT_MAX_RETRIES: Retries for transient errors (default: 5)
+    """
+    global _default_scheduler
+    if _default_scheduler is None:
+        _default_scheduler = AgentScheduler(
+            max_concurrency=int(os.getenv("AGENT_MAX_CONCURRENCY", "8")),
+            requests_per_minute=_env_float("AGENT_REQUESTS_PER_MINUTE"),
+            tokens_per_minute=_env_float("AGENT_TOKENS_PER_MINUTE"),
+            max_retries=int(os.getenv("AGENT_MAX_RETRIES", "5")),
+        )
+    return _default_scheduler
+
+
+def set_agent_scheduler(scheduler: Optional[AgentScheduler]) -> None:
+    """Replace the process-wide scheduler (None re-reads the environment on next use)."""
+    global _default_scheduler
+    _default_scheduler = scheduler
+
+
+__all__ = [
+    "AgentPriority",
+    "AgentScheduler",
+    "SchedulerStats",
+    "agent_priority",
+    "estimate_agent_tokens",
+    "get_agent_scheduler",
+    "set_agent_scheduler",
+]
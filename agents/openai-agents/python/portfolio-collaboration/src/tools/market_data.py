@@ -21,18 +21,29 @@ Biblical Principle: PERSEVERE - Graceful fallback when primary data source is un
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-import pandas as pd
-import yfinance as yf
 from pydantic import BaseModel, Field
 
+# yfinance and pandas are slow to import, so they are loaded on first use
+# (see _yfinance). Importing this module stays cheap for CLI and worker startup.
+if TYPE_CHECKING:
+    import pandas as pd
+
 # ============================================================================
 # Logging Configuration
 # ============================================================================
 
 logger = logging.getLogger(__name__)
 
+
+def _yfinance():
+    """Import yfinance on first use (pulls in pandas as well)."""
+    import yfinance
+
+    return yfinance
+
+
 # ============================================================================
 # Pydantic Models for Structured Outputs
 # ============================================================================
@@ -62,7 +73,7 @@ class HistoricalData(BaseModel):
     start_date: str = Field(..., description="Start date of data")
     end_date: str = Field(..., description="End date of data")
     data_points: int = Field(..., description="Number of data points")
-    df: Optional[pd.DataFrame] = Field(
+    df: Optional[Any] = Field(
         None, description="Pandas DataFrame with OHLCV data"
     )
 
@@ -96,7 +107,7 @@ class DividendData(BaseModel):
     latest_dividend_date: Optional[str] = Field(
         None, description="Date of latest dividend"
     )
-    df: Optional[pd.DataFrame] = Field(
+    df: Optional[Any] = Field(
         None, description="Pandas DataFrame with dividend history"
     )
 
@@ -141,7 +152,7 @@ def fetch_current_price(ticker: str, use_mcp: bool = False) -> StockPrice:
         logger.warning("MCP server integration not yet implemented, using direct call")
 
     try:
-        stock = yf.Ticker(ticker)
+        stock = _yfinance().Ticker(ticker)
         info = stock.info
 
         # Extract current price
@@ -207,7 +218,7 @@ def fetch_historical_data(
         logger.warning("MCP server integration not yet implemented, using direct call")
 
     try:
-        stock = yf.Ticker(ticker)
+        stock = _yfinance().Ticker(ticker)
         df = stock.history(period=period, interval=interval)
 
         if df.empty:
@@ -264,7 +275,7 @@ def fetch_stock_info(ticker: str, use_mcp: bool = False) -> CompanyInfo:
         logger.warning("MCP server integration not yet implemented, using direct call")
 
     try:
-        stock = yf.Ticker(ticker)
+        stock = _yfinance().Ticker(ticker)
         info = stock.info
 
         # Extract key information
@@ -320,7 +331,7 @@ def fetch_dividend_data(ticker: str, use_mcp: bool = False) -> DividendData:
         logger.warning("MCP server integration not yet implemented, using direct call")
 
     try:
-        stock = yf.Ticker(ticker)
+        stock = _yfinance().Ticker(ticker)
         dividends = stock.dividends
 
         if dividends.empty:
@@ -359,7 +370,7 @@ def fetch_financial_statement(
     statement_type: str = "income_stmt",
     quarterly: bool = False,
     use_mcp: bool = False,
-) -> pd.DataFrame:
+) -> "pd.DataFrame":
     """
     Fetch financial statements (income, balance sheet, cashflow).
 
@@ -400,7 +411,7 @@ def fetch_financial_statement(
         logger.warning("MCP server integration not yet implemented, using direct call")
 
     try:
-        stock = yf.Ticker(ticker)
+        stock = _yfinance().Ticker(ticker)
 
         # Map statement types to yfinance attributes
         if statement_type == "income_stmt":
@@ -502,7 +513,7 @@ def fetch_multiple_stock_info(
 # ============================================================================
 
 
-def calculate_returns(historical_data: HistoricalData) -> pd.Series:
+def calculate_returns(historical_data: HistoricalData) -> "pd.Series":
     """
     Calculate daily returns from historical price data.
 
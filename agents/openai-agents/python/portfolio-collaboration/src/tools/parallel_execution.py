@@ -24,8 +24,6 @@ import asyncio
 import time
 from typing import Optional
 
-from agents import Runner
-
 from ..agents.compliance_officer import (
     analyze_compliance,
     compliance_officer_agent,
@@ -43,6 +41,7 @@ from ..models.schemas import (
     Portfolio,
     RiskAnalysis,
 )
+from .agent_cache import run_agent_cached
 
 
 # ============================================================================
@@ -113,6 +112,8 @@ async def run_specialists_parallel_async(
 
     Uses asyncio.gather to run all three agents concurrently, reducing
     total execution time from ~3x sequential time to max(agent times).
+    Agent runs go through the shared agent run cache (see agent_cache), so
+    identical requests are served without another LLM call.
 
     Args:
         portfolio: Portfolio to analyze
@@ -140,9 +141,9 @@ async def run_specialists_parallel_async(
 
     # Run all three agents concurrently using asyncio.gather
     results = await asyncio.gather(
-        Runner.run(risk_analyst_agent, risk_input),
-        Runner.run(compliance_officer_agent, compliance_input),
-        Runner.run(performance_analyst_agent, performance_input),
+        run_agent_cached(risk_analyst_agent, risk_input),
+        run_agent_cached(compliance_officer_agent, compliance_input),
+        run_agent_cached(performance_analyst_agent, performance_input),
     )
 
     execution_time = time.time() - start_time
@@ -227,7 +228,7 @@ async def run_risk_analyst_async(
     Returns:
         RiskAnalysis output
     """
-    result = await Runner.run(
+    result = await run_agent_cached(
         risk_analyst_agent, {"portfolio": portfolio, "client_profile": client_profile}
     )
     return result.final_output
@@ -248,7 +249,7 @@ async def run_compliance_officer_async(
     Returns:
         ComplianceReport output
     """
-    result = await Runner.run(
+    result = await run_agent_cached(
         compliance_officer_agent,
         {"portfolio": portfolio, "client_profile": client_profile},
     )
@@ -270,7 +271,7 @@ async def run_performance_analyst_async(
     Returns:
         PerformanceReport output
     """
-    result = await Runner.run(
+    result = await run_agent_cached(
         performance_analyst_agent, {"portfolio": portfolio, "benchmark": benchmark}
     )
     return result.final_output
@@ -6,12 +6,23 @@ combining outputs from all specialist agents into a comprehensive client report.
 
 Biblical Principle: TRUTH - All analysis results are presented clearly and transparently.
 Biblical Principle: SERVE - Reports are designed for clarity and actionable insights.
+
+Streaming & Batch Rendering:
+    Report sections are produced lazily by iter_report_sections(), so a report
+    can be streamed to a file (stream_report_to_file) or an HTTP response
+    (aiter_report_chunks) as each section is rendered. Many reports can be
+    rendered across a process pool with render_reports_parallel(). Output
+    formats are "markdown" (default), "html" and "pdf" (requires weasyprint).
 """
 
+import asyncio
+import html
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Iterator, List, Optional, Sequence
 
 from src.models.schemas import (
     ComplianceReport,
@@ -21,6 +32,9 @@ from src.models.schemas import (
     SuitabilityScore,
 )
 
+# Separator placed between report sections
+SECTION_SEPARATOR = "\n\n"
+
 
 def generate_markdown_report(recommendations: PortfolioRecommendations) -> str:
     """
@@ -41,34 +55,46 @@ def generate_markdown_report(recommendations: PortfolioRecommendations) -> str:
         # Portfolio Analysis Report
         ...
     """
+    # Combine all sections with double newlines
+    return SECTION_SEPARATOR.join(iter_report_sections(recommendations))
+
+
+def iter_report_sections(recommendations: PortfolioRecommendations) -> Iterator[str]:
+    """
+    Yield markdown report sections one at a time, in report order.
+
+    Each section is rendered only when requested, so callers can write or
+    send it before the next one is built. Joining the sections with
+    SECTION_SEPARATOR gives exactly generate_markdown_report() output.
+
+    Args:
+        recommendations: Complete portfolio analysis with all specialist outputs
+
+    Yields:
+        Formatted markdown section strings
+    """
     # Extract portfolio details from embedded analysis
     portfolio_value = _format_currency(
         recommendations.performance_report.total_return
     )  # Will be calculated from holdings
     analysis_date = recommendations.analysis_date.strftime("%Y-%m-%d")
 
-    # Build report sections
-    sections = [
-        _generate_header(
-            recommendations.client_id,
-            analysis_date,
-            portfolio_value,
-            recommendations.risk_analysis,
-        ),
-        _generate_executive_summary(
-            recommendations.executive_summary, recommendations.suitability_score
-        ),
-        format_risk_section(recommendations.risk_analysis),
-        format_compliance_section(recommendations.compliance_report),
-        format_performance_section(recommendations.performance_report),
-        format_suitability_section(recommendations.suitability_score),
-        _generate_recommendations_section(recommendations.recommendations),
-        _generate_action_items_section(recommendations.action_items),
-        _generate_footer(recommendations.analysis_date),
-    ]
-
-    # Combine all sections with double newlines
-    return "\n\n".join(sections)
+    yield _generate_header(
+        recommendations.client_id,
+        analysis_date,
+        portfolio_value,
+        recommendations.risk_analysis,
+    )
+    yield _generate_executive_summary(
+        recommendations.executive_summary, recommendations.suitability_score
+    )
+    yield format_risk_section(recommendations.risk_analysis)
+    yield format_compliance_section(recommendations.compliance_report)
+    yield format_performance_section(recommendations.performance_report)
+    yield format_suitability_section(recommendations.suitability_score)
+    yield _generate_recommendations_section(recommendations.recommendations)
+    yield _generate_action_items_section(recommendations.action_items)
+    yield _generate_footer(recommendations.analysis_date)
 
 
 def _generate_header(
@@ -434,6 +460,36 @@ def _format_signed_percentage(value: float) -> str:
     return f"{sign}{value:.1f}%"
 
 
+def _resolve_report_path(
+    filename: Optional[str], output_dir: str, extension: str = ".md"
+) -> Path:
+    """
+    Build the output path for a report, creating the directory if needed.
+
+    Args:
+        filename: Optional custom filename (with or without extension)
+        output_dir: Output directory path
+        extension: File extension to enforce (e.g. ".md", ".html")
+
+    Returns:
+        Path to the report file
+    """
+    # Create output directory if it doesn't exist
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    # Generate filename if not provided
+    if filename is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"portfolio_report_{timestamp}"
+
+    # Ensure extension
+    if not filename.endswith(extension):
+        filename = f"{filename}{extension}"
+
+    return output_path / filename
+
+
 def save_report_to_file(
     report_content: str, filename: Optional[str] = None, output_dir: str = "reports"
 ) -> str:
@@ -457,21 +513,7 @@ def save_report_to_file(
         >>> print(filepath)
         /path/to/project/reports/client_123_analysis.md
     """
-    # Create output directory if it doesn't exist
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    # Generate filename if not provided
-    if filename is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"portfolio_report_{timestamp}"
-
-    # Ensure .md extension
-    if not filename.endswith(".md"):
-        filename = f"{filename}.md"
-
-    # Full file path
-    file_path = output_path / filename
+    file_path = _resolve_report_path(filename, output_dir)
 
     # Write report to file
     with open(file_path, "w", encoding="utf-8") as f:
@@ -479,3 +521,454 @@ def save_report_to_file(
 
     # Return absolute path
     return str(file_path.absolute())
+
+
+# ============================================================================
+# HTML / PDF Rendering
+# ============================================================================
+
+# Output formats supported by the streaming and parallel renderers
+REPORT_FORMATS = ("markdown", "html", "pdf")
+
+_REPORT_EXTENSIONS = {"markdown": ".md", "html": ".html", "pdf": ".pdf"}
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: -apple-system, Helvetica, Arial, sans-serif; max-width: 960px; margin: 2em auto; color: #222; }}
+table {{ border-collapse: collapse; margin: 1em 0; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 10px; text-align: left; }}
+th {{ background: #f4f4f4; }}
+</style>
+</head>
+<body>
+"""
+
+_HTML_TAIL = "</body>\n</html>\n"
+
+# Inline markdown patterns used by the report sections
+_BOLD_PATTERN = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC_PATTERN = re.compile(r"\*(.+?)\*")
+_ORDERED_ITEM_PATTERN = re.compile(r"^\d+\.\s+(.*)$")
+_TABLE_DIVIDER_PATTERN = re.compile(r"^\|[\s\-|]+\|$")
+
+
+def _inline_markdown_to_html(text: str) -> str:
+    """Convert inline bold/italic markdown to HTML (text is escaped first)."""
+    text = html.escape(text, quote=False)
+    text = _BOLD_PATTERN.sub(r"<strong>\1</strong>", text)
+    return _ITALIC_PATTERN.sub(r"<em>\1</em>", text)
+
+
+def _table_cells(line: str) -> List[str]:
+    """Split a markdown table row into cell strings."""
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def render_section_html(section: str) -> str:
+    """
+    Convert one markdown report section to HTML.
+
+    Supports the markdown subset produced by this module: headings, tables,
+    bulleted/numbered lists, horizontal rules, bold and italic text.
+
+    Args:
+        section: Markdown section (as yielded by iter_report_sections)
+
+    Returns:
+        HTML fragment for the section
+    """
+    html_lines: List[str] = []
+    open_list: Optional[str] = None
+    table_rows: List[str] = []
+
+    def close_list() -> None:
+        nonlocal open_list
+        if open_list:
+            html_lines.append(f"</{open_list}>")
+            open_list = None
+
+    def flush_table() -> None:
+        if not table_rows:
+            return
+        header, *body = table_rows
+        html_lines.append("<table>")
+        html_lines.append(
+            "<tr>"
+            + "".join(
+                f"<th>{_inline_markdown_to_html(c)}</th>" for c in _table_cells(header)
+            )
+            + "</tr>"
+        )
+        for row in body:
+            html_lines.append(
+                "<tr>"
+                + "".join(
+                    f"<td>{_inline_markdown_to_html(c)}</td>" for c in _table_cells(row)
+                )
+                + "</tr>"
+            )
+        html_lines.append("</table>")
+        table_rows.clear()
+
+    for raw_line in section.splitlines():
+        line = raw_line.strip()
+
+        if line.startswith("|"):
+            close_list()
+            if not _TABLE_DIVIDER_PATTERN.match(line):
+                table_rows.append(line)
+            continue
+        flush_table()
+
+        ordered_match = _ORDERED_ITEM_PATTERN.match(line)
+        if line.startswith("- "):
+            if open_list != "ul":
+                close_list()
+                html_lines.append("<ul>")
+                open_list = "ul"
+            html_lines.append(f"<li>{_inline_markdown_to_html(line[2:])}</li>")
+            continue
+        if ordered_match:
+            if open_list != "ol":
+                close_list()
+                html_lines.append("<ol>")
+                open_list = "ol"
+            html_lines.append(
+                f"<li>{_inline_markdown_to_html(ordered_match.group(1))}</li>"
+            )
+            continue
+        close_list()
+
+        if not line:
+            continue
+        if line == "---":
+            html_lines.append("<hr>")
+        elif line.startswith("#"):
+            level = min(len(line) - len(line.lstrip("#")), 6)
+            heading = _inline_markdown_to_html(line[level:].strip())
+            html_lines.append(f"<h{level}>{heading}</h{level}>")
+        else:
+            html_lines.append(f"<p>{_inline_markdown_to_html(line)}</p>")
+
+    flush_table()
+    close_list()
+    return "\n".join(html_lines) + "\n"
+
+
+def iter_report_html(recommendations: PortfolioRecommendations) -> Iterator[str]:
+    """
+    Yield a complete HTML report document chunk by chunk.
+
+    Args:
+        recommendations: Complete portfolio analysis with all specialist outputs
+
+    Yields:
+        HTML document head, one fragment per report section, then the tail
+    """
+    title = html.escape(f"Portfolio Analysis Report - {recommendations.client_id}")
+    yield _HTML_HEAD.format(title=title)
+    for section in iter_report_sections(recommendations):
+        yield render_section_html(section)
+    yield _HTML_TAIL
+
+
+def generate_html_report(recommendations: PortfolioRecommendations) -> str:
+    """
+    Generate complete HTML report from portfolio analysis.
+
+    Args:
+        recommendations: Complete portfolio analysis with all specialist outputs
+
+    Returns:
+        HTML document as string
+    """
+    return "".join(iter_report_html(recommendations))
+
+
+def generate_pdf_report(recommendations: PortfolioRecommendations) -> bytes:
+    """
+    Generate a PDF report from portfolio analysis.
+
+    PDF output is optional and requires the ``weasyprint`` package.
+
+    Args:
+        recommendations: Complete portfolio analysis with all specialist outputs
+
+    Returns:
+        PDF document bytes
+
+    Raises:
+        ImportError: If weasyprint is not installed
+    """
+    try:
+        from weasyprint import HTML
+    except ImportError as e:
+        raise ImportError(
+            "PDF reports require weasyprint. Install with: pip install weasyprint"
+        ) from e
+
+    return HTML(string=generate_html_report(recommendations)).write_pdf()
+
+
+def render_report(
+    recommendations: PortfolioRecommendations, output_format: str = "markdown"
+):
+    """
+    Render a report in the requested output format.
+
+    Args:
+        recommendations: Complete portfolio analysis with all specialist outputs
+        output_format: "markdown", "html" or "pdf"
+
+    Returns:
+        Report as str (markdown/html) or bytes (pdf)
+
+    Raises:
+        ValueError: If output_format is not supported
+    """
+    if output_format == "markdown":
+        return generate_markdown_report(recommendations)
+    if output_format == "html":
+        return generate_html_report(recommendations)
+    if output_format == "pdf":
+        return generate_pdf_report(recommendations)
+    raise ValueError(
+        f"Unsupported report format '{output_format}'. Expected one of {REPORT_FORMATS}"
+    )
+
+
+# ============================================================================
+# Streaming Output
+# ============================================================================
+
+
+def iter_report_chunks(
+    recommendations: PortfolioRecommendations, output_format: str = "markdown"
+) -> Iterator[str]:
+    """
+    Yield report text chunks for streaming output.
+
+    Markdown chunks include the section separators, so concatenating them
+    gives exactly generate_markdown_report() output.
+
+    Args:
+        recommendations: Complete portfolio analysis with all specialist outputs
+        output_format: "markdown" or "html" (PDF cannot be streamed)
+
+    Yields:
+        Report text chunks
+
+    Raises:
+        ValueError: If output_format is not streamable
+    """
+    if output_format == "markdown":
+        for i, section in enumerate(iter_report_sections(recommendations)):
+            yield section if i == 0 else SECTION_SEPARATOR + section
+    elif output_format == "html":
+        yield from iter_report_html(recommendations)
+    else:
+        raise ValueError(
+            f"Report format '{output_format}' cannot be streamed. Use 'markdown' or 'html'"
+        )
+
+
+def stream_report_to_file(
+    recommendations: PortfolioRecommendations,
+    filename: Optional[str] = None,
+    output_dir: str = "reports",
+    output_format: str = "markdown",
+) -> str:
+    """
+    Render a report and write each section to file as soon as it is produced.
+
+    Unlike save_report_to_file(), the full report is never held in memory.
+    PDF output is rendered in one piece (PDF layout needs the whole document).
+
+    Args:
+        recommendations: Complete portfolio analysis with all specialist outputs
+        filename: Optional custom filename (without extension)
+        output_dir: Output directory path (relative to project root)
+        output_format: "markdown", "html" or "pdf"
+
+    Returns:
+        Absolute path to saved report file
+
+    Example:
+        >>> filepath = stream_report_to_file(recommendations, "client_123_analysis")
+    """
+    if output_format not in REPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported report format '{output_format}'. Expected one of {REPORT_FORMATS}"
+        )
+
+    file_path = _resolve_report_path(
+        filename, output_dir, _REPORT_EXTENSIONS[output_format]
+    )
+
+    if output_format == "pdf":
+        with open(file_path, "wb") as f:
+            f.write(generate_pdf_report(recommendations))
+    else:
+        with open(file_path, "w", encoding="utf-8") as f:
+            for chunk in iter_report_chunks(recommendations, output_format):
+                f.write(chunk)
+
+    return str(file_path.absolute())
+
+
+async def aiter_report_chunks(
+    recommendations: PortfolioRecommendations, output_format: str = "markdown"
+) -> AsyncIterator[str]:
+    """
+    Asynchronously yield report chunks, e.g. for a FastAPI StreamingResponse.
+
+    Control returns to the event loop between sections so other requests
+    are served while a report is being rendered.
+
+    Args:
+        recommendations: Complete portfolio analysis with all specialist outputs
+        output_format: "markdown" or "html"
+
+    Yields:
+        Report text chunks
+
+    Example:
+        >>> return StreamingResponse(
+        ...     aiter_report_chunks(recommendations), media_type="text/markdown"
+        ... )
+    """
+    for chunk in iter_report_chunks(recommendations, output_format):
+        yield chunk
+        await asyncio.sleep(0)
+
+
+async def render_report_async(
+    recommendations: PortfolioRecommendations, output_format: str = "markdown"
+):
+    """
+    Render a report in a worker thread without blocking the event loop.
+
+    Args:
+        recommendations: Complete portfolio analysis with all specialist outputs
+        output_format: "markdown", "html" or "pdf"
+
+    Returns:
+        Report as str (markdown/html) or bytes (pdf)
+    """
+    return await asyncio.to_thread(render_report, recommendations, output_format)
+
+
+async def stream_report_to_file_async(
+    recommendations: PortfolioRecommendations,
+    filename: Optional[str] = None,
+    output_dir: str = "reports",
+    output_format: str = "markdown",
+) -> str:
+    """
+    Async version of stream_report_to_file() that runs in a worker thread.
+
+    Returns:
+        Absolute path to saved report file
+    """
+    return await asyncio.to_thread(
+        stream_report_to_file, recommendations, filename, output_dir, output_format
+    )
+
+
+# ============================================================================
+# Parallel Rendering
+# ============================================================================
+
+
+def render_reports_parallel(
+    recommendations_list: Sequence[PortfolioRecommendations],
+    output_format: str = "markdown",
+    max_workers: Optional[int] = None,
+) -> List:
+    """
+    Render many reports across a process pool.
+
+    Report formatting is CPU-bound, so separate processes are used to render
+    reports on all cores. Results are returned in input order.
+
+    Args:
+        recommendations_list: Analyses to render
+        output_format: "markdown", "html" or "pdf"
+        max_workers: Maximum worker processes (default: os.cpu_count())
+
+    Returns:
+        List of rendered reports (str, or bytes for pdf)
+
+    Example:
+        >>> reports = render_reports_parallel(all_recommendations, max_workers=4)
+    """
+    if output_format not in REPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported report format '{output_format}'. Expected one of {REPORT_FORMATS}"
+        )
+    if len(recommendations_list) <= 1:
+        return [render_report(r, output_format) for r in recommendations_list]
+
+    workers = min(max_workers or os.cpu_count() or 1, len(recommendations_list))
+    chunksize = max(1, len(recommendations_list) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                render_report,
+                recommendations_list,
+                [output_format] * len(recommendations_list),
+                chunksize=chunksize,
+            )
+        )
+
+
+def save_reports_parallel(
+    recommendations_list: Sequence[PortfolioRecommendations],
+    filenames: Optional[Sequence[Optional[str]]] = None,
+    output_dir: str = "reports",
+    output_format: str = "markdown",
+    max_workers: Optional[int] = None,
+) -> List[str]:
+    """
+    Render and stream many reports to files across a process pool.
+
+    Each worker streams its report directly to disk, so rendered reports are
+    never sent back to the parent process.
+
+    Args:
+        recommendations_list: Analyses to render
+        filenames: Optional filename per report (default: "<client>_<portfolio>_report")
+        output_dir: Output directory path (relative to project root)
+        output_format: "markdown", "html" or "pdf"
+        max_workers: Maximum worker processes (default: os.cpu_count())
+
+    Returns:
+        Absolute paths of saved report files, in input order
+    """
+    if filenames is None:
+        filenames = [
+            f"{r.client_id}_{r.portfolio_id}_report" for r in recommendations_list
+        ]
+    if len(filenames) != len(recommendations_list):
+        raise ValueError("filenames must have one entry per report")
+    if not recommendations_list:
+        return []
+
+    count = len(recommendations_list)
+    workers = min(max_workers or os.cpu_count() or 1, count)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                stream_report_to_file,
+                recommendations_list,
+                filenames,
+                [output_dir] * count,
+                [output_format] * count,
+            )
+        )
@@ -21,9 +21,15 @@ Interpretation:
 - 60-79: Suitable
 - 40-59: Marginal Fit
 - 0-39: Not Suitable
+
+Batch Scoring:
+    calculate_suitability_scores_batch() scores many (client, risk, compliance,
+    performance) records at once using NumPy arrays. Results are identical to
+    calling calculate_suitability_score() on each record.
 """
 
-from typing import List
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple, Union
 
 from src.models.schemas import (
     ClientProfile,
@@ -37,6 +43,10 @@ from src.models.schemas import (
     SuitabilityScore,
 )
 
+# NumPy is only needed for batch scoring, so it is imported on first use
+if TYPE_CHECKING:
+    import numpy as np
+
 
 # ============================================================================
 # Helper Functions for Component Scoring
@@ -492,3 +502,281 @@ def calculate_suitability_score(
         interpretation=interpretation,
         explanation=explanation,
     )
+
+
+# ============================================================================
+# Batch Suitability Scoring (Vectorized)
+# ============================================================================
+
+# Lookup tables mirror the scalar helpers above. Row/column order follows the
+# enum code maps below so that tables can be indexed with integer arrays.
+_RISK_TOLERANCE_CODES: Dict[RiskTolerance, int] = {
+    RiskTolerance.CONSERVATIVE: 0,
+    RiskTolerance.MODERATE: 1,
+    RiskTolerance.AGGRESSIVE: 2,
+}
+
+_RISK_RATING_CODES: Dict[RiskRating, int] = {
+    RiskRating.LOW: 0,
+    RiskRating.MEDIUM: 1,
+    RiskRating.HIGH: 2,
+    RiskRating.VERY_HIGH: 3,
+}
+
+_COMPLIANCE_STATUS_SCORES: Dict[ComplianceStatus, float] = {
+    ComplianceStatus.PASS: 100.0,
+    ComplianceStatus.REVIEW: 70.0,
+    ComplianceStatus.FAIL: 30.0,
+}
+
+# [client risk tolerance][portfolio risk rating]
+_RISK_FIT_TABLE = [
+    [100.0, 70.0, 40.0, 30.0],  # Conservative
+    [75.0, 100.0, 75.0, 50.0],  # Moderate
+    [60.0, 80.0, 100.0, 100.0],  # Aggressive
+]
+
+# [time horizon bucket][volatility bucket]
+# Horizon buckets: 0 = <5yr, 1 = 5-15yr, 2 = >15yr
+# Volatility buckets: 0 = <=10%, 1 = 10-20%, 2 = >20%
+_TIME_HORIZON_FIT_TABLE = [
+    [100.0, 60.0, 40.0],  # Short horizon
+    [90.0, 100.0, 70.0],  # Medium horizon
+    [85.0, 95.0, 100.0],  # Long horizon
+]
+
+
+@lru_cache(maxsize=1)
+def _scoring_matrices() -> Tuple["np.ndarray", "np.ndarray"]:
+    """Build the NumPy lookup matrices (imports NumPy on first call)."""
+    import numpy as np
+
+    return np.array(_RISK_FIT_TABLE), np.array(_TIME_HORIZON_FIT_TABLE)
+
+
+def _as_client_list(
+    client_profiles: Union[ClientProfile, Sequence[ClientProfile]], size: int
+) -> List[ClientProfile]:
+    """Broadcast a single client profile to ``size`` records."""
+    if isinstance(client_profiles, ClientProfile):
+        return [client_profiles] * size
+    return list(client_profiles)
+
+
+def calculate_suitability_components_batch(
+    client_profiles: Union[ClientProfile, Sequence[ClientProfile]],
+    risk_analyses: Sequence[RiskAnalysis],
+    compliance_reports: Sequence[ComplianceReport],
+    performance_reports: Sequence[PerformanceReport],
+) -> Dict[str, "np.ndarray"]:
+    """
+    Calculate component and overall suitability scores for many records at once.
+
+    Applies the same rules as the calculate_*_fit_score helpers using NumPy
+    array operations instead of per-record Python branches. Record ``i`` is
+    (client_profiles[i], risk_analyses[i], compliance_reports[i],
+    performance_reports[i]).
+
+    Args:
+        client_profiles: One client profile per record, or a single profile
+            shared by all records (e.g. comparing many portfolios for one client)
+        risk_analyses: Risk analysis results
+        compliance_reports: Compliance check results
+        performance_reports: Performance analysis results
+
+    Returns:
+        Dict of float64 arrays keyed by "risk_fit", "compliance_fit",
+        "performance_fit", "time_horizon_fit" and "overall_score"
+
+    Raises:
+        ValueError: If the input sequences have different lengths
+    """
+    import numpy as np
+
+    risk_fit_matrix, time_horizon_fit_matrix = _scoring_matrices()
+    size = len(risk_analyses)
+    clients = _as_client_list(client_profiles, size)
+
+    if not (
+        len(clients) == len(compliance_reports) == len(performance_reports) == size
+    ):
+        raise ValueError(
+            "All inputs must have the same length "
+            f"(clients={len(clients)}, risk={size}, "
+            f"compliance={len(compliance_reports)}, "
+            f"performance={len(performance_reports)})"
+        )
+
+    # Extract columns from the models
+    client_risk = np.fromiter(
+        (_RISK_TOLERANCE_CODES[c.risk_tolerance] for c in clients),
+        dtype=np.intp,
+        count=size,
+    )
+    time_horizon = np.fromiter(
+        (c.time_horizon for c in clients), dtype=np.int64, count=size
+    )
+
+    portfolio_risk = np.fromiter(
+        (_RISK_RATING_CODES[r.risk_rating] for r in risk_analyses),
+        dtype=np.intp,
+        count=size,
+    )
+    beta = np.fromiter((r.beta for r in risk_analyses), dtype=np.float64, count=size)
+    volatility = np.fromiter(
+        (r.volatility for r in risk_analyses), dtype=np.float64, count=size
+    )
+
+    compliance_base = np.fromiter(
+        (_COMPLIANCE_STATUS_SCORES[c.overall_status] for c in compliance_reports),
+        dtype=np.float64,
+        count=size,
+    )
+    suitability_pass = np.fromiter(
+        (c.suitability_pass for c in compliance_reports), dtype=bool, count=size
+    )
+    concentration_pass = np.fromiter(
+        (c.concentration_limits_pass for c in compliance_reports),
+        dtype=bool,
+        count=size,
+    )
+
+    excess_return = np.fromiter(
+        (p.excess_return for p in performance_reports), dtype=np.float64, count=size
+    )
+    sharpe = np.fromiter(
+        (p.sharpe_ratio for p in performance_reports), dtype=np.float64, count=size
+    )
+
+    # Risk fit: matrix lookup plus beta adjustment
+    risk_fit = risk_fit_matrix[client_risk, portfolio_risk]
+    conservative_high_beta = (client_risk == 0) & (beta > 1.3)
+    aggressive_low_beta = (client_risk == 2) & (beta < 0.7)
+    risk_fit = np.where(
+        conservative_high_beta, np.maximum(30.0, risk_fit - 10.0), risk_fit
+    )
+    risk_fit = np.where(
+        aggressive_low_beta, np.maximum(60.0, risk_fit - 10.0), risk_fit
+    )
+
+    # Compliance fit: status score with suitability/concentration adjustments
+    compliance_fit = np.where(
+        suitability_pass, compliance_base, np.minimum(compliance_base, 40.0)
+    )
+    compliance_fit = np.where(
+        concentration_pass, compliance_fit, np.maximum(30.0, compliance_fit - 15.0)
+    )
+
+    # Performance fit: excess return thresholds plus Sharpe adjustment
+    performance_fit = np.select(
+        [
+            excess_return > 5.0,
+            excess_return >= 2.0,
+            excess_return >= 0.0,
+            excess_return >= -2.0,
+        ],
+        [100.0, 85.0, 70.0, 50.0],
+        default=30.0,
+    )
+    performance_fit = np.where(
+        sharpe > 1.0,
+        np.minimum(100.0, performance_fit + 5.0),
+        np.where(
+            sharpe < 0.5, np.maximum(30.0, performance_fit - 10.0), performance_fit
+        ),
+    )
+
+    # Time horizon fit: horizon bucket x volatility bucket lookup
+    horizon_bucket = np.where(time_horizon > 15, 2, np.where(time_horizon >= 5, 1, 0))
+    volatility_bucket = np.where(volatility > 20, 2, np.where(volatility > 10, 1, 0))
+    time_horizon_fit = time_horizon_fit_matrix[horizon_bucket, volatility_bucket]
+
+    # Same operation order as calculate_suitability_score for identical floats
+    overall_score = (
+        (risk_fit * 0.25)
+        + (compliance_fit * 0.35)
+        + (performance_fit * 0.25)
+        + (time_horizon_fit * 0.15)
+    )
+
+    return {
+        "risk_fit": risk_fit,
+        "compliance_fit": compliance_fit,
+        "performance_fit": performance_fit,
+        "time_horizon_fit": time_horizon_fit,
+        "overall_score": overall_score,
+    }
+
+
+def calculate_suitability_scores_batch(
+    client_profiles: Union[ClientProfile, Sequence[ClientProfile]],
+    risk_analyses: Sequence[RiskAnalysis],
+    compliance_reports: Sequence[ComplianceReport],
+    performance_reports: Sequence[PerformanceReport],
+    include_explanations: bool = True,
+) -> List[SuitabilityScore]:
+    """
+    Calculate suitability scores for many client/portfolio records at once.
+
+    Batch counterpart of calculate_suitability_score(). Component scores are
+    computed with vectorized math (see calculate_suitability_components_batch)
+    and produce the same SuitabilityScore values as the scalar path.
+
+    Args:
+        client_profiles: One client profile per record, or a single profile
+            shared by all records
+        risk_analyses: Risk analysis results
+        compliance_reports: Compliance check results
+        performance_reports: Performance analysis results
+        include_explanations: If False, skip building the per-record explanation
+            text (explanation is left empty). Useful for firm-wide sweeps that
+            only need the numbers.
+
+    Returns:
+        List of SuitabilityScore in input order
+
+    Example:
+        >>> scores = calculate_suitability_scores_batch(
+        ...     client, risk_list, compliance_list, performance_list
+        ... )
+        >>> best = max(scores, key=lambda s: s.overall_score)
+    """
+    components = calculate_suitability_components_batch(
+        client_profiles, risk_analyses, compliance_reports, performance_reports
+    )
+    clients = _as_client_list(client_profiles, len(risk_analyses))
+
+    scores: List[SuitabilityScore] = []
+    for i, overall_score in enumerate(components["overall_score"].tolist()):
+        risk_fit = float(components["risk_fit"][i])
+        compliance_fit = float(components["compliance_fit"][i])
+        performance_fit = float(components["performance_fit"][i])
+        time_horizon_fit = float(components["time_horizon_fit"][i])
+
+        explanation = ""
+        if include_explanations:
+            explanation = generate_suitability_explanation(
+                overall_score=overall_score,
+                risk_fit=risk_fit,
+                compliance_fit=compliance_fit,
+                performance_fit=performance_fit,
+                time_horizon_fit=time_horizon_fit,
+                client_profile=clients[i],
+                risk_analysis=risk_analyses[i],
+                compliance_report=compliance_reports[i],
+                performance_report=performance_reports[i],
+            )
+
+        scores.append(
+            SuitabilityScore(
+                overall_score=overall_score,
+                risk_fit=risk_fit,
+                compliance_fit=compliance_fit,
+                performance_fit=performance_fit,
+                time_horizon_fit=time_horizon_fit,
+                interpretation=map_score_to_interpretation(overall_score),
+                explanation=explanation,
+            )
+        )
+
+    return scores
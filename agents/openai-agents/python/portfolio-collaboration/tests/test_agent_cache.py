@@ -0,0 +1,222 @@
+"""
+Unit Tests for the Agent Run Response Cache.
+
+Uses a stub agent and a patched Runner.run so no LLM calls are made.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import pytest
+
+from src.data.mock_portfolios import get_conservative_example
+from src.models.schemas import RiskAnalysis, RiskRating
+from src.tools.agent_cache import (
+    AgentCacheMissError,
+    AgentCacheMode,
+    AgentRunCache,
+    CachedRunResult,
+    make_cache_key,
+)
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@dataclass
+class StubAgent:
+    name: str = "Risk Analyst"
+    instructions: str = "Analyze portfolio risk."
+    model: Optional[str] = "gpt-4o-mini"
+    output_type: Any = RiskAnalysis
+
+
+@dataclass
+class StubRunResult:
+    final_output: Any
+
+
+@pytest.fixture
+def risk_output():
+    return RiskAnalysis(
+        volatility=11.0,
+        var_95=-8.5,
+        beta=0.9,
+        concentration_score=20.0,
+        risk_rating=RiskRating.LOW,
+        concerns=["None"],
+    )
+
+
+@pytest.fixture
+def agent_input():
+    client, portfolio = get_conservative_example()
+    return {"portfolio": portfolio, "client_profile": client}
+
+
+@pytest.fixture
+def runner_calls(monkeypatch, risk_output):
+    """Patch Runner.run to count live calls and return a fixed output."""
+    import agents
+
+    calls = []
+
+    async def fake_run(agent, agent_input, **kwargs):
+        calls.append((agent.name, agent_input))
+        return StubRunResult(final_output=risk_output)
+
+    monkeypatch.setattr(agents.Runner, "run", fake_run)
+    return calls
+
+
+# ============================================================================
+# Cache Key
+# ============================================================================
+
+
+def test_cache_key_is_deterministic(agent_input):
+    agent = StubAgent()
+    assert make_cache_key(agent, agent_input) == make_cache_key(agent, dict(agent_input))
+
+
+def test_cache_key_changes_with_agent_config(agent_input):
+    base = make_cache_key(StubAgent(), agent_input)
+
+    assert make_cache_key(StubAgent(instructions="Other"), agent_input) != base
+    assert make_cache_key(StubAgent(model="gpt-4.1"), agent_input) != base
+    assert make_cache_key(StubAgent(name="Compliance Officer"), agent_input) != base
+    assert make_cache_key(StubAgent(), agent_input, fingerprint="2024-01-16") != base
+    assert make_cache_key(StubAgent(), agent_input, runner_kwargs={"max_turns": 3}) != base
+    assert make_cache_key(StubAgent(), agent_input, runner_kwargs={}) == base
+
+
+def test_runner_kwargs_are_part_of_the_key(tmp_path, agent_input, runner_calls):
+    cache = AgentRunCache(cache_dir=tmp_path)
+    agent = StubAgent()
+
+    asyncio.run(cache.run(agent, agent_input, max_turns=3))
+    asyncio.run(cache.run(agent, agent_input, max_turns=5))
+    asyncio.run(cache.run(agent, agent_input, max_turns=5))
+
+    assert len(runner_calls) == 2
+
+
+def test_unserializable_runner_kwargs_bypass_cache(tmp_path, agent_input, runner_calls):
+    cache = AgentRunCache(cache_dir=tmp_path)
+    context = object()
+
+    asyncio.run(cache.run(StubAgent(), agent_input, context=context))
+    asyncio.run(cache.run(StubAgent(), agent_input, context=context))
+
+    assert len(runner_calls) == 2
+    assert not any(tmp_path.iterdir())
+
+    replayer = AgentRunCache(cache_dir=tmp_path, mode=AgentCacheMode.REPLAY)
+    with pytest.raises(AgentCacheMissError):
+        asyncio.run(replayer.run(StubAgent(), agent_input, context=context))
+
+
+# ============================================================================
+# Cache Modes
+# ============================================================================
+
+
+def test_read_write_serves_second_call_from_cache(
+    tmp_path, agent_input, runner_calls, risk_output
+):
+    cache = AgentRunCache(cache_dir=tmp_path, mode=AgentCacheMode.READ_WRITE)
+    agent = StubAgent()
+
+    first = asyncio.run(cache.run(agent, agent_input))
+    second = asyncio.run(cache.run(agent, agent_input))
+
+    assert len(runner_calls) == 1
+    assert not isinstance(first, CachedRunResult)
+    assert isinstance(second, CachedRunResult)
+    assert isinstance(second.final_output, RiskAnalysis)
+    assert second.final_output == risk_output
+
+
+def test_record_then_replay_offline(tmp_path, agent_input, runner_calls, risk_output):
+    agent = StubAgent()
+
+    recorder = AgentRunCache(cache_dir=tmp_path, mode=AgentCacheMode.RECORD)
+    asyncio.run(recorder.run(agent, agent_input))
+    asyncio.run(recorder.run(agent, agent_input))
+    assert len(runner_calls) == 2  # record mode always calls the LLM
+
+    replayer = AgentRunCache(cache_dir=tmp_path, mode=AgentCacheMode.REPLAY)
+    replayed = asyncio.run(replayer.run(agent, agent_input))
+
+    assert len(runner_calls) == 2
+    assert replayed.final_output == risk_output
+
+
+def test_replay_miss_raises(tmp_path, agent_input, runner_calls):
+    cache = AgentRunCache(cache_dir=tmp_path, mode=AgentCacheMode.REPLAY)
+
+    with pytest.raises(AgentCacheMissError):
+        asyncio.run(cache.run(StubAgent(), agent_input))
+    assert runner_calls == []
+
+
+def test_off_mode_never_caches(tmp_path, agent_input, runner_calls):
+    cache = AgentRunCache(cache_dir=tmp_path, mode=AgentCacheMode.OFF)
+
+    asyncio.run(cache.run(StubAgent(), agent_input))
+    asyncio.run(cache.run(StubAgent(), agent_input))
+
+    assert len(runner_calls) == 2
+    assert not any(tmp_path.iterdir())
+
+
+# ============================================================================
+# Invalidation
+# ============================================================================
+
+
+def test_fingerprint_change_invalidates(tmp_path, agent_input, runner_calls):
+    cache = AgentRunCache(cache_dir=tmp_path)
+    agent = StubAgent()
+    market_data_date = {"value": "2024-01-15"}
+    cache.register_fingerprint(agent.name, lambda _input: market_data_date["value"])
+
+    asyncio.run(cache.run(agent, agent_input))
+    asyncio.run(cache.run(agent, agent_input))
+    assert len(runner_calls) == 1
+
+    market_data_date["value"] = "2024-01-16"
+    asyncio.run(cache.run(agent, agent_input))
+    assert len(runner_calls) == 2
+
+
+def test_explicit_invalidate(tmp_path, agent_input, runner_calls):
+    cache = AgentRunCache(cache_dir=tmp_path)
+    agent = StubAgent()
+
+    asyncio.run(cache.run(agent, agent_input))
+    assert cache.invalidate(agent.name) == 1
+
+    asyncio.run(cache.run(agent, agent_input))
+    assert len(runner_calls) == 2
+
+
+def test_ttl_expires_entries(tmp_path, agent_input, runner_calls):
+    cache = AgentRunCache(cache_dir=tmp_path, ttl_seconds=-1)
+
+    asyncio.run(cache.run(StubAgent(), agent_input))
+    asyncio.run(cache.run(StubAgent(), agent_input))
+
+    assert len(runner_calls) == 2
+
+
+def test_replay_ignores_ttl(tmp_path, agent_input, runner_calls, risk_output):
+    agent = StubAgent()
+    recorder = AgentRunCache(cache_dir=tmp_path, mode=AgentCacheMode.RECORD)
+    asyncio.run(recorder.run(agent, agent_input))
+
+    replayer = AgentRunCache(cache_dir=tmp_path, mode=AgentCacheMode.REPLAY, ttl_seconds=-1)
+    assert asyncio.run(replayer.run(agent, agent_input)).final_output == risk_output
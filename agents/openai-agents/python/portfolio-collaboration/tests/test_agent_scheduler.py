@@ -0,0 +1,207 @@
+"""
+Unit Tests for the Shared Agent Scheduler.
+
+Exercises concurrency limits, priorities, retries and rate budgets with
+plain coroutines, so no LLM calls are made.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.tools.agent_scheduler import (
+    AgentPriority,
+    AgentScheduler,
+    agent_priority,
+)
+
+
+class RateLimitError(Exception):
+    """Stand-in for openai.RateLimitError (matched by class name)."""
+
+    status_code = 429
+
+
+class ValidationFailure(Exception):
+    """Non-retryable error."""
+
+
+# ============================================================================
+# Concurrency & Priority
+# ============================================================================
+
+
+def test_concurrency_is_bounded():
+    scheduler = AgentScheduler(max_concurrency=2)
+    active = {"now": 0, "peak": 0}
+
+    async def call():
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return "ok"
+
+    async def main():
+        return await asyncio.gather(*[scheduler.submit(call) for _ in range(10)])
+
+    results = asyncio.run(main())
+
+    assert results == ["ok"] * 10
+    assert active["peak"] == 2
+    stats = scheduler.stats()
+    assert stats.completed == 10
+    assert stats.in_flight == 0
+    assert stats.queue_depth == 0
+
+
+def test_interactive_runs_before_queued_batch():
+    scheduler = AgentScheduler(max_concurrency=1)
+    order = []
+
+    def make_call(label):
+        async def call():
+            order.append(label)
+            await asyncio.sleep(0.01)
+
+        return call
+
+    async def main():
+        blocker = asyncio.create_task(scheduler.submit(make_call("first")))
+        await asyncio.sleep(0)
+        with agent_priority(AgentPriority.BATCH):
+            batch = [
+                asyncio.create_task(scheduler.submit(make_call(f"batch-{i}")))
+                for i in range(3)
+            ]
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 3
+        interactive = asyncio.create_task(scheduler.submit(make_call("interactive")))
+        await asyncio.gather(blocker, interactive, *batch)
+
+    asyncio.run(main())
+
+    assert order[:2] == ["first", "interactive"]
+    assert order[2:] == ["batch-0", "batch-1", "batch-2"]
+
+
+def test_blocking_interactive_run_starts_before_queued_batch_run():
+    scheduler = AgentScheduler(max_concurrency=1, requests_per_minute=1)
+    release = threading.Event()
+    started = []
+
+    def analysis(label):
+        started.append(label)
+        if label == "first":
+            release.wait(timeout=5)
+        return label
+
+    async def main():
+        blocker = asyncio.create_task(scheduler.run_blocking(analysis, "first"))
+        await asyncio.sleep(0)
+        with agent_priority(AgentPriority.BATCH):
+            batch = asyncio.create_task(scheduler.run_blocking(analysis, "batch"))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(scheduler.run_blocking(analysis, "interactive"))
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 2
+        release.set()
+        return await asyncio.gather(blocker, batch, interactive)
+
+    results = asyncio.run(main())
+
+    assert results == ["first", "batch", "interactive"]
+    assert started == ["first", "interactive", "batch"]
+    # Blocking analyses make no API request, so the request budget is untouched
+    assert scheduler._request_allowance == 1
+
+
+# ============================================================================
+# Retries & Adaptive Concurrency
+# ============================================================================
+
+
+def test_rate_limit_is_retried_and_reduces_concurrency():
+    scheduler = AgentScheduler(max_concurrency=4, base_delay=0.001, max_delay=0.002)
+    attempts = {"count": 0}
+
+    async def flaky():
+        attempts["count"] += 1
+        if attempts["count"] < 3:
+            raise RateLimitError("slow down")
+        return "done"
+
+    result = asyncio.run(scheduler.submit(flaky))
+
+    assert result == "done"
+    stats = scheduler.stats()
+    assert stats.retries == 2
+    assert stats.rate_limited == 2
+    # 4 -> 2 -> 1 on the rate limits, then +1 after the successful call
+    assert stats.concurrency_limit == 2
+
+
+def test_non_retryable_error_raises_immediately():
+    scheduler = AgentScheduler(base_delay=0.001)
+
+    async def broken():
+        raise ValidationFailure("bad output")
+
+    with pytest.raises(ValidationFailure):
+        asyncio.run(scheduler.submit(broken))
+
+    stats = scheduler.stats()
+    assert stats.retries == 0
+    assert stats.failed == 1
+    assert stats.in_flight == 0
+
+
+def test_retries_are_bounded():
+    scheduler = AgentScheduler(max_retries=2, base_delay=0.001, max_delay=0.002)
+
+    async def always_limited():
+        raise RateLimitError("slow down")
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(scheduler.submit(always_limited))
+
+    assert scheduler.stats().retries == 2
+
+
+def test_concurrency_recovers_after_successes():
+    scheduler = AgentScheduler(max_concurrency=4)
+    scheduler._on_rate_limited()
+    assert scheduler.stats().concurrency_limit == 2
+
+    async def ok():
+        return None
+
+    async def main():
+        for _ in range(10):
+            await scheduler.submit(ok)
+
+    asyncio.run(main())
+
+    assert scheduler.stats().concurrency_limit == 4
+
+
+# ============================================================================
+# Rate Budget
+# ============================================================================
+
+
+def test_request_budget_spaces_calls():
+    # 600 requests/minute = 1 request per 0.1s once the bucket is empty
+    scheduler = AgentScheduler(max_concurrency=10, requests_per_minute=600)
+    scheduler._request_allowance = 0
+
+    async def ok():
+        return asyncio.get_running_loop().time()
+
+    async def main():
+        return await asyncio.gather(*[scheduler.submit(ok) for _ in range(3)])
+
+    timestamps = asyncio.run(main())
+
+    assert max(timestamps) - min(timestamps) >= 0.15
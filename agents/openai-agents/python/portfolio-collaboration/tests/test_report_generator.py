@@ -0,0 +1,190 @@
+"""
+Unit Tests for Report Generation.
+
+Covers the streaming, HTML and parallel report renderers and checks they
+produce the same content as generate_markdown_report().
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from src.models.schemas import (
+    ComplianceReport,
+    ComplianceStatus,
+    PerformanceReport,
+    PortfolioRecommendations,
+    RiskAnalysis,
+    RiskRating,
+    SuitabilityRating,
+    SuitabilityScore,
+)
+from src.tools.report_generator import (
+    aiter_report_chunks,
+    generate_html_report,
+    generate_markdown_report,
+    iter_report_sections,
+    render_report,
+    render_report_async,
+    render_reports_parallel,
+    save_report_to_file,
+    stream_report_to_file,
+)
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+def _make_recommendations(client_id: str = "CLT-2024-001") -> PortfolioRecommendations:
+    return PortfolioRecommendations(
+        portfolio_id="PORT-001",
+        client_id=client_id,
+        analysis_date=datetime(2024, 1, 15, 10, 30, 0),
+        suitability_score=SuitabilityScore(
+            overall_score=82.5,
+            risk_fit=100.0,
+            compliance_fit=70.0,
+            performance_fit=85.0,
+            time_horizon_fit=90.0,
+            interpretation=SuitabilityRating.HIGHLY_SUITABLE,
+            explanation="This portfolio is HIGHLY SUITABLE for the client.",
+        ),
+        risk_analysis=RiskAnalysis(
+            volatility=12.3,
+            var_95=-9.8,
+            beta=0.95,
+            concentration_score=35.0,
+            risk_rating=RiskRating.MEDIUM,
+            concerns=["Technology weighting above 30%"],
+            recommendations=["Trim technology exposure"],
+        ),
+        compliance_report=ComplianceReport(
+            overall_status=ComplianceStatus.REVIEW,
+            checks_performed=["Suitability", "Concentration"],
+            warnings=["Single holding above 10%"],
+            required_disclosures=["Concentration risk disclosure"],
+            suitability_pass=True,
+            concentration_limits_pass=True,
+        ),
+        performance_report=PerformanceReport(
+            total_return=11.2,
+            benchmark_return=9.0,
+            excess_return=2.2,
+            sharpe_ratio=1.1,
+            alpha=1.5,
+            attribution={"Technology": 3.1, "Utilities": -0.4},
+            top_performers=["AAPL", "MSFT"],
+        ),
+        recommendations=["Rebalance to target weights", "Add fixed income <5%>"],
+        action_items=["Schedule review meeting"],
+        executive_summary="Portfolio is well aligned with **moderate** goals.",
+    )
+
+
+@pytest.fixture
+def recommendations():
+    return _make_recommendations()
+
+
+# ============================================================================
+# Markdown Streaming
+# ============================================================================
+
+
+def test_sections_join_to_full_report(recommendations):
+    """Joining streamed sections reproduces the full markdown report."""
+    sections = list(iter_report_sections(recommendations))
+
+    assert len(sections) == 9
+    assert sections[0].startswith("# Portfolio Analysis Report")
+    assert "\n\n".join(sections) == generate_markdown_report(recommendations)
+
+
+def test_stream_to_file_matches_save(recommendations, tmp_path):
+    """Streaming to file writes the same content as save_report_to_file."""
+    streamed_path = stream_report_to_file(
+        recommendations, "streamed", output_dir=str(tmp_path)
+    )
+    saved_path = save_report_to_file(
+        generate_markdown_report(recommendations), "saved", output_dir=str(tmp_path)
+    )
+
+    assert streamed_path.endswith("streamed.md")
+    with open(streamed_path, encoding="utf-8") as streamed, open(
+        saved_path, encoding="utf-8"
+    ) as saved:
+        assert streamed.read() == saved.read()
+
+
+def test_async_chunks_match_report(recommendations):
+    """Async chunk iterator yields the full report."""
+
+    async def collect():
+        return [chunk async for chunk in aiter_report_chunks(recommendations)]
+
+    chunks = asyncio.run(collect())
+
+    assert len(chunks) == 9
+    assert "".join(chunks) == generate_markdown_report(recommendations)
+
+
+# ============================================================================
+# HTML / PDF Output
+# ============================================================================
+
+
+def test_html_report_structure(recommendations):
+    """HTML output converts headings, tables, lists and escapes content."""
+    html_report = generate_html_report(recommendations)
+
+    assert html_report.startswith("<!DOCTYPE html>")
+    assert html_report.rstrip().endswith("</html>")
+    assert "<h1>Portfolio Analysis Report</h1>" in html_report
+    assert "<th>Metric</th>" in html_report
+    assert "<td>Volatility</td>" in html_report
+    assert "<li>Trim technology exposure</li>" in html_report
+    assert "<ol>" in html_report
+    assert "<strong>moderate</strong>" in html_report
+    assert "&lt;5%&gt;" in html_report
+    assert "|--------|" not in html_report
+
+
+def test_stream_html_to_file(recommendations, tmp_path):
+    """HTML reports stream to .html files."""
+    path = stream_report_to_file(
+        recommendations, "report", output_dir=str(tmp_path), output_format="html"
+    )
+
+    assert path.endswith("report.html")
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == generate_html_report(recommendations)
+
+
+def test_unsupported_format_raises(recommendations):
+    """Unknown output formats are rejected."""
+    with pytest.raises(ValueError, match="Unsupported report format"):
+        render_report(recommendations, "docx")
+
+
+# ============================================================================
+# Parallel / Async Rendering
+# ============================================================================
+
+
+def test_render_reports_parallel_preserves_order():
+    """Parallel rendering returns reports in input order."""
+    batch = [_make_recommendations(f"CLT-{i:03d}") for i in range(4)]
+
+    reports = render_reports_parallel(batch, max_workers=2)
+
+    assert reports == [generate_markdown_report(r) for r in batch]
+
+
+def test_render_report_async(recommendations):
+    """Async rendering returns the same report without blocking the loop."""
+    report = asyncio.run(render_report_async(recommendations, "html"))
+
+    assert report == generate_html_report(recommendations)
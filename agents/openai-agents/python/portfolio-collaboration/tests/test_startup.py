@@ -0,0 +1,46 @@
+"""
+Startup Tests.
+
+Importing the CLI and API entry points must not pull in the Agents SDK or
+the market data stack; those load on first use.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+HEAVY_MODULES = ["agents", "yfinance", "pandas"]
+
+
+def _loaded_heavy_modules(module: str) -> str:
+    code = (
+        f"import sys; import {module}; "
+        f"print('loaded:' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # The API logs to stdout on import; the probe line is always last
+    return result.stdout.strip().splitlines()[-1].split("loaded:", 1)[1]
+
+
+@pytest.mark.parametrize("module", ["src.tools", "src.agents", "src.main", "src.api.main"])
+def test_entry_point_import_is_lightweight(module):
+    assert _loaded_heavy_modules(module) == ""
+
+
+def test_lazy_exports_resolve():
+    import src.agents
+    import src.tools
+
+    assert callable(src.tools.calculate_suitability_score)
+    assert src.agents.risk_analyst_agent.name
+    assert "calculate_suitability_score" in dir(src.tools)
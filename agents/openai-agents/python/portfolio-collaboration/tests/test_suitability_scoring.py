@@ -0,0 +1,198 @@
+"""
+Unit Tests for Suitability Scoring.
+
+Verifies that the vectorized batch scoring path produces exactly the same
+results as the scalar calculate_suitability_score() for every branch of the
+component scoring rules.
+"""
+
+import itertools
+
+import pytest
+
+from src.models.schemas import (
+    ClientProfile,
+    ComplianceReport,
+    ComplianceStatus,
+    PerformanceReport,
+    RiskAnalysis,
+    RiskRating,
+    RiskTolerance,
+)
+from src.tools.suitability_scoring import (
+    calculate_suitability_components_batch,
+    calculate_suitability_score,
+    calculate_suitability_scores_batch,
+)
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+def _make_client(risk_tolerance: RiskTolerance, time_horizon: int) -> ClientProfile:
+    return ClientProfile(
+        client_id=f"C-{risk_tolerance.value}-{time_horizon}",
+        age=50,
+        risk_tolerance=risk_tolerance,
+        investment_goals=["Retirement"],
+        time_horizon=time_horizon,
+    )
+
+
+def _make_risk(rating: RiskRating, beta: float, volatility: float) -> RiskAnalysis:
+    return RiskAnalysis(
+        volatility=volatility,
+        var_95=-10.0,
+        beta=beta,
+        concentration_score=25.0,
+        risk_rating=rating,
+    )
+
+
+def _make_compliance(
+    status: ComplianceStatus, suitability_pass: bool, concentration_pass: bool
+) -> ComplianceReport:
+    return ComplianceReport(
+        overall_status=status,
+        checks_performed=["Suitability", "Concentration"],
+        violations=[] if status == ComplianceStatus.PASS else ["Concentration limit"],
+        suitability_pass=suitability_pass,
+        concentration_limits_pass=concentration_pass,
+    )
+
+
+def _make_performance(excess_return: float, sharpe_ratio: float) -> PerformanceReport:
+    return PerformanceReport(
+        total_return=10.0 + excess_return,
+        benchmark_return=10.0,
+        excess_return=excess_return,
+        sharpe_ratio=sharpe_ratio,
+    )
+
+
+@pytest.fixture
+def scoring_grid():
+    """Records covering every branch (and boundary) of the scoring rules."""
+    clients = [
+        _make_client(tolerance, horizon)
+        for tolerance, horizon in itertools.product(RiskTolerance, [3, 5, 15, 16])
+    ]
+    risks = [
+        _make_risk(rating, beta, volatility)
+        for rating, beta, volatility in itertools.product(
+            RiskRating, [0.5, 0.7, 1.0, 1.3, 1.5], [8.0, 10.0, 15.0, 20.0, 25.0]
+        )
+    ]
+    compliances = [
+        _make_compliance(status, suitability, concentration)
+        for status, suitability, concentration in itertools.product(
+            ComplianceStatus, [True, False], [True, False]
+        )
+    ]
+    performances = [
+        _make_performance(excess, sharpe)
+        for excess, sharpe in itertools.product(
+            [-3.0, -2.0, -0.5, 0.0, 1.0, 2.0, 5.0, 6.0], [0.3, 0.5, 0.8, 1.0, 1.5]
+        )
+    ]
+
+    records = []
+    for i, (client, risk) in enumerate(itertools.product(clients, risks)):
+        records.append(
+            (
+                client,
+                risk,
+                compliances[i % len(compliances)],
+                performances[(i * 7) % len(performances)],
+            )
+        )
+    return records
+
+
+# ============================================================================
+# Batch vs Scalar Equivalence
+# ============================================================================
+
+
+def test_batch_matches_scalar(scoring_grid):
+    """Batch scores are identical to scalar scores, including explanations."""
+    clients, risks, compliances, performances = map(list, zip(*scoring_grid))
+
+    batch_scores = calculate_suitability_scores_batch(
+        clients, risks, compliances, performances
+    )
+
+    assert len(batch_scores) == len(scoring_grid)
+    for record, batch_score in zip(scoring_grid, batch_scores):
+        assert batch_score == calculate_suitability_score(*record)
+
+
+def test_components_match_scalar_unrounded(scoring_grid):
+    """Raw overall scores match bit-for-bit before model rounding."""
+    clients, risks, compliances, performances = map(list, zip(*scoring_grid))
+
+    components = calculate_suitability_components_batch(
+        clients, risks, compliances, performances
+    )
+
+    for i, record in enumerate(scoring_grid):
+        scalar = calculate_suitability_score(*record)
+        assert components["risk_fit"][i] == scalar.risk_fit
+        assert components["compliance_fit"][i] == scalar.compliance_fit
+        assert components["performance_fit"][i] == scalar.performance_fit
+        assert components["time_horizon_fit"][i] == scalar.time_horizon_fit
+        expected_overall = (
+            (scalar.risk_fit * 0.25)
+            + (scalar.compliance_fit * 0.35)
+            + (scalar.performance_fit * 0.25)
+            + (scalar.time_horizon_fit * 0.15)
+        )
+        assert components["overall_score"][i] == expected_overall
+
+
+def test_single_client_broadcast(scoring_grid):
+    """A single client profile is shared across all records (compare mode)."""
+    client = scoring_grid[0][0]
+    _, risks, compliances, performances = map(list, zip(*scoring_grid[:10]))
+
+    batch_scores = calculate_suitability_scores_batch(
+        client, risks, compliances, performances
+    )
+
+    for i, batch_score in enumerate(batch_scores):
+        expected = calculate_suitability_score(
+            client, risks[i], compliances[i], performances[i]
+        )
+        assert batch_score == expected
+
+
+def test_batch_without_explanations(scoring_grid):
+    """Explanations can be skipped for numeric-only sweeps."""
+    clients, risks, compliances, performances = map(list, zip(*scoring_grid[:5]))
+
+    batch_scores = calculate_suitability_scores_batch(
+        clients, risks, compliances, performances, include_explanations=False
+    )
+
+    for record, batch_score in zip(scoring_grid, batch_scores):
+        scalar = calculate_suitability_score(*record)
+        assert batch_score.explanation == ""
+        assert batch_score.overall_score == scalar.overall_score
+        assert batch_score.interpretation == scalar.interpretation
+
+
+def test_empty_batch():
+    """Empty input returns an empty list."""
+    assert calculate_suitability_scores_batch([], [], [], []) == []
+
+
+def test_mismatched_lengths_raise(scoring_grid):
+    """Inputs of different lengths are rejected."""
+    clients, risks, compliances, performances = map(list, zip(*scoring_grid[:3]))
+
+    with pytest.raises(ValueError, match="same length"):
+        calculate_suitability_scores_batch(
+            clients, risks, compliances[:2], performances
+        )